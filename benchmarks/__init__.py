@@ -0,0 +1 @@
+"""Eludris-autodoc benchmarks."""
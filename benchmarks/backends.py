@@ -0,0 +1,152 @@
+"""Compare decoding and encoding gateway payloads across codegen backends.
+
+The attrs backend is the eludris-autodoc package itself. To include the
+msgspec backend, generate it into a separate directory first and pass that
+directory to this benchmark::
+
+    generate-autodoc --backend msgspec --target /tmp/eludris_autodoc_msgspec
+    python -m benchmarks.backends /tmp/eludris_autodoc_msgspec
+"""
+
+import importlib.util
+import json
+import pathlib
+import sys
+import timeit
+import types
+import typing
+
+from eludris_autodoc import gateway
+
+NUMBER = 200
+
+RATE_LIMIT = {"reset_after": 10, "limit": 5}
+USER: typing.Final[dict[str, typing.Any]] = {
+    "id": 48615849987333,
+    "username": "yendri",
+    "display_name": "Nicolas",
+    "social_credit": -69420,
+    "status": {"type": "ONLINE", "text": "ayúdame por favor"},
+    "bio": "NICOLAAAAAAAAAAAAAAAAAAS!!!",
+    "badges": 0,
+    "permissions": 0,
+}
+CORPUS: typing.Final[tuple[bytes, ...]] = tuple(
+    json.dumps(payload).encode()
+    for payload in (
+        {"op": "PONG"},
+        {
+            "op": "HELLO",
+            "d": {
+                "heartbeat_interval": 45000,
+                "instance_info": {
+                    "instance_name": "EmreLand",
+                    "description": "More based than Oliver's instance (trust)",
+                    "version": "0.3.3",
+                    "message_limit": 2048,
+                    "oprish_url": "https://example.com",
+                    "pandemonium_url": "https://example.com",
+                    "effis_url": "https://example.com",
+                    "file_size": 20_000_000,
+                    "attachment_file_size": 100_000_000,
+                },
+                "rate_limit": RATE_LIMIT,
+            },
+        },
+        {"op": "AUTHENTICATED", "d": {"user": USER, "users": [USER] * 50}},
+        {"op": "PRESENCE_UPDATE", "d": {"user_id": USER["id"], "status": USER["status"]}},
+        *({"op": "MESSAGE_CREATE", "d": {"author": USER, "content": "Woo!"}},) * 100,
+    )
+)
+"""Raw gateway frames, mostly messages like on a busy connection."""
+
+Codec = tuple[typing.Callable[[bytes], typing.Any], typing.Callable[[typing.Any], bytes]]
+
+
+def _make_json_codec() -> Codec:
+    def decode(frame: bytes) -> gateway.ServerPayload:
+        return gateway.decode_server_payload(json.loads(frame))
+
+    def encode(payload: gateway.ServerPayload) -> bytes:
+        return json.dumps(payload.to_payload()).encode()
+
+    return decode, encode
+
+
+def _make_orjson_codec() -> Codec | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    def decode(frame: bytes) -> gateway.ServerPayload:
+        return gateway.decode_server_payload(orjson.loads(frame))
+
+    def encode(payload: gateway.ServerPayload) -> bytes:
+        return orjson.dumps(payload.to_payload())
+
+    return decode, encode
+
+
+def _import_package(path: pathlib.Path) -> types.ModuleType:
+    # Import the generated package under another name, so it can live next to
+    # the attrs package.
+    spec = importlib.util.spec_from_file_location(
+        "eludris_autodoc_msgspec",
+        path / "__init__.py",
+        submodule_search_locations=[str(path)],
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = package
+    spec.loader.exec_module(package)
+    return package
+
+
+def make_msgspec_codec(path: pathlib.Path) -> Codec:
+    """Import the msgspec package generated into ``path``, and make its gateway codec."""
+    import msgspec
+
+    package = _import_package(path)
+    decoder = msgspec.json.Decoder(package.ServerPayload)
+    encoder = msgspec.json.Encoder()
+    return decoder.decode, encoder.encode
+
+
+def _bench(name: str, codec: Codec) -> None:
+    decode, encode = codec
+    decoded = [decode(frame) for frame in CORPUS]
+
+    def run_decode() -> None:
+        for frame in CORPUS:
+            decode(frame)
+
+    def run_encode() -> None:
+        for payload in decoded:
+            encode(payload)
+
+    for operation, func in (("decode", run_decode), ("encode", run_encode)):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name + ' ' + operation:<24} {best / len(CORPUS) * 1e6:8.2f} us/payload")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    codecs: dict[str, Codec | None] = {
+        "attrs + json": _make_json_codec(),
+        "attrs + orjson": _make_orjson_codec(),
+    }
+    if len(sys.argv) > 1:
+        codecs["msgspec"] = make_msgspec_codec(pathlib.Path(sys.argv[1]))
+
+    for name, codec in codecs.items():
+        if codec is None:
+            print(f"{name:<24} skipped, not installed")
+            continue
+
+        _bench(name, codec)
+
+
+if __name__ == "__main__":
+    main()
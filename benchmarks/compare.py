@@ -0,0 +1,79 @@
+"""Compare benchmark suite results against a saved baseline.
+
+Every benchmark that is present in both files is compared by its mean.
+Benchmarks that got slower by more than the threshold, and by more than
+the noise of both runs, are flagged as regressions, and the comparison
+exits with status 1 if there are any::
+
+    python -m benchmarks.compare baseline.json results.json --threshold 0.05
+
+This requires `pyperf <https://pypi.org/project/pyperf/>`_.
+"""
+
+import argparse
+import math
+import sys
+
+import pyperf
+
+
+def _is_regression(
+    baseline: pyperf.Benchmark,
+    result: pyperf.Benchmark,
+    threshold: float,
+) -> bool:
+    change = result.mean() / baseline.mean() - 1
+    if change <= threshold:
+        return False
+
+    # Differences within the combined standard deviation are noise.
+    noise = math.hypot(
+        baseline.stdev() if baseline.get_nvalue() > 1 else 0.0,
+        result.stdev() if result.get_nvalue() > 1 else 0.0,
+    )
+    return result.mean() - baseline.mean() > noise
+
+
+def main() -> None:
+    """Compare two benchmark suite results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("baseline", help="the saved baseline results")
+    parser.add_argument("results", help="the results to compare against the baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="the relative slowdown above which a benchmark regressed (default: 0.05)",
+    )
+    args = parser.parse_args()
+
+    baseline = pyperf.BenchmarkSuite.load(args.baseline)
+    results = pyperf.BenchmarkSuite.load(args.results)
+    baseline_names = set(baseline.get_benchmark_names())
+
+    regressions = 0
+    for result in results.get_benchmarks():
+        name = result.get_name()
+        if name not in baseline_names:
+            print(f"{name:<48} {result.format_value(result.mean()):>12}  new")
+            continue
+
+        base = baseline.get_benchmark(name)
+        change = result.mean() / base.mean() - 1
+        flag = ""
+        if _is_regression(base, result, args.threshold):
+            regressions += 1
+            flag = "  REGRESSION"
+
+        print(
+            f"{name:<48} {base.format_value(base.mean()):>12} -> "
+            f"{result.format_value(result.mean()):>12} {change:+8.1%}{flag}",
+        )
+
+    print(f"{regressions} regression(s) above {args.threshold:.0%}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
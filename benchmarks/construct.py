@@ -0,0 +1,79 @@
+"""Compare construction through ``__init__`` with the trusted fast path used by decoders."""
+
+import time
+import typing
+
+from eludris_autodoc import instance, messaging, undefined, users
+
+ITERATIONS = 200_000
+
+STATUS = users.Status(type=users.StatusType.ONLINE, text="ayúdame por favor")
+USER_FIELDS: typing.Final[dict[str, typing.Any]] = {
+    "id": 48615849987333,
+    "username": "yendri",
+    "display_name": "Nicolas",
+    "social_credit": -69420,
+    "status": STATUS,
+    "bio": "NICOLAAAAAAAAAAAAAAAAAAS!!!",
+    "avatar": undefined.Undefined,
+    "banner": undefined.Undefined,
+    "badges": 0,
+    "permissions": 0,
+    "email": undefined.Undefined,
+    "verified": undefined.Undefined,
+}
+USER = users.User(**USER_FIELDS)
+MESSAGE_FIELDS: typing.Final[dict[str, typing.Any]] = {
+    "author": USER,
+    "content": "Hello, World!",
+    "disguise": undefined.Undefined,
+}
+INSTANCE_INFO_FIELDS: typing.Final[dict[str, typing.Any]] = {
+    "instance_name": "WooChat",
+    "description": "The poggest place to chat",
+    "version": "0.3.3",
+    "message_limit": 2048,
+    "oprish_url": "https://example.com",
+    "pandemonium_url": "https://example.com",
+    "effis_url": "https://example.com",
+    "file_size": 20_000_000,
+    "attachment_file_size": 25_000_000,
+    "email_address": undefined.Undefined,
+    "rate_limits": undefined.Undefined,
+}
+
+CASES: typing.Final[tuple[tuple[type[typing.Any], dict[str, typing.Any]], ...]] = (
+    (users.User, USER_FIELDS),
+    (messaging.Message, MESSAGE_FIELDS),
+    (instance.InstanceInfo, INSTANCE_INFO_FIELDS),
+)
+
+
+def _compile_constructor(
+    cls: type[typing.Any],
+    method: str,
+    fields: dict[str, typing.Any],
+) -> typing.Callable[[], object]:
+    # Pass the arguments as literal keywords like the generated decoders do,
+    # rather than unpacking a dict.
+    arguments = ", ".join(f"{name}=fields[{name!r}]" for name in fields)
+    namespace = {"cls": cls, "fields": fields}
+    exec(f"def construct():\n    return cls{method}({arguments})", namespace)  # noqa: S102
+    return namespace["construct"]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for cls, fields in CASES:
+        for name, method in (("__init__", ""), ("_from_trusted", "._from_trusted")):
+            construct = _compile_constructor(cls, method, fields)
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                construct()
+
+            elapsed = time.perf_counter() - start
+            print(f"{cls.__name__ + ' ' + name:<28} {ITERATIONS / elapsed / 1e6:8.2f} M objects/s")
+
+
+if __name__ == "__main__":
+    main()
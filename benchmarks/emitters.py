@@ -0,0 +1,177 @@
+"""Compare the libcst and string-template emitters of ``generate-autodoc``.
+
+Both emitters render every module of the attrs backend and its raw
+TypedDict mirrors, including the ``__init__`` modules, which have to be
+byte-for-byte identical. This is checked and timed against the item snapshot
+in ``benchmarks/items``, and against a synthetic schema made by cloning every
+item of the snapshot under new names until it holds ``--items`` items::
+
+    python -m benchmarks.emitters --items 10000
+
+Exits with status 1 if any module differs. This requires the codegen
+dependencies, aiohttp and libcst.
+"""
+
+import argparse
+import copy
+import json
+import math
+import pathlib
+import sys
+import time
+import typing
+
+from codegen import gen, utils
+
+ITEMS_PATH: typing.Final[pathlib.Path] = pathlib.Path(__file__).parent / "items"
+REPEAT = 5
+
+Sources = tuple[dict[str, str], dict[str, str]]
+
+
+def load_items() -> tuple[str, list[utils.ItemInfo]]:
+    """Load the version and items of the item snapshot."""
+    index = json.loads((ITEMS_PATH / "index.json").read_text())
+    return index["version"], [
+        json.loads((ITEMS_PATH / name).read_text())
+        for name in index["items"]
+        if name.startswith("todel")
+    ]
+
+
+def _rename(field_type: str, suffix: str, names: typing.Container[str]) -> str:
+    name = field_type.removesuffix("[]")
+    return field_type.replace(name, name + suffix, 1) if name in names else field_type
+
+
+def _clone(item_info: utils.ItemInfo, suffix: str, names: typing.Container[str]) -> utils.ItemInfo:
+    # Renames the item and every reference to another item of the snapshot.
+    clone = copy.deepcopy(item_info)
+    clone["name"] += suffix
+    item = clone["item"]
+    field_lists = [item["fields"]] if item["type"] == "object" else []
+    if item["type"] == "enum":
+        for variant in item["variants"]:
+            if variant["type"] == "tuple":
+                variant["field_type"] = _rename(variant["field_type"], suffix, names)
+
+            elif variant["type"] == "object":
+                field_lists.append(variant["fields"])
+
+    for fields in field_lists:
+        for field in fields:
+            field["type"] = _rename(field["type"], suffix, names)
+
+    return clone
+
+
+def make_synthetic_items(
+    item_infos: typing.Sequence[utils.ItemInfo],
+    count: int,
+) -> list[utils.ItemInfo]:
+    """Clone the provided items under new names until there are at least ``count`` items."""
+    names = {item_info["name"] for item_info in item_infos}
+    return [
+        _clone(item_info, f"Copy{copy_index}", names)
+        for copy_index in range(math.ceil(count / len(item_infos)))
+        for item_info in item_infos
+    ]
+
+
+def resolve_items(item_infos: typing.Iterable[utils.ItemInfo]) -> dict[str, utils.AutodocItem]:
+    """Create items from their info and sort them by their dependencies."""
+    parsed = [utils.AutodocItem.from_item(item_info) for item_info in item_infos]
+    return gen.resolve_dependencies({item.name: item for item in parsed})
+
+
+def emit_libcst(items: dict[str, utils.AutodocItem], *, version: str) -> Sources:
+    """Emit all modules through libcst CST."""
+    parsed = gen.parse_items(items)
+    modules = gen.collect_module_items(parsed)
+    raw_modules = gen.collect_module_items(parsed, raw=True)
+    modules["__init__"] = gen.make_init_module(modules, version=version)
+    raw_modules["__init__"] = gen.make_raw_init_module(raw_modules)
+    return (
+        {name: module.code for name, module in modules.items()},
+        {name: module.code for name, module in raw_modules.items()},
+    )
+
+
+def emit_templates(items: dict[str, utils.AutodocItem], *, version: str) -> Sources:
+    """Emit all modules through string templates."""
+    modules = gen.render_module_sources(items)
+    raw_modules = gen.render_module_sources(items, raw=True)
+    modules["__init__"] = gen.render_init_module(modules, version=version)
+    raw_modules["__init__"] = gen.render_raw_init_module(raw_modules)
+    return modules, raw_modules
+
+
+def get_mismatches(expected: Sources, actual: Sources) -> list[str]:
+    """Get the names of the modules that differ between two sets of emitted modules."""
+    return sorted(
+        f"{prefix}{name}"
+        for prefix, expected_modules, actual_modules in zip(
+            ("", "raw/"),
+            expected,
+            actual,
+            strict=True,
+        )
+        for name in expected_modules.keys() | actual_modules.keys()
+        if expected_modules.get(name) != actual_modules.get(name)
+    )
+
+
+def _run(
+    label: str,
+    item_infos: typing.Sequence[utils.ItemInfo],
+    *,
+    version: str,
+    repeat: int,
+) -> bool:
+    # Items are resolved anew for every run, as parsing stores CST on them.
+    timings: dict[str, float] = {}
+    sources: dict[str, Sources] = {}
+    for emitter, emit in (("libcst", emit_libcst), ("templates", emit_templates)):
+        timings[emitter] = math.inf
+        for _ in range(repeat):
+            items = resolve_items(item_infos)
+            start = time.perf_counter()
+            sources[emitter] = emit(items, version=version)
+            timings[emitter] = min(timings[emitter], time.perf_counter() - start)
+
+    size = sum(len(code) for modules in sources["templates"] for code in modules.values())
+    print(f"{label}: {len(item_infos)} items, {size / 1024:.0f} KiB of code")
+    for emitter, timing in timings.items():
+        speedup = timings["libcst"] / timing
+        print(f"  {emitter:<12} {timing * 1e3:10.1f} ms {speedup:8.1f}x")
+
+    mismatches = get_mismatches(sources["libcst"], sources["templates"])
+    for name in mismatches:
+        print(f"  {name} differs between the emitters")
+
+    return not mismatches
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--items",
+        type=int,
+        default=10_000,
+        help="the number of items in the synthetic schema (default: 10000)",
+    )
+    args = parser.parse_args()
+
+    version, item_infos = load_items()
+    identical = _run("snapshot", item_infos, version=version, repeat=REPEAT)
+    # libcst takes minutes on the synthetic schema, so it is only run once.
+    synthetic = make_synthetic_items(item_infos, args.items)
+    identical &= _run("synthetic", synthetic, version=version, repeat=1)
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Measure recording and replaying gateway frames with an event log.
+
+The log holds a session: a ``HELLO`` and an ``AUTHENTICATED`` event, followed
+by the other events of the corpus over and over. A raw scan reads every frame
+without decoding it, a filtered scan only reads the block that contains the
+``AUTHENTICATED`` event, and a replay decodes events into their generated
+classes.
+"""
+
+import json
+import pathlib
+import tempfile
+import time
+import typing
+
+from eludris_autodoc import eventlog
+
+from .backends import CORPUS
+
+EVENTS = 1_000_000
+SESSION_OPS = ("HELLO", "AUTHENTICATED")
+
+
+def _bench(name: str, func: typing.Callable[[], int]) -> None:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        count = func()
+        best = min(best, time.perf_counter() - start)
+
+    print(f"{name:<24} {count:8d} events {best * 1e3:8.2f} ms {count / best / 1e6:8.2f} M events/s")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    frames = [(json.loads(frame)["op"], frame) for frame in CORPUS]
+    session = [frame for frame in frames if frame[0] in SESSION_OPS]
+    events = [frame for frame in frames if frame[0] not in SESSION_OPS]
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory, "gateway.log")
+        start = time.perf_counter()
+        with eventlog.EventLogWriter(path) as writer:
+            for op, frame in session:
+                writer.append(op, frame, timestamp=0)
+
+            for i in range(EVENTS - len(session)):
+                writer.append(*events[i % len(events)], timestamp=i)
+
+        elapsed = time.perf_counter() - start
+        rate = EVENTS / elapsed / 1e6
+        print(f"{'record':<24} {EVENTS:8d} events {elapsed * 1e3:8.2f} ms {rate:8.2f} M events/s")
+        with eventlog.EventLog.open(path) as log:
+
+            def scan(ops: typing.Collection[str] | None = None) -> int:
+                count = 0
+                for _ in log.scan(ops=ops):
+                    count += 1
+
+                return count
+
+            def replay() -> int:
+                return sum(1 for _ in log.replay(until=EVENTS // 10))
+
+            _bench("raw scan", scan)
+            _bench("scan AUTHENTICATED", lambda: scan({"AUTHENTICATED"}))
+            _bench("replay", replay)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Time decoding and encoding every JSON example from the eludris-autodoc docs.
+
+The examples are extracted into ``examples.json`` by ``generate-autodoc``.
+Both directions are timed for every example, giving every class with an
+example a baseline. Examples that are not valid JSON or do not round-trip
+are listed and skipped; ``tests/test_examples.py`` checks the round-trip of
+every example, and knows which of them are stale.
+"""
+
+import functools
+import json
+import pathlib
+import timeit
+import typing
+
+import eludris_autodoc
+
+NUMBER = 10_000
+EXAMPLES_PATH: typing.Final[pathlib.Path] = pathlib.Path(__file__).parent / "examples.json"
+
+
+def resolve_decoder(path: str) -> typing.Callable[[typing.Any], typing.Any]:
+    """Resolve the decoder of an example by its path relative to the package."""
+    obj: typing.Any = eludris_autodoc
+    for part in path.split("."):
+        obj = getattr(obj, part)
+
+    return obj
+
+
+def check_round_trip(
+    decode: typing.Callable[[typing.Any], typing.Any],
+    payload: object,
+) -> str | None:
+    """Decode and encode an example, and return why it does not round-trip, if it does not."""
+    try:
+        decoded = decode(payload)
+
+    except (KeyError, TypeError, ValueError) as exc:
+        return f"does not decode: {exc!r}"
+
+    encoded = decoded.to_payload() if hasattr(decoded, "to_payload") else decoded.value
+    if encoded != payload:
+        return f"encodes to {json.dumps(encoded)}"
+
+    return None
+
+
+def main() -> None:
+    """Run the benchmark."""
+    fixtures = json.loads(EXAMPLES_PATH.read_text())
+    for example in fixtures["invalid"]:
+        print(f"{example['name']:<32} invalid JSON: {example['error']}")
+
+    for example in fixtures["examples"]:
+        name, payload = example["name"], example["payload"]
+        decode = resolve_decoder(example["decoder"])
+        error = check_round_trip(decode, payload)
+        if error:
+            print(f"{name:<32} {error}")
+            continue
+
+        decoded = decode(payload)
+        encode = getattr(type(decoded), "to_payload", None)
+        decode_time = min(
+            timeit.repeat(functools.partial(decode, payload), number=NUMBER, repeat=5),
+        )
+        line = f"{name:<32} decode {decode_time / NUMBER * 1e6:8.2f} us"
+        if encode is not None:
+            encode_time = min(
+                timeit.repeat(functools.partial(encode, decoded), number=NUMBER, repeat=5),
+            )
+            line += f"  encode {encode_time / NUMBER * 1e6:8.2f} us"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
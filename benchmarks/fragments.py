@@ -0,0 +1,88 @@
+"""Count and time the CST that ``generate-autodoc`` builds with the libcst emitter.
+
+Annotations, ``attrs.field(...)`` calls and import lines are interned CST
+fragments, which are shared between all items. This counts the nodes of all
+modules once as a tree, counting shared nodes every time they appear, and
+once as distinct node objects. Parsing and collecting the items is timed
+with cold fragment caches. Both are done for the item snapshot in
+``benchmarks/items`` and a synthetic schema of ``--items`` items, see
+:mod:`benchmarks.emitters`::
+
+    python -m benchmarks.fragments --items 2000
+
+This requires the codegen dependencies, aiohttp and libcst.
+"""
+
+import argparse
+import math
+import time
+import typing
+
+import libcst
+
+from codegen import cst, gen, utils
+
+from .emitters import load_items, make_synthetic_items, resolve_items
+
+REPEAT = 5
+
+
+def count_nodes(modules: typing.Iterable[libcst.CSTNode]) -> tuple[int, int]:
+    """Count the nodes of the provided modules, and how many distinct node objects they are."""
+    total = 0
+    distinct: set[int] = set()
+    stack = list(modules)
+    while stack:
+        node = stack.pop()
+        total += 1
+        distinct.add(id(node))
+        stack.extend(node.children)
+
+    return total, len(distinct)
+
+
+def _collect(items: dict[str, utils.AutodocItem]) -> list[libcst.Module]:
+    parsed = gen.parse_items(items)
+    return [
+        *gen.collect_module_items(parsed).values(),
+        *gen.collect_module_items(parsed, raw=True).values(),
+    ]
+
+
+def _run(label: str, item_infos: typing.Sequence[utils.ItemInfo], *, repeat: int) -> None:
+    # Items are resolved anew for every run, as parsing stores CST on them.
+    timing = math.inf
+    for _ in range(repeat):
+        items = resolve_items(item_infos)
+        cst.clear_fragment_caches()
+        start = time.perf_counter()
+        modules = _collect(items)
+        timing = min(timing, time.perf_counter() - start)
+
+    total, distinct = count_nodes(modules)
+    hits, misses = cst.count_fragment_hits()
+    print(f"{label}: {len(item_infos)} items")
+    print(f"  parse and collect {timing * 1e3:12.1f} ms")
+    print(f"  nodes in tree     {total:12}")
+    print(f"  distinct nodes    {distinct:12} ({1 - distinct / total:.1%} shared)")
+    print(f"  fragments         {misses:12} made, {hits} reused")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--items",
+        type=int,
+        default=10_000,
+        help="the number of items in the synthetic schema (default: 10000)",
+    )
+    args = parser.parse_args()
+
+    _, item_infos = load_items()
+    _run("snapshot", item_infos, repeat=REPEAT)
+    _run("synthetic", make_synthetic_items(item_infos, args.items), repeat=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare the per-send cost of serializing client payloads with and without frame caching."""
+
+import json
+import timeit
+
+from eludris_autodoc import frames, gateway
+
+TOKEN = (
+    "eyJhbGciOiJIUzI1NiJ9.eyJ1c2VyX2lkIjoyMzQxMDY1MjYxMDU3LCJzZXNzaW9uX2lkIjoyMzQxMDgyNDMxNDg5fQ"  # noqa: S105
+    ".j-nMmVTLXplaC4opGdZH32DUSWt1yD9Tm9hgB9M6oi4"
+)
+NUMBER = 200_000
+
+
+def _encode(payload: frames.SupportsPayload) -> bytes:
+    return json.dumps(payload.to_payload(), separators=frames.SEPARATORS).encode()
+
+
+def _bench(name: str, func: object) -> None:
+    best = min(timeit.repeat(func, number=NUMBER, repeat=5))  # type: ignore
+    print(f"{name:<40} {best / NUMBER * 1e9:8.1f} ns/send")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    cache = frames.FrameCache()
+    ping = gateway.PingClientPayload(op="PING")
+    authenticate = gateway.AuthenticateClientPayload(op="AUTHENTICATE", d=TOKEN)
+
+    _bench("ping: construct + json", lambda: _encode(gateway.PingClientPayload(op="PING")))
+    _bench("ping: encode_frame", lambda: frames.encode_frame(ping))
+    _bench("ping: FrameCache.get", lambda: cache.get(ping))
+
+    _bench(
+        "authenticate: construct + json",
+        lambda: _encode(gateway.AuthenticateClientPayload(op="AUTHENTICATE", d=TOKEN)),
+    )
+    _bench("authenticate: FrameCache.get", lambda: cache.get(authenticate))
+
+    frame = cache.get(authenticate)
+    _bench("authenticate: reuse cached memoryview", lambda: frame)
+
+
+if __name__ == "__main__":
+    main()
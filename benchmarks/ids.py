@@ -0,0 +1,68 @@
+"""Compare per-id and batch timestamp extraction, and linear and indexed range queries."""
+
+import array
+import datetime
+import random
+import time
+
+from eludris_autodoc import ids
+
+IDS = 1_000_000
+QUERIES = 1_000
+
+
+def _make_ids(seed: int) -> "array.array[int]":
+    rng = random.Random(seed)
+    start = ids.min_id(datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc))
+    # Roughly one id per second over a couple of weeks.
+    return array.array("Q", (start + (rng.randrange(IDS * 1000) << 16) for _ in range(IDS)))
+
+
+def _report(name: str, elapsed: float, amount: int, unit: str) -> None:
+    print(f"{name:<24} {amount / elapsed / 1e6:8.2f} M {unit}/s")
+
+
+def _bench_timestamps(raw_ids: "array.array[int]") -> None:
+    start = time.perf_counter()
+    array.array("Q", [ids.timestamp(id_) for id_ in raw_ids])
+    _report("timestamp (per id)", time.perf_counter() - start, IDS, "ids")
+
+    start = time.perf_counter()
+    ids.timestamps(raw_ids)
+    _report("timestamps (batch)", time.perf_counter() - start, IDS, "ids")
+
+    start = time.perf_counter()
+    ids.relative_timestamps(raw_ids)
+    _report("relative_timestamps", time.perf_counter() - start, IDS, "ids")
+
+
+def _bench_ranges(raw_ids: "array.array[int]") -> None:
+    rng = random.Random(1)
+    bounds: list[tuple[int, int]] = []
+    for _ in range(QUERIES):
+        lower = rng.choice(raw_ids)
+        bounds.append((lower, lower + (60_000 << 16)))
+
+    start = time.perf_counter()
+    for lower, upper in bounds[:10]:
+        [id_ for id_ in raw_ids if lower <= id_ <= upper]
+    elapsed = (time.perf_counter() - start) / 10
+    print(f"{'range (linear scan)':<24} {elapsed * 1e6:8.2f} us/query")
+
+    index = ids.SortedIds(raw_ids)
+    start = time.perf_counter()
+    for lower, upper in bounds:
+        index.between(lower, upper)
+    elapsed = (time.perf_counter() - start) / QUERIES
+    print(f"{'range (SortedIds)':<24} {elapsed * 1e6:8.2f} us/query")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    raw_ids = _make_ids(0)
+    _bench_timestamps(raw_ids)
+    _bench_ranges(raw_ids)
+
+
+if __name__ == "__main__":
+    main()
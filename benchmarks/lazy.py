@@ -0,0 +1,86 @@
+"""Compare eager and lazy decoding for handlers that touch few or all fields of a payload."""
+
+import time
+import typing
+
+from eludris_autodoc import gateway, lazy
+
+ITERATIONS = 20_000
+
+RATE_LIMIT = {"reset_after": 10, "limit": 5}
+FILE_RATE_LIMIT = {"reset_after": 60, "limit": 5, "file_size_limit": 30_000_000}
+OPRISH_ROUTES = (
+    "get_instance_info",
+    "create_message",
+    "create_user",
+    "verify_user",
+    "get_user",
+    "guest_get_user",
+    "update_user",
+    "update_profile",
+    "delete_user",
+    "create_password_reset_code",
+    "reset_password",
+    "create_session",
+    "get_sessions",
+    "delete_session",
+)
+HELLO: typing.Final[dict[str, typing.Any]] = {
+    "op": "HELLO",
+    "d": {
+        "heartbeat_interval": 45000,
+        "instance_info": {
+            "instance_name": "EmreLand",
+            "description": "More based than Oliver's instance (trust)",
+            "version": "0.3.3",
+            "message_limit": 2048,
+            "oprish_url": "https://example.com",
+            "pandemonium_url": "https://example.com",
+            "effis_url": "https://example.com",
+            "file_size": 20_000_000,
+            "attachment_file_size": 100_000_000,
+            "rate_limits": {
+                "oprish": {route: RATE_LIMIT for route in OPRISH_ROUTES},
+                "pandemonium": RATE_LIMIT,
+                "effis": {
+                    "assets": FILE_RATE_LIMIT,
+                    "attachments": FILE_RATE_LIMIT,
+                    "fetch_file": RATE_LIMIT,
+                },
+            },
+        },
+        "rate_limit": RATE_LIMIT,
+    },
+}
+
+
+def _touch_few(payload: gateway.HelloServerPayload) -> object:
+    return payload.heartbeat_interval
+
+
+def _touch_all(payload: gateway.HelloServerPayload) -> object:
+    return payload.to_payload()
+
+
+def _decode_eager(raw: typing.Mapping[str, typing.Any]) -> gateway.HelloServerPayload:
+    return gateway.HelloServerPayload.from_payload(raw)
+
+
+def _decode_lazy(raw: typing.Mapping[str, typing.Any]) -> gateway.HelloServerPayload:
+    return lazy.from_payload(gateway.HelloServerPayload, raw)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for handler_name, handler in (("few fields", _touch_few), ("all fields", _touch_all)):
+        for decoder_name, decode in (("eager", _decode_eager), ("lazy", _decode_lazy)):
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                handler(decode(HELLO))
+
+            elapsed = (time.perf_counter() - start) / ITERATIONS
+            print(f"{handler_name + ', ' + decoder_name:<20} {elapsed * 1e6:8.2f} us/payload")
+
+
+if __name__ == "__main__":
+    main()
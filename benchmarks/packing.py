@@ -0,0 +1,113 @@
+"""Compare the size and speed of packed payloads against JSON.
+
+The packed MessagePack codec requires msgpack to be installed. Packed arrays
+are also serialized with JSON, which shows the gains of the positional layout
+on its own.
+"""
+
+import json
+import timeit
+import typing
+
+from eludris_autodoc import gateway, packing
+
+from .backends import CORPUS
+
+NUMBER = 200
+
+Codec = tuple[
+    typing.Callable[[gateway.ServerPayload], bytes],
+    typing.Callable[[bytes], gateway.ServerPayload],
+]
+
+
+def _make_json_codec() -> Codec:
+    def encode(payload: gateway.ServerPayload) -> bytes:
+        return json.dumps(payload.to_payload(), separators=(",", ":")).encode()
+
+    def decode(frame: bytes) -> gateway.ServerPayload:
+        return gateway.decode_server_payload(json.loads(frame))
+
+    return encode, decode
+
+
+def _make_packed_json_codec() -> Codec:
+    def encode(payload: gateway.ServerPayload) -> bytes:
+        packed = packing.pack(payload, gateway.ServerPayload)
+        return json.dumps(packed, separators=(",", ":")).encode()
+
+    def decode(frame: bytes) -> gateway.ServerPayload:
+        return packing.unpack(gateway.ServerPayload, json.loads(frame))
+
+    return encode, decode
+
+
+def _make_msgpack_codec() -> Codec | None:
+    try:
+        import msgpack
+    except ImportError:
+        return None
+
+    def encode(payload: gateway.ServerPayload) -> bytes:
+        return msgpack.packb(payload.to_payload())
+
+    def decode(frame: bytes) -> gateway.ServerPayload:
+        return gateway.decode_server_payload(msgpack.unpackb(frame))
+
+    return encode, decode
+
+
+def _make_packed_msgpack_codec() -> Codec | None:
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        return None
+
+    def encode(payload: gateway.ServerPayload) -> bytes:
+        return packing.dumps(payload, gateway.ServerPayload)
+
+    def decode(frame: bytes) -> gateway.ServerPayload:
+        return packing.loads(gateway.ServerPayload, frame)
+
+    return encode, decode
+
+
+def _bench(name: str, codec: Codec, payloads: typing.Sequence[gateway.ServerPayload]) -> None:
+    encode, decode = codec
+    frames = [encode(payload) for payload in payloads]
+    size = sum(map(len, frames)) / len(frames)
+
+    def run_encode() -> None:
+        for payload in payloads:
+            encode(payload)
+
+    def run_decode() -> None:
+        for frame in frames:
+            decode(frame)
+
+    print(f"{name:<24} {size:8.1f} bytes/payload")
+    for operation, func in (("encode", run_encode), ("decode", run_decode)):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name + ' ' + operation:<24} {best / len(payloads) * 1e6:8.2f} us/payload")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    payloads = [gateway.decode_server_payload(json.loads(frame)) for frame in CORPUS]
+    codecs: dict[str, Codec | None] = {
+        "json": _make_json_codec(),
+        "packed json": _make_packed_json_codec(),
+        "msgpack": _make_msgpack_codec(),
+        "packed msgpack": _make_packed_msgpack_codec(),
+    }
+
+    for name, codec in codecs.items():
+        if codec is None:
+            print(f"{name:<24} skipped, msgpack is not installed")
+            continue
+
+        _bench(name, codec, payloads)
+
+
+if __name__ == "__main__":
+    main()
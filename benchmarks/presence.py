@@ -0,0 +1,92 @@
+"""Compare memory use and throughput of a PresenceTable with a dict of Status objects."""
+
+import random
+import time
+import tracemalloc
+import typing
+
+from eludris_autodoc import presence, users
+
+USERS = 200_000
+TEXTS = ("BURY THE LIGHT DEEP WITHIN", "ayúdame por favor", "brb", "")
+
+
+def _make_statuses(seed: int) -> list[tuple[int, users.Status]]:
+    rng = random.Random(seed)
+    statuses: list[tuple[int, users.Status]] = []
+    for user_id in range(USERS):
+        text = rng.choice(TEXTS)
+        status = users.Status(
+            type=rng.choice(users.STATUS_TYPE_MEMBERS),
+            # Each user receives their own string object, like they would when decoding.
+            text="".join(text) if text else users.undefined.Undefined,
+        )
+        statuses.append((1 << 40 | user_id, status))
+
+    return statuses
+
+
+def _measure(name: str, store: typing.Callable[[list[tuple[int, users.Status]]], object]) -> None:
+    statuses = _make_statuses(0)
+    start = time.perf_counter()
+    store(statuses)
+    elapsed = time.perf_counter() - start
+    del statuses
+
+    # Statuses are created while tracing, so the memory of any Status objects
+    # that the store keeps alive is counted as well.
+    tracemalloc.start()
+    statuses = _make_statuses(0)
+    kept = store(statuses)
+    del statuses
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+
+    print(f"{name:<20} {size / USERS:8.1f} B/user {USERS / elapsed / 1e6:8.2f} M updates/s")
+
+
+def _store_dict(statuses: list[tuple[int, users.Status]]) -> object:
+    table: dict[int, users.Status] = {}
+    for user_id, status in statuses:
+        table[user_id] = status
+
+    return table
+
+
+def _store_table(statuses: list[tuple[int, users.Status]]) -> object:
+    table = presence.PresenceTable()
+    for user_id, status in statuses:
+        table.set(user_id, status)
+
+    return table
+
+
+def _bench_lookups() -> None:
+    table = presence.PresenceTable()
+    for user_id, status in _make_statuses(0):
+        table.set(user_id, status)
+
+    user_ids = [1 << 40 | user_id for user_id in range(USERS)]
+    for name, lookup in (("get_type", table.get_type), ("get", table.get)):
+        start = time.perf_counter()
+        for user_id in user_ids:
+            lookup(user_id)
+
+        elapsed = time.perf_counter() - start
+        print(f"{'lookup: ' + name:<20} {USERS / elapsed / 1e6:8.2f} M lookups/s")
+
+    start = time.perf_counter()
+    table.snapshot()
+    print(f"{'snapshot':<20} {(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    _measure("dict[int, Status]", _store_dict)
+    _measure("PresenceTable", _store_table)
+    _bench_lookups()
+
+
+if __name__ == "__main__":
+    main()
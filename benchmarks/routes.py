@@ -0,0 +1,288 @@
+"""Request the generated routes from a local HTTP stand-in for Oprish and Effis.
+
+The routes module is rendered from the route items in ``benchmarks/items``
+and is loaded into the eludris-autodoc package. A local HTTP/1.1 server then
+stands in for both services. It answers every route with a synthetic payload
+of the route's response type, and records every request it receives. The
+routes are checked against it in ``tests/test_rest.py``.
+
+A single route is requested ``--requests`` times, both through the keep-alive
+connection pool of :class:`rest.Client` and with a new connection for every
+request::
+
+    python -m benchmarks.routes --requests 2000 --concurrency 16
+
+This requires the codegen dependencies, aiohttp and libcst.
+"""
+
+import argparse
+import asyncio
+import http.server
+import importlib.util
+import json
+import pathlib
+import re
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import types
+import typing
+import urllib.parse
+
+from codegen import routes, utils
+from eludris_autodoc import rest
+
+from .emitters import ITEMS_PATH, load_items, resolve_items
+from .synthetic import PayloadGenerator, resolve
+
+PATH_PARAMS: typing.Final[dict[str, object]] = {
+    "identifier": "yendri",
+    "session_id": 2312155037697,
+    "id": 1173270749609985,
+}
+FORMAT_REPEAT = 100_000
+
+
+def load_routes() -> list[utils.RouteInfo]:
+    """Load the route items of the item snapshot."""
+    index = json.loads((ITEMS_PATH / "index.json").read_text())
+    return [
+        json.loads((ITEMS_PATH / name).read_text())
+        for name in index["items"]
+        if not name.startswith("todel")
+    ]
+
+
+def import_routes(source: str, directory: pathlib.Path) -> types.ModuleType:
+    """Import a rendered routes module from a directory into the eludris-autodoc package.
+
+    The package holds the types and runtime modules the routes module imports.
+    """
+    path = directory / f"{routes.ROUTES_MODULE}.py"
+    path.write_text(source)
+    name = f"eludris_autodoc.{routes.ROUTES_MODULE}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Response(typing.NamedTuple):
+    status: int
+    content_type: str
+    body: bytes
+
+
+NOT_FOUND: typing.Final[_Response] = _Response(
+    404,
+    "application/json",
+    b'{"type":"NOT_FOUND","status":404}',
+)
+
+
+class StandIn(http.server.ThreadingHTTPServer):
+    """Answers requests to the routes with canned responses, and records them."""
+
+    def __init__(self, responses: dict[tuple[str, typing.Pattern[str]], _Response]) -> None:
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+        self.responses = responses
+        self.requests: list[tuple[str, str, bytes]] = []
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """The URL of this stand-in, for both services."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StandInHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and bodies are written separately, which stalls keep-alive
+    # connections on delayed acknowledgements otherwise.
+    disable_nagle_algorithm = True
+    server: StandIn
+
+    def setup(self) -> None:
+        # Handlers are made for every connection rather than every request.
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _handle(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path, body))
+
+        path = urllib.parse.urlsplit(self.path).path
+        response = next(
+            (
+                response
+                for (method, pattern), response in self.server.responses.items()
+                if method == self.command and pattern.fullmatch(path)
+            ),
+            NOT_FOUND,
+        )
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    # http.server dispatches requests to methods named after their HTTP method.
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle  # noqa: N815
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def _make_pattern(route: rest.Route[typing.Any, typing.Any]) -> typing.Pattern[str]:
+    literals = re.split(r"\{\w+\}", route.path)
+    return re.compile(r"[^/]+".join(map(re.escape, literals)))
+
+
+def make_responses(
+    table: typing.Mapping[str, rest.Route[typing.Any, typing.Any]],
+    items: typing.Mapping[str, utils.AutodocItem],
+    generator: PayloadGenerator,
+) -> dict[str, tuple[_Response, typing.Any]]:
+    """Make a synthetic response of every route, along with the payload it holds."""
+    responses: dict[str, tuple[_Response, typing.Any]] = {}
+    for name, route in table.items():
+        if route.response_type is None:
+            responses[name] = _Response(200, "application/json", b""), None
+            continue
+
+        type_name = route.response_type.removesuffix("[]")
+        if type_name in utils.TYPE_MAPPING:
+            data = b"\x89PNG\r\n\x1a\n"
+            responses[name] = _Response(200, "application/octet-stream", data), data
+            continue
+
+        cls = resolve(f"{items[type_name].category}.{type_name}")
+        if route.response_type.endswith("[]"):
+            payload = [generator.generate(cls).to_payload() for _ in range(3)]
+
+        else:
+            payload = generator.generate(cls).to_payload()
+
+        responses[name] = _Response(200, "application/json", json.dumps(payload).encode()), payload
+
+    return responses
+
+
+def serve(
+    table: typing.Mapping[str, rest.Route[typing.Any, typing.Any]],
+    responses: typing.Mapping[str, tuple[_Response, typing.Any]],
+) -> StandIn:
+    """Serve the responses of the routes from a stand-in, in a daemon thread.
+
+    Requests for the user ``missing`` are answered with a 404.
+    """
+    server = StandIn(
+        {
+            ("GET", re.compile("/users/missing")): NOT_FOUND,
+            **{
+                (route.method, _make_pattern(route)): responses[name][0]
+                for name, route in table.items()
+            },
+        },
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _time_requests(
+    route: rest.Route[typing.Any, typing.Any],
+    url: str,
+    *,
+    requests: int,
+    concurrency: int,
+    pooled: bool,
+) -> float:
+    async def request_pooled(client: rest.Client) -> None:
+        for _ in range(requests // concurrency):
+            await client.request(route, identifier=PATH_PARAMS["identifier"])
+
+    async def request_unpooled() -> None:
+        for _ in range(requests // concurrency):
+            async with rest.Client(oprish_url=url) as client:
+                await client.request(route, identifier=PATH_PARAMS["identifier"])
+
+    start = time.perf_counter()
+    if pooled:
+        async with rest.Client(oprish_url=url, max_connections=concurrency) as client:
+            await asyncio.gather(*[request_pooled(client) for _ in range(concurrency)])
+
+    else:
+        await asyncio.gather(*[request_unpooled() for _ in range(concurrency)])
+
+    return time.perf_counter() - start
+
+
+def _time_formatting(
+    route: rest.Route[typing.Any, typing.Any],
+    template: str,
+) -> tuple[float, float]:
+    # Compares the compiled path template with substituting the Rocket route on every call.
+    pattern = re.compile(r"<(\w+)(?:\.\.)?>")
+    params = PATH_PARAMS
+
+    def substitute() -> str:
+        return pattern.sub(
+            lambda match: urllib.parse.quote(str(params[match[1]]), safe=""),
+            template.partition("?")[0],
+        )
+
+    assert substitute() == route.format_path(params)
+    compiled = timeit.timeit(lambda: route.format_path(params), number=FORMAT_REPEAT)
+    return compiled / FORMAT_REPEAT, timeit.timeit(substitute, number=FORMAT_REPEAT) / FORMAT_REPEAT
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    _, item_infos = load_items()
+    items = resolve_items(item_infos)
+    route_infos = load_routes()
+    source = routes.render_routes_module(route_infos, cache=items)
+    with tempfile.TemporaryDirectory() as directory:
+        table = import_routes(source, pathlib.Path(directory)).ROUTES
+
+    server = serve(table, make_responses(table, items, PayloadGenerator(seed=0)))
+    route = table["get_user"]
+    print(f"{'':<24} {'ms':>10} {'req/s':>10} {'connections':>12}")
+    for label, pooled in (("keep-alive pool", True), ("connection per request", False)):
+        server.connections = 0
+        timing = asyncio.run(
+            _time_requests(
+                route,
+                server.url,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                pooled=pooled,
+            ),
+        )
+        print(
+            f"{label:<24} {timing * 1e3:>10.1f} {args.requests / timing:>10.0f}"
+            f" {server.connections:>12}",
+        )
+
+    template = next(info["item"]["route"] for info in route_infos if info["name"] == "get_user")
+    compiled, substituted = _time_formatting(route, template)
+    print(f"format path: compiled {compiled * 1e9:.0f} ns, substituted {substituted * 1e9:.0f} ns")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
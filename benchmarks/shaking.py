@@ -0,0 +1,115 @@
+"""Compare the full eludris-autodoc package with one tree-shaken from root types.
+
+Both packages are generated from the item snapshot in ``benchmarks/items``
+into a temporary directory, along with the runtime modules. The time and
+memory it takes to import them is then measured in fresh interpreters::
+
+    python -m benchmarks.shaking --root gateway.ServerPayload
+
+This requires the codegen dependencies, aiohttp and libcst.
+"""
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+from codegen import gen, utils
+
+from .emitters import load_items, resolve_items
+
+REPEAT = 20
+TIME_SCRIPT = """
+import time
+
+start = time.perf_counter()
+import eludris_autodoc
+print(time.perf_counter() - start)
+"""
+MEMORY_SCRIPT = """
+import tracemalloc
+
+tracemalloc.start()
+import eludris_autodoc
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+
+def _write_package(
+    items: dict[str, utils.AutodocItem],
+    target_dir: pathlib.Path,
+    *,
+    version: str,
+) -> int:
+    # Returns the size of the generated code.
+    modules = gen.render_module_sources(items)
+    raw_modules = gen.render_module_sources(items, raw=True)
+    modules["__init__"] = gen.render_init_module(modules, version=version)
+    raw_modules["__init__"] = gen.render_raw_init_module(raw_modules)
+
+    # Formatting is irrelevant here, so the modules are written as is.
+    (target_dir / "raw").mkdir(parents=True)
+    for prefix, package in ((target_dir, modules), (target_dir / "raw", raw_modules)):
+        for name, code in package.items():
+            (prefix / name).with_suffix(".py").write_text(code)
+
+    gen.copy_runtime_modules(target_dir)
+    return sum(len(code) for code in (*modules.values(), *raw_modules.values()))
+
+
+def _run_script(path: pathlib.Path, script: str) -> float:
+    # Runs from the package's parent so the eludris-autodoc checkout is not imported.
+    return float(
+        subprocess.run(
+            [sys.executable, "-c", script],  # noqa: S603
+            cwd=path,
+            env={**os.environ, "PYTHONPATH": str(path)},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout,
+    )
+
+
+def _measure_import(path: pathlib.Path) -> tuple[float, float]:
+    # The first import compiles the package, which is not timed.
+    memory = _run_script(path, MEMORY_SCRIPT)
+    timing = min(_run_script(path, TIME_SCRIPT) for _ in range(REPEAT))
+    return timing, memory
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--root",
+        nargs="+",
+        dest="roots",
+        default=["gateway.ServerPayload"],
+        help="the types to shake the package down to (default: gateway.ServerPayload)",
+    )
+    args = parser.parse_args()
+
+    version, item_infos = load_items()
+    packages: dict[str, dict[str, utils.AutodocItem]] = {
+        "full": resolve_items(item_infos),
+        "shaken": gen.shake_items(resolve_items(item_infos), args.roots),
+    }
+
+    print(f"{'':<8} {'items':>6} {'modules':>8} {'code KiB':>9} {'import ms':>10} {'KiB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, items in packages.items():
+            path = pathlib.Path(directory) / label
+            size = _write_package(items, path / "eludris_autodoc", version=version)
+            timing, memory = _measure_import(path)
+            modules = {item.category for item in items.values()}
+            print(
+                f"{label:<8} {len(items):>6} {len(modules):>8} {size / 1024:>9.0f}"
+                f" {timing * 1e3:>10.2f} {memory / 1024:>8.0f}",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare restarting from a snapshot against decoding an ``AUTHENTICATED`` payload.
+
+Both sides end with the first user lookup being served. The snapshot is
+opened cold every time, so the numbers include mapping the file.
+"""
+
+import json
+import pathlib
+import tempfile
+import timeit
+
+import attrs
+
+from eludris_autodoc import gateway, presence, snapshot
+
+from .backends import CORPUS
+
+NUMBER = 20
+USERS = 10_000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    authenticated = next(
+        payload
+        for payload in map(gateway.decode_server_payload, map(json.loads, CORPUS))
+        if isinstance(payload, gateway.AuthenticatedServerPayload)
+    )
+    template = authenticated.users[0]
+    users = [attrs.evolve(template, id=template.id + i, username=f"user{i}") for i in range(USERS)]
+    frame = json.dumps(attrs.evolve(authenticated, users=users).to_payload())
+    presences = presence.PresenceTable()
+    for user in users:
+        presences.set(user.id, user.status)
+
+    user_id = users[-1].id
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory, "state.snapshot")
+        snapshot.save(path, users=users, presences=presences)
+
+        def decode() -> object:
+            payload = gateway.decode_server_payload(json.loads(frame))
+            return {user.id: user for user in payload.users}[user_id]
+
+        def restore() -> object:
+            with snapshot.Snapshot.open(path) as state:
+                return state.get_user(user_id).to_user()
+
+        print(f"{USERS} users, frame {len(frame)} bytes, snapshot {path.stat().st_size} bytes")
+        for name, func in (("decode AUTHENTICATED", decode), ("open snapshot", restore)):
+            best = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+            print(f"{name:<24} {best * 1e3:8.3f} ms to first lookup")
+
+
+if __name__ == "__main__":
+    main()
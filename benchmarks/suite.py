@@ -0,0 +1,203 @@
+"""Run the pyperf benchmark suite over codegen and runtime hot paths.
+
+Benchmarks are grouped, and ``--group`` selects which groups to run:
+
+* ``codegen``: every stage of ``generate-autodoc``, against the item
+  snapshot in ``benchmarks/items`` served from a local HTTP server.
+* ``import``: importing the eludris-autodoc package in a fresh interpreter.
+* ``construct``: constructing every generated class.
+* ``dispatch``: decoding every union through its tag or decision tree.
+* ``codec``: decoding and encoding every generated class.
+
+Payloads are generated by :mod:`benchmarks.synthetic` with a fixed seed.
+Results are written with pyperf's ``-o`` option, and compared against a
+saved baseline with :mod:`benchmarks.compare`::
+
+    python -m benchmarks.suite --fast -o results.json
+    python -m benchmarks.compare baseline.json results.json
+
+This requires `pyperf <https://pypi.org/project/pyperf/>`_, and the codegen
+group requires the codegen dependencies, aiohttp and libcst.
+"""
+
+import argparse
+import asyncio
+import functools
+import http.server
+import pathlib
+import sys
+import tempfile
+import threading
+import types
+import typing
+
+import attrs
+import pyperf
+
+import eludris_autodoc
+
+from .synthetic import PayloadGenerator
+
+GROUPS: typing.Final[tuple[str, ...]] = ("codegen", "import", "construct", "dispatch", "codec")
+ITEMS_PATH: typing.Final[pathlib.Path] = pathlib.Path(__file__).parent / "items"
+DISPATCH_PAYLOADS = 100
+
+
+def _loop(loops: int, func: typing.Callable[..., object], *args: object) -> float:
+    range_it = range(loops)
+    start = pyperf.perf_counter()
+    for _ in range_it:
+        func(*args)
+
+    return pyperf.perf_counter() - start
+
+
+def _get_classes() -> list[type[typing.Any]]:
+    return [
+        obj for obj in vars(eludris_autodoc).values() if isinstance(obj, type) and attrs.has(obj)
+    ]
+
+
+def _get_unions() -> dict[str, tuple[types.UnionType, typing.Callable[[typing.Any], object]]]:
+    # Unions are decoded by the function named after them, e.g. decode_server_payload.
+    unions: dict[str, tuple[types.UnionType, typing.Callable[[typing.Any], object]]] = {}
+    for name, obj in vars(eludris_autodoc).items():
+        if isinstance(obj, types.UnionType):
+            snake_name = "".join(f"_{char.lower()}" if char.isupper() else char for char in name)
+            unions[name] = (obj, getattr(eludris_autodoc, f"decode{snake_name}"))
+
+    return unions
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def _serve_items() -> str:
+    # Serves the item snapshot for the lifetime of the process.
+    handler = functools.partial(_QuietHandler, directory=str(ITEMS_PATH))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def _bench_codegen(runner: pyperf.Runner) -> None:
+    import aiohttp
+    import yarl
+
+    from codegen import gen
+
+    url_base = yarl.URL(_serve_items())
+
+    async def fetch() -> dict[str, typing.Any]:
+        async with aiohttp.ClientSession() as session:
+            _, names = await gen.fetch_index(session=session, url_base=url_base)
+            return await gen.fetch_items(names, session=session, url_base=url_base)
+
+    items = asyncio.run(fetch())
+    unsorted_items = dict(reversed(items.items()))
+    parsed = gen.parse_items(items)
+    modules = gen.collect_module_items(parsed)
+    raw_modules = gen.collect_module_items(parsed, raw=True)
+    target_dir = pathlib.Path(tempfile.mkdtemp())
+
+    runner.bench_async_func("codegen.fetch_items", fetch)
+    runner.bench_time_func(
+        "codegen.resolve_dependencies",
+        _loop,
+        gen.resolve_dependencies,
+        unsorted_items,
+    )
+    runner.bench_time_func("codegen.parse_items", _loop, gen.parse_items, items)
+    runner.bench_time_func("codegen.collect_module_items", _loop, gen.collect_module_items, parsed)
+    # Only writing is timed, as the formatters run in pre-commit subprocesses.
+    runner.bench_func(
+        "codegen.write_modules",
+        functools.partial(
+            gen.write_modules,
+            modules,
+            raw_modules,
+            target_dir=target_dir,
+            run_formatters=False,
+        ),
+    )
+
+
+def _bench_import(runner: pyperf.Runner) -> None:
+    # Interpreter startup on its own, to subtract from the import.
+    runner.bench_command("import.python", [sys.executable, "-c", "pass"])
+    runner.bench_command("import.eludris_autodoc", [sys.executable, "-c", "import eludris_autodoc"])
+
+
+def _bench_construct(runner: pyperf.Runner, generator: PayloadGenerator) -> None:
+    for cls in _get_classes():
+        obj = generator.generate(cls)
+        # attrs strips leading underscores from the names of init arguments.
+        kwargs = {field.name.lstrip("_"): getattr(obj, field.name) for field in attrs.fields(cls)}
+        runner.bench_time_func(f"construct.{cls.__name__}", _loop, functools.partial(cls, **kwargs))
+
+
+def _bench_dispatch(runner: pyperf.Runner, generator: PayloadGenerator) -> None:
+    for name, (union, decode) in _get_unions().items():
+        payloads = list(generator.generate_payloads(union, DISPATCH_PAYLOADS))
+
+        def decode_all(
+            payloads: list[dict[str, typing.Any]] = payloads,
+            decode: typing.Callable[[typing.Any], object] = decode,
+        ) -> None:
+            for payload in payloads:
+                decode(payload)
+
+        runner.bench_time_func(f"dispatch.{name}", _loop, decode_all, inner_loops=DISPATCH_PAYLOADS)
+
+
+def _bench_codec(runner: pyperf.Runner, generator: PayloadGenerator) -> None:
+    for cls in _get_classes():
+        obj = generator.generate(cls)
+        payload = obj.to_payload()
+        runner.bench_time_func(f"decode.{cls.__name__}", _loop, cls.from_payload, payload)
+        runner.bench_time_func(f"encode.{cls.__name__}", _loop, cls.to_payload, obj)
+
+
+def _add_cmdline_args(cmd: list[str], args: argparse.Namespace) -> None:
+    # Workers are spawned with only pyperf's own options otherwise.
+    cmd.extend(("--group", *args.group))
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    # Workers run the suite as a module, as it imports the rest of the benchmarks relatively.
+    runner = pyperf.Runner(
+        add_cmdline_args=_add_cmdline_args,
+        program_args=("-m", "benchmarks.suite"),
+    )
+    runner.argparser.add_argument(
+        "--group",
+        nargs="+",
+        choices=GROUPS,
+        default=list(GROUPS),
+        help="the groups of benchmarks to run (default: all)",
+    )
+    groups = runner.parse_args().group
+
+    # Every group gets its own generator, so that its payloads do not depend
+    # on which other groups are run.
+    if "codegen" in groups:
+        _bench_codegen(runner)
+
+    if "import" in groups:
+        _bench_import(runner)
+
+    if "construct" in groups:
+        _bench_construct(runner, PayloadGenerator(seed=0))
+
+    if "dispatch" in groups:
+        _bench_dispatch(runner, PayloadGenerator(seed=0))
+
+    if "codec" in groups:
+        _bench_codec(runner, PayloadGenerator(seed=0))
+
+
+if __name__ == "__main__":
+    main()
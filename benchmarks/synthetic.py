@@ -0,0 +1,280 @@
+"""Generate seeded, synthetic payloads to benchmark against.
+
+Payloads are generated from the ``_field_types`` table of every generated
+class, so they always decode, and the same seed and options always produce
+the same payloads. Strings also respect the ``_LENGTH_LIMITS`` of their class,
+so payloads pass validation; upper limits that depend on the instance, such as
+``message_limit``, are left to ``string_length``. Unions, such as
+``ServerPayload``, pick one of their variants at random for every payload.
+Fields named ``id`` or ending in ``_id`` draw from a fixed pool of realistic
+ids, so that caches see repeated keys.
+
+Write a corpus of raw payloads as JSON lines::
+
+    python -m benchmarks.synthetic gateway.ServerPayload -n 1000000 --seed 1 > corpus.jsonl
+
+Fields of arbitrary type, such as the file of a ``FileUpload``, are random
+bytes, which are written as base64 strings.
+
+or use :class:`PayloadGenerator` from another benchmark.
+"""
+
+import argparse
+import base64
+import enum
+import ipaddress
+import json
+import random
+import string
+import sys
+import types
+import typing
+
+import attrs
+
+import eludris_autodoc
+from eludris_autodoc import frames, ids, undefined, validation
+
+_ValueFactory = typing.Callable[[], object]
+_ALPHABET: typing.Final[str] = string.ascii_letters + string.digits + " .,!?-_áéñü😀"
+_EDGE_ALPHABET: typing.Final[str] = _ALPHABET.replace(" ", "")
+"""The characters strings that are trimmed by the server start and end with."""
+_EVEN_ODDS: typing.Final[float] = 0.5
+"""The chance to pick either of two options, such as IPv4 or IPv6 addresses."""
+
+
+def resolve(name: str) -> type[typing.Any] | types.UnionType:
+    """Resolve a generated class or union by name, e.g. ``gateway.ServerPayload``."""
+    obj: object = eludris_autodoc
+    for part in name.split("."):
+        obj = getattr(obj, part)
+
+    if not isinstance(obj, type | types.UnionType):
+        msg = f"{name} is not a generated class or union"
+        raise TypeError(msg)
+
+    return obj
+
+
+@attrs.define(kw_only=True)
+class PayloadGenerator:
+    """A seeded generator of random payloads."""
+
+    seed: int = 0
+    """The seed of the random number generator."""
+    undefined_rate: float = 0.25
+    """The chance that an omittable field is left out."""
+    none_rate: float = 0.25
+    """The chance that a nullable field is ``None``."""
+    string_length: tuple[int, int] = (0, 32)
+    """The inclusive range of the length of generated strings."""
+    list_size: tuple[int, int] = (0, 8)
+    """The inclusive range of the size of generated lists."""
+    id_pool: int = 1000
+    """The amount of distinct ids to generate fields named ``id`` or ``*_id`` from."""
+
+    _random: random.Random = attrs.field(init=False)
+    _ids: list[int] = attrs.field(init=False)
+    _factories: dict[object, _ValueFactory] = attrs.field(init=False, factory=dict)
+
+    def __attrs_post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+        self._ids = [
+            (self._random.getrandbits(40) << ids.TIMESTAMP_SHIFT) | self._random.getrandbits(16)
+            for _ in range(self.id_pool)
+        ]
+
+    def _make_string(self) -> str:
+        length = self._random.randint(*self.string_length)
+        return "".join(self._random.choices(_ALPHABET, k=length))
+
+    def _get_string_factory(self, limits: tuple[int, int | str | None, bool]) -> _ValueFactory:
+        lower, upper, trimmed = limits
+        rng = self._random
+        min_length = max(self.string_length[0], lower)
+        max_length = self.string_length[1] if not isinstance(upper, int) else upper
+        max_length = max(min(self.string_length[1], max_length), min_length)
+
+        def make_string() -> str:
+            chars = rng.choices(_ALPHABET, k=rng.randint(min_length, max_length))
+            if trimmed and chars:
+                # The length of these is checked without surrounding whitespace.
+                chars[0], chars[-1] = rng.choice(_EDGE_ALPHABET), rng.choice(_EDGE_ALPHABET)
+
+            return "".join(chars)
+
+        return make_string
+
+    def _make_ip(self) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+        if self._random.random() < _EVEN_ODDS:
+            return ipaddress.IPv4Address(self._random.getrandbits(32))
+
+        return ipaddress.IPv6Address(self._random.getrandbits(128))
+
+    def _make_list(self, factory: _ValueFactory) -> list[object]:
+        return [factory() for _ in range(self._random.randint(*self.list_size))]
+
+    def _get_type_factory(self, type_: object) -> _ValueFactory:
+        factory = self._factories.get(type_)
+        if factory is not None:
+            return factory
+
+        rng = self._random
+        if type_ is str:
+            factory = self._make_string
+
+        elif type_ is int:
+            factory = lambda: rng.getrandbits(31)  # noqa: E731
+
+        elif type_ is bool:
+            factory = lambda: rng.random() < _EVEN_ODDS  # noqa: E731
+
+        elif type_ in (ipaddress.IPv4Address, ipaddress.IPv6Address):
+            factory = self._make_ip
+
+        elif isinstance(type_, validation.ListOf):
+            item_factory = self._get_choice_factory(type_.types)
+            factory = lambda: self._make_list(item_factory)  # noqa: E731
+
+        elif isinstance(type_, types.UnionType):
+            variants = [self._get_type_factory(variant) for variant in typing.get_args(type_)]
+            factory = lambda: rng.choice(variants)()  # noqa: E731
+
+        elif isinstance(type_, type) and issubclass(type_, enum.Enum):
+            members = list(type_)
+            factory = lambda: rng.choice(members)  # noqa: E731
+
+        elif isinstance(type_, type) and attrs.has(type_):
+            factory = self._get_class_factory(type_)
+
+        else:
+            # Tags and other exact values.
+            factory = lambda: type_  # noqa: E731
+
+        self._factories[type_] = factory
+        return factory
+
+    def _get_choice_factory(
+        self,
+        field_types: typing.Sequence[object],
+        *,
+        string_factory: _ValueFactory | None = None,
+    ) -> _ValueFactory:
+        rng = self._random
+        nullable = None in field_types
+        omittable = undefined.Undefined in field_types
+        factories = [
+            string_factory if type_ is str and string_factory else self._get_type_factory(type_)
+            for type_ in field_types
+            if type_ is not None and type_ is not undefined.Undefined
+        ]
+        undefined_rate = self.undefined_rate if omittable else 0.0
+        none_rate = self.none_rate if nullable else 0.0
+
+        def choose() -> object:
+            if undefined_rate and rng.random() < undefined_rate:
+                return undefined.Undefined
+
+            if none_rate and rng.random() < none_rate:
+                return None
+
+            return rng.choice(factories)()
+
+        return choose
+
+    def _get_class_factory(self, cls: type[typing.Any]) -> _ValueFactory:
+        field_types = cls._field_types() if "_field_types" in vars(cls) else {}
+        length_limits: validation.LengthLimits = vars(cls).get("_LENGTH_LIMITS", {})
+        rng = self._random
+        factories: dict[str, _ValueFactory] = {}
+        for field in attrs.fields(cls):
+            if typing.get_origin(field.type) is typing.Literal:
+                (value,) = typing.get_args(field.type)
+                factories[field.name] = lambda value=value: value
+
+            elif field.name not in field_types:
+                # Fields of arbitrary type, such as files.
+                factories[field.name] = lambda: rng.randbytes(rng.randint(*self.string_length))
+
+            elif field.name == "id" or field.name.endswith("_id"):
+                factories[field.name] = self._get_id_factory(field_types[field.name])
+
+            elif field.name in length_limits:
+                factories[field.name] = self._get_choice_factory(
+                    field_types[field.name],
+                    string_factory=self._get_string_factory(length_limits[field.name]),
+                )
+
+            else:
+                factories[field.name] = self._get_choice_factory(field_types[field.name])
+
+        # attrs strips leading underscores from the names of init arguments.
+        items = tuple((name.lstrip("_"), factory) for name, factory in factories.items())
+        return lambda: cls(**{name: factory() for name, factory in items})
+
+    def _get_id_factory(self, field_types: tuple[object, ...]) -> _ValueFactory:
+        choose = self._get_choice_factory(field_types)
+        if int not in field_types:
+            return choose
+
+        rng, pool = self._random, self._ids
+
+        def make_id() -> object:
+            value = choose()
+            return rng.choice(pool) if isinstance(value, int) else value
+
+        return make_id
+
+    def generate(self, type_: type[typing.Any] | types.UnionType) -> frames.SupportsPayload:
+        """Generate a random instance of a generated class, or of a variant of a union."""
+        return self._get_type_factory(type_)()
+
+    def generate_payloads(
+        self,
+        type_: type[typing.Any] | types.UnionType,
+        count: int,
+    ) -> typing.Iterator[dict[str, typing.Any]]:
+        """Generate the raw API representation of many random instances."""
+        factory = self._get_type_factory(type_)
+        for _ in range(count):
+            yield factory().to_payload()
+
+
+def _encode_bytes(value: object) -> str:
+    # Used as the fallback of json.dumps, which is only called for unknown types.
+    if not isinstance(value, bytes):
+        msg = f"Object of type {type(value).__name__} is not JSON serializable"
+        raise TypeError(msg)
+
+    return base64.b64encode(value).decode()
+
+
+def main() -> None:
+    """Write synthetic payloads to stdout as JSON lines."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("type", help="a generated class or union, e.g. gateway.ServerPayload")
+    parser.add_argument("-n", "--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--undefined-rate", type=float, default=0.25)
+    parser.add_argument("--none-rate", type=float, default=0.25)
+    parser.add_argument("--string-length", type=int, nargs=2, default=(0, 32))
+    parser.add_argument("--list-size", type=int, nargs=2, default=(0, 8))
+    parser.add_argument("--id-pool", type=int, default=1000)
+    args = parser.parse_args()
+
+    generator = PayloadGenerator(
+        seed=args.seed,
+        undefined_rate=args.undefined_rate,
+        none_rate=args.none_rate,
+        string_length=tuple(args.string_length),
+        list_size=tuple(args.list_size),
+        id_pool=args.id_pool,
+    )
+    write = sys.stdout.write
+    for payload in generator.generate_payloads(resolve(args.type), args.count):
+        write(json.dumps(payload, ensure_ascii=False, default=_encode_bytes))
+        write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Compare the cost of passing payloads to another process.
+
+Per-object transfer compares the generated ``__reduce__`` against pickling
+the slots of a payload, which is what attrs does by default. Batch transfer
+compares pickling a list of payloads for a task against a shared memory batch,
+in-process, and when fanning the same batch out to every worker of a process
+pool. The shared memory block only pays off once its fixed setup cost is
+outweighed by pickling and piping the batch for every worker.
+"""
+
+import concurrent.futures
+import contextlib
+import json
+import pickle
+import timeit
+import typing
+
+import eludris_autodoc
+from eludris_autodoc import gateway, transport
+
+from .backends import CORPUS
+
+NUMBER = 100
+WORKERS = 4
+
+
+@contextlib.contextmanager
+def _default_pickling() -> typing.Iterator[None]:
+    classes = [
+        obj
+        for obj in vars(eludris_autodoc).values()
+        if isinstance(obj, type) and "__reduce__" in vars(obj)
+    ]
+    methods = [(cls, cls.__reduce__, cls.__setstate__) for cls in classes]
+    for cls in classes:
+        del cls.__reduce__, cls.__setstate__
+
+    try:
+        yield
+
+    finally:
+        for cls, reduce, setstate in methods:
+            cls.__reduce__ = reduce
+            cls.__setstate__ = setstate
+
+
+def _load_list(payloads: list[gateway.ServerPayload]) -> int:
+    return len(payloads)
+
+
+def _load_batch(batch: transport.SharedBatch[gateway.ServerPayload]) -> int:
+    with batch:
+        return len(batch.load())
+
+
+def _bench_objects(name: str, payloads: typing.Sequence[gateway.ServerPayload]) -> None:
+    size = sum(len(pickle.dumps(payload, protocol=5)) for payload in payloads) / len(payloads)
+
+    def run() -> None:
+        for payload in payloads:
+            pickle.loads(pickle.dumps(payload, protocol=5))  # noqa: S301
+
+    best = min(timeit.repeat(run, number=NUMBER, repeat=5)) / NUMBER / len(payloads)
+    print(f"{name:<32} {size:8.1f} bytes/payload {best * 1e6:8.2f} us/payload")
+
+
+def _bench_batch(name: str, func: typing.Callable[[], object], size: int) -> None:
+    best = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+    print(f"{name:<32} {size:8d} bytes/task    {best * 1e6:8.2f} us/batch")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    payloads = [gateway.decode_server_payload(json.loads(frame)) for frame in CORPUS]
+
+    with _default_pickling():
+        _bench_objects("pickle slots", payloads)
+    _bench_objects("pickle __reduce__", payloads)
+
+    list_size = len(pickle.dumps(payloads, protocol=5))
+    with transport.SharedBatch.create(payloads) as batch:
+        batch_size = len(pickle.dumps(batch, protocol=5))
+        batch.unlink()
+
+    def pickle_list() -> None:
+        pickle.loads(pickle.dumps(payloads, protocol=5))  # noqa: S301
+
+    def shared_batch() -> None:
+        with transport.SharedBatch.create(payloads) as batch:
+            with pickle.loads(pickle.dumps(batch, protocol=5)) as attached:  # noqa: S301
+                attached.load()
+
+            batch.unlink()
+
+    _bench_batch("batch: pickled list", pickle_list, list_size)
+    _bench_batch("batch: SharedBatch", shared_batch, batch_size)
+
+    with concurrent.futures.ProcessPoolExecutor(WORKERS) as executor:
+
+        def pool_list() -> None:
+            futures = [executor.submit(_load_list, payloads) for _ in range(WORKERS)]
+            concurrent.futures.wait(futures)
+
+        def pool_batch() -> None:
+            with transport.SharedBatch.create(payloads) as batch:
+                futures = [executor.submit(_load_batch, batch) for _ in range(WORKERS)]
+                concurrent.futures.wait(futures)
+                batch.unlink()
+
+        _bench_batch(f"pool x{WORKERS}: pickled list", pool_list, list_size)
+        _bench_batch(f"pool x{WORKERS}: SharedBatch", pool_batch, batch_size)
+
+
+if __name__ == "__main__":
+    main()
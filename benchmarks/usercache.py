@@ -0,0 +1,58 @@
+"""Compare a shared user cache against a per-process dict of users.
+
+The memory of the dict is what every worker process would pay, whereas the
+shared cache is paid for once.
+"""
+
+import timeit
+import tracemalloc
+
+from eludris_autodoc import usercache, users
+
+from .backends import USER
+
+USERS = 100_000
+NUMBER = 100_000
+
+
+def _make_users() -> list[users.User]:
+    return [
+        users.User.from_payload(dict(USER, id=user_id, username=f"user{user_id % 1000}"))
+        for user_id in range(1, USERS + 1)
+    ]
+
+
+def _bench(name: str, func: object) -> None:
+    best = min(timeit.repeat(func, number=NUMBER, repeat=5))  # type: ignore
+    print(f"{name:<32} {best / NUMBER * 1e9:8.1f} ns/lookup")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    tracemalloc.start()
+    by_id = {user.id: user for user in _make_users()}
+    dict_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cache = usercache.SharedUserCache.create(capacity=USERS)
+    for user in by_id.values():
+        cache.set(user)
+
+    print(f"{'dict of users':<32} {dict_size / USERS:8.1f} bytes/user per process")
+    used = cache._arena_offset + cache.arena_used  # noqa: SLF001
+    print(f"{'shared cache':<32} {used / USERS:8.1f} bytes/user")
+
+    user_id = USERS // 2
+    view = cache.get(user_id)
+    assert view is not None
+    _bench("dict: username", lambda: by_id[user_id].username)
+    _bench("shared: get", lambda: cache.get(user_id))
+    _bench("shared: view username", lambda: view.username)
+    _bench("shared: view to_user", view.to_user)
+
+    cache.close()
+    cache.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure the cost of runtime validation when converting objects into their raw representation."""
+
+import time
+import typing
+
+from eludris_autodoc import frames, messaging, undefined, users, validation
+
+ITERATIONS = 200_000
+
+STATUS = users.Status(type=users.StatusType.ONLINE, text="ayúdame por favor")
+USER = users.User(
+    id=48615849987333,
+    username="yendri",
+    display_name="Nicolas",
+    social_credit=-69420,
+    status=STATUS,
+    bio="NICOLAAAAAAAAAAAAAAAAAAS!!!",
+    avatar=undefined.Undefined,
+    banner=undefined.Undefined,
+    badges=0,
+    permissions=0,
+    email=undefined.Undefined,
+    verified=undefined.Undefined,
+)
+
+CASES: typing.Final[tuple[object, ...]] = (
+    messaging.MessageCreate(content="Hello, World!", disguise=undefined.Undefined),
+    USER,
+    messaging.Message(author=USER, content="Hello, World!", disguise=undefined.Undefined),
+)
+
+
+class _InstanceInfo:
+    message_limit = 2048
+
+
+def _run(payload: frames.SupportsPayload) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        payload.to_payload()
+
+    return ITERATIONS / (time.perf_counter() - start) / 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for payload in CASES:
+        name = type(payload).__name__
+        disabled = _run(payload)
+
+        validation.enable(typing.cast(typing.Any, _InstanceInfo()))
+        enabled = _run(payload)
+        validation.disable()
+
+        print(f"{name + ' disabled':<24} {disabled:8.2f} M payloads/s")
+        print(f"{name + ' enabled':<24} {enabled:8.2f} M payloads/s")
+
+
+if __name__ == "__main__":
+    main()
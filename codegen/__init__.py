@@ -1,5 +1,9 @@
 """Code-gen implementation for the eludris autodoc api."""
 
 from codegen.cst import *
+from codegen.examples import *
 from codegen.gen import *
+from codegen.profiling import *
+from codegen.routes import *
+from codegen.templates import *
 from codegen.utils import *
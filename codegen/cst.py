@@ -1,13 +1,22 @@
 """Impelementation of eludris-autodoc CST generation."""
 
+import functools
+import json
 import re
 import typing
 
+import attrs
 import libcst
 
 from . import utils
 
-__all__: typing.Sequence[str] = ("make_docstring", "parse_item")
+__all__: typing.Sequence[str] = (
+    "make_docstring",
+    "make_from_payload",
+    "make_to_payload",
+    "parse_raw_item",
+    "parse_item",
+)
 
 ATTRS_DEFINE = libcst.Decorator(
     libcst.parse_expression("attrs.define(kw_only=True, weakref_slot=False)"),
@@ -32,6 +41,35 @@ UNDEFINED_ANN = libcst.Subscript(
     ],
 )
 
+CLASSVAR_BYTES_ANN = libcst.Subscript(
+    value=libcst.Attribute(
+        libcst.Name("typing"),
+        libcst.Name("ClassVar"),
+    ),
+    slice=[
+        libcst.SubscriptElement(
+            libcst.Index(libcst.Name("bytes")),
+        ),
+    ],
+)
+
+LAZY_DECODERS_DOC: typing.Final[str] = "Field decoders, used to decode this object lazily."
+LAZY_FIELDS_DOC: typing.Final[str] = "Decoders of the fields only decoded on first access."
+FIELD_TYPES_DOC: typing.Final[str] = "Get the allowed types of every field, used for validation."
+LENGTH_LIMITS_DOC: typing.Final[str] = "Documented length limits of string fields."
+KEY_SLOTS_DOC: typing.Final[str] = "Raw API keys mapped to the attributes they are stored in."
+FRAME_DOC: typing.Final[str] = "The serialized form of this payload, which never changes."
+
+FRAME_SEPARATORS: typing.Final[tuple[str, str]] = (",", ":")
+"""The separators used to serialize payloads, matching ``frames.encode_frame``."""
+
+LAZY_FIELDS_BASE = libcst.Arg(
+    libcst.Attribute(
+        libcst.Name("lazy"),
+        libcst.Name("LazyFields"),
+    ),
+)
+
 IPADDR_ANN = libcst.BinaryOperation(
     left=libcst.Attribute(
         libcst.Name("ipaddress"),
@@ -50,6 +88,11 @@ def to_upper_snake_case(name: str) -> str:
     return name.title().replace("_", "")
 
 
+def to_constant_case(name: str) -> str:
+    """Convert UpperSnakeCase class names to CONSTANT_CASE names."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).upper()
+
+
 def _get_inheritable_body(item: utils.AutodocItem) -> list[libcst.BaseStatement]:
     source_class = item.main_obj
     assert isinstance(source_class.body, libcst.IndentedBlock)
@@ -57,12 +100,32 @@ def _get_inheritable_body(item: utils.AutodocItem) -> list[libcst.BaseStatement]
     inheritable: list[libcst.BaseStatement] = []
     for statement in source_class.body.body:
         match statement:
+            case libcst.SimpleStatementLine(
+                body=[
+                    libcst.AnnAssign(
+                        annotation=libcst.Annotation(
+                            annotation=libcst.Subscript(
+                                value=libcst.Attribute(attr=libcst.Name("ClassVar")),
+                            ),
+                        ),
+                    ),
+                ],
+            ):
+                # Codec tables are generated separately for every class.
+                pass
+
             case libcst.SimpleStatementLine(body=[libcst.Assign(_)]):
                 inheritable.append(statement)
 
             case libcst.SimpleStatementLine(body=[libcst.AnnAssign(_)]):
                 inheritable.append(statement)
 
+            case libcst.FunctionDef(
+                decorators=[libcst.Decorator(decorator=libcst.Name("property"))],
+            ):
+                # Accessors for lazily decoded fields.
+                inheritable.append(statement)
+
             case _:
                 pass
 
@@ -74,132 +137,1274 @@ def _make_rest_header(match: typing.Match[str]) -> str:
     return f"{header}\n{'-' * len(header)}\n"
 
 
-def make_docstring(doc: str, *, indentation: int) -> libcst.SimpleStatementLine:
-    """Make a docstring for a given item or method.
+def make_docstring_source(doc: str, *, indentation: int) -> str:
+    """Make the string literal of a docstring for a given item or method.
+
+    The literal itself is not indented, but any lines after the first are.
+    """
+    # TODO: Make this work better by taking max line length into account, etc.
+    indent = " " * 4 * indentation
+
+    doc = (
+        re.sub(
+            r"### (\w+)\n\n",
+            _make_rest_header,
+            doc.replace("-----\n\n", ""),
+        )
+        .replace("\n", f"\n{indent}")
+        .replace(". ", f".\n\n{indent}")
+        .replace("> ", "")
+        .replace(">\n", "\n")
+    )
+
+    strtype = "r" if "\\" in doc else ""
+    end = f"\n{indent}" if "\n" in doc else ""
+    return f'{strtype}"""{doc}{end}"""'
+
+
+def make_docstring(doc: str, *, indentation: int) -> libcst.SimpleStatementLine:
+    """Make a docstring for a given item or method.
+
+    This takes into account indentation and tries to convert autodoc markdown to rst.
+    """
+    return libcst.SimpleStatementLine(
+        body=[
+            libcst.Expr(
+                libcst.SimpleString(make_docstring_source(doc, indentation=indentation)),
+            ),
+        ],
+    )
+
+
+FragmentKey = tuple[str, str, str | None]
+"""The key of interned CST fragments of a field type.
+
+This consists of the field type, the category of the item the field is on,
+and the category of the item the field type refers to, if any. Together,
+these determine whether the field type has to be qualified with its module.
+"""
+
+
+def get_fragment_key(
+    item_info: utils.ItemInfo,
+    field_type: str,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> FragmentKey:
+    """Get the key under which CST fragments of a field type are interned."""
+    name = field_type.removesuffix("[]")
+    reference_category = None if name in utils.TYPE_MAPPING else cache[name].category
+    return field_type, item_info["category"].lower(), reference_category
+
+
+def make_annotation(
+    item_info: utils.ItemInfo,
+    field_type: str,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> libcst.BaseExpression:
+    """Make type annotation for a given field.
+
+    As CST nodes are immutable, annotations are interned by their
+    ``FragmentKey`` and shared between all fields of the same type.
+    """
+    return _make_annotation(*get_fragment_key(item_info, field_type, cache=cache))
+
+
+@functools.cache
+def _make_annotation(
+    field_type: str,
+    category: str,
+    reference_category: str | None,
+) -> libcst.BaseExpression:
+    is_list = field_type.endswith("[]")
+    if is_list:
+        field_type = field_type.removesuffix("[]")
+
+    if reference_category is None:
+        raw_annotation = utils.TYPE_MAPPING[field_type]
+        annotation = IPADDR_ANN if raw_annotation == "IpAddr" else libcst.Name(raw_annotation)
+
+    elif reference_category == category:
+        annotation = libcst.Name(f"{field_type}")
+
+    else:
+        annotation = libcst.Attribute(
+            libcst.Name(f"{reference_category}_m"),
+            libcst.Name(field_type),
+        )
+
+    if not is_list:
+        return annotation
+
+    return libcst.Subscript(
+        value=libcst.Attribute(
+            libcst.Name("typing"),
+            libcst.Name("Sequence"),
+        ),
+        slice=[
+            libcst.SubscriptElement(
+                libcst.Index(annotation),
+            ),
+        ],
+    )
+
+
+def make_annotation_source(
+    item_info: utils.ItemInfo,
+    field_type: str,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the source of the type annotation for a given field.
+
+    This matches the code of the annotation made by ``make_annotation``.
+    """
+    is_list = field_type.endswith("[]")
+    if is_list:
+        field_type = field_type.removesuffix("[]")
+
+    if field_type in utils.TYPE_MAPPING:
+        raw_annotation = utils.TYPE_MAPPING[field_type]
+        annotation = (
+            "ipaddress.IPv4Address | ipaddress.IPv6Address"
+            if raw_annotation == "IpAddr"
+            else raw_annotation
+        )
+
+    else:
+        annotation = _make_reference(item_info, field_type, category=cache[field_type].category)
+
+    return f"typing.Sequence[{annotation}]" if is_list else annotation
+
+
+def is_pure_unit_enum(item: utils.ObjectItem | utils.EnumItem) -> bool:
+    """Check whether an item is an enum of which all variants are represented as plain strings."""
+    return item["type"] == "enum" and not item["tag"] and not item["untagged"]
+
+
+def is_lazy_field(field: utils.FieldInfo) -> bool:
+    """Check whether a field is kept in its raw form and only decoded on first access.
+
+    This is currently the case for IP addresses, which are rarely used but
+    expensive to parse.
+    """
+    return utils.TYPE_MAPPING.get(field["type"]) == "IpAddr"
+
+
+def has_lazy_fields(fields: typing.Sequence[utils.FieldInfo]) -> bool:
+    """Check whether a class with the given wire fields derives from ``lazy.LazyFields``."""
+    return any(is_lazy_field(field) for field in fields)
+
+
+def _parse_method(code: str) -> libcst.FunctionDef:
+    # Methods are separated from the statements before them by a blank line.
+    return libcst.ensure_type(libcst.parse_statement(code), libcst.FunctionDef).with_changes(
+        leading_lines=[libcst.EmptyLine(indent=False)],
+    )
+
+
+def _union(left: libcst.BaseExpression, right: libcst.BaseExpression) -> libcst.BaseExpression:
+    return libcst.BinaryOperation(left=left, operator=libcst.BitOr(), right=right)
+
+
+def make_field_annotation(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> libcst.BaseExpression:
+    """Make the annotation of a field.
+
+    Like the annotations themselves, these are interned by the ``FragmentKey``
+    of the field type and whether the field is nullable and omittable.
+    """
+    return _make_field_annotation_expr(
+        *get_fragment_key(item_info, field["type"], cache=cache),
+        nullable=field["nullable"],
+        omittable=field["omittable"],
+    )
+
+
+@functools.cache
+def _make_field_annotation_expr(
+    field_type: str,
+    category: str,
+    reference_category: str | None,
+    *,
+    nullable: bool,
+    omittable: bool,
+) -> libcst.BaseExpression:
+    annotation = _make_annotation(field_type, category, reference_category)
+    if nullable:
+        annotation = _union(annotation, libcst.Name("None"))
+
+    if omittable:
+        annotation = _union(annotation, UNDEFINED_ANN)
+
+    return annotation
+
+
+@functools.cache
+def _make_field_value(*, omittable: bool) -> libcst.Call:
+    # The attrs.field(...) call of a field, which is shared between all fields
+    # with the same arguments.
+    args: list[libcst.Arg] = []
+    if omittable:
+        args.append(
+            libcst.Arg(
+                keyword=libcst.Name("default"),
+                value=UNDEFINED,
+                equal=EQUALS,
+            ),
+        )
+
+    return libcst.Call(ATTRS_FIELD, args)
+
+
+@functools.cache
+def _make_field_annotation(annotation: libcst.BaseExpression) -> libcst.Annotation:
+    # Nodes hash by identity, so this only shares wrappers of interned annotations.
+    return libcst.Annotation(annotation)
+
+
+def make_field_annotation_source(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the source of the annotation of a field.
+
+    This matches the code of the annotation made by ``make_field_annotation``.
+    """
+    annotation = make_annotation_source(item_info, field["type"], cache=cache)
+    if field["nullable"]:
+        annotation += " | None"
+
+    if field["omittable"]:
+        annotation += " | typing.Literal[undefined.Undefined]"
+
+    return annotation
+
+
+def make_field(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> typing.Sequence[libcst.SimpleStatementLine]:
+    """Make an attrs class field from an autodoc item field.
+
+    This consists of a name, an annotation, and an attrs.field(...) expression.
+    """
+    lines = [
+        libcst.SimpleStatementLine(
+            body=[
+                libcst.AnnAssign(
+                    target=libcst.Name(field["name"]),
+                    annotation=_make_field_annotation(
+                        make_field_annotation(item_info, field, cache=cache),
+                    ),
+                    value=_make_field_value(omittable=field["omittable"]),
+                ),
+            ],
+        ),
+    ]
+
+    if field["doc"]:
+        lines.append(make_docstring(field["doc"], indentation=1))
+
+    return lines
+
+
+def resolve_fields(
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[utils.FieldInfo]:
+    """Resolve flattened fields into the fields of the items they refer to.
+
+    The result matches the fields as they are sent over the wire, in the same
+    order as they appear on the generated class.
+    """
+    resolved: list[utils.FieldInfo] = []
+    for field in fields:
+        if not field["flattened"]:
+            resolved.append(field)
+            continue
+
+        item = cache[field["type"]].data["item"]
+        assert item["type"] == "object"
+        resolved.extend(resolve_fields(item["fields"], cache=cache))
+
+    return resolved
+
+
+def make_encode_expr(
+    value: str,
+    field_type: str,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the expression that encodes ``value`` of the given type into its payload."""
+    if field_type.endswith("[]"):
+        inner = make_encode_expr("item", field_type.removesuffix("[]"), cache=cache)
+        return f"list({value})" if inner == "item" else f"[{inner} for item in {value}]"
+
+    if field_type in utils.TYPE_MAPPING:
+        return f"str({value})" if utils.TYPE_MAPPING[field_type] == "IpAddr" else value
+
+    item = cache[field_type].data["item"]
+    if is_pure_unit_enum(item):
+        return f"{value}.value"
+
+    return f"{value}.to_payload()"
+
+
+def _make_field_encode_expr(
+    field: utils.FieldInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    value = f"self.{field['name']}"
+    expr = make_encode_expr(value, field["type"], cache=cache)
+
+    if field["nullable"] and expr != value:
+        return f"None if {value} is None else {expr}"
+
+    return expr
+
+
+def make_to_payload_source(
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: str | None = None,
+    content: str | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the source of the ``to_payload`` method that encodes a class to its API representation.
+
+    Omittable fields are only included if they are not ``Undefined``. If a
+    ``content`` key is provided, the fields are nested under that key next to
+    the ``tag``, otherwise the tag is included with the rest of the fields.
+    """
+    entries = [
+        f'"{field["name"]}": {_make_field_encode_expr(field, cache=cache)}'
+        for field in fields
+        if not field["omittable"]
+    ]
+    if tag and not content:
+        entries.insert(0, f'"{tag}": self.{tag}')
+
+    body = ['"""Convert this object into its raw API representation."""']
+    omittable = [field for field in fields if field["omittable"]]
+    if omittable:
+        body.append(f"payload: dict[str, typing.Any] = {{{', '.join(entries)}}}")
+        for field in omittable:
+            expr = _make_field_encode_expr(field, cache=cache)
+            body.append(f"if self.{field['name']} is not undefined.Undefined:")
+            body.append(f'    payload["{field["name"]}"] = {expr}')
+        payload = "payload"
+
+    else:
+        payload = f"{{{', '.join(entries)}}}"
+
+    if tag and content:
+        payload = f'{{"{tag}": self.{tag}, "{content}": {payload}}}'
+
+    body.append(f"return {payload}")
+
+    return "def to_payload(self) -> dict[str, typing.Any]:\n" + "".join(
+        f"    {line}\n" for line in body
+    )
+
+
+def make_to_payload(
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: str | None = None,
+    content: str | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> libcst.FunctionDef:
+    """Make the ``to_payload`` method that encodes a class to its raw API representation."""
+    return _parse_method(make_to_payload_source(fields, tag=tag, content=content, cache=cache))
+
+
+def make_frame(tag: str, name: str) -> typing.Sequence[libcst.SimpleStatementLine]:
+    """Make a pre-serialized frame for an enum variant that carries no data."""
+    frame = json.dumps({tag: name}, separators=FRAME_SEPARATORS).encode()
+    return [
+        libcst.SimpleStatementLine(
+            body=[
+                libcst.AnnAssign(
+                    target=libcst.Name("_FRAME"),
+                    annotation=libcst.Annotation(CLASSVAR_BYTES_ANN),
+                    value=libcst.SimpleString(repr(frame)),
+                ),
+            ],
+        ),
+        make_docstring(FRAME_DOC, indentation=1),
+    ]
+
+
+def _make_reference(
+    item_info: utils.ItemInfo,
+    name: str,
+    *,
+    category: str,
+) -> str:
+    if category == item_info["category"].lower():
+        return name
+
+    return f"{category}_m.{name}"
+
+
+def make_decode_expr(
+    item_info: utils.ItemInfo,
+    value: str,
+    field_type: str,
+    *,
+    deferred: bool = False,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the expression that decodes the payload ``value`` into the given type.
+
+    References to other items are qualified with their module unless they are
+    in the category of ``item_info``.
+    """
+    if field_type.endswith("[]"):
+        field_type = field_type.removesuffix("[]")
+        inner = make_decode_expr(item_info, "item", field_type, cache=cache)
+        return value if inner == "item" else f"[{inner} for item in {value}]"
+
+    if field_type in utils.TYPE_MAPPING:
+        is_ip_address = utils.TYPE_MAPPING[field_type] == "IpAddr"
+        return f"lazy.ip_address({value})" if is_ip_address else value
+
+    dependency = cache[field_type]
+    item = dependency.data["item"]
+    if is_pure_unit_enum(item):
+        # Unknown values fall back to the enum itself, which raises a ValueError.
+        table = f"{to_constant_case(field_type)}_VALUES"
+        table = _make_reference(item_info, table, category=dependency.category)
+        enum_cls = _make_reference(item_info, field_type, category=dependency.category)
+        return f"{table}.get({value}) or {enum_cls}({value})"
+
+    if item["type"] == "enum":
+        decoder = f"decode_{to_constant_case(field_type).lower()}"
+        return f"{_make_reference(item_info, decoder, category=dependency.category)}({value})"
+
+    cls = _make_reference(item_info, field_type, category=dependency.category)
+    if deferred:
+        return f"lazy.from_payload({cls}, {value})"
+
+    return f"{cls}.from_payload({value})"
+
+
+def _make_field_decode_expr(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    source: str,
+    *,
+    deferred: bool = False,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    value = f'{source}["{field["name"]}"]'
+    if is_lazy_field(field) and not deferred:
+        # Lazy fields are passed raw, and decoded on first access instead.
+        expr = value
+
+    else:
+        expr = make_decode_expr(item_info, value, field["type"], deferred=deferred, cache=cache)
+
+    if expr == value:
+        if field["omittable"]:
+            return f'{source}.get("{field["name"]}", undefined.Undefined)'
+
+        return expr
+
+    if field["nullable"]:
+        expr = f"None if {value} is None else {expr}"
+
+    if field["omittable"]:
+        if field["nullable"]:
+            expr = f"({expr})"
+
+        return f'{expr} if "{field["name"]}" in {source} else undefined.Undefined'
+
+    return expr
+
+
+def make_from_payload_source(
+    item_info: utils.ItemInfo,
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    options: utils.ClassOptions = utils.NO_CLASS_OPTIONS,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the source of the ``from_payload`` classmethod that decodes a class.
+
+    This is the inverse of ``make_to_payload``; omitted fields are set to
+    ``Undefined``. Only the tag and content of the ``options`` are used.
+    """
+    content = options.content
+    source = "data" if content else "payload"
+    args = [f'{options.tag[0]}=payload["{options.tag[0]}"]'] if options.tag else []
+    args.extend(
+        f"{field['name'].lstrip('_')}="
+        + _make_field_decode_expr(item_info, field, source, cache=cache)
+        for field in fields
+    )
+
+    body = ['"""Create this object from its raw API representation."""']
+    if content:
+        body.append(f'data = payload["{content}"]')
+
+    body.append(f"return cls._from_trusted({', '.join(args)})")
+
+    return (
+        "@classmethod\n"
+        f'def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "{name}":\n'
+        + "".join(f"    {line}\n" for line in body)
+    )
+
+
+def make_from_payload(
+    item_info: utils.ItemInfo,
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    options: utils.ClassOptions = utils.NO_CLASS_OPTIONS,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> libcst.FunctionDef:
+    """Make the ``from_payload`` classmethod that decodes a class from its API representation."""
+    return _parse_method(
+        make_from_payload_source(item_info, name, fields, options=options, cache=cache),
+    )
+
+
+def make_from_trusted_source(
+    item_info: utils.ItemInfo,
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: tuple[str, str] | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the source of the ``_from_trusted`` classmethod that bypasses ``__init__``.
+
+    This takes the same arguments as ``__init__`` but requires all of them,
+    skipping the keyword argument and default handling of the attrs
+    ``__init__``. It is used by ``from_payload``, which always knows every
+    field. The tag of an enum variant is passed as a ``(key, value)`` pair.
+    Lazy fields may also be passed raw, and are only decoded on first access.
+    """
+    params: list[tuple[str, str, str]] = []
+    if tag:
+        params.append((tag[0], tag[0], f'typing.Literal["{tag[1]}"]'))
+
+    lazy_entries: list[str] = []
+    for field in fields:
+        param = field["name"].lstrip("_")
+        annotation = make_field_annotation_source(item_info, field, cache=cache)
+        if is_lazy_field(field):
+            params.append((param, "", f"{annotation} | str"))
+            lazy_entries.append(f'"{field["name"]}": {param}')
+
+        else:
+            params.append((param, field["name"], annotation))
+
+    signature = ", ".join(f"{param}: {annotation}" for param, _, annotation in params)
+    body = [
+        '"""Create this object from already decoded values, bypassing ``__init__``."""',
+        "self = object.__new__(cls)",
+        *(f"self.{attribute} = {param}" for param, attribute, _ in params if attribute),
+    ]
+    if lazy_entries:
+        body.append(f"self._lazy_raw = {{{', '.join(lazy_entries)}}}")
+
+    body.append("return self")
+
+    indented_body = "".join(f"    {line}\n" for line in body)
+    return f'@classmethod\ndef _from_trusted(cls, *, {signature}) -> "{name}":\n{indented_body}'
+
+
+def make_from_trusted(
+    item_info: utils.ItemInfo,
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: tuple[str, str] | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> libcst.FunctionDef:
+    """Make the ``_from_trusted`` classmethod that creates a class without calling ``__init__``."""
+    return _parse_method(make_from_trusted_source(item_info, name, fields, tag=tag, cache=cache))
+
+
+def make_reduce_sources(
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: tuple[str, str] | None = None,
+) -> tuple[str, str]:
+    """Make the source of the ``__reduce__`` and ``__setstate__`` methods used to pickle a class.
+
+    Objects are pickled as a plain tuple of their attribute values rather
+    than the mapping attrs uses by default. The tag of an enum variant is
+    passed as a ``(key, value)`` pair and is never pickled.
+    """
+    attributes = [f"self.{field['name']}" for field in fields]
+    trailing_comma = "," if len(attributes) == 1 else ""
+    state = f"({', '.join(attributes)}{trailing_comma})"
+
+    setstate_body = [f"{state} = state"] if attributes else []
+    if tag:
+        setstate_body.insert(0, f'self.{tag[0]} = "{tag[1]}"')
+
+    reduce_code = (
+        "def __reduce__(self) -> tuple[typing.Any, ...]:\n"
+        '    """Reduce this object to a compact tuple of its attribute values for pickling."""\n'
+        f"    return (copyreg.__newobj__, ({name},), {state})\n"
+    )
+    setstate_code = (
+        "def __setstate__(self, state: tuple[typing.Any, ...]) -> None:\n"
+        '    """Restore this object from the state created by ``__reduce__``."""\n'
+        + "".join(f"    {line}\n" for line in setstate_body)
+    )
+    return reduce_code, setstate_code
+
+
+def make_reduce(
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: tuple[str, str] | None = None,
+) -> typing.Sequence[libcst.FunctionDef]:
+    """Make the ``__reduce__`` and ``__setstate__`` methods used to pickle a class."""
+    return [_parse_method(code) for code in make_reduce_sources(name, fields, tag=tag)]
+
+
+def make_lazy_decoders_source(
+    item_info: utils.ItemInfo,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: str | None = None,
+    content: str | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str | None:
+    """Make the source of the table of per-field decoders used to decode a class lazily.
+
+    Each decoder takes the raw API representation of the class and decodes a
+    single attribute from it. Nested objects are decoded lazily as well. No
+    table is made if no field needs decoding, as such classes are cheap to
+    decode eagerly.
+    """
+    if not any(
+        not is_lazy_field(field)
+        and make_decode_expr(item_info, "value", field["type"], cache=cache) != "value"
+        for field in fields
+    ):
+        return None
+
+    source = f'payload["{content}"]' if content else "payload"
+    entries = [f'"{tag}": lambda payload: payload["{tag}"]'] if tag else []
+    for field in fields:
+        expr = _make_field_decode_expr(item_info, field, source, deferred=True, cache=cache)
+        if " if " in expr:
+            # Parenthesized so the conditional can be split over multiple lines.
+            expr = f"({expr})"
+
+        entries.append(f'"{field["name"]}": lambda payload: {expr}')
+
+    return f"_LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {{{', '.join(entries)}}}"
+
+
+def make_lazy_fields_source(fields: typing.Sequence[utils.FieldInfo]) -> str | None:
+    """Make the source of the table of decoders of the fields only decoded on first access.
+
+    Each decoder takes the raw value of a single field, as kept by
+    ``_from_trusted``. No table is made if there are no such fields.
+    """
+    entries = [f'"{field["name"]}": lazy.ip_address' for field in fields if is_lazy_field(field)]
+    if not entries:
+        return None
+
+    return f"_LAZY_FIELDS: typing.ClassVar[lazy.FieldDecoders] = {{{', '.join(entries)}}}"
+
+
+def _parse_table(code: str | None, doc: str) -> typing.Sequence[libcst.SimpleStatementLine]:
+    # Tables are separated from the statements before them by a blank line.
+    if code is None:
+        return []
+
+    return [
+        libcst.ensure_type(libcst.parse_statement(code), libcst.SimpleStatementLine).with_changes(
+            leading_lines=[libcst.EmptyLine(indent=False)],
+        ),
+        make_docstring(doc, indentation=1),
+    ]
+
+
+def make_lazy_decoders(
+    item_info: utils.ItemInfo,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: str | None = None,
+    content: str | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> typing.Sequence[libcst.SimpleStatementLine]:
+    """Make the table of per-field decoders used to decode a class lazily."""
+    return _parse_table(
+        make_lazy_decoders_source(item_info, fields, tag=tag, content=content, cache=cache),
+        LAZY_DECODERS_DOC,
+    )
+
+
+def make_lazy_fields(
+    fields: typing.Sequence[utils.FieldInfo],
+) -> typing.Sequence[libcst.SimpleStatementLine]:
+    """Make the table of decoders of the fields only decoded on first access."""
+    return _parse_table(make_lazy_fields_source(fields), LAZY_FIELDS_DOC)
+
+
+def _make_field_types(
+    item_info: utils.ItemInfo,
+    field_type: str,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[str]:
+    if field_type.endswith("[]"):
+        inner = _make_field_types(item_info, field_type.removesuffix("[]"), cache=cache)
+        return [f"validation.ListOf({', '.join(inner)})"]
+
+    if field_type in utils.TYPE_MAPPING:
+        raw_annotation = utils.TYPE_MAPPING[field_type]
+        if raw_annotation == "IpAddr":
+            return ["ipaddress.IPv4Address", "ipaddress.IPv6Address"]
+
+        return [raw_annotation]
+
+    return [_make_reference(item_info, field_type, category=cache[field_type].category)]
+
+
+def make_field_types_source(
+    item_info: utils.ItemInfo,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: tuple[str, str] | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str | None:
+    """Make the source of the method returning the allowed field types used by runtime validation.
+
+    The table is returned by a static method as it may refer to classes that
+    are defined later in the module. Fields of arbitrary type, such as files,
+    are not checked. The tag of an enum variant is passed as a ``(key, value)``
+    pair and must match exactly.
+    """
+    entries = [f'"{tag[0]}": ("{tag[1]}",)'] if tag else []
+    for field in fields:
+        if utils.TYPE_MAPPING.get(field["type"]) == "object":
+            continue
+
+        field_types = _make_field_types(item_info, field["type"], cache=cache)
+        if field["nullable"]:
+            field_types.append("None")
+
+        if field["omittable"]:
+            field_types.append("undefined.Undefined")
+
+        trailing_comma = "," if len(field_types) == 1 else ""
+        entries.append(f'"{field["name"]}": ({", ".join(field_types)}{trailing_comma})')
+
+    if not entries:
+        return None
+
+    return (
+        "@staticmethod\n"
+        "def _field_types() -> validation.FieldTypes:\n"
+        f'    """{FIELD_TYPES_DOC}"""\n'
+        f"    return {{{', '.join(entries)}}}\n"
+    )
+
+
+def make_field_types(
+    item_info: utils.ItemInfo,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: tuple[str, str] | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> typing.Sequence[libcst.FunctionDef]:
+    """Make the method returning the allowed field types used by optional runtime validation."""
+    source = make_field_types_source(item_info, fields, tag=tag, cache=cache)
+    return [_parse_method(source)] if source else []
+
+
+_RANGE_LIMIT_PATTERN: typing.Final[typing.Pattern[str]] = re.compile(
+    r"between (\d+) and (\d+) characters long",
+)
+_LOWER_LIMIT_PATTERN: typing.Final[typing.Pattern[str]] = re.compile(
+    r"at-least (\d+) characters long",
+)
+_UPPER_LIMIT_PATTERN: typing.Final[typing.Pattern[str]] = re.compile(
+    r"cannot be more than (\d+) characters long",
+)
+_INSTANCE_LIMIT_PATTERN: typing.Final[typing.Pattern[str]] = re.compile(
+    r"upper\s+limit\s+is\s+the\s+instance's\s+\[`InstanceInfo`\]\s+`(\w+)`",
+)
+"""Matches upper length limits documented as an attribute of ``InstanceInfo``."""
+_TRIMMED_PATTERN: typing.Final[typing.Pattern[str]] = re.compile(
+    r"trimmed\s+from\s+leading\s+and\s+trailing\s+whitespace",
+)
+"""Matches fields documented to be trimmed before their length is checked."""
+
+
+def get_length_limits(field: utils.FieldInfo) -> tuple[int, int | str | None, bool] | None:
+    """Get the lower and upper length limit of a string field from its documentation.
+
+    The upper limit is either a number of characters, the name of the
+    attribute of ``InstanceInfo`` that holds it, or ``None`` if there is none.
+    The last value is whether the field is documented to be trimmed from
+    whitespace before its length is checked. Fields without any documented
+    limit return ``None``.
+    """
+    doc = field["doc"]
+    if not doc or utils.TYPE_MAPPING.get(field["type"]) != "str":
+        return None
+
+    trimmed = bool(_TRIMMED_PATTERN.search(doc))
+    range_match = _RANGE_LIMIT_PATTERN.search(doc)
+    if range_match:
+        return int(range_match[1]), int(range_match[2]), trimmed
+
+    lower_match = _LOWER_LIMIT_PATTERN.search(doc)
+    upper_match = _UPPER_LIMIT_PATTERN.search(doc)
+    instance_match = _INSTANCE_LIMIT_PATTERN.search(doc)
+    if not (lower_match or upper_match or instance_match):
+        return None
+
+    upper: int | str | None = None
+    if upper_match:
+        upper = int(upper_match[1])
+
+    elif instance_match:
+        upper = instance_match[1]
+
+    return int(lower_match[1]) if lower_match else 0, upper, trimmed
+
+
+def make_length_limits_source(fields: typing.Sequence[utils.FieldInfo]) -> str | None:
+    """Make the source of the table of documented length limits used by runtime validation."""
+    entries: list[str] = []
+    for field in fields:
+        limits = get_length_limits(field)
+        if limits is None:
+            continue
+
+        lower, upper, trimmed = limits
+        upper_source = json.dumps(upper) if isinstance(upper, str) else str(upper)
+        entries.append(f'"{field["name"]}": ({lower}, {upper_source}, {trimmed})')
+
+    if not entries:
+        return None
+
+    return f"_LENGTH_LIMITS: typing.ClassVar[validation.LengthLimits] = {{{', '.join(entries)}}}"
+
+
+def make_length_limits(
+    fields: typing.Sequence[utils.FieldInfo],
+) -> typing.Sequence[libcst.SimpleStatementLine]:
+    """Make the table of documented length limits used by optional runtime validation."""
+    return _parse_table(make_length_limits_source(fields), LENGTH_LIMITS_DOC)
+
+
+def make_key_slots_source(
+    item_info: utils.ItemInfo,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: str | None = None,
+    content: str | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the source of the flat map of raw API keys to the attributes they are stored in.
+
+    Flattened fields are resolved and keys are mapped to the attribute of
+    their field, so generic decoders need a single lookup per key. Each entry
+    also holds a function decoding the raw value, or ``None`` if the raw value
+    is stored as-is. For adjacently tagged variants the ``content`` key is
+    mapped to ``None`` and the map of the keys inside of it.
+    """
+    entries: list[str] = []
+    for field in fields:
+        expr = make_decode_expr(item_info, "value", field["type"], cache=cache)
+        if expr == "value":
+            decoder = "None"
+
+        elif field["nullable"]:
+            decoder = f"lambda value: None if value is None else {expr}"
+
+        else:
+            decoder = f"lambda value: {expr}"
+
+        entries.append(f'"{field["name"]}": ("{field["name"]}", {decoder})')
+
+    if content:
+        entries = [f'"{content}": (None, {{{", ".join(entries)}}})']
+
+    if tag:
+        entries.insert(0, f'"{tag}": ("{tag}", None)')
+
+    return f"_KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {{{', '.join(entries)}}}"
+
+
+def make_key_slots(
+    item_info: utils.ItemInfo,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    tag: str | None = None,
+    content: str | None = None,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> typing.Sequence[libcst.SimpleStatementLine]:
+    """Make the flat map of raw API keys to the attributes they are stored in."""
+    return _parse_table(
+        make_key_slots_source(item_info, fields, tag=tag, content=content, cache=cache),
+        KEY_SLOTS_DOC,
+    )
+
+
+def make_enum_table_sources(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+) -> tuple[tuple[str, str], ...]:
+    """Make the source and docs of the lookup tables for a pure unit enum."""
+    name = item_info["name"]
+    prefix = to_constant_case(name)
+    members = [f"{name}.{variant['name']}" for variant in item["variants"]]
+
+    values = ", ".join(
+        f'"{variant["name"]}": {member}'
+        for variant, member in zip(item["variants"], members, strict=True)
+    )
+    codes = ", ".join(f"{member}: {code}" for code, member in enumerate(members))
+    by_code = ", ".join(members) + ("," if len(members) == 1 else "")
+
+    return (
+        (
+            f"{prefix}_VALUES: typing.Final[dict[str, {name}]] = {{{values}}}",
+            f"Mapping of raw API values to {name} members.",
+        ),
+        (
+            f"{prefix}_CODES: typing.Final[dict[{name}, int]] = {{{codes}}}",
+            f"Mapping of {name} members to their compact integer code.",
+        ),
+        (
+            f"{prefix}_MEMBERS: typing.Final[tuple[{name}, ...]] = ({by_code})",
+            f"{name} members, indexed by their compact integer code.",
+        ),
+    )
+
+
+def make_enum_tables(item_info: utils.ItemInfo, item: utils.EnumItem) -> list[utils.ModuleCodeType]:
+    """Make the lookup tables for a pure unit enum.
+
+    These map raw API values to enum members for decoding, and enum members to
+    (and from) small integer codes for compact storage.
+    """
+    statements: list[utils.ModuleCodeType] = []
+    for code, doc in make_enum_table_sources(item_info, item):
+        statements.append(
+            libcst.parse_statement(code).with_changes(leading_lines=[libcst.EmptyLine()]),
+        )
+        statements.append(make_docstring(doc, indentation=0))
+
+    return statements
+
+
+def make_variant_decoder_sources(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    variant_names: typing.Sequence[str],
+) -> tuple[str, str, str]:
+    """Make the source of the tag lookup table, its docs and the decoder of a tagged enum."""
+    name = item_info["name"]
+    prefix = to_constant_case(name)
+    entries = ", ".join(
+        f'"{variant["name"]}": {variant_name}'
+        for variant, variant_name in zip(item["variants"], variant_names, strict=True)
+    )
+
+    return (
+        f"{prefix}_VARIANTS: typing.Final[dict[str, type[{name}]]] = {{{entries}}}",
+        f"Mapping of `{item['tag']}` tags to {name} variants.",
+        f"def decode_{prefix.lower()}(payload: typing.Mapping[str, typing.Any]) -> {name}:\n"
+        f'    """Decode a raw API payload into the matching {name} variant."""\n'
+        f'    return {prefix}_VARIANTS[payload["{item["tag"]}"]].from_payload(payload)\n',
+    )
+
+
+def make_variant_decoder(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    variants: typing.Sequence[libcst.ClassDef],
+) -> list[utils.ModuleCodeType]:
+    """Make the tag lookup table and decoder function for a tagged enum."""
+    table, doc, decoder = make_variant_decoder_sources(
+        item_info,
+        item,
+        [cls.name.value for cls in variants],
+    )
+
+    return [
+        libcst.parse_statement(table).with_changes(leading_lines=[libcst.EmptyLine()]),
+        make_docstring(doc, indentation=0),
+        libcst.parse_statement(decoder).with_changes(
+            leading_lines=[libcst.EmptyLine(), libcst.EmptyLine()],
+        ),
+    ]
+
+
+JSON_KINDS: typing.Final[frozenset[str]] = frozenset(
+    ("None", "bool", "int", "str", "list", "dict"),
+)
+"""The python types of all values a JSON payload can hold, by name."""
+
+
+def _get_json_kinds(
+    field: utils.FieldInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> frozenset[str]:
+    field_type = field["type"]
+    if field_type.endswith("[]"):
+        kinds = {"list"}
+
+    elif field_type in utils.TYPE_MAPPING:
+        annotation = utils.TYPE_MAPPING[field_type]
+        if annotation == "object":
+            # Anything goes, so this can never be used to tell variants apart.
+            return JSON_KINDS
+
+        kinds = {"str" if annotation == "IpAddr" else annotation}
+
+    else:
+        kinds = {"str" if is_pure_unit_enum(cache[field_type].data["item"]) else "dict"}
+
+    if field["nullable"]:
+        kinds.add("None")
+
+    return frozenset(kinds)
+
+
+@attrs.frozen
+class _VariantShape:
+    name: str
+    """The name of the class of the variant."""
+    required: frozenset[str]
+    """The keys that are always present in payloads of the variant."""
+    kinds: typing.Mapping[str, frozenset[str]]
+    """The kinds of values every key, required or not, can hold."""
+
+    @classmethod
+    def from_fields(
+        cls,
+        name: str,
+        fields: typing.Sequence[utils.FieldInfo],
+        *,
+        cache: typing.Mapping[str, utils.AutodocItem],
+    ) -> "_VariantShape":
+        return cls(
+            name=name,
+            required=frozenset(field["name"] for field in fields if not field["omittable"]),
+            kinds={field["name"]: _get_json_kinds(field, cache=cache) for field in fields},
+        )
+
+
+def _make_kind_check(key: str, kind: str) -> str:
+    value = f'payload["{key}"]'
+    if kind == "None":
+        return f"{value} is None"
+
+    if kind == "int":
+        # bool is a subclass of int, so isinstance would match both.
+        return f"type({value}) is int"
+
+    return f"isinstance({value}, {kind})"
+
+
+def _split_shapes(
+    shapes: typing.Sequence[_VariantShape],
+    present: frozenset[str],
+) -> tuple[str, list[_VariantShape], list[_VariantShape], frozenset[str]] | None:
+    # Find the check that best splits the remaining variants, preferring checks
+    # that leave the fewest variants in the largest branch. Variants that may
+    # or may not pass a check, e.g. because a key is omittable, end up in both
+    # branches. A branch that holds every variant must have learnt that a key
+    # is present, or the same check would be picked for it again forever.
+    best: tuple[str, list[_VariantShape], list[_VariantShape], frozenset[str]] | None = None
+    best_score = (len(shapes), 2 * len(shapes))
+
+    def consider(
+        check: str,
+        passed: list[_VariantShape],
+        failed: list[_VariantShape],
+        passed_present: frozenset[str],
+    ) -> None:
+        nonlocal best, best_score
+        if len(failed) == len(shapes) or (len(passed) == len(shapes) and passed_present == present):
+            return
+
+        score = (max(len(passed), len(failed)), len(passed) + len(failed))
+        if passed and failed and score < best_score:
+            best = (check, passed, failed, passed_present)
+            best_score = score
+
+    keys = sorted({key for shape in shapes for key in shape.kinds})
+    for key in keys:
+        if key not in present and not all(key in shape.required for shape in shapes):
+            consider(
+                f'"{key}" in payload',
+                [shape for shape in shapes if key in shape.kinds],
+                [shape for shape in shapes if key not in shape.required],
+                present | {key},
+            )
+            continue
+
+        for kind in sorted(set().union(*(shape.kinds[key] for shape in shapes))):
+            consider(
+                _make_kind_check(key, kind),
+                [shape for shape in shapes if kind in shape.kinds[key]],
+                [shape for shape in shapes if shape.kinds[key] - {kind}],
+                present,
+            )
+
+    return best
+
 
-    This takes into account indentation and tries to convert autodoc markdown to rst.
-    """
-    # TODO: Make this work better by taking max line length into account, etc.
+def _make_fallback(shapes: typing.Sequence[_VariantShape], *, indentation: int) -> list[str]:
+    # No check tells the remaining variants apart, so they are tried in order
+    # just like serde does, and payloads decode into the first that accepts them.
     indent = " " * 4 * indentation
+    if len(shapes) == 1:
+        return [f"{indent}return {shapes[0].name}.from_payload(payload)"]
 
-    doc = (
-        re.sub(
-            r"### (\w+)\n\n",
-            _make_rest_header,
-            doc.replace("-----\n\n", ""),
-        )
-        .replace("\n", f"\n{indent}")
-        .replace(". ", f".\n\n{indent}")
-        .replace("> ", "")
-        .replace(">\n", "\n")
-    )
+    return [
+        f"{indent}try:",
+        f"{indent}    return {shapes[0].name}.from_payload(payload)",
+        f"{indent}except (KeyError, TypeError, ValueError):",
+        *_make_fallback(shapes[1:], indentation=indentation + 1),
+    ]
 
-    strtype = "r" if "\\" in doc else ""
-    end = f"\n{indent}" if "\n" in doc else ""
 
-    return libcst.SimpleStatementLine(
-        body=[
-            libcst.Expr(
-                libcst.SimpleString(
-                    f'{strtype}"""{doc}{end}"""',
-                ),
-            ),
-        ],
-    )
+def _make_decision_tree(
+    shapes: typing.Sequence[_VariantShape],
+    *,
+    present: frozenset[str] = frozenset(),
+    indentation: int = 1,
+) -> list[str]:
+    indent = " " * 4 * indentation
+    split = _split_shapes(shapes, present)
+    if split is None:
+        return _make_fallback(shapes, indentation=indentation)
+
+    check, passed, failed, passed_present = split
+    return [
+        f"{indent}if {check}:",
+        *_make_decision_tree(passed, present=passed_present, indentation=indentation + 1),
+        *_make_decision_tree(failed, present=present, indentation=indentation),
+    ]
 
 
-def make_annotation(
-    item_info: utils.ItemInfo,
-    field_type: str,
+def _get_variant_wire_fields(
+    variant: utils.EnumVariant,
     *,
     cache: typing.Mapping[str, utils.AutodocItem],
-) -> libcst.BaseExpression:
-    """Make type annotation for a given field."""
-    is_list = field_type.endswith("[]")
-    if is_list:
-        field_type = field_type.removesuffix("[]")
-
-    if field_type in utils.TYPE_MAPPING:
-        raw_annotation = utils.TYPE_MAPPING[field_type]
-        annotation = IPADDR_ANN if raw_annotation == "IpAddr" else libcst.Name(raw_annotation)
+) -> list[utils.FieldInfo]:
+    if variant["type"] == "object":
+        return resolve_fields(variant["fields"], cache=cache)
 
-    else:
-        category = cache[field_type].category
-        if category == item_info["category"].lower():
-            annotation = libcst.Name(f"{field_type}")
+    if variant["type"] == "tuple":
+        flattened = cache[variant["field_type"]].data["item"]
+        assert flattened["type"] == "object"
+        return resolve_fields(flattened["fields"], cache=cache)
 
-        else:
-            annotation = libcst.Attribute(
-                libcst.Name(f"{category}_m"),
-                libcst.Name(field_type),
-            )
+    return []
 
-    if not is_list:
-        return annotation
 
-    return libcst.Subscript(
-        value=libcst.Attribute(
-            libcst.Name("typing"),
-            libcst.Name("Sequence"),
-        ),
-        slice=[
-            libcst.SubscriptElement(
-                libcst.Index(annotation),
-            ),
-        ],
-    )
+def check_untagged_variants(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> None:
+    """Check that all variants of an untagged enum are represented as objects."""
+    for variant in item["variants"]:
+        if variant["type"] == "unit" or (
+            variant["type"] == "tuple"
+            and cache[variant["field_type"]].data["item"]["type"] != "object"
+        ):
+            msg = (
+                f"Variant {variant['name']} of untagged enum {item_info['name']} is not"
+                " represented as an object, which is not supported."
+            )
+            raise NotImplementedError(msg)
 
 
-def make_field(
+def make_untagged_decoder_source(
     item_info: utils.ItemInfo,
-    field: utils.FieldInfo,
+    item: utils.EnumItem,
+    variant_names: typing.Sequence[str],
     *,
     cache: typing.Mapping[str, utils.AutodocItem],
-) -> typing.Sequence[libcst.SimpleStatementLine]:
-    """Make an attrs class field from an autodoc item field.
+) -> str:
+    """Make the source of the decoder function for an untagged enum.
 
-    This consists of a name, an annotation, and an attrs.field(...) expression.
+    Rather than trying every variant in turn, the decoder walks a decision
+    tree of key presence and value type checks that is computed here, so that
+    every payload is classified in a few dict lookups.
     """
-    annotation = make_annotation(item_info, field["type"], cache=cache)
-
-    if field["nullable"]:
-        annotation = libcst.BinaryOperation(
-            left=annotation,
-            operator=libcst.BitOr(),
-            right=libcst.Name("None"),
+    name = item_info["name"]
+    shapes = [
+        _VariantShape.from_fields(
+            variant_name,
+            _get_variant_wire_fields(variant, cache=cache),
+            cache=cache,
         )
+        for variant, variant_name in zip(item["variants"], variant_names, strict=True)
+    ]
 
-    args: list[libcst.Arg] = []
-    if field["omittable"]:
-        args.append(
-            libcst.Arg(
-                keyword=libcst.Name("default"),
-                value=UNDEFINED,
-                equal=EQUALS,
-            ),
-        )
-        annotation = libcst.BinaryOperation(
-            left=annotation,
-            operator=libcst.BitOr(),
-            right=UNDEFINED_ANN,
-        )
+    return (
+        f"def decode_{to_constant_case(name).lower()}"
+        f"(payload: typing.Mapping[str, typing.Any]) -> {name}:\n"
+        f'    """Decode a raw API payload into the matching {name} variant.\n\n'
+        f"    As {name} is untagged, the variant is picked by the keys and value\n"
+        '    types of the payload.\n    """\n'
+        + "".join(f"{line}\n" for line in _make_decision_tree(shapes))
+    )
 
-    lines = [
-        libcst.SimpleStatementLine(
-            body=[
-                libcst.AnnAssign(
-                    target=libcst.Name(field["name"]),
-                    annotation=libcst.Annotation(annotation),
-                    value=libcst.Call(ATTRS_FIELD, args),
-                ),
-            ],
-        ),
-    ]
 
-    if field["doc"]:
-        lines.append(make_docstring(field["doc"], indentation=1))
+def make_untagged_decoder(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    variants: typing.Sequence[libcst.ClassDef],
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[utils.ModuleCodeType]:
+    """Make the decoder function for an untagged enum.
 
-    return lines
+    Rather than trying every variant in turn, the decoder walks a decision
+    tree of key presence and value type checks, so that every payload is
+    classified in a few dict lookups.
+    """
+    decoder = libcst.parse_statement(
+        make_untagged_decoder_source(
+            item_info,
+            item,
+            [cls.name.value for cls in variants],
+            cache=cache,
+        ),
+    )
+    return [decoder.with_changes(leading_lines=[libcst.EmptyLine(), libcst.EmptyLine()])]
 
 
 def parse_object_item(
@@ -221,80 +1426,152 @@ def parse_object_item(
         else:
             fields.extend(_get_inheritable_body(cache[field["type"]]))
 
+    wire_fields = resolve_fields(item["fields"], cache=cache)
+    fields.extend(make_lazy_fields(wire_fields))
+    fields.extend(make_lazy_decoders(item_info, wire_fields, cache=cache))
+    fields.extend(make_length_limits(wire_fields))
+    fields.extend(make_key_slots(item_info, wire_fields, cache=cache))
+    fields.extend(make_field_types(item_info, wire_fields, cache=cache))
+    fields.append(make_to_payload(wire_fields, cache=cache))
+    fields.append(make_from_payload(item_info, item_info["name"], wire_fields, cache=cache))
+    fields.append(make_from_trusted(item_info, item_info["name"], wire_fields, cache=cache))
+    fields.extend(make_reduce(item_info["name"], wire_fields))
+
     return libcst.ClassDef(
         libcst.Name(item_info["name"]),
         body=libcst.IndentedBlock(
             body=fields,
         ),
+        bases=[LAZY_FIELDS_BASE] if has_lazy_fields(wire_fields) else [],
         decorators=[ATTRS_DEFINE],
     )
 
 
 def _prepare_enum_variant(
     item_info: utils.ItemInfo,
-    item: utils.EnumItem,
     variant: utils.EnumVariant,
     *,
     append_nodes: typing.Sequence[libcst.BaseStatement] | None = None,
+    wire_fields: typing.Sequence[utils.FieldInfo] = (),
+    cache: typing.Mapping[str, utils.AutodocItem],
 ) -> libcst.ClassDef:
-    """Parse an enum item into a python attrs class."""
+    """Parse a variant of the enum item of ``item_info`` into a python attrs class."""
     if append_nodes is None:
         append_nodes = []
 
+    item = item_info["item"]
+    assert item["type"] == "enum"
     doc = variant["doc"] or f"Please refer to {item_info['name']}."
+    name = to_upper_snake_case(variant["name"]) + item_info["name"]
+    tag = item["tag"]
+
+    codec_nodes: list[libcst.BaseStatement] = []
+    if tag and variant["type"] == "unit":
+        codec_nodes.extend(make_frame(tag, variant["name"]))
+
+    content = item["content"] if variant["type"] == "object" else None
+    if wire_fields:
+        codec_nodes.extend(make_lazy_fields(wire_fields))
+        codec_nodes.extend(
+            make_lazy_decoders(
+                item_info,
+                wire_fields,
+                tag=tag,
+                content=content,
+                cache=cache,
+            ),
+        )
+        codec_nodes.extend(make_length_limits(wire_fields))
 
-    if item["tag"]:
-        name = to_upper_snake_case(variant["name"]) + item_info["name"]
+    if wire_fields or tag:
+        # Variants without fields still have their tag decoded and checked.
+        codec_nodes.extend(
+            make_key_slots(item_info, wire_fields, tag=tag, content=content, cache=cache),
+        )
+        codec_nodes.extend(
+            make_field_types(
+                item_info,
+                wire_fields,
+                tag=(tag, variant["name"]) if tag else None,
+                cache=cache,
+            ),
+        )
 
-        return libcst.ClassDef(
-            libcst.Name(name),
-            body=libcst.IndentedBlock(
+    codec_nodes.append(
+        make_to_payload(wire_fields, tag=tag, content=content, cache=cache),
+    )
+    options = utils.ClassOptions(tag=(tag, variant["name"]) if tag else None, content=content)
+    codec_nodes.append(
+        make_from_payload(item_info, name, wire_fields, options=options, cache=cache),
+    )
+    codec_nodes.append(
+        make_from_trusted(
+            item_info,
+            name,
+            wire_fields,
+            tag=(tag, variant["name"]) if tag else None,
+            cache=cache,
+        ),
+    )
+    codec_nodes.extend(
+        make_reduce(name, wire_fields, tag=(tag, variant["name"]) if tag else None),
+    )
+
+    tag_nodes: list[libcst.BaseStatement] = []
+    if tag:
+        tag_nodes.append(
+            libcst.SimpleStatementLine(
                 body=[
-                    make_docstring(doc, indentation=1),
-                    libcst.SimpleStatementLine(
-                        body=[
-                            libcst.AnnAssign(
-                                target=libcst.Name(item["tag"]),
-                                annotation=libcst.Annotation(
-                                    annotation=libcst.Subscript(
-                                        value=libcst.Attribute(
-                                            libcst.Name("typing"),
-                                            libcst.Name("Literal"),
+                    libcst.AnnAssign(
+                        target=libcst.Name(tag),
+                        annotation=libcst.Annotation(
+                            annotation=libcst.Subscript(
+                                value=libcst.Attribute(
+                                    libcst.Name("typing"),
+                                    libcst.Name("Literal"),
+                                ),
+                                slice=[
+                                    libcst.SubscriptElement(
+                                        libcst.Index(
+                                            libcst.SimpleString(f'"{variant["name"]}"'),
                                         ),
-                                        slice=[
-                                            libcst.SubscriptElement(
-                                                libcst.Index(
-                                                    libcst.SimpleString(f'"{variant["name"]}"'),
-                                                ),
-                                            ),
-                                        ],
                                     ),
-                                ),
-                                value=libcst.Call(ATTRS_FIELD),
+                                ],
                             ),
-                        ],
+                        ),
+                        value=_make_field_value(omittable=False),
                     ),
-                    *append_nodes,
                 ],
             ),
-            decorators=[ATTRS_DEFINE],
         )
 
-    raise NotImplementedError
+    return libcst.ClassDef(
+        libcst.Name(name),
+        body=libcst.IndentedBlock(
+            body=[
+                make_docstring(doc, indentation=1),
+                *tag_nodes,
+                *append_nodes,
+                *codec_nodes,
+            ],
+        ),
+        bases=[LAZY_FIELDS_BASE] if has_lazy_fields(wire_fields) else [],
+        decorators=[ATTRS_DEFINE],
+    )
 
 
 def parse_unit_enum_variant(
     item_info: utils.ItemInfo,
-    item: utils.EnumItem,
     variant: utils.UnitEnumVariant,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
 ) -> libcst.ClassDef:
     """Parse a unit enum into a python attrs class."""
-    return _prepare_enum_variant(item_info, item, variant)
+    return _prepare_enum_variant(item_info, variant, cache=cache)
 
 
 def parse_object_enum_variant(
     item_info: utils.ItemInfo,
-    item: utils.EnumItem,
     variant: utils.ObjectEnumVariant,
     *,
     cache: typing.Mapping[str, utils.AutodocItem],
@@ -310,20 +1587,22 @@ def parse_object_enum_variant(
 
     return _prepare_enum_variant(
         item_info,
-        item,
         variant,
         append_nodes=fields,
+        wire_fields=resolve_fields(variant["fields"], cache=cache),
+        cache=cache,
     )
 
 
 def parse_tuple_enum_variant(
     item_info: utils.ItemInfo,
-    item: utils.EnumItem,
     variant: utils.TupleEnumVariant,
     *,
     cache: typing.Mapping[str, utils.AutodocItem],
 ) -> libcst.ClassDef:
     """Parse a tuple enum variant into a python attrs class."""
+    item = item_info["item"]
+    assert item["type"] == "enum"
     field_type = variant["field_type"]
 
     if item["content"]:
@@ -331,31 +1610,48 @@ def parse_tuple_enum_variant(
 
         return _prepare_enum_variant(
             item_info,
-            item,
             variant,
             append_nodes=[
                 libcst.SimpleStatementLine(
                     body=[
                         libcst.AnnAssign(
                             target=libcst.Name(item["content"]),
-                            annotation=libcst.Annotation(annotation),
-                            value=libcst.Call(ATTRS_FIELD),
+                            annotation=_make_field_annotation(annotation),
+                            value=_make_field_value(omittable=False),
                         ),
                     ],
                 ),
             ],
+            wire_fields=[
+                utils.FieldInfo(
+                    name=item["content"],
+                    doc=None,
+                    type=field_type,
+                    nullable=False,
+                    omittable=False,
+                    flattened=False,
+                ),
+            ],
+            cache=cache,
         )
 
+    flattened = cache[field_type].data["item"]
+    assert flattened["type"] == "object"
+
     return _prepare_enum_variant(
         item_info,
-        item,
         variant,
         append_nodes=_get_inheritable_body(cache[field_type]),
+        wire_fields=resolve_fields(flattened["fields"], cache=cache),
+        cache=cache,
     )
 
 
-def parse_pure_unit_enum(item_info: utils.ItemInfo, item: utils.EnumItem) -> list[libcst.ClassDef]:
-    """Parse a pure unit enum into a python Enum class."""
+def parse_pure_unit_enum(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+) -> list[utils.ModuleCodeType]:
+    """Parse a pure unit enum into a python Enum class and its lookup tables."""
     body: list[libcst.BaseStatement] = []
 
     if item_info["doc"]:
@@ -394,6 +1690,7 @@ def parse_pure_unit_enum(item_info: utils.ItemInfo, item: utils.EnumItem) -> lis
                 ),
             ],
         ),
+        *make_enum_tables(item_info, item),
     ]
 
 
@@ -402,44 +1699,35 @@ def parse_enum_item(
     item: utils.EnumItem,
     *,
     cache: typing.Mapping[str, utils.AutodocItem],
-) -> list[libcst.ClassDef] | list[libcst.ClassDef | libcst.SimpleStatementLine]:
+) -> list[utils.ModuleCodeType]:
     """Parse an enum item into python code.
 
     This automatically determines the type of enum item and parses it
     accordingly.
 
-    In case the enum is *not* a pure unit enum, the last item in the returned
-    list will be a union of all other items that make up the enum item. This is
-    done to replicate the Rust-based eludris backend as closely as possible.
+    In case the enum is *not* a pure unit enum, the returned list will contain
+    a union of all other classes that make up the enum item. This is done to
+    replicate the Rust-based eludris backend as closely as possible. The union
+    is followed by a decoder function that picks the right variant by its tag,
+    or by the keys and value types of the payload for untagged enums.
     """
-    if not item["tag"]:
+    if is_pure_unit_enum(item):
         return parse_pure_unit_enum(item_info, item)
 
+    if item["untagged"]:
+        check_untagged_variants(item_info, item, cache=cache)
+
     variants: list[libcst.ClassDef] = []
 
     for variant in item["variants"]:
         if variant["type"] == "unit":
-            variants.append(parse_unit_enum_variant(item_info, item, variant))
+            variants.append(parse_unit_enum_variant(item_info, variant, cache=cache))
 
         elif variant["type"] == "tuple":
-            variants.append(
-                parse_tuple_enum_variant(
-                    item_info,
-                    item,
-                    variant,
-                    cache=cache,
-                ),
-            )
+            variants.append(parse_tuple_enum_variant(item_info, variant, cache=cache))
 
         if variant["type"] == "object":
-            variants.append(
-                parse_object_enum_variant(
-                    item_info,
-                    item,
-                    variant,
-                    cache=cache,
-                ),
-            )
+            variants.append(parse_object_enum_variant(item_info, variant, cache=cache))
 
     variant_union = libcst.BinaryOperation(
         left=variants[-2].name,
@@ -453,7 +1741,7 @@ def parse_enum_item(
             right=variant_union,
         )
 
-    body = [
+    body: list[utils.ModuleCodeType] = [
         *variants,
         libcst.SimpleStatementLine(
             body=[
@@ -468,9 +1756,213 @@ def parse_enum_item(
     if item_info["doc"]:
         body.append(make_docstring(item_info["doc"], indentation=0))
 
+    if item["untagged"]:
+        body.extend(make_untagged_decoder(item_info, item, variants, cache=cache))
+
+    else:
+        body.extend(make_variant_decoder(item_info, item, variants))
+
     return body
 
 
+def make_raw_annotation(
+    item_info: utils.ItemInfo,
+    field_type: str,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the source of the type annotation of a field in a TypedDict."""
+    if field_type.endswith("[]"):
+        inner = make_raw_annotation(item_info, field_type.removesuffix("[]"), cache=cache)
+        return f"list[{inner}]"
+
+    if field_type in utils.TYPE_MAPPING:
+        annotation = utils.TYPE_MAPPING[field_type]
+        return "str" if annotation == "IpAddr" else annotation
+
+    return _make_reference(item_info, field_type, category=cache[field_type].category)
+
+
+def make_raw_doc(name: str, *, role: str = "class") -> str:
+    """Make the docs of a TypedDict, referring to the class or alias it mirrors."""
+    return f"The raw API representation of :{role}:`~eludris_autodoc.{name}`."
+
+
+def _make_raw_field(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    annotation = make_raw_annotation(item_info, field["type"], cache=cache)
+    if field["nullable"]:
+        annotation += " | None"
+
+    code = f"    {field['name']}: {annotation}\n"
+    if field["doc"]:
+        code += f"    {make_docstring_source(field['doc'], indentation=1)}\n"
+
+    return code
+
+
+def make_typed_dict_sources(
+    item_info: utils.ItemInfo,
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    options: utils.ClassOptions,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[str]:
+    """Make the source of the classes of a TypedDict that mirrors the raw form of a class.
+
+    The content of enum variants is annotated with ``options.content_annotation``.
+    As ``typing.NotRequired`` is not available on all supported python versions,
+    omittable fields are split off into a subclass with ``total=False``. The
+    required fields then go into a private base class.
+    """
+    required: list[str] = []
+    if options.tag:
+        key, value = options.tag
+        required.append(f'    {key}: typing.Literal["{value}"]\n')
+
+    if options.content:
+        required.append(f"    {options.content}: {options.content_annotation}\n")
+
+    required.extend(
+        _make_raw_field(item_info, field, cache=cache) for field in fields if not field["omittable"]
+    )
+    omittable = [
+        _make_raw_field(item_info, field, cache=cache) for field in fields if field["omittable"]
+    ]
+
+    docstring = ""
+    if options.doc:
+        docstring = f"    {make_docstring_source(options.doc, indentation=1)}\n"
+
+    if not omittable:
+        body = "".join(required) or "    pass\n"
+        return [f"class {name}(typing.TypedDict):\n{docstring}{body}"]
+
+    if not required:
+        return [f"class {name}(typing.TypedDict, total=False):\n{docstring}{''.join(omittable)}"]
+
+    return [
+        f"class _{name}Required(typing.TypedDict):\n{''.join(required)}",
+        f"class {name}(_{name}Required, total=False):\n{docstring}{''.join(omittable)}",
+    ]
+
+
+def make_typed_dict(
+    item_info: utils.ItemInfo,
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    options: utils.ClassOptions,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[utils.ModuleCodeType]:
+    """Make a TypedDict that mirrors the raw API representation of a class.
+
+    Omittable fields are split off into a subclass with ``total=False``, see
+    ``make_typed_dict_sources``.
+    """
+    return [
+        libcst.parse_statement(code).with_changes(
+            leading_lines=[libcst.EmptyLine(), libcst.EmptyLine()],
+        )
+        for code in make_typed_dict_sources(item_info, name, fields, options=options, cache=cache)
+    ]
+
+
+def _parse_raw_enum_variant(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    variant: utils.EnumVariant,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[utils.ModuleCodeType]:
+    name = to_upper_snake_case(variant["name"]) + item_info["name"]
+    tag = (item["tag"], variant["name"]) if item["tag"] else None
+    options = utils.ClassOptions(doc=make_raw_doc(name), tag=tag)
+
+    if variant["type"] == "unit":
+        return make_typed_dict(item_info, name, [], options=options, cache=cache)
+
+    if variant["type"] == "object":
+        fields = resolve_fields(variant["fields"], cache=cache)
+        if not item["content"]:
+            return make_typed_dict(item_info, name, fields, options=options, cache=cache)
+
+        # Adjacently tagged fields are nested under the content key.
+        content_name = f"{name}Data"
+        content_options = utils.ClassOptions(doc=f"The ``{item['content']}`` of :class:`{name}`.")
+        options = attrs.evolve(options, content=item["content"], content_annotation=content_name)
+        return [
+            *make_typed_dict(item_info, content_name, fields, options=content_options, cache=cache),
+            *make_typed_dict(item_info, name, [], options=options, cache=cache),
+        ]
+
+    if item["content"]:
+        annotation = make_raw_annotation(item_info, variant["field_type"], cache=cache)
+        options = attrs.evolve(options, content=item["content"], content_annotation=annotation)
+        return make_typed_dict(item_info, name, [], options=options, cache=cache)
+
+    flattened = cache[variant["field_type"]].data["item"]
+    assert flattened["type"] == "object"
+    fields = resolve_fields(flattened["fields"], cache=cache)
+    return make_typed_dict(item_info, name, fields, options=options, cache=cache)
+
+
+def make_raw_alias_source(item_info: utils.ItemInfo) -> str:
+    """Make the source of the alias for the raw API representation of an enum.
+
+    This is a union of literals for pure unit enums, and a union of the
+    TypedDicts of every variant otherwise.
+    """
+    name = item_info["name"]
+    item = item_info["item"]
+    assert item["type"] == "enum"
+
+    if is_pure_unit_enum(item):
+        values = ", ".join(f'"{variant["name"]}"' for variant in item["variants"])
+        return f"{name} = typing.Literal[{values}]"
+
+    variant_names = [to_upper_snake_case(variant["name"]) + name for variant in item["variants"]]
+    return f"{name} = {' | '.join(variant_names)}"
+
+
+def _parse_raw_item(
+    item_info: utils.ItemInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[utils.ModuleCodeType]:
+    name = item_info["name"]
+    item = item_info["item"]
+    if item["type"] == "object":
+        fields = resolve_fields(item["fields"], cache=cache)
+        options = utils.ClassOptions(doc=make_raw_doc(name))
+        return make_typed_dict(item_info, name, fields, options=options, cache=cache)
+
+    if is_pure_unit_enum(item):
+        alias = libcst.parse_statement(make_raw_alias_source(item_info))
+        return [
+            alias.with_changes(leading_lines=[libcst.EmptyLine(), libcst.EmptyLine()]),
+            make_docstring(make_raw_doc(name), indentation=0),
+        ]
+
+    statements: list[utils.ModuleCodeType] = []
+    for variant in item["variants"]:
+        statements.extend(_parse_raw_enum_variant(item_info, item, variant, cache=cache))
+
+    alias = libcst.parse_statement(make_raw_alias_source(item_info))
+    statements.append(
+        alias.with_changes(leading_lines=[libcst.EmptyLine(), libcst.EmptyLine()]),
+    )
+    statements.append(
+        make_docstring(make_raw_doc(name, role="data"), indentation=0),
+    )
+    return statements
+
+
 def _parse_item(
     item_info: utils.ItemInfo,
     *,
@@ -502,6 +1994,23 @@ def parse_item(
     return items
 
 
+def parse_raw_item(
+    item_info: utils.ItemInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> typing.Sequence[utils.ModuleCodeType]:
+    """Parse an eludris-autodoc item into TypedDicts mirroring its raw API representation.
+
+    Objects become a TypedDict, tagged enums become a union of TypedDicts
+    discriminated by their tag, untagged enums become a plain union of
+    TypedDicts, and pure unit enums become a union of literals.
+    """
+    items = _parse_raw_item(item_info, cache=cache)
+    cache[item_info["name"]].raw_code = items
+    return items
+
+
+@functools.cache
 def make_import(
     module: str,
     *,
@@ -512,6 +2021,7 @@ def make_import(
 
     Note that this doesn't deal with optimally combining import lines. Since we
     run formatting tools over this anyways, we don't need to worry about this.
+    Import lines are interned, so every module shares the same nodes.
     """
     if not import_from:
         return libcst.SimpleStatementLine(
@@ -549,3 +2059,28 @@ def make_import(
             ),
         ],
     )
+
+
+_FRAGMENT_CACHES: typing.Final = (
+    _make_annotation,
+    _make_field_annotation_expr,
+    _make_field_value,
+    _make_field_annotation,
+    make_import,
+)
+
+
+def clear_fragment_caches() -> None:
+    """Clear all interned CST fragments.
+
+    Fragments are otherwise kept for the lifetime of the process, which only
+    matters when generating code for many different schemas in one process.
+    """
+    for fragment_cache in _FRAGMENT_CACHES:
+        fragment_cache.cache_clear()
+
+
+def count_fragment_hits() -> tuple[int, int]:
+    """Count how often interned CST fragments were reused and how often they were made."""
+    infos = [fragment_cache.cache_info() for fragment_cache in _FRAGMENT_CACHES]
+    return sum(info.hits for info in infos), sum(info.misses for info in infos)
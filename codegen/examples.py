@@ -0,0 +1,118 @@
+"""Extraction of the JSON examples in eludris-autodoc docs into fixtures."""
+
+import json
+import pathlib
+import re
+import typing
+
+from . import cst, utils
+
+__all__: typing.Sequence[str] = (
+    "EXAMPLES_PATH",
+    "Example",
+    "InvalidExample",
+    "extract_examples",
+    "write_examples",
+)
+
+EXAMPLES_PATH: typing.Final[pathlib.Path] = pathlib.Path.cwd() / "benchmarks" / "examples.json"
+
+_EXAMPLE_PATTERN: typing.Final[re.Pattern[str]] = re.compile(r"```json\n(.*?)```", re.DOTALL)
+_LENIENCY_PATTERN: typing.Final[re.Pattern[str]] = re.compile(
+    r'("(?:\\.|[^"\\])*")|//[^\n]*|,(?=\s*[}\]])',
+)
+"""Matches line comments and trailing commas, as well as strings so they are left as-is."""
+
+
+class Example(typing.TypedDict):
+    """A JSON example from the docs of an item, as it is stored in the fixture file."""
+
+    name: str
+    """The name of the class or union the example belongs to."""
+    decoder: str
+    """The path of the function that decodes the example, relative to the package."""
+    payload: typing.Any
+    """The example payload."""
+
+
+class InvalidExample(typing.TypedDict):
+    """A JSON example from the docs of an item that could not be parsed."""
+
+    name: str
+    """The name of the class or union the example belongs to."""
+    source: str
+    """The example as it appears in the docs."""
+    error: str
+    """Why the example could not be parsed."""
+
+
+def _make_strict(source: str) -> str:
+    # Examples annotate values with line comments and sometimes leave trailing
+    # commas, neither of which are valid JSON.
+    return _LENIENCY_PATTERN.sub(lambda match: match[1] or "", source)
+
+
+def _parse_example(source: str) -> tuple[typing.Any, str | None]:
+    # Returns the payload of the example, or why it could not be parsed.
+    try:
+        return json.loads(_make_strict(source)), None
+
+    except json.JSONDecodeError as exc:
+        return None, str(exc)
+
+
+def _get_decoders(item_info: utils.ItemInfo) -> list[tuple[str, str, str | None]]:
+    # Returns the name, decoder path and docs of the item and its variants.
+    name = item_info["name"]
+    module = item_info["category"].lower()
+    item = item_info["item"]
+    if item["type"] == "object":
+        return [(name, f"{module}.{name}.from_payload", item_info["doc"])]
+
+    if cst.is_pure_unit_enum(item):
+        return [(name, f"{module}.{name}", item_info["doc"])]
+
+    decoder = f"{module}.decode_{cst.to_constant_case(name).lower()}"
+    decoders = [(name, decoder, item_info["doc"])]
+    for variant in item["variants"]:
+        variant_name = cst.to_upper_snake_case(variant["name"]) + name
+        decoders.append((variant_name, f"{module}.{variant_name}.from_payload", variant["doc"]))
+
+    return decoders
+
+
+def extract_examples(
+    items: typing.Iterable[utils.AutodocItem],
+) -> tuple[list[Example], list[InvalidExample]]:
+    """Extract the JSON examples from the docs of the provided items and their variants.
+
+    Line comments and trailing commas are stripped from examples. Examples
+    that are not valid JSON afterwards are returned separately, so they can
+    be reported.
+    """
+    examples: list[Example] = []
+    invalid: list[InvalidExample] = []
+    for item in items:
+        for name, decoder, doc in _get_decoders(item.data):
+            for source in _EXAMPLE_PATTERN.findall(doc or ""):
+                payload, error = _parse_example(source)
+                if error is not None:
+                    invalid.append({"name": name, "source": source, "error": error})
+
+                else:
+                    examples.append({"name": name, "decoder": decoder, "payload": payload})
+
+    return examples, invalid
+
+
+def write_examples(
+    examples: typing.Sequence[Example],
+    invalid: typing.Sequence[InvalidExample],
+    *,
+    version: str,
+    path: pathlib.Path = EXAMPLES_PATH,
+) -> None:
+    """Write extracted examples to a JSON fixture file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": version, "examples": examples, "invalid": invalid}
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
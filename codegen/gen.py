@@ -3,6 +3,7 @@
 import asyncio
 import collections
 import pathlib
+import shutil
 import subprocess
 import typing
 
@@ -10,19 +11,29 @@ import aiohttp
 import libcst
 import yarl
 
-from . import cst, utils
+from . import cst, profiling, structs, templates, utils
 
 __all__: typing.Sequence[str] = (
+    "Backend",
+    "Emitter",
     "fetch_index",
     "fetch_items",
+    "fetch_routes",
+    "shake_items",
     "parse_items",
     "collect_module_items",
     "make_init_module",
+    "make_raw_init_module",
+    "render_module_sources",
+    "render_init_module",
+    "render_raw_init_module",
     "write_modules",
+    "copy_runtime_modules",
 )
 
 CWD: typing.Final[pathlib.Path] = pathlib.Path.cwd()
 TARGET_DIR: typing.Final[pathlib.Path] = CWD / "eludris_autodoc"
+RAW_TARGET_DIR: typing.Final[pathlib.Path] = TARGET_DIR / "raw"
 
 DEFAULT_URL_BASE: typing.Final[yarl.URL] = yarl.URL(
     "https://refactor-autodoc-format.eludevs.pages.dev/autodoc/",
@@ -30,12 +41,65 @@ DEFAULT_URL_BASE: typing.Final[yarl.URL] = yarl.URL(
 
 DEPENDENCY_RESOLUTION_MAX_ATTEMPTS: typing.Final[int] = 10
 
+Backend = typing.Literal["attrs", "msgspec"]
+"""The kind of classes to generate.
+
+``attrs`` generates attrs classes with generated codecs. ``msgspec``
+generates ``msgspec.Struct`` classes, which require msgspec to be installed.
+"""
+
+Emitter = typing.Literal["libcst", "templates"]
+"""How to emit the code of the attrs backend.
+
+``libcst`` builds CST for every item and renders it. ``templates`` renders
+exactly the same code straight from string templates, which is much faster.
+"""
+
+RUNTIME_MODULES: typing.Final[typing.Sequence[str]] = (
+    "undefined",
+    "frames",
+    "presence",
+    "lazy",
+    "ids",
+    "validation",
+    "partial",
+    "packing",
+    "transport",
+    "usercache",
+    "snapshot",
+    "eventlog",
+    "rest",
+)
+"""Hand-written modules in the eludris-autodoc package that are never generated."""
+
 DEFAULT_IMPORTS = (
+    cst.make_import("copyreg"),
     cst.make_import("typing"),
     cst.make_import("attrs"),
     cst.make_import("enum"),
     cst.make_import("ipaddress"),
     cst.make_import("undefined", import_from="."),
+    cst.make_import("lazy", import_from="."),
+    cst.make_import("validation", import_from="."),
+    cst.make_import("partial", import_from="."),
+)
+
+STRUCT_DEFAULT_IMPORTS = (
+    cst.make_import("copyreg"),
+    cst.make_import("typing"),
+    cst.make_import("enum"),
+    cst.make_import("msgspec"),
+)
+
+RAW_DEFAULT_IMPORTS = (cst.make_import("typing"),)
+
+# The default imports are prepended to the libcst modules one by one, which
+# reverses their order, whereas the __init__ module lists them in order.
+_render_node = libcst.Module([]).code_for_node
+DEFAULT_IMPORTS_SOURCE: typing.Final[str] = "".join(map(_render_node, DEFAULT_IMPORTS))
+MODULE_IMPORTS_SOURCE: typing.Final[str] = "".join(map(_render_node, reversed(DEFAULT_IMPORTS)))
+RAW_MODULE_IMPORTS_SOURCE: typing.Final[str] = "".join(
+    map(_render_node, reversed(RAW_DEFAULT_IMPORTS)),
 )
 
 MODULE_DOC_FMT = (
@@ -45,19 +109,38 @@ MODULE_DOC_FMT = (
     '"""'
 )
 
+RAW_MODULE_DOC_FMT = (
+    '"""This module implements raw Eludris API payloads related to {category}.\n\n'
+    "These mirror the types in :mod:`eludris_autodoc.{category}` as TypedDicts.\n\n"
+    ".. warning::\n"
+    "    This module was automatically generated.\n"
+    '"""'
+)
+
+RAW_INIT_MODULE_DOC = (
+    '"""Raw Eludris API payloads.\n\n'
+    "This package contains TypedDicts mirroring the raw API representation of\n"
+    "every type in eludris-autodoc. These can be used to type-check code that\n"
+    "works on payloads directly, without converting them to attrs classes.\n\n"
+    ".. warning::\n"
+    "    This package was automatically generated.\n"
+    '"""'
+)
+
 
 def resolve_dependencies(entry_map: dict[str, utils.AutodocItem]) -> dict[str, utils.AutodocItem]:
     """Sort items such that no dependency conflicts appear down the line.
 
     Items are sorted in such a way that items without dependencies come first,
     and from there items are added only if all their dependencies are already
-    in the sorted dict.
+    in the sorted dict. Items are otherwise kept in the order they were
+    provided in, so that the same items are always sorted the same way.
 
     If the items could not be ordered in a predefined number of attempts, a
     RuntimeError is raised.
     """
     sorted_entries = {name: entry for name, entry in entry_map.items() if not entry.dependencies}
-    to_resolve = entry_map.keys() - sorted_entries
+    to_resolve = [name for name in entry_map if name not in sorted_entries]
 
     for _ in range(DEPENDENCY_RESOLUTION_MAX_ATTEMPTS):
         for entry_name in to_resolve.copy():
@@ -112,7 +195,11 @@ async def fetch_items(
     url_base: yarl.URL | None = None,
     session: aiohttp.ClientSession,
 ) -> dict[str, utils.AutodocItem]:
-    """Fetch multiple items from the eludris-autodoc-api."""
+    """Fetch multiple items from the eludris-autodoc-api.
+
+    Only the types in the ``todel`` package are fetched, routes are fetched
+    separately through ``fetch_routes``.
+    """
     if not url_base:
         url_base = DEFAULT_URL_BASE
 
@@ -127,16 +214,127 @@ async def fetch_items(
     return resolve_dependencies({item.name: item for item in parsed_items})
 
 
-def parse_items(items: dict[str, utils.AutodocItem]) -> dict[str, utils.AutodocItem]:
-    """Parse the provided eludris-autodoc items into CST."""
+async def _fetch_route(
+    item: str,
+    *,
+    url_base: yarl.URL,
+    session: aiohttp.ClientSession,
+) -> utils.RouteInfo | None:
+    async with session.get(url_base / item) as resp:
+        route_info = await resp.json()
+        return route_info if route_info["item"]["type"] == "route" else None
+
+
+async def fetch_routes(
+    items: typing.Sequence[str],
+    *,
+    url_base: yarl.URL | None = None,
+    session: aiohttp.ClientSession,
+) -> list[utils.RouteInfo]:
+    """Fetch the routes of all services, e.g. ``oprish``, from the eludris-autodoc-api.
+
+    These are the route items in every package other than ``todel``, in the
+    order of the index.
+    """
+    if not url_base:
+        url_base = DEFAULT_URL_BASE
+
+    route_infos = await asyncio.gather(
+        *[
+            _fetch_route(item, session=session, url_base=url_base)
+            for item in items
+            if not item.startswith("todel")
+        ],
+    )
+
+    return [route_info for route_info in route_infos if route_info]
+
+
+def shake_items(
+    items: dict[str, utils.AutodocItem],
+    roots: typing.Iterable[str],
+) -> dict[str, utils.AutodocItem]:
+    """Keep only the provided root items and all items they depend on.
+
+    Roots are item names, optionally qualified by their module, e.g.
+    ``gateway.ServerPayload``. Items keep their order, so they remain sorted by
+    their dependencies. As modules and their imports are derived from the
+    remaining items, modules without any remaining items are left out
+    entirely.
+
+    If any of the roots does not exist, a ValueError is raised.
+    """
+    pending: list[str] = []
+    unknown: list[str] = []
+    for root in roots:
+        category, _, name = root.rpartition(".")
+        item = items.get(name)
+        if item is None or (category and item.category != category.lower()):
+            unknown.append(root)
+
+        else:
+            pending.append(name)
+
+    if unknown:
+        msg = f"Unknown root types: {', '.join(unknown)}."
+        raise ValueError(msg)
+
+    reachable: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name not in reachable:
+            reachable.add(name)
+            pending.extend(items[name].dependencies)
+
+    return {name: item for name, item in items.items() if name in reachable}
+
+
+def parse_items(
+    items: dict[str, utils.AutodocItem],
+    *,
+    backend: Backend = "attrs",
+    profiler: profiling.Profiler | None = None,
+) -> dict[str, utils.AutodocItem]:
+    """Parse the provided eludris-autodoc items into CST.
+
+    This parses both the classes of the provided backend and their raw
+    TypedDict mirrors. If a profiler is provided, every item is profiled.
+    """
     for item in items.values():
-        item.code = cst.parse_item(item.data, cache=items)
+        with profiling.optional_span(profiler, item.name, category="item"):
+            if backend == "msgspec":
+                item.set_code(structs.parse_item(item.data, cache=items))
+
+            else:
+                item.code = cst.parse_item(item.data, cache=items)
+
+        with profiling.optional_span(profiler, f"{item.name} (raw)", category="item"):
+            item.raw_code = cst.parse_raw_item(item.data, cache=items)
 
     return items
 
 
-def collect_module_items(items: dict[str, utils.AutodocItem]) -> dict[str, libcst.Module]:
-    """Collect items into modules by category and add the necessary imports."""
+def collect_module_items(
+    items: dict[str, utils.AutodocItem],
+    *,
+    raw: bool = False,
+    backend: Backend = "attrs",
+) -> dict[str, libcst.Module]:
+    """Collect items into modules by category and add the necessary imports.
+
+    If ``raw`` is set, this collects the raw TypedDict mirrors of the items instead.
+    The backend must match the one the items were parsed with.
+    """
+    if raw:
+        default_imports = RAW_DEFAULT_IMPORTS
+
+    elif backend == "msgspec":
+        default_imports = STRUCT_DEFAULT_IMPORTS
+
+    else:
+        default_imports = DEFAULT_IMPORTS
+
+    doc_fmt = RAW_MODULE_DOC_FMT if raw else MODULE_DOC_FMT
     modules: dict[str, libcst.Module] = {}
     module_items: dict[str, collections.deque[utils.ModuleCodeType]] = {}
     module_imports: dict[str, set[str]] = {}
@@ -147,11 +345,12 @@ def collect_module_items(items: dict[str, utils.AutodocItem]) -> dict[str, libcs
             modules[item.category] = libcst.Module(module_items[item.category])
             module_imports[item.category] = set()
 
-        if not item.code:
+        code = item.raw_code if raw else item.code
+        if not code:
             msg = f"Encountered unparsed (or empty) item: {item.name!r}."
             raise RuntimeError(msg)
 
-        module_items[item.category].extend(item.code)
+        module_items[item.category].extend(code)
         module_imports[item.category].update(
             items[dependency].category
             for dependency in item.dependencies
@@ -164,12 +363,12 @@ def collect_module_items(items: dict[str, utils.AutodocItem]) -> dict[str, libcs
             cst.make_import(import_, import_from=".", import_as=f"{import_}_m")
             for import_ in imports
         )
-        module_code.extendleft(DEFAULT_IMPORTS)
+        module_code.extendleft(default_imports)
         module_code.appendleft(
             libcst.SimpleStatementLine(
                 body=[
                     libcst.Expr(
-                        libcst.SimpleString(MODULE_DOC_FMT.format(category=module_name)),
+                        libcst.SimpleString(doc_fmt.format(category=module_name)),
                     ),
                 ],
             ),
@@ -178,30 +377,45 @@ def collect_module_items(items: dict[str, utils.AutodocItem]) -> dict[str, libcs
     return modules
 
 
-def make_init_module(modules: typing.Iterable[str], *, version: str) -> libcst.Module:
-    """Make the __init__ module for the eludris-autodoc packages."""
+def _make_init_doc(version: str) -> str:
     # TODO: actually make sure the link is valid
-    doc = (
+    *leading_modules, last_module = (f"`{module}`" for module in RUNTIME_MODULES)
+    runtime_modules = f"{', '.join(leading_modules)} and {last_module}"
+    return (
         f'"""Eludris-Autodoc version {version}.\n\n'
         "This module contains auto-generated types provided by Eludris autodoc,\n"
         "which can be found at https://docs.eludris.com/autodoc.\n"
         "The version of this module matches that of the Eludris API version for\n"
         " which it was generated.\n\n"
         ".. warning::\n"
-        "    This module and all submodules except for `undefined` were\n"
-        "    automatically generated.\n"
+        "    This module and all submodules except for\n"
+        f"    {runtime_modules} were automatically generated.\n"
         '"""'
     )
+
+
+def make_init_module(
+    modules: typing.Iterable[str],
+    *,
+    version: str,
+    backend: Backend = "attrs",
+) -> libcst.Module:
+    """Make the __init__ module for the eludris-autodoc packages.
+
+    The hand-written runtime modules only support the attrs backend, so they
+    are not imported for the msgspec backend.
+    """
+    default_imports = STRUCT_DEFAULT_IMPORTS if backend == "msgspec" else DEFAULT_IMPORTS
     return libcst.Module(
         body=[
             libcst.SimpleStatementLine(
                 body=[
                     libcst.Expr(
-                        libcst.SimpleString(doc),
+                        libcst.SimpleString(_make_init_doc(version)),
                     ),
                 ],
             ),
-            *DEFAULT_IMPORTS,
+            *default_imports,
             *[cst.make_import("*", import_from=f".{module}") for module in modules],
             libcst.SimpleStatementLine(
                 body=[
@@ -228,16 +442,157 @@ def make_init_module(modules: typing.Iterable[str], *, version: str) -> libcst.M
     )
 
 
-def write_modules(modules: dict[str, libcst.Module]) -> None:
-    """Write the parsed modules to files."""
-    for module_name, module in modules.items():
-        path = (TARGET_DIR / module_name).with_suffix(".py")
-        path.write_text(module.code)
+def make_raw_init_module(modules: typing.Iterable[str]) -> libcst.Module:
+    """Make the __init__ module for the raw subpackage."""
+    return libcst.Module(
+        body=[
+            libcst.SimpleStatementLine(
+                body=[libcst.Expr(libcst.SimpleString(RAW_INIT_MODULE_DOC))],
+            ),
+            *[cst.make_import("*", import_from=f".{module}") for module in modules],
+        ],
+    )
 
-    for hook in ("ruff-format", "ruff"):
-        subprocess.run(
-            [f"pre-commit run {hook} --files eludris_autodoc/* -v"],
-            cwd=str(CWD),
-            shell=True,  # noqa: S602
-            check=False,
+
+def render_module_sources(
+    items: dict[str, utils.AutodocItem],
+    *,
+    raw: bool = False,
+    profiler: profiling.Profiler | None = None,
+) -> dict[str, str]:
+    """Render items into the source of modules by category, using string templates.
+
+    This is the template counterpart to ``parse_items`` followed by
+    ``collect_module_items`` for the attrs backend, and renders exactly the
+    same code. If ``raw`` is set, this renders the raw TypedDict mirrors of the
+    items instead. If a profiler is provided, every item is profiled.
+    """
+    if raw:
+        render, default_imports, doc_fmt = (
+            templates.render_raw_item,
+            RAW_MODULE_IMPORTS_SOURCE,
+            RAW_MODULE_DOC_FMT,
         )
+
+    else:
+        render, default_imports, doc_fmt = (
+            templates.render_item,
+            MODULE_IMPORTS_SOURCE,
+            MODULE_DOC_FMT,
+        )
+
+    module_items: dict[str, list[str]] = {}
+    module_imports: dict[str, set[str]] = {}
+
+    for item in items.values():
+        if item.category not in module_items:
+            module_items[item.category] = []
+            module_imports[item.category] = set()
+
+        with profiling.optional_span(
+            profiler,
+            f"{item.name} (raw)" if raw else item.name,
+            category="item",
+        ):
+            module_items[item.category].extend(render(item.data, cache=items))
+
+        # Built exactly like in collect_module_items, so that the imports are
+        # iterated in the same order.
+        module_imports[item.category].update(
+            items[dependency].category
+            for dependency in item.dependencies
+            if items[dependency].category != item.category
+        )
+
+    return {
+        module_name: (
+            f"{doc_fmt.format(category=module_name)}\n"
+            + default_imports
+            + "".join(
+                templates.render_import(import_, import_from=".", import_as=f"{import_}_m")
+                for import_ in reversed(list(imports))
+            )
+            + "".join(module_items[module_name])
+        )
+        for module_name, imports in module_imports.items()
+    }
+
+
+def render_init_module(modules: typing.Iterable[str], *, version: str) -> str:
+    """Render the source of the __init__ module for the eludris-autodoc package.
+
+    This matches ``make_init_module`` for the attrs backend.
+    """
+    return (
+        f"{_make_init_doc(version)}\n"
+        + DEFAULT_IMPORTS_SOURCE
+        + "".join(templates.render_import("*", import_from=f".{module}") for module in modules)
+        + f'__version__: typing.Final[str] = "{version}"\n'
+    )
+
+
+def render_raw_init_module(modules: typing.Iterable[str]) -> str:
+    """Render the source of the __init__ module for the raw subpackage.
+
+    This matches ``make_raw_init_module``.
+    """
+    return f"{RAW_INIT_MODULE_DOC}\n" + "".join(
+        templates.render_import("*", import_from=f".{module}") for module in modules
+    )
+
+
+def write_modules(
+    modules: typing.Mapping[str, libcst.Module | str],
+    raw_modules: typing.Mapping[str, libcst.Module | str] | None = None,
+    *,
+    target_dir: pathlib.Path = TARGET_DIR,
+    profiler: profiling.Profiler | None = None,
+    run_formatters: bool = True,
+) -> None:
+    """Write the parsed modules to files and format them.
+
+    Modules are either libcst modules or their rendered source. Raw modules,
+    if provided, are written to the raw subpackage. Modules are written to the
+    eludris-autodoc package unless another directory is provided.
+    If a profiler is provided, writing and formatting are profiled as stages.
+    The formatters are skipped if ``run_formatters`` is False.
+    """
+    raw_target_dir = target_dir / RAW_TARGET_DIR.relative_to(TARGET_DIR)
+    with profiling.optional_span(profiler, "write"):
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for module_name, module in modules.items():
+            path = (target_dir / module_name).with_suffix(".py")
+            path.write_text(module if isinstance(module, str) else module.code)
+
+        if raw_modules:
+            raw_target_dir.mkdir(exist_ok=True)
+            for module_name, module in raw_modules.items():
+                path = (raw_target_dir / module_name).with_suffix(".py")
+                path.write_text(module if isinstance(module, str) else module.code)
+
+    if not run_formatters:
+        return
+
+    # The formatters run in subprocesses, so their CPU time is not recorded.
+    with profiling.optional_span(profiler, "format"):
+        for hook in ("ruff-format", "ruff"):
+            subprocess.run(
+                [f"pre-commit run {hook} --files {target_dir}/*.py {raw_target_dir}/*.py -v"],
+                cwd=str(CWD),
+                shell=True,  # noqa: S602
+                check=False,
+            )
+
+
+def copy_runtime_modules(target_dir: pathlib.Path) -> None:
+    """Copy the hand-written runtime modules into another package directory.
+
+    The attrs backend imports these, so they are needed by every package that
+    is not generated into the eludris-autodoc package itself. Runtime modules
+    that use generated modules which were left out, e.g. by ``shake_items``,
+    can not be imported.
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for module in RUNTIME_MODULES:
+        path = pathlib.Path(module).with_suffix(".py")
+        shutil.copyfile(TARGET_DIR / path, target_dir / path)
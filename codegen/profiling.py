@@ -0,0 +1,132 @@
+"""Profiling of the stages of eludris-autodoc code-gen."""
+
+import contextlib
+import json
+import os
+import pathlib
+import threading
+import time
+import tracemalloc
+import typing
+
+import attrs
+
+__all__: typing.Sequence[str] = ("Profiler", "Span", "optional_span")
+
+
+@attrs.define(kw_only=True)
+class Span:
+    """The resources used by a single stage or item."""
+
+    name: str
+    """The name of the stage or item."""
+    category: str
+    """Whether this span is a ``stage`` or an ``item``."""
+    start: float
+    """When this span started, in seconds since the profiler started."""
+    wall_time: float = 0.0
+    """The time this span took, in seconds."""
+    cpu_time: float = 0.0
+    """The CPU time used by the process during this span, in seconds."""
+    peak_memory: int = 0
+    """The most memory allocated by python at any point during this span, in bytes."""
+
+
+@attrs.define
+class Profiler:
+    """Records the wall time, CPU time and peak memory of stages and the items in them.
+
+    Memory is traced with :mod:`tracemalloc` from the moment the profiler is
+    created, which slows down code-gen noticeably. Spans can be nested, e.g.
+    items within a stage.
+    """
+
+    spans: list[Span] = attrs.field(factory=list, init=False)
+    """All finished spans, in the order they finished."""
+    _origin: float = attrs.field(factory=time.perf_counter, init=False)
+    _stack: list[Span] = attrs.field(factory=list, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        tracemalloc.start()
+
+    @contextlib.contextmanager
+    def span(self, name: str, *, category: str = "stage") -> typing.Iterator[Span]:
+        """Record the resources used by the wrapped code."""
+        # Fold the peak so far into the enclosing span before resetting it.
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak_memory = max(parent.peak_memory, tracemalloc.get_traced_memory()[1])
+
+        tracemalloc.reset_peak()
+        span = Span(name=name, category=category, start=time.perf_counter() - self._origin)
+        self._stack.append(span)
+        cpu_start = time.process_time()
+        try:
+            yield span
+
+        finally:
+            span.cpu_time = time.process_time() - cpu_start
+            span.wall_time = time.perf_counter() - self._origin - span.start
+            span.peak_memory = max(span.peak_memory, tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak_memory = max(parent.peak_memory, span.peak_memory)
+
+            self.spans.append(span)
+
+    def get_slowest(self, count: int, *, category: str = "item") -> list[Span]:
+        """Get the slowest spans of the provided category."""
+        spans = [span for span in self.spans if span.category == category]
+        return sorted(spans, key=lambda span: span.wall_time, reverse=True)[:count]
+
+    def format_summary(self, *, slowest_items: int = 10) -> str:
+        """Format the stages and the slowest items as a table."""
+        lines = [f"{'':<32} {'wall ms':>10} {'cpu ms':>10} {'peak KiB':>10}"]
+        for title, spans in (
+            ("stages", [span for span in self.spans if span.category == "stage"]),
+            ("slowest items", self.get_slowest(slowest_items)),
+        ):
+            lines.append(title)
+            lines.extend(
+                f"  {span.name:<30} {span.wall_time * 1e3:10.2f} {span.cpu_time * 1e3:10.2f}"
+                f" {span.peak_memory / 1024:10.1f}"
+                for span in spans
+            )
+
+        return "\n".join(lines)
+
+    def write_trace(self, path: pathlib.Path) -> None:
+        """Write all spans to a Chrome trace file.
+
+        The file can be opened in ``chrome://tracing`` or Perfetto. CPU time
+        and peak memory are included as the arguments of every span.
+        """
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": span.wall_time * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": {
+                    "cpu_ms": span.cpu_time * 1e3,
+                    "peak_memory_bytes": span.peak_memory,
+                },
+            }
+            for span in self.spans
+        ]
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, indent=1))
+
+
+def optional_span(
+    profiler: Profiler | None,
+    name: str,
+    *,
+    category: str = "stage",
+) -> typing.ContextManager[object]:
+    """Record a span if a profiler is provided, or do nothing otherwise."""
+    return profiler.span(name, category=category) if profiler else contextlib.nullcontext()
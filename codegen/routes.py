@@ -0,0 +1,174 @@
+"""Implementation of eludris-autodoc route table generation.
+
+Every route item of the eludris-autodoc api, i.e. every item outside of the
+``todel`` package, is generated into a ``rest.Route`` in a single ``routes``
+module. Routes refer to the generated types of their body and response, so
+they have to be generated along with them.
+
+The module is rendered straight from its source for both emitters, and parsed
+into CST for the libcst emitter, so both produce exactly the same code.
+"""
+
+import json
+import re
+import typing
+
+import libcst
+
+from . import cst, utils
+
+__all__: typing.Sequence[str] = (
+    "get_route_dependencies",
+    "make_routes_module",
+    "render_routes_module",
+)
+
+ROUTES_MODULE: typing.Final[str] = "routes"
+"""The name of the generated module that contains every route."""
+
+ROUTES_MODULE_DOC: typing.Final[str] = (
+    '"""This module implements the routes of the Eludris HTTP APIs.\n\n'
+    "Every route can be requested through a :class:`rest.Client`.\n\n"
+    ".. warning::\n"
+    "    This module was automatically generated.\n"
+    '"""'
+)
+
+_ROCKET_PARAM: typing.Final[typing.Pattern[str]] = re.compile(r"<(\w+)(?:\.\.)?>")
+"""A parameter in a Rocket route, e.g. ``<id>`` or ``<path..>``."""
+
+
+def get_route_dependencies(route_info: utils.RouteInfo) -> set[str]:
+    """Get the names of all items the body and response of a route refer to."""
+    route = route_info["item"]
+    return {
+        field_type.removesuffix("[]")
+        for field_type in (route["body_type"], route["return_type"])
+        if field_type
+    } - utils.TYPE_MAPPING.keys()
+
+
+def make_path_template(route: str) -> str:
+    """Convert a Rocket route into a path template, e.g. ``/users/<id>`` into ``/users/{id}``.
+
+    The query part of the route is left out, as query parameters are listed separately.
+    """
+    return _ROCKET_PARAM.sub(r"{\1}", route.partition("?")[0])
+
+
+def get_rate_limit(
+    route_info: utils.RouteInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str | None:
+    """Get the key of the rate limit of a route in the rate limits of its service.
+
+    The rate limits of a service, e.g. ``OprishRateLimits``, have a field
+    named after every route that has its own rate limit. If the rate limits of
+    the service are not among the items, no route has a key.
+    """
+    rate_limits = cache.get(f"{route_info['package'].capitalize()}RateLimits")
+    if rate_limits is None or rate_limits.data["item"]["type"] != "object":
+        return None
+
+    fields = {field["name"] for field in rate_limits.data["item"]["fields"]}
+    return route_info["name"] if route_info["name"] in fields else None
+
+
+def _make_literal(value: str | None) -> str:
+    return "None" if value is None else json.dumps(value)
+
+
+def make_route_source(
+    route_info: utils.RouteInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Make the source of the route constant and docstring of a route item."""
+    route = route_info["item"]
+    # Types are referenced from the routes module rather than the route's category.
+    reference_info = typing.cast(utils.ItemInfo, {**route_info, "category": ROUTES_MODULE})
+    body_type, return_type = route["body_type"], route["return_type"]
+
+    body_annotation = response_annotation = "None"
+    encode = decode = "None"
+    if body_type:
+        body_annotation = cst.make_annotation_source(reference_info, body_type, cache=cache)
+        expr = cst.make_encode_expr("body", body_type, cache=cache)
+        encode = "None" if expr == "body" else f"lambda body: {expr}"
+
+    if return_type:
+        response_annotation = cst.make_annotation_source(reference_info, return_type, cache=cache)
+        expr = cst.make_decode_expr(reference_info, "payload", return_type, cache=cache)
+        decode = "None" if expr == "payload" else f"lambda payload: {expr}"
+
+    query_params = "".join(f"{_make_literal(param['name'])}, " for param in route["query_params"])
+    source = (
+        f"{route_info['name'].upper()}: typing.Final["
+        f"rest.Route[{body_annotation}, {response_annotation}]] = rest.Route(\n"
+        f"    name={_make_literal(route_info['name'])},\n"
+        f"    service={_make_literal(route_info['package'])},\n"
+        f"    method={_make_literal(route['method'].upper())},\n"
+        f"    path={_make_literal(make_path_template(route['route']))},\n"
+        f"    query_params=({query_params.removesuffix(' ')}),\n"
+        f"    body_type={_make_literal(body_type)},\n"
+        f"    response_type={_make_literal(return_type)},\n"
+        f"    rate_limit={_make_literal(get_rate_limit(route_info, cache=cache))},\n"
+        f"    encode={encode},\n"
+        f"    decode={decode},\n"
+        ")\n"
+    )
+    if route_info["doc"]:
+        source += f"{cst.make_docstring_source(route_info['doc'], indentation=0)}\n"
+
+    return source
+
+
+def render_routes_module(
+    routes: typing.Sequence[utils.RouteInfo],
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    """Render the source of the routes module.
+
+    The types of the bodies and responses of all routes must be in the cache.
+    If multiple routes have the same name, a ValueError is raised.
+    """
+    names = [route_info["name"] for route_info in routes]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        msg = f"Duplicate route names: {', '.join(duplicates)}"
+        raise ValueError(msg)
+
+    imports = sorted(
+        {
+            cache[dependency].category
+            for route_info in routes
+            for dependency in get_route_dependencies(route_info)
+        },
+    )
+    table = "".join(f"    {_make_literal(name)}: {name.upper()},\n" for name in names)
+    return (
+        f"{ROUTES_MODULE_DOC}\n"
+        "import typing\n\n"
+        "from . import rest\n"
+        + "".join(f"from . import {import_} as {import_}_m\n" for import_ in imports)
+        + "".join(f"\n{make_route_source(route_info, cache=cache)}" for route_info in routes)
+        + "\nROUTES: typing.Final[typing.Mapping[str, rest.Route[typing.Any, typing.Any]]] = {\n"
+        + table
+        + "}\n"
+        '"""Every route, by name."""\n'
+    )
+
+
+def make_routes_module(
+    routes: typing.Sequence[utils.RouteInfo],
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> libcst.Module:
+    """Make the routes module.
+
+    This parses the source rendered by ``render_routes_module``, so that the
+    code of the module matches it exactly.
+    """
+    return libcst.parse_module(render_routes_module(routes, cache=cache))
@@ -0,0 +1,280 @@
+"""Implementation of eludris-autodoc CST generation for the msgspec backend.
+
+Rather than attrs classes with generated codecs, this backend generates
+``msgspec.Struct`` classes which msgspec decodes and encodes natively. The
+generated classes keep the public API of the attrs backend: every class has
+``from_payload`` and ``to_payload``, and every enum has its union alias and
+``decode_`` function. The differences are:
+
+- Omitted fields are ``msgspec.UNSET`` rather than ``Undefined``.
+- IP addresses are kept as strings, as msgspec has no IP address type.
+- msgspec has no adjacently tagged unions, so the fields of adjacently tagged
+  object variants are nested in a separate ``<Variant>Data`` struct under the
+  content key. They can still be read from the variant itself.
+"""
+
+import typing
+
+import attrs
+import libcst
+
+from . import cst, utils
+
+__all__: typing.Sequence[str] = ("parse_item",)
+
+STRUCT_OPTIONS: typing.Final[str] = "msgspec.Struct, kw_only=True, omit_defaults=True"
+"""The bases and options shared by every generated struct."""
+
+
+def _make_annotation(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    if utils.TYPE_MAPPING.get(field["type"]) == "IpAddr":
+        annotation = "str"
+
+    else:
+        node = cst.make_annotation(item_info, field["type"], cache=cache)
+        annotation = libcst.Module([]).code_for_node(node)
+
+    if field["nullable"]:
+        annotation += " | None"
+
+    if field["omittable"]:
+        annotation += " | msgspec.UnsetType"
+
+    return annotation
+
+
+def _make_field(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    # Struct fields can't be private, so fields such as `_disguise` are renamed.
+    name = field["name"].lstrip("_")
+    options = ["default=msgspec.UNSET"] if field["omittable"] else []
+    if name != field["name"]:
+        options.append(f'name="{field["name"]}"')
+
+    code = f"{name}: {_make_annotation(item_info, field, cache=cache)}"
+    if options == ["default=msgspec.UNSET"]:
+        code += " = msgspec.UNSET"
+
+    elif options:
+        code += f" = msgspec.field({', '.join(options)})"
+
+    code += "\n"
+    if field["doc"]:
+        code += libcst.Module([]).code_for_node(cst.make_docstring(field["doc"], indentation=0))
+
+    return code
+
+
+def _make_forwarding_property(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    content: str,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    name = field["name"].lstrip("_")
+    return (
+        "@property\n"
+        f"def {name}(self) -> {_make_annotation(item_info, field, cache=cache)}:\n"
+        f'    """The `{name}` field of :attr:`{content}`."""\n'
+        f"    return self.{content}.{name}\n"
+    )
+
+
+def _make_codec(name: str) -> str:
+    return (
+        "def to_payload(self) -> dict[str, typing.Any]:\n"
+        '    """Convert this object into its raw API representation."""\n'
+        "    return msgspec.to_builtins(self)\n\n"
+        "@classmethod\n"
+        f'def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "{name}":\n'
+        '    """Create this object from its raw API representation."""\n'
+        "    return msgspec.convert(payload, type=cls)\n"
+    )
+
+
+def make_struct(
+    item_info: utils.ItemInfo,
+    name: str,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    options: utils.ClassOptions,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> libcst.ClassDef:
+    """Make a ``msgspec.Struct`` class with the provided (wire) fields.
+
+    The tag of enum variants is handled by msgspec, and exposed as a class
+    variable to match the attrs backend. Any additional members are added as
+    code after the fields.
+    """
+    bases = STRUCT_OPTIONS
+    body: list[str] = []
+    if options.doc:
+        docstring = cst.make_docstring(options.doc, indentation=0)
+        body.append(libcst.Module([]).code_for_node(docstring) + "\n")
+
+    if options.tag:
+        key, value = options.tag
+        bases += f', tag_field="{key}", tag="{value}"'
+        body.append(f'{key}: typing.ClassVar[typing.Literal["{value}"]] = "{value}"\n')
+
+    if options.content:
+        body.append(f"{options.content}: {options.content_annotation}\n")
+
+    body.extend(_make_field(item_info, field, cache=cache) for field in fields)
+    body.extend(f"\n{member}" for member in options.members)
+    body.append(f"\n{_make_codec(name)}")
+
+    code = f"class {name}({bases}):\n" + "".join(
+        "".join(f"    {line}\n" if line else "\n" for line in part.removesuffix("\n").split("\n"))
+        for part in body
+    )
+    return libcst.ensure_type(libcst.parse_statement(code), libcst.ClassDef).with_changes(
+        leading_lines=[libcst.EmptyLine(), libcst.EmptyLine()],
+    )
+
+
+def _get_variant_fields(
+    item: utils.EnumItem,
+    variant: utils.EnumVariant,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[utils.FieldInfo]:
+    if variant["type"] == "unit":
+        return []
+
+    if variant["type"] == "object":
+        return cst.resolve_fields(variant["fields"], cache=cache)
+
+    if item["content"]:
+        return [
+            utils.FieldInfo(
+                name=item["content"],
+                doc=None,
+                type=variant["field_type"],
+                nullable=False,
+                omittable=False,
+                flattened=False,
+            ),
+        ]
+
+    flattened = cache[variant["field_type"]].data["item"]
+    assert flattened["type"] == "object"
+    return cst.resolve_fields(flattened["fields"], cache=cache)
+
+
+def parse_enum_variant(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    variant: utils.EnumVariant,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[libcst.ClassDef]:
+    """Parse an enum variant into a struct.
+
+    The fields of adjacently tagged object variants are parsed into a
+    separate struct that precedes the variant.
+    """
+    name = cst.to_upper_snake_case(variant["name"]) + item_info["name"]
+    tag = (item["tag"], variant["name"]) if item["tag"] else None
+    options = utils.ClassOptions(
+        doc=variant["doc"] or f"Please refer to {item_info['name']}.",
+        tag=tag,
+    )
+    fields = _get_variant_fields(item, variant, cache=cache)
+
+    if not (item["content"] and variant["type"] == "object"):
+        return [make_struct(item_info, name, fields, options=options, cache=cache)]
+
+    content_name = f"{name}Data"
+    content_options = utils.ClassOptions(doc=f"The ``{item['content']}`` of :class:`{name}`.")
+    options = attrs.evolve(
+        options,
+        content=item["content"],
+        content_annotation=content_name,
+        members=[
+            _make_forwarding_property(item_info, field, item["content"], cache=cache)
+            for field in fields
+        ],
+    )
+    return [
+        make_struct(item_info, content_name, fields, options=content_options, cache=cache),
+        make_struct(item_info, name, [], options=options, cache=cache),
+    ]
+
+
+def parse_enum_item(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[utils.ModuleCodeType]:
+    """Parse an enum item into structs, or a python Enum for pure unit enums.
+
+    Like the attrs backend, the variants are followed by their union and a
+    decoder function. Tagged unions can also be decoded by msgspec directly,
+    e.g. through ``msgspec.json.decode(data, type=ServerPayload)``.
+    """
+    if cst.is_pure_unit_enum(item):
+        return cst.parse_pure_unit_enum(item_info, item)
+
+    variants: list[libcst.ClassDef] = []
+    body: list[utils.ModuleCodeType] = []
+    for variant in item["variants"]:
+        structs = parse_enum_variant(item_info, item, variant, cache=cache)
+        variants.append(structs[-1])
+        body.extend(structs)
+
+    alias = libcst.parse_statement(
+        f"{item_info['name']} = {' | '.join(variant.name.value for variant in variants)}",
+    )
+    body.append(alias.with_changes(leading_lines=[libcst.EmptyLine(), libcst.EmptyLine()]))
+    if item_info["doc"]:
+        body.append(cst.make_docstring(item_info["doc"], indentation=0))
+
+    if item["untagged"]:
+        cst.check_untagged_variants(item_info, item, cache=cache)
+        body.extend(cst.make_untagged_decoder(item_info, item, variants, cache=cache))
+
+    else:
+        body.extend(cst.make_variant_decoder(item_info, item, variants))
+
+    return body
+
+
+def parse_item(
+    item_info: utils.ItemInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> typing.Sequence[utils.ModuleCodeType]:
+    """Parse an eludris-autodoc item into msgspec structs.
+
+    Flattened fields are resolved into the fields of the items they refer to.
+    """
+    item = item_info["item"]
+    if item["type"] == "object":
+        fields = cst.resolve_fields(item["fields"], cache=cache)
+        return [
+            make_struct(
+                item_info,
+                item_info["name"],
+                fields,
+                options=utils.ClassOptions(doc=item_info["doc"]),
+                cache=cache,
+            ),
+        ]
+
+    if item["type"] == "enum":
+        return parse_enum_item(item_info, item, cache=cache)
+
+    msg = f"What the heck is an {item['type']!r}!?"
+    raise ValueError(msg)
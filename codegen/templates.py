@@ -0,0 +1,408 @@
+"""String-template implementation of eludris-autodoc code-gen.
+
+This renders exactly the same code as :mod:`codegen.cst`, but formats the
+source of every statement from templates instead of building libcst nodes and
+rendering them with ``libcst.Module.code``. The sources of methods and tables
+are shared with :mod:`codegen.cst`, which parses them into nodes instead.
+
+Only the attrs backend is supported.
+"""
+
+import json
+import typing
+
+import attrs
+
+from . import cst, utils
+
+__all__: typing.Sequence[str] = (
+    "render_import",
+    "render_item",
+    "render_raw_item",
+)
+
+INDENT: typing.Final[str] = " " * 4
+
+ATTRS_DECORATOR: typing.Final[str] = "@attrs.define(kw_only=True, weakref_slot=False)"
+ATTRS_CLASS_TEMPLATE: typing.Final[str] = ATTRS_DECORATOR + "\nclass {name}{bases}:\n{body}"
+LAZY_FIELDS_BASES: typing.Final[str] = "(lazy.LazyFields)"
+ENUM_CLASS_TEMPLATE: typing.Final[str] = "class {name}(str, enum.Enum):\n{body}"
+FIELD_TEMPLATE: typing.Final[str] = "    {name}: {annotation} = attrs.field({args})\n"
+TAG_TEMPLATE: typing.Final[str] = '    {tag}: typing.Literal["{value}"] = attrs.field()\n'
+FRAME_TEMPLATE: typing.Final[str] = "    _FRAME: typing.ClassVar[bytes] = {frame!r}\n"
+MEMBER_TEMPLATE: typing.Final[str] = '    {name} = "{name}"\n'
+
+
+def _render_docstring(doc: str, *, indentation: int) -> str:
+    return f"{INDENT * indentation}{cst.make_docstring_source(doc, indentation=indentation)}\n"
+
+
+def _render_method(code: str) -> str:
+    # Methods are separated from the statements before them by a blank line.
+    return "\n" + "".join(f"{INDENT}{line}\n" for line in code.splitlines())
+
+
+def _render_table(code: str | None, doc: str) -> str:
+    if code is None:
+        return ""
+
+    return f"\n{INDENT}{code}\n{_render_docstring(doc, indentation=1)}"
+
+
+def _render_field(
+    item_info: utils.ItemInfo,
+    field: utils.FieldInfo,
+    *,
+    inherited: bool = False,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    code = FIELD_TEMPLATE.format(
+        name=field["name"],
+        annotation=cst.make_field_annotation_source(item_info, field, cache=cache),
+        args="default=undefined.Undefined" if field["omittable"] else "",
+    )
+
+    # Docstrings are not inherited by classes that flatten this field.
+    if field["doc"] and not inherited:
+        code += _render_docstring(field["doc"], indentation=1)
+
+    return code
+
+
+def _render_fields(
+    item_info: utils.ItemInfo,
+    fields: typing.Sequence[utils.FieldInfo],
+    *,
+    inherited: bool = False,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    # Flattened fields are rendered relative to the item they are defined on,
+    # just like cst copies the statements of its class.
+    code = ""
+    for field in fields:
+        if not field["flattened"]:
+            code += _render_field(item_info, field, inherited=inherited, cache=cache)
+            continue
+
+        flattened = cache[field["type"]].data
+        assert flattened["item"]["type"] == "object"
+        code += _render_fields(flattened, flattened["item"]["fields"], inherited=True, cache=cache)
+
+    return code
+
+
+def _bases(wire_fields: typing.Sequence[utils.FieldInfo]) -> str:
+    return LAZY_FIELDS_BASES if cst.has_lazy_fields(wire_fields) else ""
+
+
+def _render_codecs(
+    item_info: utils.ItemInfo,
+    name: str,
+    wire_fields: typing.Sequence[utils.FieldInfo],
+    *,
+    options: utils.ClassOptions = utils.NO_CLASS_OPTIONS,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    tag_value = options.tag
+    tag = tag_value[0] if tag_value else None
+    content = options.content
+    code = ""
+    if wire_fields:
+        code += _render_table(cst.make_lazy_fields_source(wire_fields), cst.LAZY_FIELDS_DOC)
+        code += _render_table(
+            cst.make_lazy_decoders_source(
+                item_info,
+                wire_fields,
+                tag=tag,
+                content=content,
+                cache=cache,
+            ),
+            cst.LAZY_DECODERS_DOC,
+        )
+        code += _render_table(cst.make_length_limits_source(wire_fields), cst.LENGTH_LIMITS_DOC)
+
+    if wire_fields or tag:
+        code += _render_table(
+            cst.make_key_slots_source(
+                item_info,
+                wire_fields,
+                tag=tag,
+                content=content,
+                cache=cache,
+            ),
+            cst.KEY_SLOTS_DOC,
+        )
+        field_types = cst.make_field_types_source(
+            item_info,
+            wire_fields,
+            tag=tag_value,
+            cache=cache,
+        )
+        if field_types:
+            code += _render_method(field_types)
+
+    code += _render_method(
+        cst.make_to_payload_source(wire_fields, tag=tag, content=content, cache=cache),
+    )
+    code += _render_method(
+        cst.make_from_payload_source(item_info, name, wire_fields, options=options, cache=cache),
+    )
+    code += _render_method(
+        cst.make_from_trusted_source(item_info, name, wire_fields, tag=tag_value, cache=cache),
+    )
+    for method in cst.make_reduce_sources(name, wire_fields, tag=tag_value):
+        code += _render_method(method)
+
+    return code
+
+
+def _render_object_item(
+    item_info: utils.ItemInfo,
+    item: utils.ObjectItem,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[str]:
+    body = ""
+    if item_info["doc"]:
+        body += _render_docstring(item_info["doc"], indentation=1)
+
+    body += _render_fields(item_info, item["fields"], cache=cache)
+    wire_fields = cst.resolve_fields(item["fields"], cache=cache)
+    body += _render_codecs(item_info, item_info["name"], wire_fields, cache=cache)
+    bases = _bases(wire_fields)
+    return [ATTRS_CLASS_TEMPLATE.format(name=item_info["name"], bases=bases, body=body)]
+
+
+def _render_enum_variant(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    variant: utils.EnumVariant,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> str:
+    name = cst.to_upper_snake_case(variant["name"]) + item_info["name"]
+    tag = item["tag"]
+
+    body = _render_docstring(
+        variant["doc"] or f"Please refer to {item_info['name']}.",
+        indentation=1,
+    )
+    if tag:
+        body += TAG_TEMPLATE.format(tag=tag, value=variant["name"])
+
+    wire_fields: typing.Sequence[utils.FieldInfo] = ()
+    if variant["type"] == "object":
+        body += _render_fields(item_info, variant["fields"], cache=cache)
+        wire_fields = cst.resolve_fields(variant["fields"], cache=cache)
+
+    elif variant["type"] == "tuple" and item["content"]:
+        annotation = cst.make_annotation_source(item_info, variant["field_type"], cache=cache)
+        body += FIELD_TEMPLATE.format(name=item["content"], annotation=annotation, args="")
+        wire_fields = [
+            utils.FieldInfo(
+                name=item["content"],
+                doc=None,
+                type=variant["field_type"],
+                nullable=False,
+                omittable=False,
+                flattened=False,
+            ),
+        ]
+
+    elif variant["type"] == "tuple":
+        flattened = cache[variant["field_type"]].data
+        assert flattened["item"]["type"] == "object"
+        body += _render_fields(flattened, flattened["item"]["fields"], inherited=True, cache=cache)
+        wire_fields = cst.resolve_fields(flattened["item"]["fields"], cache=cache)
+
+    elif tag:
+        frame = json.dumps({tag: variant["name"]}, separators=cst.FRAME_SEPARATORS).encode()
+        body += FRAME_TEMPLATE.format(frame=frame)
+        body += _render_docstring(cst.FRAME_DOC, indentation=1)
+
+    options = utils.ClassOptions(
+        tag=(tag, variant["name"]) if tag else None,
+        content=item["content"] if variant["type"] == "object" else None,
+    )
+    body += _render_codecs(item_info, name, wire_fields, options=options, cache=cache)
+    return ATTRS_CLASS_TEMPLATE.format(name=name, bases=_bases(wire_fields), body=body)
+
+
+def _render_pure_unit_enum(item_info: utils.ItemInfo, item: utils.EnumItem) -> list[str]:
+    body = ""
+    if item_info["doc"]:
+        body += _render_docstring(item_info["doc"], indentation=1)
+
+    for variant in item["variants"]:
+        body += MEMBER_TEMPLATE.format(name=variant["name"])
+        if variant["doc"]:
+            body += _render_docstring(variant["doc"], indentation=1)
+
+    statements = [ENUM_CLASS_TEMPLATE.format(name=item_info["name"], body=body)]
+    statements.extend(
+        f"\n{code}\n{_render_docstring(doc, indentation=0)}"
+        for code, doc in cst.make_enum_table_sources(item_info, item)
+    )
+    return statements
+
+
+def _render_enum_item(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[str]:
+    if cst.is_pure_unit_enum(item):
+        return _render_pure_unit_enum(item_info, item)
+
+    if item["untagged"]:
+        cst.check_untagged_variants(item_info, item, cache=cache)
+
+    name = item_info["name"]
+    variant_names = [
+        cst.to_upper_snake_case(variant["name"]) + name for variant in item["variants"]
+    ]
+    statements = [
+        _render_enum_variant(item_info, item, variant, cache=cache) for variant in item["variants"]
+    ]
+    statements.append(f"{name} = {' | '.join(variant_names)}\n")
+
+    if item_info["doc"]:
+        statements.append(_render_docstring(item_info["doc"], indentation=0))
+
+    if item["untagged"]:
+        decoder = cst.make_untagged_decoder_source(item_info, item, variant_names, cache=cache)
+        statements.append(f"\n\n{decoder}")
+
+    else:
+        table, doc, decoder = cst.make_variant_decoder_sources(item_info, item, variant_names)
+        statements.append(f"\n{table}\n")
+        statements.append(_render_docstring(doc, indentation=0))
+        statements.append(f"\n\n{decoder}")
+
+    return statements
+
+
+def render_item(
+    item_info: utils.ItemInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> typing.Sequence[str]:
+    """Render an eludris-autodoc item into the source of its statements.
+
+    The statements match those of ``cst.parse_item``, including the blank
+    lines before them.
+    """
+    item = item_info["item"]
+    if item["type"] == "object":
+        return _render_object_item(item_info, item, cache=cache)
+
+    if item["type"] == "enum":
+        return _render_enum_item(item_info, item, cache=cache)
+
+    msg = f"What the heck is an {item['type']!r}!?"
+    raise ValueError(msg)
+
+
+def _render_raw_enum_variant(
+    item_info: utils.ItemInfo,
+    item: utils.EnumItem,
+    variant: utils.EnumVariant,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> list[str]:
+    name = cst.to_upper_snake_case(variant["name"]) + item_info["name"]
+    tag = (item["tag"], variant["name"]) if item["tag"] else None
+    options = utils.ClassOptions(doc=cst.make_raw_doc(name), tag=tag)
+
+    if variant["type"] == "unit":
+        fields: list[utils.FieldInfo] = []
+
+    elif variant["type"] == "object":
+        fields = cst.resolve_fields(variant["fields"], cache=cache)
+        if item["content"]:
+            # Adjacently tagged fields are nested under the content key.
+            content_name = f"{name}Data"
+            content_doc = f"The ``{item['content']}`` of :class:`{name}`."
+            return [
+                *cst.make_typed_dict_sources(
+                    item_info,
+                    content_name,
+                    fields,
+                    options=utils.ClassOptions(doc=content_doc),
+                    cache=cache,
+                ),
+                *cst.make_typed_dict_sources(
+                    item_info,
+                    name,
+                    [],
+                    options=attrs.evolve(
+                        options,
+                        content=item["content"],
+                        content_annotation=content_name,
+                    ),
+                    cache=cache,
+                ),
+            ]
+
+    elif item["content"]:
+        annotation = cst.make_raw_annotation(
+            item_info,
+            variant["field_type"],
+            cache=cache,
+        )
+        options = attrs.evolve(options, content=item["content"], content_annotation=annotation)
+        return cst.make_typed_dict_sources(item_info, name, [], options=options, cache=cache)
+
+    else:
+        flattened = cache[variant["field_type"]].data["item"]
+        assert flattened["type"] == "object"
+        fields = cst.resolve_fields(flattened["fields"], cache=cache)
+
+    return cst.make_typed_dict_sources(item_info, name, fields, options=options, cache=cache)
+
+
+def render_raw_item(
+    item_info: utils.ItemInfo,
+    *,
+    cache: typing.Mapping[str, utils.AutodocItem],
+) -> typing.Sequence[str]:
+    """Render an eludris-autodoc item into the source of the TypedDicts mirroring it.
+
+    The statements match those of ``cst.parse_raw_item``, including the blank
+    lines before them.
+    """
+    name = item_info["name"]
+    item = item_info["item"]
+    if item["type"] == "object":
+        fields = cst.resolve_fields(item["fields"], cache=cache)
+        options = utils.ClassOptions(doc=cst.make_raw_doc(name))
+        sources = cst.make_typed_dict_sources(item_info, name, fields, options=options, cache=cache)
+        return [f"\n\n{source}" for source in sources]
+
+    sources: list[str] = []
+    role = "class"
+    if not cst.is_pure_unit_enum(item):
+        role = "data"
+        for variant in item["variants"]:
+            sources.extend(_render_raw_enum_variant(item_info, item, variant, cache=cache))
+
+    return [
+        *(f"\n\n{source}" for source in sources),
+        f"\n\n{cst.make_raw_alias_source(item_info)}\n",
+        _render_docstring(cst.make_raw_doc(name, role=role), indentation=0),
+    ]
+
+
+def render_import(
+    module: str,
+    *,
+    import_from: str | None = None,
+    import_as: str | None = None,
+) -> str:
+    """Render an import line, matching ``cst.make_import``."""
+    if not import_from:
+        return f"import {module}\n"
+
+    alias = f" as {import_as}" if import_as else ""
+    return f"from {import_from} import {module}{alias}\n"
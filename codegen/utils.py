@@ -86,6 +86,55 @@ class ItemInfo(typing.TypedDict):
     item: ObjectItem | EnumItem
 
 
+class ParamInfo(typing.TypedDict):
+    name: str
+    param_type: str
+
+
+class RouteItem(typing.TypedDict):
+    type: typing.Literal["route"]
+    method: str
+    route: str
+    path_params: typing.Sequence[ParamInfo]
+    query_params: typing.Sequence[ParamInfo]
+    body_type: str | None
+    return_type: str | None
+    guards: typing.Sequence[str]
+
+
+class RouteInfo(typing.TypedDict):
+    name: str
+    doc: str | None
+    category: str
+    hidden: bool
+    package: str
+    item: RouteItem
+
+
+@attrs.frozen(kw_only=True)
+class ClassOptions:
+    """The options of a generated class, besides its name and fields.
+
+    All but the docstring only apply to enum variants, and are left unset for
+    other classes.
+    """
+
+    doc: str | None = None
+    """The docstring of the class."""
+    tag: tuple[str, str] | None = None
+    """The key and value of the tag of the variant, e.g. ``("op", "HELLO")``."""
+    content: str | None = None
+    """The key the data of an adjacently tagged variant is nested under."""
+    content_annotation: str | None = None
+    """The annotation of the data under ``content``, for classes that hold it as a field."""
+    members: typing.Sequence[str] = ()
+    """The code of any additional members of the class."""
+
+
+NO_CLASS_OPTIONS: typing.Final[ClassOptions] = ClassOptions()
+"""The options of a class that is not an enum variant, and has no docstring."""
+
+
 @attrs.define(kw_only=True)
 class AutodocItem:
     """Representation of a singular top-level eludris-autodoc item."""
@@ -101,6 +150,8 @@ class AutodocItem:
 
     code: typing.Sequence[ModuleCodeType] = attrs.field(factory=list, init=False)
     """The CST for this item."""
+    raw_code: typing.Sequence[ModuleCodeType] = attrs.field(factory=list, init=False)
+    """The CST for the TypedDicts mirroring the raw API representation of this item."""
     _main_obj: ModuleCodeType | None = attrs.field(default=None, init=False)
 
     @property
@@ -151,17 +202,29 @@ class AutodocItem:
     def set_code(self, items: typing.Sequence[ModuleCodeType]) -> None:
         """Set the generated CST for this item.
 
-        This also makes ``self.main_obj`` available.
+        This also makes ``self.main_obj`` available. The main object is the
+        statement that defines this item's name: the class for objects and
+        actual python enums, or the Union of all variants for other enums.
         """
         self.code = items
 
-        if len(items) == 1:
-            # Object or actual python enum.
-            self._main_obj = items[0]
+        for statement in items:
+            match statement:
+                case libcst.ClassDef(name=libcst.Name(name)) if name == self.name:
+                    self._main_obj = statement
+                    return
 
-        else:
-            # Enum, last item is the Union of all enum types.
-            self._main_obj = items[-1]
+                case libcst.SimpleStatementLine(
+                    body=[libcst.Assign(targets=[libcst.AssignTarget(libcst.Name(name))])],
+                ) if name == self.name:
+                    self._main_obj = statement
+                    return
+
+                case _:
+                    pass
+
+        msg = f"The code for item {self.name!r} does not define {self.name!r}."
+        raise RuntimeError(msg)
 
 
 def _get_object_dependencies(item: ObjectItem) -> set[str]:
@@ -6,8 +6,8 @@ The version of this module matches that of the Eludris API version for
  which it was generated.
 
 .. warning::
-    This module and all submodules except for `undefined` were
-    automatically generated.
+    This module and all submodules except for
+    `undefined`, `frames`, `presence`, `lazy`, `ids`, `validation`, `partial`, `packing`, `transport`, `usercache`, `snapshot`, `eventlog` and `rest` were automatically generated.
 """
 import typing
 
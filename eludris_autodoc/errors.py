@@ -3,10 +3,13 @@
 .. warning::
     This module was automatically generated.
 """
+import copyreg
 import typing
 
 import attrs
 
+from . import partial, validation
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class SharedErrorData:
@@ -17,6 +20,42 @@ class SharedErrorData:
     message: str = attrs.field()
     """A brief explanation of the error."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "status": ("status", None),
+        "message": ("message", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"status": (int,), "message": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"status": self.status, "message": self.message}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "SharedErrorData":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(status=payload["status"], message=payload["message"])
+
+    @classmethod
+    def _from_trusted(cls, *, status: int, message: str) -> "SharedErrorData":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.status = status
+        self.message = message
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (SharedErrorData,), (self.status, self.message))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.status, self.message) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class UnauthorizedErrorResponse:
@@ -40,6 +79,55 @@ class UnauthorizedErrorResponse:
     status: int = attrs.field()
     message: str = attrs.field()
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "status": ("status", None),
+        "message": ("message", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": ("UNAUTHORIZED",), "status": (int,), "message": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"type": self.type, "status": self.status, "message": self.message}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "UnauthorizedErrorResponse":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            status=payload["status"],
+            message=payload["message"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["UNAUTHORIZED"],
+        status: int,
+        message: str,
+    ) -> "UnauthorizedErrorResponse":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.status = status
+        self.message = message
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (UnauthorizedErrorResponse,), (self.status, self.message))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "UNAUTHORIZED"
+        (self.status, self.message) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class ForbiddenErrorResponse:
@@ -61,6 +149,55 @@ class ForbiddenErrorResponse:
     status: int = attrs.field()
     message: str = attrs.field()
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "status": ("status", None),
+        "message": ("message", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": ("FORBIDDEN",), "status": (int,), "message": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"type": self.type, "status": self.status, "message": self.message}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "ForbiddenErrorResponse":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            status=payload["status"],
+            message=payload["message"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["FORBIDDEN"],
+        status: int,
+        message: str,
+    ) -> "ForbiddenErrorResponse":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.status = status
+        self.message = message
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (ForbiddenErrorResponse,), (self.status, self.message))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "FORBIDDEN"
+        (self.status, self.message) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class NotFoundErrorResponse:
@@ -81,6 +218,55 @@ class NotFoundErrorResponse:
     status: int = attrs.field()
     message: str = attrs.field()
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "status": ("status", None),
+        "message": ("message", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": ("NOT_FOUND",), "status": (int,), "message": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"type": self.type, "status": self.status, "message": self.message}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "NotFoundErrorResponse":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            status=payload["status"],
+            message=payload["message"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["NOT_FOUND"],
+        status: int,
+        message: str,
+    ) -> "NotFoundErrorResponse":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.status = status
+        self.message = message
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (NotFoundErrorResponse,), (self.status, self.message))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "NOT_FOUND"
+        (self.status, self.message) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class ConflictErrorResponse:
@@ -105,6 +291,68 @@ class ConflictErrorResponse:
     item: str = attrs.field()
     """The conflicting item."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "status": ("status", None),
+        "message": ("message", None),
+        "item": ("item", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": ("CONFLICT",), "status": (int,), "message": (str,), "item": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "type": self.type,
+            "status": self.status,
+            "message": self.message,
+            "item": self.item,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "ConflictErrorResponse":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            status=payload["status"],
+            message=payload["message"],
+            item=payload["item"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["CONFLICT"],
+        status: int,
+        message: str,
+        item: str,
+    ) -> "ConflictErrorResponse":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.status = status
+        self.message = message
+        self.item = item
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (ConflictErrorResponse,),
+            (self.status, self.message, self.item),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "CONFLICT"
+        (self.status, self.message, self.item) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class MisdirectedErrorResponse:
@@ -132,6 +380,68 @@ class MisdirectedErrorResponse:
     info: str = attrs.field()
     """Extra information about what went wrong."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "status": ("status", None),
+        "message": ("message", None),
+        "info": ("info", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": ("MISDIRECTED",), "status": (int,), "message": (str,), "info": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "type": self.type,
+            "status": self.status,
+            "message": self.message,
+            "info": self.info,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "MisdirectedErrorResponse":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            status=payload["status"],
+            message=payload["message"],
+            info=payload["info"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["MISDIRECTED"],
+        status: int,
+        message: str,
+        info: str,
+    ) -> "MisdirectedErrorResponse":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.status = status
+        self.message = message
+        self.info = info
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (MisdirectedErrorResponse,),
+            (self.status, self.message, self.info),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "MISDIRECTED"
+        (self.status, self.message, self.info) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class ValidationErrorResponse:
@@ -158,6 +468,79 @@ class ValidationErrorResponse:
     info: str = attrs.field()
     """Extra information about what went wrong."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "status": ("status", None),
+        "message": ("message", None),
+        "value_name": ("value_name", None),
+        "info": ("info", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "type": ("VALIDATION",),
+            "status": (int,),
+            "message": (str,),
+            "value_name": (str,),
+            "info": (str,),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "type": self.type,
+            "status": self.status,
+            "message": self.message,
+            "value_name": self.value_name,
+            "info": self.info,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "ValidationErrorResponse":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            status=payload["status"],
+            message=payload["message"],
+            value_name=payload["value_name"],
+            info=payload["info"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["VALIDATION"],
+        status: int,
+        message: str,
+        value_name: str,
+        info: str,
+    ) -> "ValidationErrorResponse":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.status = status
+        self.message = message
+        self.value_name = value_name
+        self.info = info
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (ValidationErrorResponse,),
+            (self.status, self.message, self.value_name, self.info),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "VALIDATION"
+        (self.status, self.message, self.value_name, self.info) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class RateLimitedErrorResponse:
@@ -181,6 +564,73 @@ class RateLimitedErrorResponse:
     retry_after: int = attrs.field()
     """The amount of milliseconds you're still rate limited for."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "status": ("status", None),
+        "message": ("message", None),
+        "retry_after": ("retry_after", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "type": ("RATE_LIMITED",),
+            "status": (int,),
+            "message": (str,),
+            "retry_after": (int,),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "type": self.type,
+            "status": self.status,
+            "message": self.message,
+            "retry_after": self.retry_after,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "RateLimitedErrorResponse":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            status=payload["status"],
+            message=payload["message"],
+            retry_after=payload["retry_after"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["RATE_LIMITED"],
+        status: int,
+        message: str,
+        retry_after: int,
+    ) -> "RateLimitedErrorResponse":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.status = status
+        self.message = message
+        self.retry_after = retry_after
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (RateLimitedErrorResponse,),
+            (self.status, self.message, self.retry_after),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "RATE_LIMITED"
+        (self.status, self.message, self.retry_after) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class ServerErrorResponse:
@@ -207,6 +657,64 @@ class ServerErrorResponse:
     info: str = attrs.field()
     """Extra information about what went wrong."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "status": ("status", None),
+        "message": ("message", None),
+        "info": ("info", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": ("SERVER",), "status": (int,), "message": (str,), "info": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "type": self.type,
+            "status": self.status,
+            "message": self.message,
+            "info": self.info,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "ServerErrorResponse":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            status=payload["status"],
+            message=payload["message"],
+            info=payload["info"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["SERVER"],
+        status: int,
+        message: str,
+        info: str,
+    ) -> "ServerErrorResponse":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.status = status
+        self.message = message
+        self.info = info
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (ServerErrorResponse,), (self.status, self.message, self.info))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "SERVER"
+        (self.status, self.message, self.info) = state
+
 
 ErrorResponse = (
     UnauthorizedErrorResponse
@@ -219,3 +727,20 @@ ErrorResponse = (
     | ServerErrorResponse
 )
 """All the possible error responses that are returned from Eludris HTTP microservices."""
+
+ERROR_RESPONSE_VARIANTS: typing.Final[dict[str, type[ErrorResponse]]] = {
+    "UNAUTHORIZED": UnauthorizedErrorResponse,
+    "FORBIDDEN": ForbiddenErrorResponse,
+    "NOT_FOUND": NotFoundErrorResponse,
+    "CONFLICT": ConflictErrorResponse,
+    "MISDIRECTED": MisdirectedErrorResponse,
+    "VALIDATION": ValidationErrorResponse,
+    "RATE_LIMITED": RateLimitedErrorResponse,
+    "SERVER": ServerErrorResponse,
+}
+"""Mapping of `type` tags to ErrorResponse variants."""
+
+
+def decode_error_response(payload: typing.Mapping[str, typing.Any]) -> ErrorResponse:
+    """Decode a raw API payload into the matching ErrorResponse variant."""
+    return ERROR_RESPONSE_VARIANTS[payload["type"]].from_payload(payload)
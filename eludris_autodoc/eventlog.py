@@ -0,0 +1,357 @@
+"""This module implements recording gateway frames to disk and replaying them.
+
+An :class:`EventLogWriter` appends raw ``ServerPayload`` frames to a log file,
+along with the time they were received and their ``op``. Every
+:data:`BLOCK_SIZE` events, it also appends an entry to a sparse index next to
+the log, which holds the time range of the block and which ops occur in it.
+
+An :class:`EventLog` memory-maps a log and reads frames straight from the
+mapped file. Blocks that cannot contain any wanted events, because they are
+outside the requested time range or do not contain any of the requested ops,
+are skipped without reading them::
+
+    with eventlog.EventLog.open(path) as log:
+        for payload in log.replay(ops={"MESSAGE_CREATE"}):
+            ...
+"""
+
+import bisect
+import json
+import mmap
+import os
+import pathlib
+import struct
+import time
+import types
+import typing
+
+from . import gateway
+
+__all__: typing.Sequence[str] = ("BLOCK_SIZE", "Event", "EventLog", "EventLogWriter")
+
+BLOCK_SIZE: typing.Final[int] = 4096
+"""The amount of events covered by each entry in the index."""
+
+Event = tuple[int, str, memoryview]
+"""A raw event: its timestamp in nanoseconds since the unix epoch, its op and its frame."""
+
+_MAGIC: typing.Final[bytes] = b"ELUDLOG1"
+"""Identifies a file as an event log with this layout."""
+_RECORD: typing.Final[struct.Struct] = struct.Struct("<IqB")
+"""The size of the frame, the timestamp and the op code, before every frame."""
+_INDEX_ENTRY: typing.Final[struct.Struct] = struct.Struct("<QQqqQ")
+"""The start and end offset, the first and last timestamp and the op code mask of a block."""
+_UNINDEXED_MASK: typing.Final[int] = -1
+"""The op code mask of the events after the last index entry, which may contain any op."""
+_OPS: typing.Final[tuple[str, ...]] = tuple(gateway.SERVER_PAYLOAD_VARIANTS)
+_OP_CODES: typing.Final[dict[str, int]] = {op: code for code, op in enumerate(_OPS)}
+_VARIANTS: typing.Final[tuple[type[gateway.ServerPayload], ...]] = tuple(
+    gateway.SERVER_PAYLOAD_VARIANTS.values(),
+)
+
+
+def _get_index_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(f"{path.name}.idx")
+
+
+def _get_op_code(op: str) -> int:
+    code = _OP_CODES.get(op)
+    if code is None:
+        msg = f"Unknown server payload op {op!r}"
+        raise ValueError(msg)
+
+    return code
+
+
+class _Block(typing.NamedTuple):
+    start: int
+    end: int
+    first_timestamp: int
+    last_timestamp: int
+    mask: int
+
+
+def _read_index(file: typing.BinaryIO) -> list[_Block]:
+    # Ignores a partially written last entry.
+    file.seek(0)
+    index = file.read()
+    index = index[: len(index) - len(index) % _INDEX_ENTRY.size]
+    return list(map(_Block._make, _INDEX_ENTRY.iter_unpack(index)))
+
+
+class EventLogWriter:
+    """Appends gateway frames to an event log, creating it if needed.
+
+    Timestamps never decrease within a log; an event appended with an earlier
+    timestamp than the previous event is recorded at the previous timestamp.
+    If the log was not closed cleanly, its last, partially written event is
+    discarded when it is opened again. Blocks are synced to disk before they
+    are indexed, and index entries of blocks that did not reach the disk are
+    dropped when the log is opened again.
+    """
+
+    __slots__ = (
+        "_file",
+        "_index_file",
+        "_offset",
+        "_block_start",
+        "_block_count",
+        "_first_timestamp",
+        "_last_timestamp",
+        "_mask",
+    )
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        path = pathlib.Path(path)
+        self._file = path.open("a+b")
+        self._index_file = _get_index_path(path).open("a+b")
+        self._offset = self._file.seek(0, os.SEEK_END)
+        self._last_timestamp = 0
+        if self._offset:
+            self._recover()
+
+        else:
+            self._offset = self._file.write(_MAGIC)
+
+        self._start_block()
+
+    def _start_block(self) -> None:
+        self._block_start = self._offset
+        self._block_count = 0
+        self._first_timestamp = self._last_timestamp
+        self._mask = 0
+
+    def _recover(self) -> None:
+        # Events after the last index entry were written by a writer that was
+        # not closed. Index them as a block, and drop an incomplete last event.
+        self._file.seek(0)
+        if self._file.read(len(_MAGIC)) != _MAGIC:
+            msg = "File is not an eludris-autodoc event log"
+            raise ValueError(msg)
+
+        # The index may have reached the disk while the end of the log did not,
+        # so blocks that end beyond the log are dropped.
+        log_size = self._file.seek(0, os.SEEK_END)
+        blocks = _read_index(self._index_file)
+        while blocks and blocks[-1].end > log_size:
+            blocks.pop()
+
+        self._index_file.truncate(len(blocks) * _INDEX_ENTRY.size)
+        start = len(_MAGIC)
+        if blocks:
+            start, self._last_timestamp = blocks[-1].end, blocks[-1].last_timestamp
+
+        self._file.seek(start)
+        tail = self._file.read()
+        self._offset = start
+        self._start_block()
+        position = 0
+        while position + _RECORD.size <= len(tail):
+            length, timestamp, code = _RECORD.unpack_from(tail, position)
+            if position + _RECORD.size + length > len(tail):
+                break
+
+            position += _RECORD.size + length
+            self._block_count += 1
+            self._last_timestamp = timestamp
+            self._mask |= 1 << code
+
+        if self._block_count:
+            self._first_timestamp = _RECORD.unpack_from(tail)[1]
+
+        self._offset = start + position
+        self._file.truncate(self._offset)
+        self._end_block()
+
+    def _end_block(self) -> None:
+        if self._block_count:
+            # The block has to be on disk before the index entry that refers to it.
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._index_file.write(
+                _INDEX_ENTRY.pack(
+                    self._block_start,
+                    self._offset,
+                    self._first_timestamp,
+                    self._last_timestamp,
+                    self._mask,
+                ),
+            )
+
+        self._start_block()
+
+    def append(self, op: str, frame: bytes, *, timestamp: int | None = None) -> None:
+        """Append a raw frame with the provided op to the log.
+
+        The timestamp defaults to the current time, in nanoseconds since the
+        unix epoch.
+        """
+        code = _get_op_code(op)
+        if timestamp is None:
+            timestamp = time.time_ns()
+
+        timestamp = max(timestamp, self._last_timestamp)
+        if not self._block_count:
+            self._first_timestamp = timestamp
+
+        self._file.write(_RECORD.pack(len(frame), timestamp, code))
+        self._file.write(frame)
+        self._offset += _RECORD.size + len(frame)
+        self._last_timestamp = timestamp
+        self._mask |= 1 << code
+        self._block_count += 1
+        if self._block_count == BLOCK_SIZE:
+            self._end_block()
+
+    def flush(self) -> None:
+        """Flush all appended events to the file, making them visible to readers."""
+        self._file.flush()
+        self._index_file.flush()
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Index the last events and close the log."""
+        self._end_block()
+        self._file.close()
+        self._index_file.close()
+
+
+class EventLog:
+    """A memory-mapped, read-only event log, written by an :class:`EventLogWriter`.
+
+    Only events that were flushed before the log was opened can be read.
+    """
+
+    __slots__ = ("_mmap", "_buf", "_blocks", "_last_timestamps")
+
+    def __init__(self, buffer: mmap.mmap, blocks: typing.Sequence[_Block]) -> None:
+        self._mmap = buffer
+        self._buf = memoryview(buffer)
+        if self._buf[: len(_MAGIC)] != _MAGIC:
+            self._buf.release()
+            msg = "File is not an eludris-autodoc event log"
+            raise ValueError(msg)
+
+        # Blocks beyond the end of the log were indexed before a crash lost them.
+        blocks = [block for block in blocks if block.end <= len(buffer)]
+        # Events after the last block are not indexed yet, and always scanned.
+        end = blocks[-1].end if blocks else len(_MAGIC)
+        if end < len(buffer):
+            blocks = [*blocks, _Block(end, len(buffer), 0, 2**63 - 1, _UNINDEXED_MASK)]
+
+        self._blocks = blocks
+        self._last_timestamps = [block.last_timestamp for block in blocks]
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> "EventLog":
+        """Map the event log at the provided path."""
+        path = pathlib.Path(path)
+        index_path = _get_index_path(path)
+        blocks: list[_Block] = []
+        if index_path.exists():
+            with index_path.open("rb") as index_file:
+                blocks = _read_index(index_file)
+
+        with path.open("rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), blocks)
+
+    def _scan_block(
+        self,
+        block: _Block,
+        codes: typing.Container[int] | None,
+        since: int,
+        until: int,
+    ) -> typing.Iterator[Event]:
+        buf, unpack, record_size, ops = self._buf, _RECORD.unpack_from, _RECORD.size, _OPS
+        offset, end = block.start, block.end
+        if (
+            codes is None
+            and block.mask != _UNINDEXED_MASK
+            and since <= block.first_timestamp
+            and block.last_timestamp <= until
+        ):
+            # Indexed blocks only contain complete events, which all match here.
+            while offset < end:
+                length, timestamp, code = unpack(buf, offset)
+                start = offset + record_size
+                offset = start + length
+                yield timestamp, ops[code], buf[start:offset]
+
+            return
+
+        while offset + record_size <= end:
+            length, timestamp, code = unpack(buf, offset)
+            offset += record_size
+            if offset + length > end or timestamp > until:
+                return
+
+            if timestamp >= since and (codes is None or code in codes):
+                yield timestamp, ops[code], buf[offset : offset + length]
+
+            offset += length
+
+    def scan(
+        self,
+        *,
+        ops: typing.Collection[str] | None = None,
+        since: int = 0,
+        until: int = 2**63 - 1,
+    ) -> typing.Iterator[Event]:
+        """Iterate over raw events, optionally only those with the provided ops.
+
+        Only events with a timestamp between ``since`` and ``until``, inclusive,
+        are returned. Frames are views into the mapped file, which have to be
+        released before the log is closed.
+        """
+        codes: frozenset[int] | None = None
+        mask = -1
+        if ops is not None:
+            codes = frozenset(map(_get_op_code, ops))
+            mask = sum(1 << code for code in codes)
+
+        for block in self._blocks[bisect.bisect_left(self._last_timestamps, since) :]:
+            if block.first_timestamp > until:
+                return
+
+            if block.mask & mask:
+                yield from self._scan_block(block, codes, since, until)
+
+    def replay(
+        self,
+        *,
+        ops: typing.Collection[str] | None = None,
+        since: int = 0,
+        until: int = 2**63 - 1,
+    ) -> typing.Iterator[gateway.ServerPayload]:
+        """Iterate over decoded events, see :meth:`scan`."""
+        variants = _VARIANTS
+        op_codes = _OP_CODES
+        for _, op, frame in self.scan(ops=ops, since=since, until=until):
+            with frame:
+                yield variants[op_codes[op]].from_payload(json.loads(str(frame, "utf-8")))
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the event log."""
+        self._buf.release()
+        self._mmap.close()
@@ -3,11 +3,12 @@
 .. warning::
     This module was automatically generated.
 """
+import copyreg
 import typing
 
 import attrs
 
-from . import undefined
+from . import lazy, partial, undefined, validation
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
@@ -29,12 +30,82 @@ class FileUpload:
     file: object = attrs.field()
     spoiler: bool = attrs.field()
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "file": ("file", None),
+        "spoiler": ("spoiler", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"spoiler": (bool,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"file": self.file, "spoiler": self.spoiler}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "FileUpload":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(file=payload["file"], spoiler=payload["spoiler"])
+
+    @classmethod
+    def _from_trusted(cls, *, file: object, spoiler: bool) -> "FileUpload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.file = file
+        self.spoiler = spoiler
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (FileUpload,), (self.file, self.spoiler))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.file, self.spoiler) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class TextFileMetadata:
     """Please refer to FileMetadata."""
 
     type: typing.Literal["TEXT"] = attrs.field()
+    _FRAME: typing.ClassVar[bytes] = b'{"type":"TEXT"}'
+    """The serialized form of this payload, which never changes."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {"type": ("type", None)}
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": ("TEXT",)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"type": self.type}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "TextFileMetadata":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(type=payload["type"])
+
+    @classmethod
+    def _from_trusted(cls, *, type: typing.Literal["TEXT"]) -> "TextFileMetadata":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (TextFileMetadata,), ())
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "TEXT"
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
@@ -47,6 +118,64 @@ class ImageFileMetadata:
     height: int | typing.Literal[undefined.Undefined] = attrs.field(default=undefined.Undefined)
     """The image's height in pixels."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "width": ("width", None),
+        "height": ("height", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "type": ("IMAGE",),
+            "width": (int, undefined.Undefined),
+            "height": (int, undefined.Undefined),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {"type": self.type}
+        if self.width is not undefined.Undefined:
+            payload["width"] = self.width
+        if self.height is not undefined.Undefined:
+            payload["height"] = self.height
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "ImageFileMetadata":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            width=payload.get("width", undefined.Undefined),
+            height=payload.get("height", undefined.Undefined),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["IMAGE"],
+        width: int | typing.Literal[undefined.Undefined],
+        height: int | typing.Literal[undefined.Undefined],
+    ) -> "ImageFileMetadata":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.width = width
+        self.height = height
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (ImageFileMetadata,), (self.width, self.height))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "IMAGE"
+        (self.width, self.height) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class VideoFileMetadata:
@@ -58,12 +187,104 @@ class VideoFileMetadata:
     height: int | typing.Literal[undefined.Undefined] = attrs.field(default=undefined.Undefined)
     """The video's height in pixels."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", None),
+        "width": ("width", None),
+        "height": ("height", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "type": ("VIDEO",),
+            "width": (int, undefined.Undefined),
+            "height": (int, undefined.Undefined),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {"type": self.type}
+        if self.width is not undefined.Undefined:
+            payload["width"] = self.width
+        if self.height is not undefined.Undefined:
+            payload["height"] = self.height
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "VideoFileMetadata":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=payload["type"],
+            width=payload.get("width", undefined.Undefined),
+            height=payload.get("height", undefined.Undefined),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: typing.Literal["VIDEO"],
+        width: int | typing.Literal[undefined.Undefined],
+        height: int | typing.Literal[undefined.Undefined],
+    ) -> "VideoFileMetadata":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.width = width
+        self.height = height
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (VideoFileMetadata,), (self.width, self.height))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "VIDEO"
+        (self.width, self.height) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class OtherFileMetadata:
     """Please refer to FileMetadata."""
 
     type: typing.Literal["OTHER"] = attrs.field()
+    _FRAME: typing.ClassVar[bytes] = b'{"type":"OTHER"}'
+    """The serialized form of this payload, which never changes."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {"type": ("type", None)}
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": ("OTHER",)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"type": self.type}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "OtherFileMetadata":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(type=payload["type"])
+
+    @classmethod
+    def _from_trusted(cls, *, type: typing.Literal["OTHER"]) -> "OtherFileMetadata":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (OtherFileMetadata,), ())
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.type = "OTHER"
 
 
 FileMetadata = TextFileMetadata | ImageFileMetadata | VideoFileMetadata | OtherFileMetadata
@@ -91,6 +312,19 @@ Examples
 ```
 """
 
+FILE_METADATA_VARIANTS: typing.Final[dict[str, type[FileMetadata]]] = {
+    "TEXT": TextFileMetadata,
+    "IMAGE": ImageFileMetadata,
+    "VIDEO": VideoFileMetadata,
+    "OTHER": OtherFileMetadata,
+}
+"""Mapping of `type` tags to FileMetadata variants."""
+
+
+def decode_file_metadata(payload: typing.Mapping[str, typing.Any]) -> FileMetadata:
+    """Decode a raw API payload into the matching FileMetadata variant."""
+    return FILE_METADATA_VARIANTS[payload["type"]].from_payload(payload)
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class FileData:
@@ -122,3 +356,86 @@ class FileData:
     """Whether the file is marked as a spoiler."""
     metadata: FileMetadata = attrs.field()
     """The [`FileMetadata`] of the file."""
+
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "id": lambda payload: payload["id"],
+        "name": lambda payload: payload["name"],
+        "bucket": lambda payload: payload["bucket"],
+        "spoiler": lambda payload: payload.get("spoiler", undefined.Undefined),
+        "metadata": lambda payload: decode_file_metadata(payload["metadata"]),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "id": ("id", None),
+        "name": ("name", None),
+        "bucket": ("bucket", None),
+        "spoiler": ("spoiler", None),
+        "metadata": ("metadata", lambda value: decode_file_metadata(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "id": (int,),
+            "name": (str,),
+            "bucket": (str,),
+            "spoiler": (bool, undefined.Undefined),
+            "metadata": (FileMetadata,),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {
+            "id": self.id,
+            "name": self.name,
+            "bucket": self.bucket,
+            "metadata": self.metadata.to_payload(),
+        }
+        if self.spoiler is not undefined.Undefined:
+            payload["spoiler"] = self.spoiler
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "FileData":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            id=payload["id"],
+            name=payload["name"],
+            bucket=payload["bucket"],
+            spoiler=payload.get("spoiler", undefined.Undefined),
+            metadata=decode_file_metadata(payload["metadata"]),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        id: int,
+        name: str,
+        bucket: str,
+        spoiler: bool | typing.Literal[undefined.Undefined],
+        metadata: FileMetadata,
+    ) -> "FileData":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.id = id
+        self.name = name
+        self.bucket = bucket
+        self.spoiler = spoiler
+        self.metadata = metadata
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (FileData,),
+            (self.id, self.name, self.bucket, self.spoiler, self.metadata),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.id, self.name, self.bucket, self.spoiler, self.metadata) = state
@@ -0,0 +1,77 @@
+"""This module implements caching of serialized payloads for sending them over the gateway.
+
+Payloads without any data, such as ``PING``, have their serialized form
+generated ahead of time. Payloads with data that stays the same over the
+lifetime of a connection, such as ``AUTHENTICATE``, can be cached using a
+:class:`FrameCache`, which turns every consecutive send into a plain
+memoryview write.
+"""
+
+import json
+import operator
+import typing
+
+import attrs
+
+__all__: typing.Sequence[str] = ("SupportsPayload", "FrameCache", "encode_frame")
+
+SEPARATORS: typing.Final[tuple[str, str]] = (",", ":")
+"""The separators used to serialize payloads. These match the pre-serialized frames."""
+
+
+class SupportsPayload(typing.Protocol):
+    """A generated attrs class that can be converted into its raw API representation."""
+
+    __attrs_attrs__: typing.ClassVar[typing.Any]
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        ...
+
+
+def encode_frame(payload: SupportsPayload) -> bytes:
+    """Serialize a payload to compact JSON.
+
+    Payloads without any data return their pre-serialized frame instead.
+    """
+    frame: bytes | None = getattr(payload, "_FRAME", None)
+    if frame is not None:
+        return frame
+
+    return json.dumps(payload.to_payload(), separators=SEPARATORS).encode()
+
+
+class FrameCache:
+    """A cache of serialized payloads for a single connection.
+
+    Frames are cached by payload type and field values, so this should only
+    be used for payloads that are sent repeatedly with the same data and whose
+    field values are hashable, e.g. ``PING`` and ``AUTHENTICATE``. Create a new
+    cache (or clear it) whenever the connection, and with it the data that was
+    fixed for it, changes.
+    """
+
+    __slots__ = ("_frames", "_key_getters")
+
+    def __init__(self) -> None:
+        self._frames: dict[tuple[type[SupportsPayload], object], memoryview] = {}
+        self._key_getters: dict[type[SupportsPayload], operator.attrgetter[object]] = {}
+
+    def get(self, payload: SupportsPayload) -> memoryview:
+        """Get the serialized frame for a payload, serializing it on first use."""
+        cls = type(payload)
+        key_getter = self._key_getters.get(cls)
+        if key_getter is None:
+            names = [field.name for field in attrs.fields(cls)]
+            key_getter = self._key_getters[cls] = operator.attrgetter(*names)
+
+        key = (cls, key_getter(payload))
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = memoryview(encode_frame(payload))
+
+        return frame
+
+    def clear(self) -> None:
+        """Clear all cached frames."""
+        self._frames.clear()
@@ -3,11 +3,13 @@
 .. warning::
     This module was automatically generated.
 """
+import copyreg
 import typing
 
 import attrs
 
 from . import instance as instance_m
+from . import lazy, partial, validation
 from . import messaging as messaging_m
 from . import users as users_m
 
@@ -36,6 +38,40 @@ class PingClientPayload:
     """
 
     op: typing.Literal["PING"] = attrs.field()
+    _FRAME: typing.ClassVar[bytes] = b'{"op":"PING"}'
+    """The serialized form of this payload, which never changes."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {"op": ("op", None)}
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"op": ("PING",)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"op": self.op}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "PingClientPayload":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(op=payload["op"])
+
+    @classmethod
+    def _from_trusted(cls, *, op: typing.Literal["PING"]) -> "PingClientPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (PingClientPayload,), ())
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "PING"
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
@@ -58,10 +94,60 @@ class AuthenticateClientPayload:
     op: typing.Literal["AUTHENTICATE"] = attrs.field()
     d: str = attrs.field()
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {"op": ("op", None), "d": ("d", None)}
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"op": ("AUTHENTICATE",), "d": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"op": self.op, "d": self.d}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "AuthenticateClientPayload":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(op=payload["op"], d=payload["d"])
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        op: typing.Literal["AUTHENTICATE"],
+        d: str,
+    ) -> "AuthenticateClientPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        self.d = d
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (AuthenticateClientPayload,), (self.d,))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "AUTHENTICATE"
+        (self.d,) = state
+
 
 ClientPayload = PingClientPayload | AuthenticateClientPayload
 """Pandemonium websocket payloads sent by the client to the server."""
 
+CLIENT_PAYLOAD_VARIANTS: typing.Final[dict[str, type[ClientPayload]]] = {
+    "PING": PingClientPayload,
+    "AUTHENTICATE": AuthenticateClientPayload,
+}
+"""Mapping of `op` tags to ClientPayload variants."""
+
+
+def decode_client_payload(payload: typing.Mapping[str, typing.Any]) -> ClientPayload:
+    """Decode a raw API payload into the matching ClientPayload variant."""
+    return CLIENT_PAYLOAD_VARIANTS[payload["op"]].from_payload(payload)
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class PongServerPayload:
@@ -77,6 +163,40 @@ class PongServerPayload:
     """
 
     op: typing.Literal["PONG"] = attrs.field()
+    _FRAME: typing.ClassVar[bytes] = b'{"op":"PONG"}'
+    """The serialized form of this payload, which never changes."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {"op": ("op", None)}
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"op": ("PONG",)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"op": self.op}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "PongServerPayload":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(op=payload["op"])
+
+    @classmethod
+    def _from_trusted(cls, *, op: typing.Literal["PONG"]) -> "PongServerPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (PongServerPayload,), ())
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "PONG"
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
@@ -102,6 +222,49 @@ class RateLimitServerPayload:
     wait: int = attrs.field()
     """The amount of milliseconds you have to wait before the rate limit ends"""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "op": ("op", None),
+        "d": (None, {"wait": ("wait", None)}),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"op": ("RATE_LIMIT",), "wait": (int,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"op": self.op, "d": {"wait": self.wait}}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "RateLimitServerPayload":
+        """Create this object from its raw API representation."""
+        data = payload["d"]
+        return cls._from_trusted(op=payload["op"], wait=data["wait"])
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        op: typing.Literal["RATE_LIMIT"],
+        wait: int,
+    ) -> "RateLimitServerPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        self.wait = wait
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (RateLimitServerPayload,), (self.wait,))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "RATE_LIMIT"
+        (self.wait,) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class HelloServerPayload:
@@ -146,6 +309,101 @@ class HelloServerPayload:
     rate_limit: instance_m.RateLimitConf = attrs.field()
     """The pandemonium ratelimit info."""
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "op": lambda payload: payload["op"],
+        "heartbeat_interval": lambda payload: payload["d"]["heartbeat_interval"],
+        "instance_info": lambda payload: lazy.from_payload(
+            instance_m.InstanceInfo,
+            payload["d"]["instance_info"],
+        ),
+        "rate_limit": lambda payload: lazy.from_payload(
+            instance_m.RateLimitConf,
+            payload["d"]["rate_limit"],
+        ),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "op": ("op", None),
+        "d": (
+            None,
+            {
+                "heartbeat_interval": ("heartbeat_interval", None),
+                "instance_info": (
+                    "instance_info",
+                    lambda value: instance_m.InstanceInfo.from_payload(value),
+                ),
+                "rate_limit": (
+                    "rate_limit",
+                    lambda value: instance_m.RateLimitConf.from_payload(value),
+                ),
+            },
+        ),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "op": ("HELLO",),
+            "heartbeat_interval": (int,),
+            "instance_info": (instance_m.InstanceInfo,),
+            "rate_limit": (instance_m.RateLimitConf,),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "op": self.op,
+            "d": {
+                "heartbeat_interval": self.heartbeat_interval,
+                "instance_info": self.instance_info.to_payload(),
+                "rate_limit": self.rate_limit.to_payload(),
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "HelloServerPayload":
+        """Create this object from its raw API representation."""
+        data = payload["d"]
+        return cls._from_trusted(
+            op=payload["op"],
+            heartbeat_interval=data["heartbeat_interval"],
+            instance_info=instance_m.InstanceInfo.from_payload(data["instance_info"]),
+            rate_limit=instance_m.RateLimitConf.from_payload(data["rate_limit"]),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        op: typing.Literal["HELLO"],
+        heartbeat_interval: int,
+        instance_info: instance_m.InstanceInfo,
+        rate_limit: instance_m.RateLimitConf,
+    ) -> "HelloServerPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        self.heartbeat_interval = heartbeat_interval
+        self.instance_info = instance_info
+        self.rate_limit = rate_limit
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (HelloServerPayload,),
+            (self.heartbeat_interval, self.instance_info, self.rate_limit),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "HELLO"
+        (self.heartbeat_interval, self.instance_info, self.rate_limit) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class AuthenticatedServerPayload:
@@ -184,6 +442,83 @@ class AuthenticatedServerPayload:
     users: typing.Sequence[users_m.User] = attrs.field()
     """The currently online users who are relavent to the connector."""
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "op": lambda payload: payload["op"],
+        "user": lambda payload: lazy.from_payload(users_m.User, payload["d"]["user"]),
+        "users": lambda payload: [
+            users_m.User.from_payload(item) for item in payload["d"]["users"]
+        ],
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "op": ("op", None),
+        "d": (
+            None,
+            {
+                "user": ("user", lambda value: users_m.User.from_payload(value)),
+                "users": (
+                    "users",
+                    lambda value: [users_m.User.from_payload(item) for item in value],
+                ),
+            },
+        ),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "op": ("AUTHENTICATED",),
+            "user": (users_m.User,),
+            "users": (validation.ListOf(users_m.User),),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "op": self.op,
+            "d": {
+                "user": self.user.to_payload(),
+                "users": [item.to_payload() for item in self.users],
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "AuthenticatedServerPayload":
+        """Create this object from its raw API representation."""
+        data = payload["d"]
+        return cls._from_trusted(
+            op=payload["op"],
+            user=users_m.User.from_payload(data["user"]),
+            users=[users_m.User.from_payload(item) for item in data["users"]],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        op: typing.Literal["AUTHENTICATED"],
+        user: users_m.User,
+        users: typing.Sequence[users_m.User],
+    ) -> "AuthenticatedServerPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        self.user = user
+        self.users = users
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (AuthenticatedServerPayload,), (self.user, self.users))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "AUTHENTICATED"
+        (self.user, self.users) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class UserUpdateServerPayload:
@@ -208,6 +543,54 @@ class UserUpdateServerPayload:
     op: typing.Literal["USER_UPDATE"] = attrs.field()
     d: users_m.User = attrs.field()
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "op": lambda payload: payload["op"],
+        "d": lambda payload: lazy.from_payload(users_m.User, payload["d"]),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "op": ("op", None),
+        "d": ("d", lambda value: users_m.User.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"op": ("USER_UPDATE",), "d": (users_m.User,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"op": self.op, "d": self.d.to_payload()}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "UserUpdateServerPayload":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(op=payload["op"], d=users_m.User.from_payload(payload["d"]))
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        op: typing.Literal["USER_UPDATE"],
+        d: users_m.User,
+    ) -> "UserUpdateServerPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        self.d = d
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (UserUpdateServerPayload,), (self.d,))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "USER_UPDATE"
+        (self.d,) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class PresenceUpdateServerPayload:
@@ -232,6 +615,71 @@ class PresenceUpdateServerPayload:
     user_id: int = attrs.field()
     status: users_m.Status = attrs.field()
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "op": lambda payload: payload["op"],
+        "user_id": lambda payload: payload["d"]["user_id"],
+        "status": lambda payload: lazy.from_payload(users_m.Status, payload["d"]["status"]),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "op": ("op", None),
+        "d": (
+            None,
+            {
+                "user_id": ("user_id", None),
+                "status": ("status", lambda value: users_m.Status.from_payload(value)),
+            },
+        ),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"op": ("PRESENCE_UPDATE",), "user_id": (int,), "status": (users_m.Status,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"op": self.op, "d": {"user_id": self.user_id, "status": self.status.to_payload()}}
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: typing.Mapping[str, typing.Any],
+    ) -> "PresenceUpdateServerPayload":
+        """Create this object from its raw API representation."""
+        data = payload["d"]
+        return cls._from_trusted(
+            op=payload["op"],
+            user_id=data["user_id"],
+            status=users_m.Status.from_payload(data["status"]),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        op: typing.Literal["PRESENCE_UPDATE"],
+        user_id: int,
+        status: users_m.Status,
+    ) -> "PresenceUpdateServerPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        self.user_id = user_id
+        self.status = status
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (PresenceUpdateServerPayload,), (self.user_id, self.status))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "PRESENCE_UPDATE"
+        (self.user_id, self.status) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class MessageCreateServerPayload:
@@ -253,6 +701,54 @@ class MessageCreateServerPayload:
     op: typing.Literal["MESSAGE_CREATE"] = attrs.field()
     d: messaging_m.Message = attrs.field()
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "op": lambda payload: payload["op"],
+        "d": lambda payload: lazy.from_payload(messaging_m.Message, payload["d"]),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "op": ("op", None),
+        "d": ("d", lambda value: messaging_m.Message.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"op": ("MESSAGE_CREATE",), "d": (messaging_m.Message,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"op": self.op, "d": self.d.to_payload()}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "MessageCreateServerPayload":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(op=payload["op"], d=messaging_m.Message.from_payload(payload["d"]))
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        op: typing.Literal["MESSAGE_CREATE"],
+        d: messaging_m.Message,
+    ) -> "MessageCreateServerPayload":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.op = op
+        self.d = d
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (MessageCreateServerPayload,), (self.d,))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        self.op = "MESSAGE_CREATE"
+        (self.d,) = state
+
 
 ServerPayload = (
     PongServerPayload
@@ -264,3 +760,19 @@ ServerPayload = (
     | MessageCreateServerPayload
 )
 """Pandemonium websocket payloads sent by the server to the client."""
+
+SERVER_PAYLOAD_VARIANTS: typing.Final[dict[str, type[ServerPayload]]] = {
+    "PONG": PongServerPayload,
+    "RATE_LIMIT": RateLimitServerPayload,
+    "HELLO": HelloServerPayload,
+    "AUTHENTICATED": AuthenticatedServerPayload,
+    "USER_UPDATE": UserUpdateServerPayload,
+    "PRESENCE_UPDATE": PresenceUpdateServerPayload,
+    "MESSAGE_CREATE": MessageCreateServerPayload,
+}
+"""Mapping of `op` tags to ServerPayload variants."""
+
+
+def decode_server_payload(payload: typing.Mapping[str, typing.Any]) -> ServerPayload:
+    """Decode a raw API payload into the matching ServerPayload variant."""
+    return SERVER_PAYLOAD_VARIANTS[payload["op"]].from_payload(payload)
@@ -0,0 +1,185 @@
+"""This module implements helpers for working with Eludris ids.
+
+Ids such as ``User.id``, ``Session.id`` and ``FileData.id`` are 64-bit
+integers made up of a 48-bit millisecond timestamp relative to the Eludris
+epoch, followed by an 8-bit worker id and an 8-bit sequence number. Since the
+timestamp makes up the most significant bits, sorting ids also sorts them by
+creation time.
+
+Batch helpers accept any iterable of ids and work on ``array.array("Q")``
+buffers. Extracting the timestamps of ids runs no Python code per id, but
+:func:`timestamps` still adds the epoch to every id through ``operator.add``.
+"""
+
+import array
+import bisect
+import datetime
+import itertools
+import operator
+import sys
+import typing
+
+__all__: typing.Sequence[str] = (
+    "EPOCH",
+    "SortedIds",
+    "created_at",
+    "id_range",
+    "max_id",
+    "min_id",
+    "relative_timestamps",
+    "sequence",
+    "timestamp",
+    "timestamps",
+    "worker_id",
+)
+
+EPOCH: typing.Final[int] = 1_650_000_000_000
+"""The Eludris epoch, in milliseconds since the unix epoch."""
+
+TIMESTAMP_SHIFT: typing.Final[int] = 16
+"""The position of the timestamp in an id."""
+WORKER_ID_SHIFT: typing.Final[int] = 8
+"""The position of the worker id in an id."""
+
+_BYTE_MASK: typing.Final[int] = 0xFF
+_LOW_BITS_MASK: typing.Final[int] = (1 << TIMESTAMP_SHIFT) - 1
+
+IdArray: typing.TypeAlias = "array.array[int]"
+"""An array of unsigned 64-bit ids or timestamps, with typecode ``Q``."""
+
+
+def _to_milliseconds(time: datetime.datetime) -> int:
+    # Naive datetimes are interpreted as UTC, matching created_at.
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=datetime.timezone.utc)
+
+    return int(time.timestamp() * 1000)
+
+
+def timestamp(id_: int) -> int:
+    """Get the creation time of an id, in milliseconds since the unix epoch."""
+    return (id_ >> TIMESTAMP_SHIFT) + EPOCH
+
+
+def created_at(id_: int) -> datetime.datetime:
+    """Get the creation time of an id as an aware UTC datetime."""
+    return datetime.datetime.fromtimestamp(timestamp(id_) / 1000, tz=datetime.timezone.utc)
+
+
+def worker_id(id_: int) -> int:
+    """Get the id of the worker that generated an id."""
+    return (id_ >> WORKER_ID_SHIFT) & _BYTE_MASK
+
+
+def sequence(id_: int) -> int:
+    """Get the sequence number of an id."""
+    return id_ & _BYTE_MASK
+
+
+def relative_timestamps(ids: typing.Iterable[int]) -> IdArray:
+    """Get the creation time of many ids at once, in milliseconds since the Eludris epoch.
+
+    The timestamps are extracted by shuffling the 16-bit words of the ids
+    rather than shifting every id separately, so no Python integers are
+    created. Passing an ``array.array("Q")`` avoids copying the ids into one
+    first.
+    """
+    if not isinstance(ids, array.array) or ids.typecode != "Q":
+        ids = array.array("Q", ids)
+
+    words = array.array("H")
+    words.frombytes(ids.tobytes())
+    shifted = array.array("H", bytes(len(words) * words.itemsize))
+
+    # Drop the 16 least significant bits of every id, which hold the worker id
+    # and sequence, and zero the most significant ones.
+    if sys.byteorder == "little":
+        shifted[0::4] = words[1::4]
+        shifted[1::4] = words[2::4]
+        shifted[2::4] = words[3::4]
+
+    else:
+        shifted[1::4] = words[0::4]
+        shifted[2::4] = words[1::4]
+        shifted[3::4] = words[2::4]
+
+    result = array.array("Q")
+    result.frombytes(shifted.tobytes())
+    return result
+
+
+def timestamps(ids: typing.Iterable[int]) -> IdArray:
+    """Get the creation time of many ids at once, in milliseconds since the unix epoch.
+
+    If the timestamps are only compared with each other, prefer
+    :func:`relative_timestamps`, which skips adding the epoch to every id.
+    """
+    relative = relative_timestamps(ids)
+    return array.array("Q", map(operator.add, relative, itertools.repeat(EPOCH)))
+
+
+def min_id(time: datetime.datetime) -> int:
+    """Get the smallest id that could have been created at the provided time."""
+    return (_to_milliseconds(time) - EPOCH) << TIMESTAMP_SHIFT
+
+
+def max_id(time: datetime.datetime) -> int:
+    """Get the largest id that could have been created at the provided time."""
+    return min_id(time) | _LOW_BITS_MASK
+
+
+def id_range(start: datetime.datetime, end: datetime.datetime) -> tuple[int, int]:
+    """Get the inclusive bounds of all ids created between two points in time."""
+    return min_id(start), max_id(end)
+
+
+class SortedIds:
+    """A sorted, compact collection of ids supporting fast range queries.
+
+    Ids are stored in a single unsigned 64-bit array, so range queries by id
+    or creation time are a pair of binary searches followed by a slice.
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: typing.Iterable[int] = ()) -> None:
+        self._ids: IdArray = array.array("Q", sorted(ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self._ids)
+
+    def __contains__(self, id_: object) -> bool:
+        if not isinstance(id_, int):
+            return False
+
+        index = bisect.bisect_left(self._ids, id_)
+        return index < len(self._ids) and self._ids[index] == id_
+
+    def add(self, id_: int) -> None:
+        """Add an id, keeping the collection sorted.
+
+        Newly created ids are larger than all existing ones, so adding them is
+        an append.
+        """
+        if not self._ids or id_ >= self._ids[-1]:
+            self._ids.append(id_)
+
+        else:
+            self._ids.insert(bisect.bisect_left(self._ids, id_), id_)
+
+    def between(self, lower: int, upper: int) -> IdArray:
+        """Get all ids between two ids, inclusive."""
+        start = bisect.bisect_left(self._ids, lower)
+        stop = bisect.bisect_right(self._ids, upper, lo=start)
+        return self._ids[start:stop]
+
+    def created_between(self, start: datetime.datetime, end: datetime.datetime) -> IdArray:
+        """Get all ids created between two points in time, inclusive."""
+        return self.between(*id_range(start, end))
+
+    def timestamps(self) -> IdArray:
+        """Get the creation time of every id, in milliseconds since the unix epoch."""
+        return timestamps(self._ids)
@@ -3,11 +3,12 @@
 .. warning::
     This module was automatically generated.
 """
+import copyreg
 import typing
 
 import attrs
 
-from . import undefined
+from . import lazy, partial, undefined, validation
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
@@ -32,6 +33,62 @@ class EffisRateLimitConf:
     file_size_limit: int = attrs.field()
     """The maximum amount of bytes that can be sent within the `reset_after` interval."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "reset_after": ("reset_after", None),
+        "limit": ("limit", None),
+        "file_size_limit": ("file_size_limit", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"reset_after": (int,), "limit": (int,), "file_size_limit": (int,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "reset_after": self.reset_after,
+            "limit": self.limit,
+            "file_size_limit": self.file_size_limit,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "EffisRateLimitConf":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            reset_after=payload["reset_after"],
+            limit=payload["limit"],
+            file_size_limit=payload["file_size_limit"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        reset_after: int,
+        limit: int,
+        file_size_limit: int,
+    ) -> "EffisRateLimitConf":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.reset_after = reset_after
+        self.limit = limit
+        self.file_size_limit = file_size_limit
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (EffisRateLimitConf,),
+            (self.reset_after, self.limit, self.file_size_limit),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.reset_after, self.limit, self.file_size_limit) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class RateLimitConf:
@@ -52,6 +109,42 @@ class RateLimitConf:
     limit: int = attrs.field()
     """The amount of requests that can be made within the `reset_after` interval."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "reset_after": ("reset_after", None),
+        "limit": ("limit", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"reset_after": (int,), "limit": (int,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"reset_after": self.reset_after, "limit": self.limit}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "RateLimitConf":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(reset_after=payload["reset_after"], limit=payload["limit"])
+
+    @classmethod
+    def _from_trusted(cls, *, reset_after: int, limit: int) -> "RateLimitConf":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.reset_after = reset_after
+        self.limit = limit
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (RateLimitConf,), (self.reset_after, self.limit))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.reset_after, self.limit) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class OprishRateLimits:
@@ -106,6 +199,209 @@ class OprishRateLimits:
     delete_session: RateLimitConf = attrs.field()
     """Rate limits for the [`delete_session`] endpoint."""
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "get_instance_info": lambda payload: lazy.from_payload(
+            RateLimitConf,
+            payload["get_instance_info"],
+        ),
+        "create_message": lambda payload: lazy.from_payload(
+            RateLimitConf,
+            payload["create_message"],
+        ),
+        "create_user": lambda payload: lazy.from_payload(RateLimitConf, payload["create_user"]),
+        "verify_user": lambda payload: lazy.from_payload(RateLimitConf, payload["verify_user"]),
+        "get_user": lambda payload: lazy.from_payload(RateLimitConf, payload["get_user"]),
+        "guest_get_user": lambda payload: lazy.from_payload(
+            RateLimitConf,
+            payload["guest_get_user"],
+        ),
+        "update_user": lambda payload: lazy.from_payload(RateLimitConf, payload["update_user"]),
+        "update_profile": lambda payload: lazy.from_payload(
+            RateLimitConf,
+            payload["update_profile"],
+        ),
+        "delete_user": lambda payload: lazy.from_payload(RateLimitConf, payload["delete_user"]),
+        "create_password_reset_code": lambda payload: lazy.from_payload(
+            RateLimitConf,
+            payload["create_password_reset_code"],
+        ),
+        "reset_password": lambda payload: lazy.from_payload(
+            RateLimitConf,
+            payload["reset_password"],
+        ),
+        "create_session": lambda payload: lazy.from_payload(
+            RateLimitConf,
+            payload["create_session"],
+        ),
+        "get_sessions": lambda payload: lazy.from_payload(RateLimitConf, payload["get_sessions"]),
+        "delete_session": lambda payload: lazy.from_payload(
+            RateLimitConf,
+            payload["delete_session"],
+        ),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "get_instance_info": ("get_instance_info", lambda value: RateLimitConf.from_payload(value)),
+        "create_message": ("create_message", lambda value: RateLimitConf.from_payload(value)),
+        "create_user": ("create_user", lambda value: RateLimitConf.from_payload(value)),
+        "verify_user": ("verify_user", lambda value: RateLimitConf.from_payload(value)),
+        "get_user": ("get_user", lambda value: RateLimitConf.from_payload(value)),
+        "guest_get_user": ("guest_get_user", lambda value: RateLimitConf.from_payload(value)),
+        "update_user": ("update_user", lambda value: RateLimitConf.from_payload(value)),
+        "update_profile": ("update_profile", lambda value: RateLimitConf.from_payload(value)),
+        "delete_user": ("delete_user", lambda value: RateLimitConf.from_payload(value)),
+        "create_password_reset_code": (
+            "create_password_reset_code",
+            lambda value: RateLimitConf.from_payload(value),
+        ),
+        "reset_password": ("reset_password", lambda value: RateLimitConf.from_payload(value)),
+        "create_session": ("create_session", lambda value: RateLimitConf.from_payload(value)),
+        "get_sessions": ("get_sessions", lambda value: RateLimitConf.from_payload(value)),
+        "delete_session": ("delete_session", lambda value: RateLimitConf.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "get_instance_info": (RateLimitConf,),
+            "create_message": (RateLimitConf,),
+            "create_user": (RateLimitConf,),
+            "verify_user": (RateLimitConf,),
+            "get_user": (RateLimitConf,),
+            "guest_get_user": (RateLimitConf,),
+            "update_user": (RateLimitConf,),
+            "update_profile": (RateLimitConf,),
+            "delete_user": (RateLimitConf,),
+            "create_password_reset_code": (RateLimitConf,),
+            "reset_password": (RateLimitConf,),
+            "create_session": (RateLimitConf,),
+            "get_sessions": (RateLimitConf,),
+            "delete_session": (RateLimitConf,),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "get_instance_info": self.get_instance_info.to_payload(),
+            "create_message": self.create_message.to_payload(),
+            "create_user": self.create_user.to_payload(),
+            "verify_user": self.verify_user.to_payload(),
+            "get_user": self.get_user.to_payload(),
+            "guest_get_user": self.guest_get_user.to_payload(),
+            "update_user": self.update_user.to_payload(),
+            "update_profile": self.update_profile.to_payload(),
+            "delete_user": self.delete_user.to_payload(),
+            "create_password_reset_code": self.create_password_reset_code.to_payload(),
+            "reset_password": self.reset_password.to_payload(),
+            "create_session": self.create_session.to_payload(),
+            "get_sessions": self.get_sessions.to_payload(),
+            "delete_session": self.delete_session.to_payload(),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "OprishRateLimits":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            get_instance_info=RateLimitConf.from_payload(payload["get_instance_info"]),
+            create_message=RateLimitConf.from_payload(payload["create_message"]),
+            create_user=RateLimitConf.from_payload(payload["create_user"]),
+            verify_user=RateLimitConf.from_payload(payload["verify_user"]),
+            get_user=RateLimitConf.from_payload(payload["get_user"]),
+            guest_get_user=RateLimitConf.from_payload(payload["guest_get_user"]),
+            update_user=RateLimitConf.from_payload(payload["update_user"]),
+            update_profile=RateLimitConf.from_payload(payload["update_profile"]),
+            delete_user=RateLimitConf.from_payload(payload["delete_user"]),
+            create_password_reset_code=RateLimitConf.from_payload(
+                payload["create_password_reset_code"],
+            ),
+            reset_password=RateLimitConf.from_payload(payload["reset_password"]),
+            create_session=RateLimitConf.from_payload(payload["create_session"]),
+            get_sessions=RateLimitConf.from_payload(payload["get_sessions"]),
+            delete_session=RateLimitConf.from_payload(payload["delete_session"]),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        get_instance_info: RateLimitConf,
+        create_message: RateLimitConf,
+        create_user: RateLimitConf,
+        verify_user: RateLimitConf,
+        get_user: RateLimitConf,
+        guest_get_user: RateLimitConf,
+        update_user: RateLimitConf,
+        update_profile: RateLimitConf,
+        delete_user: RateLimitConf,
+        create_password_reset_code: RateLimitConf,
+        reset_password: RateLimitConf,
+        create_session: RateLimitConf,
+        get_sessions: RateLimitConf,
+        delete_session: RateLimitConf,
+    ) -> "OprishRateLimits":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.get_instance_info = get_instance_info
+        self.create_message = create_message
+        self.create_user = create_user
+        self.verify_user = verify_user
+        self.get_user = get_user
+        self.guest_get_user = guest_get_user
+        self.update_user = update_user
+        self.update_profile = update_profile
+        self.delete_user = delete_user
+        self.create_password_reset_code = create_password_reset_code
+        self.reset_password = reset_password
+        self.create_session = create_session
+        self.get_sessions = get_sessions
+        self.delete_session = delete_session
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (OprishRateLimits,),
+            (
+                self.get_instance_info,
+                self.create_message,
+                self.create_user,
+                self.verify_user,
+                self.get_user,
+                self.guest_get_user,
+                self.update_user,
+                self.update_profile,
+                self.delete_user,
+                self.create_password_reset_code,
+                self.reset_password,
+                self.create_session,
+                self.get_sessions,
+                self.delete_session,
+            ),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (
+            self.get_instance_info,
+            self.create_message,
+            self.create_user,
+            self.verify_user,
+            self.get_user,
+            self.guest_get_user,
+            self.update_user,
+            self.update_profile,
+            self.delete_user,
+            self.create_password_reset_code,
+            self.reset_password,
+            self.create_session,
+            self.get_sessions,
+            self.delete_session,
+        ) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class EffisRateLimits:
@@ -140,6 +436,76 @@ class EffisRateLimits:
     fetch_file: RateLimitConf = attrs.field()
     """Rate limits for the file fetching endpoints."""
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "assets": lambda payload: lazy.from_payload(EffisRateLimitConf, payload["assets"]),
+        "attachments": lambda payload: lazy.from_payload(
+            EffisRateLimitConf,
+            payload["attachments"],
+        ),
+        "fetch_file": lambda payload: lazy.from_payload(RateLimitConf, payload["fetch_file"]),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "assets": ("assets", lambda value: EffisRateLimitConf.from_payload(value)),
+        "attachments": ("attachments", lambda value: EffisRateLimitConf.from_payload(value)),
+        "fetch_file": ("fetch_file", lambda value: RateLimitConf.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "assets": (EffisRateLimitConf,),
+            "attachments": (EffisRateLimitConf,),
+            "fetch_file": (RateLimitConf,),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "assets": self.assets.to_payload(),
+            "attachments": self.attachments.to_payload(),
+            "fetch_file": self.fetch_file.to_payload(),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "EffisRateLimits":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            assets=EffisRateLimitConf.from_payload(payload["assets"]),
+            attachments=EffisRateLimitConf.from_payload(payload["attachments"]),
+            fetch_file=RateLimitConf.from_payload(payload["fetch_file"]),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        assets: EffisRateLimitConf,
+        attachments: EffisRateLimitConf,
+        fetch_file: RateLimitConf,
+    ) -> "EffisRateLimits":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.assets = assets
+        self.attachments = attachments
+        self.fetch_file = fetch_file
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (EffisRateLimits,),
+            (self.assets, self.attachments, self.fetch_file),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.assets, self.attachments, self.fetch_file) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class InstanceRateLimits:
@@ -193,6 +559,73 @@ class InstanceRateLimits:
     effis: EffisRateLimits = attrs.field()
     """The instance's Effis rate limit information (The CDN)."""
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "oprish": lambda payload: lazy.from_payload(OprishRateLimits, payload["oprish"]),
+        "pandemonium": lambda payload: lazy.from_payload(RateLimitConf, payload["pandemonium"]),
+        "effis": lambda payload: lazy.from_payload(EffisRateLimits, payload["effis"]),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "oprish": ("oprish", lambda value: OprishRateLimits.from_payload(value)),
+        "pandemonium": ("pandemonium", lambda value: RateLimitConf.from_payload(value)),
+        "effis": ("effis", lambda value: EffisRateLimits.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "oprish": (OprishRateLimits,),
+            "pandemonium": (RateLimitConf,),
+            "effis": (EffisRateLimits,),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "oprish": self.oprish.to_payload(),
+            "pandemonium": self.pandemonium.to_payload(),
+            "effis": self.effis.to_payload(),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "InstanceRateLimits":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            oprish=OprishRateLimits.from_payload(payload["oprish"]),
+            pandemonium=RateLimitConf.from_payload(payload["pandemonium"]),
+            effis=EffisRateLimits.from_payload(payload["effis"]),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        oprish: OprishRateLimits,
+        pandemonium: RateLimitConf,
+        effis: EffisRateLimits,
+    ) -> "InstanceRateLimits":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.oprish = oprish
+        self.pandemonium = pandemonium
+        self.effis = effis
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (InstanceRateLimits,),
+            (self.oprish, self.pandemonium, self.effis),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.oprish, self.pandemonium, self.effis) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class InstanceInfo:
@@ -283,3 +716,162 @@ class InstanceInfo:
 
     This is not present if the `rate_limits` query parameter is not set.
     """
+
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "instance_name": lambda payload: payload["instance_name"],
+        "description": lambda payload: payload["description"],
+        "version": lambda payload: payload["version"],
+        "message_limit": lambda payload: payload["message_limit"],
+        "oprish_url": lambda payload: payload["oprish_url"],
+        "pandemonium_url": lambda payload: payload["pandemonium_url"],
+        "effis_url": lambda payload: payload["effis_url"],
+        "file_size": lambda payload: payload["file_size"],
+        "attachment_file_size": lambda payload: payload["attachment_file_size"],
+        "email_address": lambda payload: payload.get("email_address", undefined.Undefined),
+        "rate_limits": lambda payload: (
+            lazy.from_payload(InstanceRateLimits, payload["rate_limits"])
+            if "rate_limits" in payload
+            else undefined.Undefined
+        ),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _LENGTH_LIMITS: typing.ClassVar[validation.LengthLimits] = {"description": (1, 2048, False)}
+    """Documented length limits of string fields."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "instance_name": ("instance_name", None),
+        "description": ("description", None),
+        "version": ("version", None),
+        "message_limit": ("message_limit", None),
+        "oprish_url": ("oprish_url", None),
+        "pandemonium_url": ("pandemonium_url", None),
+        "effis_url": ("effis_url", None),
+        "file_size": ("file_size", None),
+        "attachment_file_size": ("attachment_file_size", None),
+        "email_address": ("email_address", None),
+        "rate_limits": ("rate_limits", lambda value: InstanceRateLimits.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "instance_name": (str,),
+            "description": (str, None),
+            "version": (str,),
+            "message_limit": (int,),
+            "oprish_url": (str,),
+            "pandemonium_url": (str,),
+            "effis_url": (str,),
+            "file_size": (int,),
+            "attachment_file_size": (int,),
+            "email_address": (str, undefined.Undefined),
+            "rate_limits": (InstanceRateLimits, undefined.Undefined),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {
+            "instance_name": self.instance_name,
+            "description": self.description,
+            "version": self.version,
+            "message_limit": self.message_limit,
+            "oprish_url": self.oprish_url,
+            "pandemonium_url": self.pandemonium_url,
+            "effis_url": self.effis_url,
+            "file_size": self.file_size,
+            "attachment_file_size": self.attachment_file_size,
+        }
+        if self.email_address is not undefined.Undefined:
+            payload["email_address"] = self.email_address
+        if self.rate_limits is not undefined.Undefined:
+            payload["rate_limits"] = self.rate_limits.to_payload()
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "InstanceInfo":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            instance_name=payload["instance_name"],
+            description=payload["description"],
+            version=payload["version"],
+            message_limit=payload["message_limit"],
+            oprish_url=payload["oprish_url"],
+            pandemonium_url=payload["pandemonium_url"],
+            effis_url=payload["effis_url"],
+            file_size=payload["file_size"],
+            attachment_file_size=payload["attachment_file_size"],
+            email_address=payload.get("email_address", undefined.Undefined),
+            rate_limits=InstanceRateLimits.from_payload(payload["rate_limits"])
+            if "rate_limits" in payload
+            else undefined.Undefined,
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        instance_name: str,
+        description: str | None,
+        version: str,
+        message_limit: int,
+        oprish_url: str,
+        pandemonium_url: str,
+        effis_url: str,
+        file_size: int,
+        attachment_file_size: int,
+        email_address: str | typing.Literal[undefined.Undefined],
+        rate_limits: InstanceRateLimits | typing.Literal[undefined.Undefined],
+    ) -> "InstanceInfo":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.instance_name = instance_name
+        self.description = description
+        self.version = version
+        self.message_limit = message_limit
+        self.oprish_url = oprish_url
+        self.pandemonium_url = pandemonium_url
+        self.effis_url = effis_url
+        self.file_size = file_size
+        self.attachment_file_size = attachment_file_size
+        self.email_address = email_address
+        self.rate_limits = rate_limits
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (InstanceInfo,),
+            (
+                self.instance_name,
+                self.description,
+                self.version,
+                self.message_limit,
+                self.oprish_url,
+                self.pandemonium_url,
+                self.effis_url,
+                self.file_size,
+                self.attachment_file_size,
+                self.email_address,
+                self.rate_limits,
+            ),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (
+            self.instance_name,
+            self.description,
+            self.version,
+            self.message_limit,
+            self.oprish_url,
+            self.pandemonium_url,
+            self.effis_url,
+            self.file_size,
+            self.attachment_file_size,
+            self.email_address,
+            self.rate_limits,
+        ) = state
@@ -0,0 +1,178 @@
+"""This module implements helpers for fields that are only decoded on first access.
+
+Some fields, such as the IP address of a session, are rarely used but
+relatively expensive to decode. Generated models derive from
+:class:`LazyFields` to keep these in their raw form when decoded from a
+payload, and only decode them when the field is first accessed.
+
+Entire payloads can be decoded lazily as well using :func:`from_payload`,
+which is useful for handlers that only ever touch a few fields of a large
+payload. Tagged unions can be decoded lazily by looking up the variant class
+first, e.g. ``lazy.from_payload(SERVER_PAYLOAD_VARIANTS[payload["op"]], payload)``.
+"""
+
+import functools
+import ipaddress
+import typing
+
+import attrs
+
+__all__: typing.Sequence[str] = (
+    "Decoders",
+    "FieldDecoders",
+    "LazyFields",
+    "from_payload",
+    "ip_address",
+)
+
+_T = typing.TypeVar("_T")
+
+Decoders: typing.TypeAlias = (
+    "dict[str, typing.Callable[[typing.Mapping[str, typing.Any]], typing.Any]]"
+)
+"""A mapping of attribute names to functions decoding them from a raw payload."""
+
+FieldDecoders: typing.TypeAlias = "dict[str, typing.Callable[[typing.Any], typing.Any]]"
+"""A mapping of attribute names to functions decoding them from their raw value."""
+
+_IP_ADDRESS_CACHE_SIZE: typing.Final[int] = 1024
+"""The maximum amount of distinct IP addresses kept in the interning cache."""
+
+
+class _LazyObject(typing.Protocol):
+    _lazy_payload: typing.Mapping[str, typing.Any]
+
+
+@functools.lru_cache(maxsize=_IP_ADDRESS_CACHE_SIZE)
+def _parse_ip_address(value: str) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+    return ipaddress.ip_address(value)
+
+
+def ip_address(
+    value: ipaddress.IPv4Address | ipaddress.IPv6Address | str,
+) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
+    """Decode a raw IP address, or return it as-is if it was already decoded.
+
+    Decoded addresses are interned, so sessions sharing the same address also
+    share the same address object.
+    """
+    if isinstance(value, str):
+        return _parse_ip_address(value)
+
+    return value
+
+
+class LazyFields:
+    """A base class for generated classes with fields that are decoded on first access.
+
+    ``_from_trusted`` keeps the raw values of these fields and leaves their
+    attributes unset. The first time such an attribute is read, its raw value
+    is decoded by the matching function in the ``_LAZY_FIELDS`` table of the
+    class and stored like any other attribute. Objects created through
+    ``__init__`` are passed decoded values, and never decode anything.
+    """
+
+    __slots__ = ("_lazy_raw",)
+
+    _LAZY_FIELDS: typing.ClassVar[FieldDecoders] = {}
+    _lazy_raw: dict[str, typing.Any]
+
+    def __getattr__(self, name: str) -> object:
+        # This is only called for attributes that are not set, which lazy
+        # fields are not until they are first accessed.
+        decoder = self._LAZY_FIELDS.get(name)
+        if decoder is None:
+            raise AttributeError(name)
+
+        try:
+            raw = self._lazy_raw.pop(name)
+
+        except (AttributeError, KeyError):
+            raise AttributeError(name) from None
+
+        value = decoder(raw)
+        object.__setattr__(self, name, value)
+        return value
+
+
+def _make_proxy_class(cls: type[_T]) -> type[_T]:
+    decoders: Decoders = getattr(cls, "_LAZY_DECODERS")  # noqa: B009
+
+    def __getattr__(self: _LazyObject, name: str) -> object:  # noqa: N807
+        # This is only called for attributes that were not decoded yet.
+        decoder = decoders.get(name)
+        if decoder is None:
+            raise AttributeError(name)
+
+        value = decoder(self._lazy_payload)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __eq__(self: _T, other: object) -> bool:  # noqa: N807
+        # attrs only compares instances of the exact same class.
+        if not isinstance(other, cls):
+            return NotImplemented
+
+        for attribute in attrs.fields(cls):
+            if not attribute.eq:
+                continue
+
+            key = attribute.eq_key or _identity
+            if key(getattr(self, attribute.name)) != key(getattr(other, attribute.name)):
+                return False
+
+        return True
+
+    def __ne__(self: _T, other: object) -> bool:  # noqa: N807
+        result = __eq__(self, other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self: _T) -> tuple[typing.Any, ...]:  # noqa: N807
+        # Objects are pickled as eagerly decoded ones, but pickle requires
+        # objects created through `copyreg.__newobj__` to be of that exact class.
+        _, args, state = cls.__reduce__(self)
+        return (object.__new__, args, state)
+
+    namespace = {
+        "__slots__": ("_lazy_payload",),
+        "__qualname__": cls.__qualname__,
+        "__module__": cls.__module__,
+        "__getattr__": __getattr__,
+        "__eq__": __eq__,
+        "__ne__": __ne__,
+        "__reduce__": __reduce__,
+        "__hash__": cls.__hash__,
+    }
+    return typing.cast(type[_T], type(cls.__name__, (cls,), namespace))
+
+
+def _identity(value: _T) -> _T:
+    return value
+
+
+_PROXY_CLASSES: dict[type[typing.Any], type[typing.Any]] = {}
+
+
+def from_payload(cls: type[_T], payload: typing.Mapping[str, typing.Any]) -> _T:
+    """Create an object of the provided class that decodes its fields on first access.
+
+    The returned object is an instance of (a subclass of) ``cls`` and behaves
+    exactly like an eagerly decoded one, but only decodes each field, including
+    nested objects, the first time it is accessed. The payload must therefore
+    not be mutated afterwards.
+
+    Decoding a field on first access is slower than decoding it eagerly, so
+    this is only worth it for payloads of which most fields are never used.
+
+    Classes without lazily decodable fields are decoded eagerly.
+    """
+    if not hasattr(cls, "_LAZY_DECODERS"):
+        return typing.cast(typing.Any, cls).from_payload(payload)
+
+    proxy_cls = _PROXY_CLASSES.get(cls)
+    if proxy_cls is None:
+        proxy_cls = _PROXY_CLASSES[cls] = _make_proxy_class(cls)
+
+    instance = object.__new__(proxy_cls)
+    object.__setattr__(instance, "_lazy_payload", payload)
+    return instance
@@ -3,11 +3,12 @@
 .. warning::
     This module was automatically generated.
 """
+import copyreg
 import typing
 
 import attrs
 
-from . import undefined
+from . import lazy, partial, undefined, validation
 from . import users as users_m
 
 
@@ -33,6 +34,42 @@ class MessageDisguise:
     avatar: str | None = attrs.field()
     """The URL of the message's disguise."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "name": ("name", None),
+        "avatar": ("avatar", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"name": (str, None), "avatar": (str, None)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"name": self.name, "avatar": self.avatar}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "MessageDisguise":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(name=payload["name"], avatar=payload["avatar"])
+
+    @classmethod
+    def _from_trusted(cls, *, name: str | None, avatar: str | None) -> "MessageDisguise":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.name = name
+        self.avatar = avatar
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (MessageDisguise,), (self.name, self.avatar))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.name, self.avatar) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class MessageCreate:
@@ -63,6 +100,70 @@ class MessageCreate:
         default=undefined.Undefined,
     )
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "content": lambda payload: payload["content"],
+        "_disguise": lambda payload: (
+            lazy.from_payload(MessageDisguise, payload["_disguise"])
+            if "_disguise" in payload
+            else undefined.Undefined
+        ),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _LENGTH_LIMITS: typing.ClassVar[validation.LengthLimits] = {
+        "content": (2, "message_limit", True),
+    }
+    """Documented length limits of string fields."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "content": ("content", None),
+        "_disguise": ("_disguise", lambda value: MessageDisguise.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"content": (str,), "_disguise": (MessageDisguise, undefined.Undefined)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {"content": self.content}
+        if self._disguise is not undefined.Undefined:
+            payload["_disguise"] = self._disguise.to_payload()
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "MessageCreate":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            content=payload["content"],
+            disguise=MessageDisguise.from_payload(payload["_disguise"])
+            if "_disguise" in payload
+            else undefined.Undefined,
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        content: str,
+        disguise: MessageDisguise | typing.Literal[undefined.Undefined],
+    ) -> "MessageCreate":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.content = content
+        self._disguise = disguise
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (MessageCreate,), (self.content, self._disguise))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.content, self._disguise) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class Message:
@@ -93,3 +194,79 @@ class Message:
     _disguise: MessageDisguise | typing.Literal[undefined.Undefined] = attrs.field(
         default=undefined.Undefined,
     )
+
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "author": lambda payload: lazy.from_payload(users_m.User, payload["author"]),
+        "content": lambda payload: payload["content"],
+        "_disguise": lambda payload: (
+            lazy.from_payload(MessageDisguise, payload["_disguise"])
+            if "_disguise" in payload
+            else undefined.Undefined
+        ),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _LENGTH_LIMITS: typing.ClassVar[validation.LengthLimits] = {
+        "content": (2, "message_limit", True),
+    }
+    """Documented length limits of string fields."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "author": ("author", lambda value: users_m.User.from_payload(value)),
+        "content": ("content", None),
+        "_disguise": ("_disguise", lambda value: MessageDisguise.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "author": (users_m.User,),
+            "content": (str,),
+            "_disguise": (MessageDisguise, undefined.Undefined),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {
+            "author": self.author.to_payload(),
+            "content": self.content,
+        }
+        if self._disguise is not undefined.Undefined:
+            payload["_disguise"] = self._disguise.to_payload()
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "Message":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            author=users_m.User.from_payload(payload["author"]),
+            content=payload["content"],
+            disguise=MessageDisguise.from_payload(payload["_disguise"])
+            if "_disguise" in payload
+            else undefined.Undefined,
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        author: users_m.User,
+        content: str,
+        disguise: MessageDisguise | typing.Literal[undefined.Undefined],
+    ) -> "Message":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.author = author
+        self.content = content
+        self._disguise = disguise
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (Message,), (self.author, self.content, self._disguise))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.author, self.content, self._disguise) = state
@@ -0,0 +1,376 @@
+"""This module implements a compact binary format for passing payloads between services.
+
+This format is meant for services that both use eludris-autodoc, e.g. to pass
+decoded gateway payloads over a local queue, rather than for talking to
+Eludris itself. Objects are packed into positional arrays in field order
+instead of mappings, and the string tags of variants, such as ``op`` and
+``type``, are replaced by the index of the variant in its union. Members of
+unit enums are packed as their index as well. Omitted fields are left out
+entirely, after a bitmask of the omittable fields that are present.
+
+The packing and unpacking functions of every class are compiled into
+straight-line code from its fields and ``_field_types`` table on first use.
+:func:`dumps` serializes packed objects with MessagePack, prefixed by a
+fingerprint of the layout of every class involved. :func:`loads` checks this
+fingerprint, so different versions of eludris-autodoc on either end raise a
+:class:`SchemaMismatchError` instead of silently decoding garbage. These two
+require the `msgpack <https://pypi.org/project/msgpack/>`_ package.
+"""
+
+import enum
+import functools
+import hashlib
+import ipaddress
+import types
+import typing
+
+import attrs
+
+from . import lazy, undefined, validation
+
+__all__: typing.Sequence[str] = (
+    "Packable",
+    "SchemaMismatchError",
+    "dumps",
+    "fingerprint",
+    "loads",
+    "pack",
+    "unpack",
+)
+
+_T = typing.TypeVar("_T")
+
+Packable: typing.TypeAlias = "type[typing.Any] | types.UnionType"
+"""A generated class, or a union of generated classes such as ``ServerPayload``."""
+
+FINGERPRINT_SIZE: typing.Final[int] = 8
+"""The size of the schema fingerprint that prefixes serialized payloads, in bytes."""
+
+_IP_ADDRESS_TYPES: typing.Final[tuple[type[typing.Any], ...]] = (
+    ipaddress.IPv4Address,
+    ipaddress.IPv6Address,
+)
+
+
+class SchemaMismatchError(ValueError):
+    """Raised when a payload was serialized with a different layout than it is loaded with."""
+
+    def __init__(self, type_: Packable, expected: bytes, received: bytes) -> None:
+        self.type = type_
+        """The type the payload was loaded as."""
+        self.expected = expected
+        """The fingerprint of the layout of that type."""
+        self.received = received
+        """The fingerprint the payload was serialized with."""
+
+        super().__init__(
+            f"Payload was serialized with schema {received.hex()}, "
+            f"but {type_} has schema {expected.hex()}",
+        )
+
+
+class _Codec:
+    # Filled in after compilation, so that codecs can refer to each other.
+    __slots__ = ("pack", "unpack")
+
+    pack: typing.Callable[[typing.Any], list[typing.Any]]
+    unpack: typing.Callable[[typing.Sequence[typing.Any]], typing.Any]
+
+
+_CODECS: dict[tuple[Packable, int | None], _Codec] = {}
+
+
+def _get_model_class(cls: type[_T]) -> type[_T]:
+    # Lazily decoded payloads are instances of a subclass.
+    for base in cls.__mro__:
+        if "__attrs_attrs__" in vars(base):
+            return base
+
+    msg = f"{cls.__name__} is not a generated class"
+    raise TypeError(msg)
+
+
+def _get_field_types(cls: type[typing.Any]) -> dict[str, tuple[object, ...]]:
+    # Fields of arbitrary type, such as files, are missing from the table and
+    # are packed as-is. Classes consisting of only a tag have no table at all.
+    if "_field_types" not in vars(cls):
+        return {}
+
+    return cls._field_types()
+
+
+def _get_constant(field: "attrs.Attribute[typing.Any]") -> tuple[object] | None:
+    # Tags are typed as a single literal and never need to be packed.
+    if typing.get_origin(field.type) is typing.Literal:
+        (value,) = typing.get_args(field.type)
+        return (value,)
+
+    return None
+
+
+def _make_value_codec(
+    value: str,
+    field_types: tuple[object, ...],
+    namespace: dict[str, object],
+) -> tuple[str, str]:
+    # Returns expressions packing and unpacking the provided value. Undefined
+    # is handled by the caller, and None and plain values are packed as-is.
+    def bind(obj: object) -> str:
+        name = f"_{len(namespace)}"
+        namespace[name] = obj
+        return name
+
+    field_types = tuple(type_ for type_ in field_types if type_ is not undefined.Undefined)
+    nullable = None in field_types
+    complex_types = [
+        type_
+        for type_ in field_types
+        if isinstance(type_, types.UnionType | validation.ListOf)
+        or (isinstance(type_, type) and (attrs.has(type_) or issubclass(type_, enum.Enum)))
+    ]
+
+    if not complex_types:
+        if any(type_ in _IP_ADDRESS_TYPES for type_ in field_types):
+            # IP addresses are packed as strings, and interned when unpacked.
+            return f"str({value})", f"{bind(lazy.ip_address)}({value})"
+
+        return value, value
+
+    if len(complex_types) > 1:
+        msg = f"Fields of types {complex_types} can not be packed"
+        raise TypeError(msg)
+
+    (type_,) = complex_types
+    if isinstance(type_, validation.ListOf):
+        pack, unpack = _make_value_codec("item", type_.types, namespace)
+        if pack != "item":
+            pack = f"[{pack} for item in {value}]"
+        if unpack != "item":
+            unpack = f"[{unpack} for item in {value}]"
+
+    elif isinstance(type_, type) and issubclass(type_, enum.Enum):
+        members = tuple(typing.cast(typing.Iterable[enum.Enum], type_))
+        codes = {member: code for code, member in enumerate(members)}
+        pack, unpack = f"{bind(codes)}[{value}]", f"{bind(members)}[{value}]"
+
+    else:
+        codec = bind(_get_codec(typing.cast(Packable, type_)))
+        pack, unpack = f"{codec}.pack({value})", f"{codec}.unpack({value})"
+
+    if nullable:
+        pack = f"(None if {value} is None else {pack})"
+        unpack = f"(None if {value} is None else {unpack})"
+
+    return pack, unpack
+
+
+def _compile_class_codec(cls: type[typing.Any], tag: int | None, codec: _Codec) -> None:
+    # Required fields preceding the first omittable one are packed into the
+    # initial list, followed by the mask of omittable fields that are present.
+    field_types = _get_field_types(cls)
+    namespace: dict[str, object] = {"cls": cls, "Undefined": undefined.Undefined}
+    initial = [] if tag is None else [str(tag)]
+    pack_lines: list[str] = []
+    unpack_lines = ["def unpack(data):", "    self = object.__new__(cls)", "    it = iter(data)"]
+    if tag is not None:
+        unpack_lines.append("    next(it)")
+
+    omittable = mask_index = 0
+    for field in attrs.fields(cls):
+        name = field.name
+        constant = _get_constant(field)
+        if constant is not None:
+            namespace[f"_{name}"] = constant[0]
+            unpack_lines.append(f"    self.{name} = _{name}")
+            continue
+
+        allowed = field_types.get(name, ())
+        if undefined.Undefined not in allowed:
+            pack, _ = _make_value_codec(f"self.{name}", allowed, namespace)
+            _, unpack = _make_value_codec("value", allowed, namespace)
+            if omittable:
+                pack_lines.append(f"    append({pack})")
+            else:
+                initial.append(pack)
+
+            unpack_lines.extend(("    value = next(it)", f"    self.{name} = {unpack}"))
+            continue
+
+        if not omittable:
+            mask_index = len(initial)
+            initial.append("0")
+            unpack_lines.append("    mask = next(it)")
+
+        bit = 1 << omittable
+        omittable += 1
+        pack, unpack = _make_value_codec("value", allowed, namespace)
+        pack_lines.extend(
+            (
+                f"    value = self.{name}",
+                "    if value is not Undefined:",
+                f"        mask |= {bit}",
+                f"        append({pack})",
+            ),
+        )
+        unpack_lines.extend(
+            (
+                f"    if mask & {bit}:",
+                "        value = next(it)",
+                f"        self.{name} = {unpack}",
+                "    else:",
+                f"        self.{name} = Undefined",
+            ),
+        )
+
+    if omittable:
+        pack_lines = [
+            "def pack(self):",
+            f"    packed = [{', '.join(initial)}]",
+            "    append = packed.append",
+            "    mask = 0",
+            *pack_lines,
+            f"    packed[{mask_index}] = mask",
+            "    return packed",
+        ]
+
+    else:
+        pack_lines = ["def pack(self):", f"    return [{', '.join(initial)}]"]
+
+    unpack_lines.append("    return self")
+
+    exec("\n".join(pack_lines), namespace)  # noqa: S102
+    exec("\n".join(unpack_lines), namespace)  # noqa: S102
+    codec.pack = typing.cast(typing.Any, namespace["pack"])
+    codec.unpack = typing.cast(typing.Any, namespace["unpack"])
+
+
+def _compile_union_codec(union: types.UnionType, codec: _Codec) -> None:
+    variants = typing.get_args(union)
+    variant_codecs = [_get_codec(variant, tag) for tag, variant in enumerate(variants)]
+    packers = dict(
+        zip(variants, [variant_codec.pack for variant_codec in variant_codecs], strict=True),
+    )
+    unpackers = [variant_codec.unpack for variant_codec in variant_codecs]
+
+    def pack(obj: object) -> list[typing.Any]:
+        packer = packers.get(type(obj))
+        if packer is None:
+            packer = packers[_get_model_class(type(obj))]
+
+        return packer(obj)
+
+    def unpack(data: typing.Sequence[typing.Any]) -> object:
+        return unpackers[data[0]](data)
+
+    codec.pack = pack
+    codec.unpack = unpack
+
+
+def _get_codec(type_: Packable, tag: int | None = None) -> _Codec:
+    # Variants of a union are packed with their tag, and have separate codecs
+    # from the same classes packed on their own.
+    codec = _CODECS.get((type_, tag))
+    if codec is None:
+        codec = _CODECS[type_, tag] = _Codec()
+        if isinstance(type_, types.UnionType):
+            _compile_union_codec(type_, codec)
+        else:
+            _compile_class_codec(type_, tag, codec)
+
+    return codec
+
+
+def _describe(type_: object, seen: set[object]) -> str:
+    if isinstance(type_, types.UnionType):
+        return f"({'|'.join(_describe(variant, seen) for variant in typing.get_args(type_))})"
+
+    if isinstance(type_, validation.ListOf):
+        return f"[{'|'.join(_describe(item, seen) for item in type_.types)}]"
+
+    if not isinstance(type_, type):
+        return repr(type_)
+
+    if issubclass(type_, enum.Enum):
+        members = typing.cast(typing.Iterable[enum.Enum], type_)
+        return f"{type_.__name__}<{','.join(repr(member.value) for member in members)}>"
+
+    if not attrs.has(type_) or type_ in seen:
+        return type_.__name__
+
+    seen.add(type_)
+    field_types = _get_field_types(type_)
+    fields = ",".join(
+        f"{field.name}={_get_constant(field) or _describe_all(field_types.get(field.name), seen)}"
+        for field in attrs.fields(type_)
+    )
+    return f"{type_.__name__}({fields})"
+
+
+def _describe_all(field_types: tuple[object, ...] | None, seen: set[object]) -> str:
+    if field_types is None:
+        return "any"
+
+    return "|".join(_describe(type_, seen) for type_ in field_types)
+
+
+@functools.lru_cache
+def fingerprint(type_: Packable) -> bytes:
+    """Get the fingerprint of the packed layout of a class or union.
+
+    The fingerprint covers the layout of all nested classes, unions and enums,
+    so it changes whenever any change to the generated package changes how
+    payloads of this type are packed.
+    """
+    description = _describe(type_, set())
+    return hashlib.blake2b(description.encode(), digest_size=FINGERPRINT_SIZE).digest()
+
+
+def pack(obj: object, type_: "Packable | None" = None) -> list[typing.Any]:
+    """Pack an object into nested positional arrays.
+
+    If ``type_`` is a union, the object is packed along with the index of its
+    class in that union, so that it can be unpacked as that union. Otherwise,
+    the object is packed as its own class.
+    """
+    if type_ is None:
+        type_ = _get_model_class(type(obj))
+
+    return _get_codec(type_).pack(obj)
+
+
+def unpack(type_: type[_T] | types.UnionType, data: typing.Sequence[typing.Any]) -> _T:
+    """Unpack an object of the provided class or union from nested positional arrays.
+
+    ``type_`` must be the same as the one the object was packed with.
+    """
+    return _get_codec(type_).unpack(data)
+
+
+def dumps(obj: object, type_: "Packable | None" = None) -> bytes:
+    """Serialize an object to MessagePack, prefixed by the fingerprint of its layout.
+
+    ``type_`` is used as with :func:`pack`.
+    """
+    import msgpack
+
+    if type_ is None:
+        type_ = _get_model_class(type(obj))
+
+    return fingerprint(type_) + msgpack.packb(_get_codec(type_).pack(obj))
+
+
+def loads(type_: type[_T] | types.UnionType, data: bytes) -> _T:
+    """Deserialize an object of the provided class or union from MessagePack.
+
+    Raises a :class:`SchemaMismatchError` if the object was serialized with a
+    different layout, e.g. by another version of eludris-autodoc.
+    """
+    import msgpack
+
+    expected = fingerprint(type_)
+    received = data[:FINGERPRINT_SIZE]
+    if received != expected:
+        raise SchemaMismatchError(type_, expected, received)
+
+    packed = msgpack.unpackb(memoryview(data)[FINGERPRINT_SIZE:])
+    return _get_codec(type_).unpack(packed)
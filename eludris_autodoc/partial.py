@@ -0,0 +1,99 @@
+"""This module implements generic decoding of (partial) payloads in a single pass.
+
+Every generated class carries a flat map of its raw API keys to the attributes
+they are stored in, with flattened fields already resolved and fields such as
+``Session.ip`` mapped onto their private storage. Decoding a payload through
+this map is a single pass over its keys, which makes it well suited to
+applying partial payloads, such as the ones used to update a user, onto
+existing objects.
+
+The content of adjacently tagged variants, e.g. the ``d`` of a gateway
+payload, is decoded through its own map, just as it is nested in the payload.
+"""
+
+import typing
+
+import attrs
+
+from . import undefined
+
+__all__: typing.Sequence[str] = ("KeySlots", "decode", "update")
+
+_T = typing.TypeVar("_T")
+
+_Decoder: typing.TypeAlias = "typing.Callable[[typing.Any], typing.Any]"
+
+KeySlots: typing.TypeAlias = "dict[str, tuple[str, _Decoder | None] | tuple[None, KeySlots]]"
+"""A mapping of raw API keys to the attribute they are stored in and a function
+decoding their raw value, or ``None`` if the raw value is stored as-is.
+
+The content key of adjacently tagged variants is instead mapped to ``None`` and
+the key slots of the payload nested under it.
+"""
+
+_Layout = tuple[tuple[str, ...], tuple[str, ...]]
+
+_LAYOUTS: dict[type[typing.Any], _Layout] = {}
+
+
+def _get_layout(cls: type[typing.Any]) -> _Layout:
+    # The attributes that default to Undefined, and those that are required.
+    layout = _LAYOUTS.get(cls)
+    if layout is None:
+        fields = attrs.fields(cls)
+        layout = _LAYOUTS[cls] = (
+            tuple(field.name for field in fields if field.default is undefined.Undefined),
+            tuple(field.name for field in fields if field.default is not undefined.Undefined),
+        )
+
+    return layout
+
+
+def update(obj: _T, payload: typing.Mapping[str, typing.Any]) -> _T:
+    """Apply a partial raw API payload onto an existing object, in place.
+
+    Only the keys present in the payload are decoded and set; all other
+    attributes keep their current value. Unknown keys are ignored. Adjacently
+    tagged variants take the content nested under its key, just like the full
+    payload. Returns the updated object.
+    """
+    _apply(obj, getattr(type(obj), "_KEY_SLOTS"), payload)  # noqa: B009
+    return obj
+
+
+def _apply(obj: object, key_slots: KeySlots, payload: typing.Mapping[str, typing.Any]) -> None:
+    for key, value in payload.items():
+        slot = key_slots.get(key)
+        if slot is None:
+            continue
+
+        attribute, decoder = slot
+        if attribute is None:
+            # The content of an adjacently tagged variant, which has key slots of its own.
+            _apply(obj, typing.cast(KeySlots, decoder), value)
+
+        else:
+            object.__setattr__(obj, attribute, value if decoder is None else decoder(value))
+
+
+def decode(cls: type[_T], payload: typing.Mapping[str, typing.Any]) -> _T:
+    """Create an object of the provided class from its raw API representation.
+
+    This is a generic, single pass alternative to the generated
+    ``from_payload`` methods, with the same rules as :func:`update`. Omitted
+    fields are set to ``Undefined``; omitting any other field raises a
+    :class:`TypeError`.
+    """
+    omittable, required = _get_layout(cls)
+    obj = object.__new__(cls)
+    for attribute in omittable:
+        object.__setattr__(obj, attribute, undefined.Undefined)
+
+    update(obj, payload)
+
+    missing = [attribute for attribute in required if not hasattr(obj, attribute)]
+    if missing:
+        msg = f"{cls.__name__} payload is missing required fields: {', '.join(missing)}"
+        raise TypeError(msg)
+
+    return obj
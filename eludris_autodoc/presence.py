@@ -0,0 +1,148 @@
+"""This module implements a compact store for user presences.
+
+Rather than keeping a :class:`~eludris_autodoc.users.Status` object around for
+every user, a :class:`PresenceTable` stores each user's status type as a small
+integer code and their status text as an index into a table of deduplicated
+texts. Statuses are only turned back into objects when they are looked up.
+"""
+
+import array
+import typing
+
+import attrs
+
+from . import gateway, undefined, users
+
+__all__: typing.Sequence[str] = ("PresenceSnapshot", "PresenceTable")
+
+_NO_TEXT: typing.Final[int] = 0
+"""The text id used for statuses without text."""
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class PresenceSnapshot:
+    """A bulk export of all presences in a :class:`PresenceTable`.
+
+    All arrays are parallel: the presence of ``user_ids[i]`` has status type
+    code ``codes[i]`` and status text ``texts[text_ids[i]]``. A text id of 0
+    means that the status has no text.
+    """
+
+    user_ids: "array.array[int]" = attrs.field()
+    """The ids of all users with a known presence."""
+    codes: bytes = attrs.field()
+    """The compact status type code of each user, see ``users.STATUS_TYPE_MEMBERS``."""
+    text_ids: "array.array[int]" = attrs.field()
+    """The index of each user's status text into ``texts``."""
+    texts: typing.Sequence[str | None] = attrs.field()
+    """The deduplicated status texts. The first entry is always ``None``."""
+
+
+class PresenceTable:
+    """A compact, columnar store of user presences keyed by user id.
+
+    Updates and lookups are O(1). Status texts are deduplicated, so many users
+    sharing the same text only store it once.
+    """
+
+    __slots__ = ("_rows", "_codes", "_text_ids", "_texts", "_text_index")
+
+    def __init__(self) -> None:
+        # Rows are never removed, so the insertion order of this dict matches
+        # the order of the rows in the arrays below.
+        self._rows: dict[int, int] = {}
+        self._codes = bytearray()
+        self._text_ids = array.array("I")
+        self._texts: list[str | None] = [None]
+        self._text_index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._rows
+
+    def _intern_text(self, text: str | typing.Literal[undefined.Undefined]) -> int:
+        if text is undefined.Undefined:
+            return _NO_TEXT
+
+        text_id = self._text_index.get(text)
+        if text_id is None:
+            text_id = self._text_index[text] = len(self._texts)
+            self._texts.append(text)
+
+        return text_id
+
+    def set(self, user_id: int, status: users.Status) -> None:
+        """Set the presence of the user with the provided id."""
+        code = users.STATUS_TYPE_CODES[status.type]
+        text_id = self._intern_text(status.text)
+
+        row = self._rows.get(user_id)
+        if row is None:
+            self._rows[user_id] = len(self._codes)
+            self._codes.append(code)
+            self._text_ids.append(text_id)
+
+        else:
+            self._codes[row] = code
+            self._text_ids[row] = text_id
+
+    def update(self, payload: gateway.PresenceUpdateServerPayload) -> None:
+        """Apply a ``PRESENCE_UPDATE`` gateway payload."""
+        self.set(payload.user_id, payload.status)
+
+    def get_type(self, user_id: int) -> users.StatusType | None:
+        """Get the status type of the user with the provided id, if known."""
+        row = self._rows.get(user_id)
+        if row is None:
+            return None
+
+        return users.STATUS_TYPE_MEMBERS[self._codes[row]]
+
+    def get(self, user_id: int) -> users.Status | None:
+        """Get the status of the user with the provided id, if known."""
+        row = self._rows.get(user_id)
+        if row is None:
+            return None
+
+        text = self._texts[self._text_ids[row]]
+        return users.Status(
+            type=users.STATUS_TYPE_MEMBERS[self._codes[row]],
+            text=undefined.Undefined if text is None else text,
+        )
+
+    def snapshot(self) -> PresenceSnapshot:
+        """Export all presences at once.
+
+        The returned snapshot is a copy and is not affected by further updates.
+        """
+        return PresenceSnapshot(
+            user_ids=array.array("Q", self._rows),
+            codes=bytes(self._codes),
+            text_ids=array.array("I", self._text_ids),
+            texts=tuple(self._texts),
+        )
+
+    def compact(self) -> None:
+        """Drop status texts that are no longer used by any user.
+
+        Texts are never removed on update, so this should be called
+        periodically if many distinct status texts pass through the table.
+        """
+        texts: list[str | None] = [None]
+        text_index: dict[str, int] = {}
+        remapped: dict[int, int] = {_NO_TEXT: _NO_TEXT}
+
+        for row, text_id in enumerate(self._text_ids):
+            new_id = remapped.get(text_id)
+            if new_id is None:
+                text = self._texts[text_id]
+                assert text is not None
+                new_id = remapped[text_id] = text_index[text] = len(texts)
+                texts.append(text)
+
+            self._text_ids[row] = new_id
+
+        self._texts = texts
+        self._text_index = text_index
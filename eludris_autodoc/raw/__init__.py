@@ -0,0 +1,16 @@
+"""Raw Eludris API payloads.
+
+This package contains TypedDicts mirroring the raw API representation of
+every type in eludris-autodoc. These can be used to type-check code that
+works on payloads directly, without converting them to attrs classes.
+
+.. warning::
+    This package was automatically generated.
+"""
+from .errors import *
+from .files import *
+from .gateway import *
+from .instance import *
+from .messaging import *
+from .sessions import *
+from .users import *
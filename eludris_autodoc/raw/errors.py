@@ -0,0 +1,122 @@
+"""This module implements raw Eludris API payloads related to errors.
+
+These mirror the types in :mod:`eludris_autodoc.errors` as TypedDicts.
+
+.. warning::
+    This module was automatically generated.
+"""
+import typing
+
+
+class SharedErrorData(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.SharedErrorData`."""
+
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+
+
+class UnauthorizedErrorResponse(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.UnauthorizedErrorResponse`."""
+
+    type: typing.Literal["UNAUTHORIZED"]
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+
+
+class ForbiddenErrorResponse(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.ForbiddenErrorResponse`."""
+
+    type: typing.Literal["FORBIDDEN"]
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+
+
+class NotFoundErrorResponse(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.NotFoundErrorResponse`."""
+
+    type: typing.Literal["NOT_FOUND"]
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+
+
+class ConflictErrorResponse(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.ConflictErrorResponse`."""
+
+    type: typing.Literal["CONFLICT"]
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+    item: str
+    """The conflicting item."""
+
+
+class MisdirectedErrorResponse(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.MisdirectedErrorResponse`."""
+
+    type: typing.Literal["MISDIRECTED"]
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+    info: str
+    """Extra information about what went wrong."""
+
+
+class ValidationErrorResponse(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.ValidationErrorResponse`."""
+
+    type: typing.Literal["VALIDATION"]
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+    value_name: str
+    """The name of the value that failed validation."""
+    info: str
+    """Extra information about what went wrong."""
+
+
+class RateLimitedErrorResponse(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.RateLimitedErrorResponse`."""
+
+    type: typing.Literal["RATE_LIMITED"]
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+    retry_after: int
+    """The amount of milliseconds you're still rate limited for."""
+
+
+class ServerErrorResponse(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.ServerErrorResponse`."""
+
+    type: typing.Literal["SERVER"]
+    status: int
+    """The HTTP status of the error."""
+    message: str
+    """A brief explanation of the error."""
+    info: str
+    """Extra information about what went wrong."""
+
+
+ErrorResponse = (
+    UnauthorizedErrorResponse
+    | ForbiddenErrorResponse
+    | NotFoundErrorResponse
+    | ConflictErrorResponse
+    | MisdirectedErrorResponse
+    | ValidationErrorResponse
+    | RateLimitedErrorResponse
+    | ServerErrorResponse
+)
+"""The raw API representation of :data:`~eludris_autodoc.ErrorResponse`."""
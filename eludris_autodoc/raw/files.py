@@ -0,0 +1,75 @@
+"""This module implements raw Eludris API payloads related to files.
+
+These mirror the types in :mod:`eludris_autodoc.files` as TypedDicts.
+
+.. warning::
+    This module was automatically generated.
+"""
+import typing
+
+
+class FileUpload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.FileUpload`."""
+
+    file: object
+    spoiler: bool
+
+
+class TextFileMetadata(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.TextFileMetadata`."""
+
+    type: typing.Literal["TEXT"]
+
+
+class _ImageFileMetadataRequired(typing.TypedDict):
+    type: typing.Literal["IMAGE"]
+
+
+class ImageFileMetadata(_ImageFileMetadataRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.ImageFileMetadata`."""
+
+    width: int
+    """The image's width in pixels."""
+    height: int
+    """The image's height in pixels."""
+
+
+class _VideoFileMetadataRequired(typing.TypedDict):
+    type: typing.Literal["VIDEO"]
+
+
+class VideoFileMetadata(_VideoFileMetadataRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.VideoFileMetadata`."""
+
+    width: int
+    """The video's width in pixels."""
+    height: int
+    """The video's height in pixels."""
+
+
+class OtherFileMetadata(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.OtherFileMetadata`."""
+
+    type: typing.Literal["OTHER"]
+
+
+FileMetadata = TextFileMetadata | ImageFileMetadata | VideoFileMetadata | OtherFileMetadata
+"""The raw API representation of :data:`~eludris_autodoc.FileMetadata`."""
+
+
+class _FileDataRequired(typing.TypedDict):
+    id: int
+    """The file's ID."""
+    name: str
+    """The file's name."""
+    bucket: str
+    """The bucket the file is stored in."""
+    metadata: FileMetadata
+    """The [`FileMetadata`] of the file."""
+
+
+class FileData(_FileDataRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.FileData`."""
+
+    spoiler: bool
+    """Whether the file is marked as a spoiler."""
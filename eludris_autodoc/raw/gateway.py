@@ -0,0 +1,126 @@
+"""This module implements raw Eludris API payloads related to gateway.
+
+These mirror the types in :mod:`eludris_autodoc.gateway` as TypedDicts.
+
+.. warning::
+    This module was automatically generated.
+"""
+import typing
+
+from . import instance as instance_m
+from . import messaging as messaging_m
+from . import users as users_m
+
+
+class PingClientPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.PingClientPayload`."""
+
+    op: typing.Literal["PING"]
+
+
+class AuthenticateClientPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.AuthenticateClientPayload`."""
+
+    op: typing.Literal["AUTHENTICATE"]
+    d: str
+
+
+ClientPayload = PingClientPayload | AuthenticateClientPayload
+"""The raw API representation of :data:`~eludris_autodoc.ClientPayload`."""
+
+
+class PongServerPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.PongServerPayload`."""
+
+    op: typing.Literal["PONG"]
+
+
+class RateLimitServerPayloadData(typing.TypedDict):
+    """The ``d`` of :class:`RateLimitServerPayload`."""
+
+    wait: int
+    """The amount of milliseconds you have to wait before the rate limit ends"""
+
+
+class RateLimitServerPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.RateLimitServerPayload`."""
+
+    op: typing.Literal["RATE_LIMIT"]
+    d: RateLimitServerPayloadData
+
+
+class HelloServerPayloadData(typing.TypedDict):
+    """The ``d`` of :class:`HelloServerPayload`."""
+
+    heartbeat_interval: int
+    """The amount of milliseconds your ping interval is supposed to be."""
+    instance_info: instance_m.InstanceInfo
+    """The instance's info.
+
+    This is the same payload you get from the [`get_instance_info`] payload without
+    ratelimits
+    """
+    rate_limit: instance_m.RateLimitConf
+    """The pandemonium ratelimit info."""
+
+
+class HelloServerPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.HelloServerPayload`."""
+
+    op: typing.Literal["HELLO"]
+    d: HelloServerPayloadData
+
+
+class AuthenticatedServerPayloadData(typing.TypedDict):
+    """The ``d`` of :class:`AuthenticatedServerPayload`."""
+
+    user: users_m.User
+    users: list[users_m.User]
+    """The currently online users who are relavent to the connector."""
+
+
+class AuthenticatedServerPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.AuthenticatedServerPayload`."""
+
+    op: typing.Literal["AUTHENTICATED"]
+    d: AuthenticatedServerPayloadData
+
+
+class UserUpdateServerPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.UserUpdateServerPayload`."""
+
+    op: typing.Literal["USER_UPDATE"]
+    d: users_m.User
+
+
+class PresenceUpdateServerPayloadData(typing.TypedDict):
+    """The ``d`` of :class:`PresenceUpdateServerPayload`."""
+
+    user_id: int
+    status: users_m.Status
+
+
+class PresenceUpdateServerPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.PresenceUpdateServerPayload`."""
+
+    op: typing.Literal["PRESENCE_UPDATE"]
+    d: PresenceUpdateServerPayloadData
+
+
+class MessageCreateServerPayload(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.MessageCreateServerPayload`."""
+
+    op: typing.Literal["MESSAGE_CREATE"]
+    d: messaging_m.Message
+
+
+ServerPayload = (
+    PongServerPayload
+    | RateLimitServerPayload
+    | HelloServerPayload
+    | AuthenticatedServerPayload
+    | UserUpdateServerPayload
+    | PresenceUpdateServerPayload
+    | MessageCreateServerPayload
+)
+"""The raw API representation of :data:`~eludris_autodoc.ServerPayload`."""
@@ -0,0 +1,121 @@
+"""This module implements raw Eludris API payloads related to instance.
+
+These mirror the types in :mod:`eludris_autodoc.instance` as TypedDicts.
+
+.. warning::
+    This module was automatically generated.
+"""
+import typing
+
+
+class EffisRateLimitConf(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.EffisRateLimitConf`."""
+
+    reset_after: int
+    """The amount of seconds after which the rate limit resets."""
+    limit: int
+    """The amount of requests that can be made within the `reset_after` interval."""
+    file_size_limit: int
+    """The maximum amount of bytes that can be sent within the `reset_after` interval."""
+
+
+class RateLimitConf(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.RateLimitConf`."""
+
+    reset_after: int
+    """The amount of seconds after which the rate limit resets."""
+    limit: int
+    """The amount of requests that can be made within the `reset_after` interval."""
+
+
+class OprishRateLimits(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.OprishRateLimits`."""
+
+    get_instance_info: RateLimitConf
+    """Rate limits for the [`get_instance_info`] endpoint."""
+    create_message: RateLimitConf
+    """Rate limits for the [`create_message`] endpoint."""
+    create_user: RateLimitConf
+    """Rate limits for the [`create_user`] endpoint."""
+    verify_user: RateLimitConf
+    """Rate limits for the [`verify_user`] endpoint."""
+    get_user: RateLimitConf
+    """Rate limits for the [`get_self`], [`get_user`] and [`get_user_from_username`] endpoints."""
+    guest_get_user: RateLimitConf
+    """Rate limits for the [`get_self`], [`get_user`] and [`get_user_from_username`] endpoints for
+    someone who hasn't made an account.
+    """
+    update_user: RateLimitConf
+    """Rate limits for the [`update_user`] enpoint."""
+    update_profile: RateLimitConf
+    """Rate limits for the [`update_profile`] enpoint."""
+    delete_user: RateLimitConf
+    """Rate limits for the [`delete_user`] enpoint."""
+    create_password_reset_code: RateLimitConf
+    """Rate limits for the [`create_password_reset_code`] enpoint."""
+    reset_password: RateLimitConf
+    """Rate limits for the [`reset_password`] enpoint."""
+    create_session: RateLimitConf
+    """Rate limits for the [`create_session`] endpoint."""
+    get_sessions: RateLimitConf
+    """Rate limits for the [`get_sessions`] endpoint."""
+    delete_session: RateLimitConf
+    """Rate limits for the [`delete_session`] endpoint."""
+
+
+class EffisRateLimits(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.EffisRateLimits`."""
+
+    assets: EffisRateLimitConf
+    """Rate limits for the asset buckets."""
+    attachments: EffisRateLimitConf
+    """Rate limits for the attachment bucket."""
+    fetch_file: RateLimitConf
+    """Rate limits for the file fetching endpoints."""
+
+
+class InstanceRateLimits(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.InstanceRateLimits`."""
+
+    oprish: OprishRateLimits
+    """The instance's Oprish rate limit information (The REST API)."""
+    pandemonium: RateLimitConf
+    """The instance's Pandemonium rate limit information (The WebSocket API)."""
+    effis: EffisRateLimits
+    """The instance's Effis rate limit information (The CDN)."""
+
+
+class _InstanceInfoRequired(typing.TypedDict):
+    instance_name: str
+    """The instance's name."""
+    description: str | None
+    """The instance's description.
+
+    This is between 1 and 2048 characters long.
+    """
+    version: str
+    """The instance's Eludris version."""
+    message_limit: int
+    """The maximum length of a message's content."""
+    oprish_url: str
+    """The URL of the instance's Oprish (REST API) endpoint."""
+    pandemonium_url: str
+    """The URL of the instance's Pandemonium (WebSocket API) endpoint."""
+    effis_url: str
+    """The URL of the instance's Effis (CDN) endpoint."""
+    file_size: int
+    """The maximum file size (in bytes) of an asset."""
+    attachment_file_size: int
+    """The maximum file size (in bytes) of an attachment."""
+
+
+class InstanceInfo(_InstanceInfoRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.InstanceInfo`."""
+
+    email_address: str
+    """The instance's email address if any."""
+    rate_limits: InstanceRateLimits
+    """The rate limits that apply to the connected Eludris instance.
+
+    This is not present if the `rate_limits` query parameter is not set.
+    """
@@ -0,0 +1,59 @@
+"""This module implements raw Eludris API payloads related to messaging.
+
+These mirror the types in :mod:`eludris_autodoc.messaging` as TypedDicts.
+
+.. warning::
+    This module was automatically generated.
+"""
+import typing
+
+from . import users as users_m
+
+
+class MessageDisguise(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.MessageDisguise`."""
+
+    name: str | None
+    """The name of the message's disguise."""
+    avatar: str | None
+    """The URL of the message's disguise."""
+
+
+class _MessageCreateRequired(typing.TypedDict):
+    content: str
+    """The message's content.
+
+    This field has to be at-least 2 characters long.
+
+    The upper limit
+    is the instance's [`InstanceInfo`] `message_limit`.
+
+    The content will be trimmed from leading and trailing whitespace.
+    """
+
+
+class MessageCreate(_MessageCreateRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.MessageCreate`."""
+
+    _disguise: MessageDisguise
+
+
+class _MessageRequired(typing.TypedDict):
+    author: users_m.User
+    """The message's author."""
+    content: str
+    """The message's content.
+
+    This field has to be at-least 2 characters long.
+
+    The upper limit
+    is the instance's [`InstanceInfo`] `message_limit`.
+
+    The content will be trimmed from leading and trailing whitespace.
+    """
+
+
+class Message(_MessageRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.Message`."""
+
+    _disguise: MessageDisguise
@@ -0,0 +1,51 @@
+"""This module implements raw Eludris API payloads related to sessions.
+
+These mirror the types in :mod:`eludris_autodoc.sessions` as TypedDicts.
+
+.. warning::
+    This module was automatically generated.
+"""
+import typing
+
+
+class SessionCreate(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.SessionCreate`."""
+
+    identifier: str
+    """The session user's identifier.
+
+    This can be either their email or username.
+    """
+    password: str
+    """The session user's password."""
+    platform: str
+    """The session's platform (linux, windows, mac, etc.)"""
+    client: str
+    """The client the session was created by."""
+
+
+class Session(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.Session`."""
+
+    id: int
+    """The session's ID."""
+    user_id: int
+    """The session user's ID."""
+    platform: str
+    """The session's platform (linux, windows, mac, etc.)"""
+    client: str
+    """The client the session was created by."""
+    ip: str
+    """The session's creation IP address."""
+
+
+class SessionCreated(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.SessionCreated`."""
+
+    token: str
+    """The session's token.
+
+    This can be used by the user to properly interface with the API.
+    """
+    session: Session
+    """The session object that was created."""
@@ -0,0 +1,165 @@
+"""This module implements raw Eludris API payloads related to users.
+
+These mirror the types in :mod:`eludris_autodoc.users` as TypedDicts.
+
+.. warning::
+    This module was automatically generated.
+"""
+import typing
+
+
+class ResetPassword(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.ResetPassword`."""
+
+    code: int
+    """The password reset code the user got emailed."""
+    email: str
+    """The user's email."""
+    password: str
+    """The user's new password."""
+
+
+class PasswordDeleteCredentials(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.PasswordDeleteCredentials`."""
+
+    password: str
+
+
+class _UpdateUserRequired(typing.TypedDict):
+    password: str
+    """The user's current password for validation."""
+
+
+class UpdateUser(_UpdateUserRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.UpdateUser`."""
+
+    username: str
+    """The user's new username."""
+    email: str
+    """The user's new email."""
+    new_password: str
+    """The user's new password."""
+
+
+class UserCreate(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.UserCreate`."""
+
+    username: str
+    """The user's name.
+
+    This is different to their `display_name` as it denotes how they're more formally
+    referenced by the API.
+    """
+    email: str
+    """The user's email."""
+    password: str
+    """The user's password."""
+
+
+StatusType = typing.Literal["ONLINE", "OFFLINE", "IDLE", "BUSY"]
+"""The raw API representation of :class:`~eludris_autodoc.StatusType`."""
+
+
+class CreatePasswordResetCode(typing.TypedDict):
+    """The raw API representation of :class:`~eludris_autodoc.CreatePasswordResetCode`."""
+
+    email: str
+    """The user's email."""
+
+
+class _StatusRequired(typing.TypedDict):
+    type: StatusType
+
+
+class Status(_StatusRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.Status`."""
+
+    text: str
+
+
+class _UserRequired(typing.TypedDict):
+    id: int
+    """The user's ID."""
+    username: str
+    """The user's username.
+
+    This field has to be between 2 and 32 characters long.
+    """
+    social_credit: int
+    """The user's social credit score."""
+    status: Status
+    """The user's status."""
+    badges: int
+    """The user's badges as a bitfield."""
+    permissions: int
+    """The user's instance-wide permissions as a bitfield."""
+
+
+class User(_UserRequired, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.User`."""
+
+    display_name: str
+    """The user's display name.
+
+    This field has to be between 2 and 32 characters long.
+    """
+    bio: str
+    """The user's bio.
+
+    The upper limit is the instance's [`InstanceInfo`] `bio_limit`.
+    """
+    avatar: int
+    """The user's avatar.
+
+    This field has to be a valid file ID in the "avatar" bucket.
+    """
+    banner: int
+    """The user's banner.
+
+    This field has to be a valid file ID in the "banner" bucket.
+    """
+    email: str
+    """The user's email.
+
+    This is only shown when the user queries their own data.
+    """
+    verified: bool
+    """The user's verification status.
+
+    This is only shown when the user queries their own data.
+    """
+
+
+class UpdateUserProfile(typing.TypedDict, total=False):
+    """The raw API representation of :class:`~eludris_autodoc.UpdateUserProfile`."""
+
+    display_name: str | None
+    """The user's new display name.
+
+    This field has to be between 2 and 32 characters long.
+    """
+    status: str | None
+    """The user's new status.
+
+    This field cannot be more than 150 characters long.
+    """
+    status_type: StatusType
+    """The user's new status type.
+
+    This must be one of `ONLINE`, `OFFLINE`, `IDLE` and `BUSY`.
+    """
+    bio: str | None
+    """The user's new bio.
+
+    The upper limit is the instance's [`InstanceInfo`] `bio_limit`.
+    """
+    avatar: int | None
+    """The user's new avatar.
+
+    This field has to be a valid file ID in the "avatar" bucket.
+    """
+    banner: int | None
+    """The user's new banner.
+
+    This field has to be a valid file ID in the "banner" bucket.
+    """
@@ -0,0 +1,469 @@
+"""This module implements requesting the routes of the Eludris HTTP APIs.
+
+The generated ``routes`` module describes every Oprish and Effis route as a
+:class:`Route`: its method, path template, query parameters, the types of its
+body and response, and the key of its rate limit in the instance's rate
+limits. A :class:`Client` requests routes over a pool of keep-alive HTTP/1.1
+connections per service, which are opened as needed and reused by every
+following request::
+
+    async with rest.Client(oprish_url="https://api.eludris.gay") as client:
+        info = await client.request(routes.GET_INSTANCE_INFO, rate_limits=True)
+        user = await client.request(routes.GET_USER, identifier="ooliver")
+
+The ``routes`` module is generated from the route items that only the live
+API serves, so it only exists after ``generate-autodoc`` has been run against
+it; it is not part of the committed package.
+
+Request bodies are always sent as JSON. Responses are decoded from JSON if the
+server says they are JSON, and passed on as bytes otherwise. Responses with an
+error status raise :class:`HTTPError`.
+"""
+
+import asyncio
+import contextlib
+import json
+import re
+import ssl
+import typing
+import urllib.parse
+
+from . import undefined
+
+__all__: typing.Sequence[str] = ("Client", "HTTPError", "Route")
+
+_BodyT = typing.TypeVar("_BodyT")
+_ResponseT = typing.TypeVar("_ResponseT")
+
+_PATH_PARAM: typing.Final[typing.Pattern[str]] = re.compile(r"\{(\w+)\}")
+"""A parameter in a path template, e.g. ``{id}``."""
+_UNRESERVED: typing.Final = re.compile(r"[\w.~-]*", re.ASCII).fullmatch
+"""Matches path parameters that never have to be quoted, such as ids."""
+_NO_BODY_STATUSES: typing.Final[frozenset[int]] = frozenset((204, 304))
+_MIN_ERROR_STATUS: typing.Final[int] = 400
+
+_Response = tuple[int, dict[str, str], bytes]
+
+
+def _quote(value: object) -> str:
+    text = str(value)
+    return text if _UNRESERVED(text) else urllib.parse.quote(text, safe="")
+
+
+class Route(typing.Generic[_BodyT, _ResponseT]):
+    """A route of an Eludris HTTP API.
+
+    The path template is compiled once, when the route is made, into a single
+    :meth:`str.format` call that only has to be passed the quoted path
+    parameters.
+    """
+
+    __slots__ = (
+        "name",
+        "service",
+        "method",
+        "path",
+        "path_params",
+        "query_params",
+        "body_type",
+        "response_type",
+        "rate_limit",
+        "encode",
+        "decode",
+        "_format",
+        "_param_names",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        service: str,
+        method: str,
+        path: str,
+        query_params: typing.Sequence[str] = (),
+        body_type: str | None = None,
+        response_type: str | None = None,
+        rate_limit: str | None = None,
+        encode: typing.Callable[[_BodyT], typing.Any] | None = None,
+        decode: typing.Callable[[typing.Any], _ResponseT] | None = None,
+    ) -> None:
+        self.name = name
+        """The name of this route, e.g. ``get_user``."""
+        self.service = service
+        """The service this route belongs to, e.g. ``oprish``."""
+        self.method = method
+        """The HTTP method of this route."""
+        self.path = path
+        """The path template of this route, e.g. ``/users/{identifier}``."""
+        self.query_params = tuple(query_params)
+        """The names of the query parameters of this route."""
+        self.body_type = body_type
+        """The autodoc type of the body of this route, if it has one."""
+        self.response_type = response_type
+        """The autodoc type of the response of this route, if it has one."""
+        self.rate_limit = rate_limit
+        """The key of the rate limit of this route in the rate limits of its service.
+
+        This is ``None`` for routes without their own rate limit.
+        """
+        self.encode = encode
+        """Encodes the body of this route into a JSON payload."""
+        self.decode = decode
+        """Decodes the JSON payload of a response of this route."""
+
+        parts = _PATH_PARAM.split(path)
+        self.path_params: tuple[str, ...] = tuple(parts[1::2])
+        """The names of the path parameters of this route, in order."""
+        literals = (part.replace("{", "{{").replace("}", "}}") for part in parts[::2])
+        self._format = "{}".join(literals).format
+        self._param_names = frozenset((*self.path_params, *self.query_params))
+
+    def __repr__(self) -> str:
+        return f"Route({self.method} {self.service}:{self.path})"
+
+    def format_path(self, params: typing.Mapping[str, object]) -> str:
+        """Format the path of this route with the provided path parameters.
+
+        Parameters are quoted, so they can not span more than one path segment.
+        If any path parameter is missing, a TypeError is raised.
+        """
+        try:
+            return self._format(*[_quote(params[name]) for name in self.path_params])
+
+        except KeyError as exc:
+            msg = f"Route {self.name!r} is missing path parameter {exc.args[0]!r}."
+            raise TypeError(msg) from None
+
+    def format_query(self, params: typing.Mapping[str, object]) -> str:
+        """Format the query string of this route, including the leading ``?``.
+
+        Parameters that are missing, ``None`` or ``Undefined`` are left out.
+        Booleans are formatted as ``true`` or ``false``.
+        """
+        query: list[tuple[str, object]] = []
+        for name in self.query_params:
+            value = params.get(name)
+            if value is None or value is undefined.Undefined:
+                continue
+
+            query.append((name, str(value).lower() if isinstance(value, bool) else value))
+
+        return f"?{urllib.parse.urlencode(query)}" if query else ""
+
+    def format_target(self, params: typing.Mapping[str, object]) -> str:
+        """Format the path and query string of this route with the provided parameters.
+
+        If any parameter is unknown or any path parameter is missing, a
+        TypeError is raised.
+        """
+        unknown = params.keys() - self._param_names
+        if unknown:
+            msg = f"Route {self.name!r} has no parameters {', '.join(sorted(unknown))}."
+            raise TypeError(msg)
+
+        return self.format_path(params) + self.format_query(params)
+
+
+class HTTPError(Exception):
+    """An error response of an Eludris HTTP API.
+
+    The payload of the response, if it is JSON, can be decoded into one of the
+    error responses in the ``errors`` module through ``decode_error_response``.
+    """
+
+    def __init__(self, route: Route[typing.Any, typing.Any], status: int, payload: object) -> None:
+        self.route = route
+        """The route that responded with an error."""
+        self.status = status
+        """The HTTP status of the response."""
+        self.payload = payload
+        """The decoded JSON payload of the response, or its raw bytes."""
+        super().__init__(f"Route {route.name!r} responded with status {status}.")
+
+
+class _StaleConnectionError(Exception):
+    """An idle connection failed before any byte of the response was read."""
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks: list[bytes] = []
+    while size := int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16):
+        chunks.append((await reader.readexactly(size + 2))[:-2])
+
+    # Skip any trailers.
+    while await reader.readuntil(b"\r\n") != b"\r\n":
+        pass
+
+    return b"".join(chunks)
+
+
+class _Pool:
+    """At most ``limit`` keep-alive connections to a single service."""
+
+    __slots__ = (
+        "_host",
+        "_port",
+        "_ssl",
+        "_prefix",
+        "_headers",
+        "_idle",
+        "_semaphore",
+        "_timeout",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        token: str | None,
+        limit: int,
+        timeout: float | None,
+    ) -> None:
+        split = urllib.parse.urlsplit(url)
+        if split.scheme not in ("http", "https") or not split.hostname:
+            msg = f"Invalid service URL: {url!r}."
+            raise ValueError(msg)
+
+        self._ssl = ssl.create_default_context() if split.scheme == "https" else None
+        self._host = split.hostname
+        self._port = split.port or (443 if self._ssl else 80)
+        self._prefix = split.path.rstrip("/")
+        # The headers shared by every request are only encoded once.
+        headers = f"Host: {split.netloc}\r\nConnection: keep-alive\r\n"
+        if token:
+            headers += f"Authorization: {token}\r\n"
+
+        self._headers = headers.encode()
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore = asyncio.Semaphore(limit)
+        self._timeout = timeout
+
+    async def request(self, method: str, target: str, body: bytes | None) -> _Response:
+        """Send a request over an idle connection, or a new one if there are none."""
+        head = [f"{method} {self._prefix}{target} HTTP/1.1\r\n".encode(), self._headers]
+        if body is not None:
+            head.append(b"Content-Type: application/json\r\n")
+
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            head.append(b"Content-Length: %d\r\n" % len(body or b""))
+
+        request = b"".join((*head, b"\r\n", body or b""))
+        async with self._semaphore:
+            while self._idle:
+                reader, writer = self._idle.pop()
+                try:
+                    return await asyncio.wait_for(
+                        self._exchange(reader, writer, method, request, reused=True),
+                        self._timeout,
+                    )
+
+                except _StaleConnectionError:
+                    # The server closed the idle connection without responding, so try the next one.
+                    continue
+
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port, ssl=self._ssl),
+                self._timeout,
+            )
+            return await asyncio.wait_for(
+                self._exchange(reader, writer, method, request, reused=False),
+                self._timeout,
+            )
+
+    async def _exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        method: str,
+        request: bytes,
+        *,
+        reused: bool,
+    ) -> _Response:
+        try:
+            status_line = await self._send(reader, writer, request, reused=reused)
+            version, status, headers, body, keep_alive = await self._read_response(
+                reader,
+                status_line,
+                method,
+            )
+
+        except BaseException:
+            writer.close()
+            raise
+
+        if keep_alive and version == b"HTTP/1.1" and headers.get("connection") != "close":
+            self._idle.append((reader, writer))
+
+        else:
+            writer.close()
+
+        return status, headers, body
+
+    @staticmethod
+    async def _send(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        request: bytes,
+        *,
+        reused: bool,
+    ) -> bytes:
+        """Send a request and read the status line of its response.
+
+        Once any byte of the response is read, the request may have been
+        handled, so only failures of reused connections before that are raised
+        as a :class:`_StaleConnectionError` to be retried.
+        """
+        try:
+            writer.write(request)
+            await writer.drain()
+            return await reader.readuntil(b"\r\n")
+
+        except asyncio.IncompleteReadError as exc:
+            if reused and not exc.partial:
+                raise _StaleConnectionError from exc
+
+            raise
+
+        except ConnectionError as exc:
+            if reused:
+                raise _StaleConnectionError from exc
+
+            raise
+
+    @staticmethod
+    async def _read_response(
+        reader: asyncio.StreamReader,
+        status_line: bytes,
+        method: str,
+    ) -> tuple[bytes, int, dict[str, str], bytes, bool]:
+        version, status, _ = status_line.split(b" ", 2)
+        headers: dict[str, str] = {}
+        while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        status_code = int(status)
+        if method == "HEAD" or status_code in _NO_BODY_STATUSES:
+            return version, status_code, headers, b"", True
+
+        if "chunked" in headers.get("transfer-encoding", ""):
+            return version, status_code, headers, await _read_chunked(reader), True
+
+        if "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+            return version, status_code, headers, body, True
+
+        # Without a length, the body ends when the server closes the connection.
+        return version, status_code, headers, await reader.read(), False
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+
+        for _, writer in idle:
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+class Client:
+    """An async client for the Eludris HTTP APIs.
+
+    Every service has its own pool of at most ``max_connections`` keep-alive
+    connections, which requests wait on when all of them are in use. Idle
+    connections are reused by the next request, and are only closed when the
+    server closes them or the client is closed.
+
+    Opening a connection, and sending a request and reading its response, are
+    each limited to ``timeout`` seconds, after which :class:`asyncio.TimeoutError`
+    is raised and the connection is closed. ``None`` waits indefinitely.
+    """
+
+    __slots__ = ("_urls", "_token", "_max_connections", "_timeout", "_pools")
+
+    def __init__(
+        self,
+        *,
+        oprish_url: str,
+        effis_url: str | None = None,
+        token: str | None = None,
+        max_connections: int = 10,
+        timeout: float | None = 30.0,
+    ) -> None:
+        self._urls = {"oprish": oprish_url}
+        if effis_url:
+            self._urls["effis"] = effis_url
+
+        self._token = token
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._pools: dict[str, _Pool] = {}
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    def _get_pool(self, service: str) -> _Pool:
+        pool = self._pools.get(service)
+        if pool:
+            return pool
+
+        if service not in self._urls:
+            msg = f"No URL was provided for the {service} service."
+            raise ValueError(msg)
+
+        pool = _Pool(
+            self._urls[service],
+            token=self._token,
+            limit=self._max_connections,
+            timeout=self._timeout,
+        )
+        self._pools[service] = pool
+        return pool
+
+    async def request(
+        self,
+        route: Route[_BodyT, _ResponseT],
+        body: _BodyT | None = None,
+        **params: object,
+    ) -> _ResponseT:
+        """Request a route with the provided body and path and query parameters.
+
+        If any parameter is unknown or any path parameter is missing, a
+        TypeError is raised. If the route responds with an error status, an
+        :class:`HTTPError` is raised.
+        """
+        target = route.format_target(params)
+        data = None
+        if body is not None:
+            payload = route.encode(body) if route.encode else body
+            data = json.dumps(payload, separators=(",", ":")).encode()
+
+        status, headers, content = await self._get_pool(route.service).request(
+            route.method,
+            target,
+            data,
+        )
+
+        response: typing.Any = content or None
+        if content and headers.get("content-type", "").startswith("application/json"):
+            response = json.loads(content)
+
+        if status >= _MIN_ERROR_STATUS:
+            raise HTTPError(route, status, response)
+
+        if response is None or route.decode is None:
+            return response
+
+        return route.decode(response)
+
+    async def close(self) -> None:
+        """Close all idle connections of every service."""
+        pools = list(self._pools.values())
+        self._pools.clear()
+        for pool in pools:
+            await pool.close()
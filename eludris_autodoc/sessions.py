@@ -3,10 +3,14 @@
 .. warning::
     This module was automatically generated.
 """
+import copyreg
 import ipaddress
+import typing
 
 import attrs
 
+from . import lazy, partial, validation
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class SessionCreate:
@@ -38,9 +42,70 @@ class SessionCreate:
     client: str = attrs.field()
     """The client the session was created by."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "identifier": ("identifier", None),
+        "password": ("password", None),
+        "platform": ("platform", None),
+        "client": ("client", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"identifier": (str,), "password": (str,), "platform": (str,), "client": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "identifier": self.identifier,
+            "password": self.password,
+            "platform": self.platform,
+            "client": self.client,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "SessionCreate":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            identifier=payload["identifier"],
+            password=payload["password"],
+            platform=payload["platform"],
+            client=payload["client"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        identifier: str,
+        password: str,
+        platform: str,
+        client: str,
+    ) -> "SessionCreate":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.identifier = identifier
+        self.password = password
+        self.platform = platform
+        self.client = client
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (SessionCreate,),
+            (self.identifier, self.password, self.platform, self.client),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.identifier, self.password, self.platform, self.client) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
-class Session:
+class Session(lazy.LazyFields):
     """The session payload.
 
     The user should ideally have one session for every client they have on every device.
@@ -68,6 +133,81 @@ class Session:
     ip: ipaddress.IPv4Address | ipaddress.IPv6Address = attrs.field()
     """The session's creation IP address."""
 
+    _LAZY_FIELDS: typing.ClassVar[lazy.FieldDecoders] = {"ip": lazy.ip_address}
+    """Decoders of the fields only decoded on first access."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "id": ("id", None),
+        "user_id": ("user_id", None),
+        "platform": ("platform", None),
+        "client": ("client", None),
+        "ip": ("ip", lambda value: lazy.ip_address(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "id": (int,),
+            "user_id": (int,),
+            "platform": (str,),
+            "client": (str,),
+            "ip": (ipaddress.IPv4Address, ipaddress.IPv6Address),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "platform": self.platform,
+            "client": self.client,
+            "ip": str(self.ip),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "Session":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            id=payload["id"],
+            user_id=payload["user_id"],
+            platform=payload["platform"],
+            client=payload["client"],
+            ip=payload["ip"],
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        id: int,
+        user_id: int,
+        platform: str,
+        client: str,
+        ip: ipaddress.IPv4Address | ipaddress.IPv6Address | str,
+    ) -> "Session":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.id = id
+        self.user_id = user_id
+        self.platform = platform
+        self.client = client
+        self._lazy_raw = {"ip": ip}
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (Session,),
+            (self.id, self.user_id, self.platform, self.client, self.ip),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.id, self.user_id, self.platform, self.client, self.ip) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class SessionCreated:
@@ -95,3 +235,48 @@ class SessionCreated:
     """
     session: Session = attrs.field()
     """The session object that was created."""
+
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "token": lambda payload: payload["token"],
+        "session": lambda payload: lazy.from_payload(Session, payload["session"]),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "token": ("token", None),
+        "session": ("session", lambda value: Session.from_payload(value)),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"token": (str,), "session": (Session,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"token": self.token, "session": self.session.to_payload()}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "SessionCreated":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            token=payload["token"],
+            session=Session.from_payload(payload["session"]),
+        )
+
+    @classmethod
+    def _from_trusted(cls, *, token: str, session: Session) -> "SessionCreated":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.token = token
+        self.session = session
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (SessionCreated,), (self.token, self.session))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.token, self.session) = state
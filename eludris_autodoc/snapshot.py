@@ -0,0 +1,233 @@
+"""This module implements persistent snapshots of client state for fast restarts.
+
+Rebuilding the users, presences and instance info of a client from a fresh
+``AUTHENTICATED`` payload means that every process has to reconnect and wait
+before it can serve a single lookup. Instead, a process can :func:`save` its
+state before shutting down, and its replacement can :meth:`Snapshot.open` the
+file right away. The file is laid out so that it is memory-mapped as-is:
+users are stored as a :class:`~eludris_autodoc.usercache.UserTable` and
+presences as sorted, parallel arrays, so lookups only touch the pages they
+need and nothing is decoded up front.
+
+A snapshot is read-only. Live state should be looked up first, falling back
+to the snapshot for anything that was not received yet, and the snapshot can
+be closed once the ``AUTHENTICATED`` payload has been handled::
+
+    user = live_users.get(user_id) or snapshot.get_user(user_id)
+"""
+
+import array
+import bisect
+import datetime
+import json
+import mmap
+import os
+import pathlib
+import struct
+import types
+import typing
+
+from . import instance, presence, undefined, usercache, users
+
+__all__: typing.Sequence[str] = ("Snapshot", "save")
+
+_MAGIC: typing.Final[bytes] = b"ELUDSNP1"
+"""Identifies a file as a snapshot with this layout."""
+_HEADER: typing.Final[struct.Struct] = struct.Struct("<8sQQQQQQQ")
+"""The magic, the creation time in milliseconds since the unix epoch, and the
+offset and size of the users, presences and instance info sections.
+"""
+_PRESENCE_HEADER: typing.Final[struct.Struct] = struct.Struct("<QQ")
+"""The amount of presences and the amount of distinct status texts."""
+_ALIGNMENT: typing.Final[int] = 8
+
+
+def _align(data: bytearray) -> None:
+    data.extend(bytes(-len(data) % _ALIGNMENT))
+
+
+def _encode_presences(presences: presence.PresenceTable) -> bytes:
+    # Presences are sorted by user id so they can be looked up with a binary
+    # search. Status texts are stored as offsets into a single blob.
+    exported = presences.snapshot()
+    order = sorted(range(len(exported.user_ids)), key=exported.user_ids.__getitem__)
+    texts = [b"" if text is None else text.encode() for text in exported.texts]
+    text_offsets = array.array("Q", [0])
+    for text in texts:
+        text_offsets.append(text_offsets[-1] + len(text))
+
+    data = bytearray(_PRESENCE_HEADER.pack(len(order), len(texts)))
+    data += array.array("Q", [exported.user_ids[row] for row in order]).tobytes()
+    data += array.array("I", [exported.text_ids[row] for row in order]).tobytes()
+    _align(data)
+    data += text_offsets.tobytes()
+    data += bytes(exported.codes[row] for row in order)
+    data += b"".join(texts)
+    return bytes(data)
+
+
+def save(
+    path: str | os.PathLike[str],
+    *,
+    users: typing.Collection[users.User] = (),
+    presences: presence.PresenceTable | None = None,
+    instance_info: instance.InstanceInfo | None = None,
+) -> None:
+    """Save client state to a snapshot file.
+
+    The file is written next to ``path`` first and then moved into place, so
+    processes that still have the previous snapshot open are unaffected.
+    """
+    arena_size = sum(
+        len(text.encode())
+        for user in users
+        for text in (user.username, user.display_name, user.bio, user.status.text, user.email)
+        if isinstance(text, str)
+    )
+    table_buffer = bytearray(
+        usercache.UserTable.get_size(capacity=len(users), arena_size=arena_size),
+    )
+    table = usercache.UserTable.initialize(
+        memoryview(table_buffer),
+        capacity=len(users),
+        arena_size=arena_size,
+    )
+    for user in users:
+        table.set(user)
+
+    sections = [
+        table.to_bytes(),
+        _encode_presences(presences or presence.PresenceTable()),
+        json.dumps(instance_info.to_payload()).encode() if instance_info else b"",
+    ]
+
+    data = bytearray(_HEADER.size)
+    offsets: list[int] = []
+    for section in sections:
+        _align(data)
+        offsets.extend((len(data), len(section)))
+        data += section
+
+    created_at = int(datetime.datetime.now(datetime.timezone.utc).timestamp() * 1000)
+    _HEADER.pack_into(data, 0, _MAGIC, created_at, *offsets)
+
+    path = pathlib.Path(path)
+    temporary_path = path.with_name(f"{path.name}.tmp")
+    temporary_path.write_bytes(data)
+    temporary_path.replace(path)
+
+
+class Snapshot:
+    """A memory-mapped snapshot of client state, created by :func:`save`."""
+
+    __slots__ = (
+        "_mmap",
+        "_views",
+        "_created_at",
+        "_users",
+        "_user_ids",
+        "_text_ids",
+        "_text_offsets",
+        "_codes",
+        "_texts",
+        "_instance_info",
+    )
+
+    def __init__(self, buffer: mmap.mmap) -> None:
+        self._mmap = buffer
+        root = memoryview(buffer)
+        magic, self._created_at, *offsets = _HEADER.unpack_from(root)
+        if magic != _MAGIC:
+            root.release()
+            msg = "File is not an eludris-autodoc snapshot"
+            raise ValueError(msg)
+
+        users_offset, users_size, presences_offset, _, info_offset, info_size = offsets
+        self._users = usercache.UserTable(root[users_offset : users_offset + users_size])
+
+        count, text_count = _PRESENCE_HEADER.unpack_from(root, presences_offset)
+        start = presences_offset + _PRESENCE_HEADER.size
+        self._user_ids = root[start : start + count * 8].cast("Q")
+        start += count * 8
+        self._text_ids = root[start : start + count * 4].cast("I")
+        start += count * 4 + -(start + count * 4) % _ALIGNMENT
+        self._text_offsets = root[start : start + (text_count + 1) * 8].cast("Q")
+        start += (text_count + 1) * 8
+        self._codes = root[start : start + count]
+        self._texts = root[start + count :]
+
+        self._instance_info: instance.InstanceInfo | None = None
+        if info_size:
+            payload = json.loads(bytes(root[info_offset : info_offset + info_size]))
+            self._instance_info = instance.InstanceInfo.from_payload(payload)
+
+        # Every view has to be released before the file can be unmapped.
+        self._views = [
+            root,
+            self._users._buf,  # noqa: SLF001
+            self._user_ids,
+            self._text_ids,
+            self._text_offsets,
+            self._codes,
+            self._texts,
+        ]
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> "Snapshot":
+        """Map the snapshot file at the provided path."""
+        with pathlib.Path(path).open("rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        """When this snapshot was saved."""
+        return datetime.datetime.fromtimestamp(self._created_at / 1000, tz=datetime.timezone.utc)
+
+    @property
+    def user_table(self) -> usercache.UserTable:
+        """All users in this snapshot, which can be iterated to repopulate a cache."""
+        return self._users
+
+    @property
+    def instance_info(self) -> instance.InstanceInfo | None:
+        """The instance info in this snapshot, if it was saved."""
+        return self._instance_info
+
+    def get_user(self, user_id: int) -> usercache.UserView | None:
+        """Get the user with the provided id, if they are in this snapshot."""
+        return self._users.get(user_id)
+
+    def get_status(self, user_id: int) -> users.Status | None:
+        """Get the status of the user with the provided id, if it is in this snapshot."""
+        row = bisect.bisect_left(self._user_ids, user_id)
+        if row == len(self._user_ids) or self._user_ids[row] != user_id:
+            return None
+
+        text_id = self._text_ids[row]
+        start, end = self._text_offsets[text_id], self._text_offsets[text_id + 1]
+        return users.Status(
+            type=users.STATUS_TYPE_MEMBERS[self._codes[row]],
+            text=str(self._texts[start:end], "utf-8") if text_id else undefined.Undefined,
+        )
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the snapshot file.
+
+        Any :class:`~eludris_autodoc.usercache.UserView` obtained from this
+        snapshot can no longer be used afterwards.
+        """
+        for view in reversed(self._views):
+            view.release()
+
+        self._mmap.close()
@@ -0,0 +1,99 @@
+"""This module implements passing batches of payloads to other processes through shared memory.
+
+Submitting payloads to a process pool pickles them for every task and copies
+them through a pipe. A :class:`SharedBatch` pickles every payload once, into
+a single shared memory block, and is itself pickled as just the name of that
+block. Workers attach to the block and unpickle the payloads straight from
+it, without copying the block first.
+
+Every process closes its batch when done with it, and the process that
+created it also unlinks it once all workers are done::
+
+    with transport.SharedBatch.create(payloads) as batch:
+        executor.submit(handle_batch, batch).result()
+        batch.unlink()
+"""
+
+import pickle
+import struct
+import types
+import typing
+from multiprocessing import shared_memory
+
+__all__: typing.Sequence[str] = ("SharedBatch",)
+
+_T = typing.TypeVar("_T")
+
+_HEADER: typing.Final[struct.Struct] = struct.Struct("<QQ")
+"""The amount of payloads and the size of their pickled form, at the start of a block."""
+
+
+class SharedBatch(typing.Generic[_T]):
+    """A batch of payloads pickled into a shared memory block.
+
+    Payloads are pickled together, so that classes and shared objects such as
+    ``Undefined`` are only pickled once. The whole batch is unpickled at once
+    through :meth:`load`, straight from the shared memory block.
+    """
+
+    __slots__ = ("_memory", "_count", "_size")
+
+    def __init__(self, memory: shared_memory.SharedMemory) -> None:
+        self._memory = memory
+        self._count, self._size = _HEADER.unpack_from(memory.buf)
+
+    @classmethod
+    def create(cls, payloads: typing.Collection[_T]) -> "SharedBatch[_T]":
+        """Pickle payloads into a new shared memory block."""
+        data = pickle.dumps(list(payloads), protocol=pickle.HIGHEST_PROTOCOL)
+        memory = shared_memory.SharedMemory(create=True, size=_HEADER.size + len(data))
+        _HEADER.pack_into(memory.buf, 0, len(payloads), len(data))
+        memory.buf[_HEADER.size : _HEADER.size + len(data)] = data
+        return cls(memory)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedBatch[_T]":
+        """Attach to the existing shared memory block with the provided name."""
+        return cls(shared_memory.SharedMemory(name=name))
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block, used to attach to it."""
+        return self._memory.name
+
+    def __len__(self) -> int:
+        return self._count
+
+    def load(self) -> list[_T]:
+        """Unpickle all payloads in this batch.
+
+        Every call unpickles the payloads again, so a worker should only call
+        this once per batch.
+        """
+        with self._memory.buf[_HEADER.size : _HEADER.size + self._size] as data:
+            return pickle.loads(data)  # noqa: S301
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (type(self).attach, (self.name,))
+
+    def __enter__(self) -> "SharedBatch[_T]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Detach from the shared memory block, without destroying it."""
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block once every process has closed it.
+
+        This should only be called by the process that created the batch.
+        """
+        self._memory.unlink()
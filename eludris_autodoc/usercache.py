@@ -0,0 +1,483 @@
+"""This module implements a user cache shared by multiple processes.
+
+Rather than every worker process keeping its own copy of every user, a
+:class:`SharedUserCache` stores them once, in a shared memory block. Each user
+is stored as a fixed-layout record, and strings such as usernames, display
+names and bios are stored in an arena of deduplicated strings that the
+records refer to.
+
+The layout itself is implemented by :class:`UserTable`, which works on any
+buffer. A single process creates the cache and keeps it up to date, e.g. from
+``USER_UPDATE`` gateway payloads. Any number of other processes attach to it
+and look users up as read-only :class:`UserView` objects, which read straight
+from shared memory. The cache itself is pickled as just the name of its block,
+so it can be passed to the initializer of a process pool::
+
+    cache = usercache.SharedUserCache.create(capacity=100_000)
+    executor = ProcessPoolExecutor(initializer=init_worker, initargs=(cache,))
+"""
+
+import struct
+import types
+import typing
+from multiprocessing import shared_memory
+
+from . import gateway, undefined, users
+
+__all__: typing.Sequence[str] = ("SharedUserCache", "UserTable", "UserView")
+
+_MAGIC: typing.Final[bytes] = b"ELUDUSR1"
+"""Identifies a buffer as a user table with this layout."""
+_HEADER: typing.Final[struct.Struct] = struct.Struct("<8sIIQQ")
+"""The magic, capacity, amount of users, arena size and used arena size of a table."""
+_COUNT_OFFSET: typing.Final[int] = 12
+_ARENA_USED_OFFSET: typing.Final[int] = 24
+_ARENA_USED: typing.Final[struct.Struct] = struct.Struct("<Q")
+
+_RECORD: typing.Final[struct.Struct] = struct.Struct("<IBBxxQqQQQQQQQQQ")
+"""The layout of a user: sequence number, status type code, presence flags, id,
+social credit, badges, permissions, avatar, banner, and the string references of
+the username, display name, bio, status text and email.
+"""
+_SEQUENCE: typing.Final[struct.Struct] = struct.Struct("<I")
+_ID: typing.Final[struct.Struct] = struct.Struct("<8xQ")
+"""The id of a user in a record, which never changes once it is indexed."""
+_SLOT: typing.Final[struct.Struct] = struct.Struct("<I")
+"""An index slot, holding the index of a record plus one, or zero if it is empty."""
+
+_HAS_DISPLAY_NAME: typing.Final[int] = 1
+_HAS_BIO: typing.Final[int] = 2
+_HAS_AVATAR: typing.Final[int] = 4
+_HAS_BANNER: typing.Final[int] = 8
+_HAS_STATUS_TEXT: typing.Final[int] = 16
+_HAS_EMAIL: typing.Final[int] = 32
+_HAS_VERIFIED: typing.Final[int] = 64
+_IS_VERIFIED: typing.Final[int] = 128
+
+_HASH_MULTIPLIER: typing.Final[int] = 0x9E3779B97F4A7C15
+_UINT64_MASK: typing.Final[int] = (1 << 64) - 1
+
+_Record = tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+
+def _get_index_layout(capacity: int) -> tuple[int, int]:
+    # The index is kept at most half full so that probe sequences stay short.
+    # Returns the amount of bits of a slot number and the size of the index.
+    bits = (capacity * 2 - 1).bit_length()
+    return bits, ((_SLOT.size << bits) + 7) // 8 * 8
+
+
+class UserTable:
+    """A table of users with a fixed layout in a buffer, keyed by user id.
+
+    The buffer holds a fixed amount of records, an open addressing index of
+    user ids and the string arena. Users are never removed and strings are
+    never freed, so the capacity and arena size should be chosen generously.
+    Lookups and updates are O(1).
+
+    Records are protected by a sequence number, so readers never observe a
+    partially updated user, and simply retry while one is being written.
+    """
+
+    __slots__ = (
+        "_buf",
+        "_capacity",
+        "_arena_size",
+        "_index_bits",
+        "_records_offset",
+        "_index_offset",
+        "_arena_offset",
+        "_strings",
+        "_decoded",
+    )
+
+    def __init__(self, buf: memoryview, *, writable: bool = False) -> None:
+        magic, capacity, _, arena_size, _ = _HEADER.unpack_from(buf)
+        if magic != _MAGIC:
+            msg = "Buffer does not contain a user table"
+            raise ValueError(msg)
+
+        self._buf = buf
+        self._capacity: int = capacity
+        self._arena_size: int = arena_size
+        self._index_bits, index_size = _get_index_layout(capacity)
+        self._records_offset = _HEADER.size
+        self._index_offset = self._records_offset + capacity * _RECORD.size
+        self._arena_offset = self._index_offset + index_size
+        # The writer deduplicates strings, readers cache their decoded form.
+        self._strings: dict[str, int] | None = {} if writable else None
+        self._decoded: dict[int, str] = {}
+
+    @staticmethod
+    def get_size(*, capacity: int, arena_size: int) -> int:
+        """Get the size of the buffer needed for a table with the provided capacity."""
+        _, index_size = _get_index_layout(capacity)
+        return _HEADER.size + capacity * _RECORD.size + index_size + arena_size
+
+    @classmethod
+    def initialize(cls, buf: memoryview, *, capacity: int, arena_size: int) -> "UserTable":
+        """Initialize an empty, writable table in a zeroed buffer.
+
+        The buffer must be at least :meth:`get_size` bytes large.
+        """
+        _HEADER.pack_into(buf, 0, _MAGIC, capacity, 0, arena_size, 0)
+        return cls(buf, writable=True)
+
+    @property
+    def arena_size(self) -> int:
+        """The amount of bytes available to store strings."""
+        return self._arena_size
+
+    @property
+    def arena_used(self) -> int:
+        """The amount of bytes used to store strings so far."""
+        return _ARENA_USED.unpack_from(self._buf, _ARENA_USED_OFFSET)[0]
+
+    def __len__(self) -> int:
+        return _SLOT.unpack_from(self._buf, _COUNT_OFFSET)[0]
+
+    def __contains__(self, user_id: object) -> bool:
+        return isinstance(user_id, int) and self._find(user_id)[1] is not None
+
+    def __iter__(self) -> typing.Iterator["UserView"]:
+        for record in range(len(self)):
+            yield UserView(self, record)
+
+    def _find(self, user_id: int) -> tuple[int, int | None]:
+        # Returns the index slot of a user, and their record if they are cached.
+        buf = self._buf
+        mask = (1 << self._index_bits) - 1
+        slot = (user_id * _HASH_MULTIPLIER & _UINT64_MASK) >> (64 - self._index_bits)
+        while True:
+            (entry,) = _SLOT.unpack_from(buf, self._index_offset + slot * _SLOT.size)
+            if not entry:
+                return slot, None
+
+            record = entry - 1
+            (record_id,) = _ID.unpack_from(buf, self._records_offset + record * _RECORD.size)
+            if record_id == user_id:
+                return slot, record
+
+            slot = slot + 1 & mask
+
+    def _read(self, record: int) -> _Record:
+        buf = self._buf
+        offset = self._records_offset + record * _RECORD.size
+        while True:
+            (sequence,) = _SEQUENCE.unpack_from(buf, offset)
+            if sequence & 1:
+                # The writer is currently updating this record.
+                continue
+
+            values = _RECORD.unpack_from(buf, offset)
+            # The sequence number is read again once the whole record is read,
+            # as the writer may have started while it was being read.
+            if _SEQUENCE.unpack_from(buf, offset)[0] == sequence:
+                return values
+
+    def _decode(self, ref: int) -> str:
+        # References are the offset of a string in the arena and its length.
+        text = self._decoded.get(ref)
+        if text is None:
+            start = self._arena_offset + (ref >> 32)
+            data = self._buf[start : start + (ref & 0xFFFFFFFF)]
+            text = self._decoded[ref] = str(data, "utf-8")
+
+        return text
+
+    def _decode_optional(
+        self,
+        values: _Record,
+        index: int,
+        flag: int,
+    ) -> str | typing.Literal[undefined.Undefined]:
+        return self._decode(values[index]) if values[2] & flag else undefined.Undefined
+
+    def _intern(self, text: str | typing.Literal[undefined.Undefined]) -> int:
+        assert self._strings is not None
+        if text is undefined.Undefined:
+            return 0
+
+        ref = self._strings.get(text)
+        if ref is None:
+            data = text.encode()
+            buf = self._buf
+            (used,) = _ARENA_USED.unpack_from(buf, _ARENA_USED_OFFSET)
+            if used + len(data) > self._arena_size:
+                msg = "The string arena of this user table is full"
+                raise MemoryError(msg)
+
+            start = self._arena_offset + used
+            buf[start : start + len(data)] = data
+            _ARENA_USED.pack_into(buf, _ARENA_USED_OFFSET, used + len(data))
+            ref = self._strings[text] = used << 32 | len(data)
+
+        return ref
+
+    def set(self, user: users.User) -> None:
+        """Add or update a user."""
+        if self._strings is None:
+            msg = "This user table is read-only"
+            raise TypeError(msg)
+
+        flags = 0
+        for value, flag in (
+            (user.display_name, _HAS_DISPLAY_NAME),
+            (user.bio, _HAS_BIO),
+            (user.avatar, _HAS_AVATAR),
+            (user.banner, _HAS_BANNER),
+            (user.status.text, _HAS_STATUS_TEXT),
+            (user.email, _HAS_EMAIL),
+            (user.verified, _HAS_VERIFIED),
+        ):
+            if value is not undefined.Undefined:
+                flags |= flag
+
+        if user.verified is True:
+            flags |= _IS_VERIFIED
+
+        refs = (
+            self._intern(user.username),
+            self._intern(user.display_name),
+            self._intern(user.bio),
+            self._intern(user.status.text),
+            self._intern(user.email),
+        )
+
+        buf = self._buf
+        slot, record = self._find(user.id)
+        is_new = record is None
+        if record is None:
+            record = len(self)
+            if record == self._capacity:
+                msg = "This user table is full"
+                raise MemoryError(msg)
+
+        offset = self._records_offset + record * _RECORD.size
+        (sequence,) = _SEQUENCE.unpack_from(buf, offset)
+        # Readers retry while the sequence number is odd, or if it changed
+        # while they were reading.
+        writing = sequence + 1 & 0xFFFFFFFF
+        _SEQUENCE.pack_into(buf, offset, writing)
+        _RECORD.pack_into(
+            buf,
+            offset,
+            writing,
+            users.STATUS_TYPE_CODES[user.status.type],
+            flags,
+            user.id,
+            user.social_credit,
+            user.badges,
+            user.permissions,
+            0 if user.avatar is undefined.Undefined else user.avatar,
+            0 if user.banner is undefined.Undefined else user.banner,
+            *refs,
+        )
+        _SEQUENCE.pack_into(buf, offset, writing + 1 & 0xFFFFFFFF)
+
+        if is_new:
+            # New users are only added to the index once their record is complete.
+            _SLOT.pack_into(buf, self._index_offset + slot * _SLOT.size, record + 1)
+            _SLOT.pack_into(buf, _COUNT_OFFSET, record + 1)
+
+    def update(self, payload: gateway.UserUpdateServerPayload) -> None:
+        """Apply a ``USER_UPDATE`` gateway payload."""
+        self.set(payload.d)
+
+    def get(self, user_id: int) -> "UserView | None":
+        """Get a read-only view of the user with the provided id, if cached."""
+        _, record = self._find(user_id)
+        if record is None:
+            return None
+
+        return UserView(self, record)
+
+    def to_bytes(self) -> bytes:
+        """Copy this table into bytes, leaving out unused space of the string arena."""
+        used = self.arena_used
+        data = bytearray(self._buf[: self._arena_offset + used])
+        _HEADER.pack_into(data, 0, _MAGIC, self._capacity, len(self), used, used)
+        return bytes(data)
+
+
+class SharedUserCache(UserTable):
+    """A :class:`UserTable` in a shared memory block.
+
+    Only the process that created the cache may update it.
+    """
+
+    __slots__ = ("_memory",)
+
+    def __init__(self, memory: shared_memory.SharedMemory, *, writable: bool) -> None:
+        super().__init__(memory.buf, writable=writable)
+        self._memory = memory
+
+    @classmethod
+    def create(cls, *, capacity: int, arena_size: int = 16 * 1024 * 1024) -> "SharedUserCache":
+        """Create a new, empty cache that can hold ``capacity`` users.
+
+        ``arena_size`` is the amount of bytes available to store the UTF-8
+        encoded strings of all users.
+        """
+        size = cls.get_size(capacity=capacity, arena_size=arena_size)
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        _HEADER.pack_into(memory.buf, 0, _MAGIC, capacity, 0, arena_size, 0)
+        return cls(memory, writable=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedUserCache":
+        """Attach to the existing cache with the provided name, for reading only."""
+        return cls(shared_memory.SharedMemory(name=name), writable=False)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block, used to attach to it."""
+        return self._memory.name
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (type(self).attach, (self.name,))
+
+    def __enter__(self) -> "SharedUserCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Detach from the shared memory block, without destroying it."""
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block once every process has closed it.
+
+        This should only be called by the process that created the cache.
+        """
+        self._memory.unlink()
+
+
+class UserView:
+    """A read-only view of a user in a :class:`UserTable`.
+
+    This has the same attributes as :class:`~eludris_autodoc.users.User`,
+    each of which is read from the table when accessed and therefore
+    reflects the latest update. Use :meth:`to_user` to get a consistent copy
+    of all attributes at once.
+    """
+
+    __slots__ = ("_table", "_record")
+
+    def __init__(self, table: UserTable, record: int) -> None:
+        self._table = table
+        self._record = record
+
+    def _get_string(self, index: int, flag: int) -> str | typing.Literal[undefined.Undefined]:
+        values = self._table._read(self._record)  # noqa: SLF001
+        return self._table._decode_optional(values, index, flag)  # noqa: SLF001
+
+    def _get_int(self, index: int, flag: int) -> int | typing.Literal[undefined.Undefined]:
+        values = self._table._read(self._record)  # noqa: SLF001
+        return values[index] if values[2] & flag else undefined.Undefined
+
+    @property
+    def id(self) -> int:
+        """The user's ID."""
+        return self._table._read(self._record)[3]  # noqa: SLF001
+
+    @property
+    def username(self) -> str:
+        """The user's username."""
+        values = self._table._read(self._record)  # noqa: SLF001
+        return self._table._decode(values[9])  # noqa: SLF001
+
+    @property
+    def display_name(self) -> str | typing.Literal[undefined.Undefined]:
+        """The user's display name."""
+        return self._get_string(10, _HAS_DISPLAY_NAME)
+
+    @property
+    def social_credit(self) -> int:
+        """The user's social credit score."""
+        return self._table._read(self._record)[4]  # noqa: SLF001
+
+    @property
+    def status(self) -> users.Status:
+        """The user's status."""
+        values = self._table._read(self._record)  # noqa: SLF001
+        return users.Status._from_trusted(  # noqa: SLF001
+            type=users.STATUS_TYPE_MEMBERS[values[1]],
+            text=self._table._decode_optional(values, 12, _HAS_STATUS_TEXT),  # noqa: SLF001
+        )
+
+    @property
+    def bio(self) -> str | typing.Literal[undefined.Undefined]:
+        """The user's bio."""
+        return self._get_string(11, _HAS_BIO)
+
+    @property
+    def avatar(self) -> int | typing.Literal[undefined.Undefined]:
+        """The user's avatar."""
+        return self._get_int(7, _HAS_AVATAR)
+
+    @property
+    def banner(self) -> int | typing.Literal[undefined.Undefined]:
+        """The user's banner."""
+        return self._get_int(8, _HAS_BANNER)
+
+    @property
+    def badges(self) -> int:
+        """The user's badges as a bitfield."""
+        return self._table._read(self._record)[5]  # noqa: SLF001
+
+    @property
+    def permissions(self) -> int:
+        """The user's instance-wide permissions as a bitfield."""
+        return self._table._read(self._record)[6]  # noqa: SLF001
+
+    @property
+    def email(self) -> str | typing.Literal[undefined.Undefined]:
+        """The user's email."""
+        return self._get_string(13, _HAS_EMAIL)
+
+    @property
+    def verified(self) -> bool | typing.Literal[undefined.Undefined]:
+        """The user's verification status."""
+        flags = self._table._read(self._record)[2]  # noqa: SLF001
+        if not flags & _HAS_VERIFIED:
+            return undefined.Undefined
+
+        return bool(flags & _IS_VERIFIED)
+
+    def to_user(self) -> users.User:
+        """Copy this user into a regular :class:`~eludris_autodoc.users.User`."""
+        table = self._table
+        values = table._read(self._record)  # noqa: SLF001
+        flags = values[2]
+        return users.User._from_trusted(  # noqa: SLF001
+            id=values[3],
+            username=table._decode(values[9]),  # noqa: SLF001
+            display_name=table._decode_optional(values, 10, _HAS_DISPLAY_NAME),  # noqa: SLF001
+            social_credit=values[4],
+            status=users.Status._from_trusted(  # noqa: SLF001
+                type=users.STATUS_TYPE_MEMBERS[values[1]],
+                text=table._decode_optional(values, 12, _HAS_STATUS_TEXT),  # noqa: SLF001
+            ),
+            bio=table._decode_optional(values, 11, _HAS_BIO),  # noqa: SLF001
+            avatar=values[7] if flags & _HAS_AVATAR else undefined.Undefined,
+            banner=values[8] if flags & _HAS_BANNER else undefined.Undefined,
+            badges=values[5],
+            permissions=values[6],
+            email=table._decode_optional(values, 13, _HAS_EMAIL),  # noqa: SLF001
+            verified=bool(flags & _IS_VERIFIED) if flags & _HAS_VERIFIED else undefined.Undefined,
+        )
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this user into its raw API representation."""
+        return self.to_user().to_payload()
+
+    def __repr__(self) -> str:
+        return f"UserView(id={self.id}, username={self.username!r})"
@@ -3,12 +3,13 @@
 .. warning::
     This module was automatically generated.
 """
+import copyreg
 import enum
 import typing
 
 import attrs
 
-from . import undefined
+from . import lazy, partial, undefined, validation
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
@@ -36,6 +37,48 @@ class ResetPassword:
     password: str = attrs.field()
     """The user's new password."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "code": ("code", None),
+        "email": ("email", None),
+        "password": ("password", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"code": (int,), "email": (str,), "password": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"code": self.code, "email": self.email, "password": self.password}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "ResetPassword":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            code=payload["code"],
+            email=payload["email"],
+            password=payload["password"],
+        )
+
+    @classmethod
+    def _from_trusted(cls, *, code: int, email: str, password: str) -> "ResetPassword":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.code = code
+        self.email = email
+        self.password = password
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (ResetPassword,), (self.code, self.email, self.password))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.code, self.email, self.password) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class PasswordDeleteCredentials:
@@ -55,6 +98,38 @@ class PasswordDeleteCredentials:
 
     password: str = attrs.field()
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {"password": ("password", None)}
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"password": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"password": self.password}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "PasswordDeleteCredentials":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(password=payload["password"])
+
+    @classmethod
+    def _from_trusted(cls, *, password: str) -> "PasswordDeleteCredentials":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.password = password
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (PasswordDeleteCredentials,), (self.password,))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.password,) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class UpdateUser:
@@ -85,6 +160,74 @@ class UpdateUser:
     )
     """The user's new password."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "password": ("password", None),
+        "username": ("username", None),
+        "email": ("email", None),
+        "new_password": ("new_password", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "password": (str,),
+            "username": (str, undefined.Undefined),
+            "email": (str, undefined.Undefined),
+            "new_password": (str, undefined.Undefined),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {"password": self.password}
+        if self.username is not undefined.Undefined:
+            payload["username"] = self.username
+        if self.email is not undefined.Undefined:
+            payload["email"] = self.email
+        if self.new_password is not undefined.Undefined:
+            payload["new_password"] = self.new_password
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "UpdateUser":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            password=payload["password"],
+            username=payload.get("username", undefined.Undefined),
+            email=payload.get("email", undefined.Undefined),
+            new_password=payload.get("new_password", undefined.Undefined),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        password: str,
+        username: str | typing.Literal[undefined.Undefined],
+        email: str | typing.Literal[undefined.Undefined],
+        new_password: str | typing.Literal[undefined.Undefined],
+    ) -> "UpdateUser":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.password = password
+        self.username = username
+        self.email = email
+        self.new_password = new_password
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (UpdateUser,),
+            (self.password, self.username, self.email, self.new_password),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.password, self.username, self.email, self.new_password) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class UserCreate:
@@ -117,6 +260,48 @@ class UserCreate:
     password: str = attrs.field()
     """The user's password."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "username": ("username", None),
+        "email": ("email", None),
+        "password": ("password", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"username": (str,), "email": (str,), "password": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"username": self.username, "email": self.email, "password": self.password}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "UserCreate":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            username=payload["username"],
+            email=payload["email"],
+            password=payload["password"],
+        )
+
+    @classmethod
+    def _from_trusted(cls, *, username: str, email: str, password: str) -> "UserCreate":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.username = username
+        self.email = email
+        self.password = password
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (UserCreate,), (self.username, self.email, self.password))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.username, self.email, self.password) = state
+
 
 class StatusType(str, enum.Enum):
     """The type of a user's status.
@@ -130,6 +315,31 @@ class StatusType(str, enum.Enum):
     BUSY = "BUSY"
 
 
+STATUS_TYPE_VALUES: typing.Final[dict[str, StatusType]] = {
+    "ONLINE": StatusType.ONLINE,
+    "OFFLINE": StatusType.OFFLINE,
+    "IDLE": StatusType.IDLE,
+    "BUSY": StatusType.BUSY,
+}
+"""Mapping of raw API values to StatusType members."""
+
+STATUS_TYPE_CODES: typing.Final[dict[StatusType, int]] = {
+    StatusType.ONLINE: 0,
+    StatusType.OFFLINE: 1,
+    StatusType.IDLE: 2,
+    StatusType.BUSY: 3,
+}
+"""Mapping of StatusType members to their compact integer code."""
+
+STATUS_TYPE_MEMBERS: typing.Final[tuple[StatusType, ...]] = (
+    StatusType.ONLINE,
+    StatusType.OFFLINE,
+    StatusType.IDLE,
+    StatusType.BUSY,
+)
+"""StatusType members, indexed by their compact integer code."""
+
+
 @attrs.define(kw_only=True, weakref_slot=False)
 class CreatePasswordResetCode:
     """The CreatePasswordResetCode payload.
@@ -149,6 +359,38 @@ class CreatePasswordResetCode:
     email: str = attrs.field()
     """The user's email."""
 
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {"email": ("email", None)}
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"email": (str,)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        return {"email": self.email}
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "CreatePasswordResetCode":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(email=payload["email"])
+
+    @classmethod
+    def _from_trusted(cls, *, email: str) -> "CreatePasswordResetCode":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.email = email
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (CreatePasswordResetCode,), (self.email,))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.email,) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class Status:
@@ -167,6 +409,60 @@ class Status:
     type: StatusType = attrs.field()
     text: str | typing.Literal[undefined.Undefined] = attrs.field(default=undefined.Undefined)
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "type": lambda payload: STATUS_TYPE_VALUES.get(payload["type"])
+        or StatusType(payload["type"]),
+        "text": lambda payload: payload.get("text", undefined.Undefined),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "type": ("type", lambda value: STATUS_TYPE_VALUES.get(value) or StatusType(value)),
+        "text": ("text", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {"type": (StatusType,), "text": (str, undefined.Undefined)}
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {"type": self.type.value}
+        if self.text is not undefined.Undefined:
+            payload["text"] = self.text
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "Status":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            type=STATUS_TYPE_VALUES.get(payload["type"]) or StatusType(payload["type"]),
+            text=payload.get("text", undefined.Undefined),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        type: StatusType,
+        text: str | typing.Literal[undefined.Undefined],
+    ) -> "Status":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.type = type
+        self.text = text
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (copyreg.__newobj__, (Status,), (self.type, self.text))
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (self.type, self.text) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class User:
@@ -241,6 +537,176 @@ class User:
     This is only shown when the user queries their own data.
     """
 
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "id": lambda payload: payload["id"],
+        "username": lambda payload: payload["username"],
+        "display_name": lambda payload: payload.get("display_name", undefined.Undefined),
+        "social_credit": lambda payload: payload["social_credit"],
+        "status": lambda payload: lazy.from_payload(Status, payload["status"]),
+        "bio": lambda payload: payload.get("bio", undefined.Undefined),
+        "avatar": lambda payload: payload.get("avatar", undefined.Undefined),
+        "banner": lambda payload: payload.get("banner", undefined.Undefined),
+        "badges": lambda payload: payload["badges"],
+        "permissions": lambda payload: payload["permissions"],
+        "email": lambda payload: payload.get("email", undefined.Undefined),
+        "verified": lambda payload: payload.get("verified", undefined.Undefined),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _LENGTH_LIMITS: typing.ClassVar[validation.LengthLimits] = {
+        "username": (2, 32, False),
+        "display_name": (2, 32, False),
+        "bio": (0, "bio_limit", False),
+    }
+    """Documented length limits of string fields."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "id": ("id", None),
+        "username": ("username", None),
+        "display_name": ("display_name", None),
+        "social_credit": ("social_credit", None),
+        "status": ("status", lambda value: Status.from_payload(value)),
+        "bio": ("bio", None),
+        "avatar": ("avatar", None),
+        "banner": ("banner", None),
+        "badges": ("badges", None),
+        "permissions": ("permissions", None),
+        "email": ("email", None),
+        "verified": ("verified", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "id": (int,),
+            "username": (str,),
+            "display_name": (str, undefined.Undefined),
+            "social_credit": (int,),
+            "status": (Status,),
+            "bio": (str, undefined.Undefined),
+            "avatar": (int, undefined.Undefined),
+            "banner": (int, undefined.Undefined),
+            "badges": (int,),
+            "permissions": (int,),
+            "email": (str, undefined.Undefined),
+            "verified": (bool, undefined.Undefined),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {
+            "id": self.id,
+            "username": self.username,
+            "social_credit": self.social_credit,
+            "status": self.status.to_payload(),
+            "badges": self.badges,
+            "permissions": self.permissions,
+        }
+        if self.display_name is not undefined.Undefined:
+            payload["display_name"] = self.display_name
+        if self.bio is not undefined.Undefined:
+            payload["bio"] = self.bio
+        if self.avatar is not undefined.Undefined:
+            payload["avatar"] = self.avatar
+        if self.banner is not undefined.Undefined:
+            payload["banner"] = self.banner
+        if self.email is not undefined.Undefined:
+            payload["email"] = self.email
+        if self.verified is not undefined.Undefined:
+            payload["verified"] = self.verified
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "User":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            id=payload["id"],
+            username=payload["username"],
+            display_name=payload.get("display_name", undefined.Undefined),
+            social_credit=payload["social_credit"],
+            status=Status.from_payload(payload["status"]),
+            bio=payload.get("bio", undefined.Undefined),
+            avatar=payload.get("avatar", undefined.Undefined),
+            banner=payload.get("banner", undefined.Undefined),
+            badges=payload["badges"],
+            permissions=payload["permissions"],
+            email=payload.get("email", undefined.Undefined),
+            verified=payload.get("verified", undefined.Undefined),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        id: int,
+        username: str,
+        display_name: str | typing.Literal[undefined.Undefined],
+        social_credit: int,
+        status: Status,
+        bio: str | typing.Literal[undefined.Undefined],
+        avatar: int | typing.Literal[undefined.Undefined],
+        banner: int | typing.Literal[undefined.Undefined],
+        badges: int,
+        permissions: int,
+        email: str | typing.Literal[undefined.Undefined],
+        verified: bool | typing.Literal[undefined.Undefined],
+    ) -> "User":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.id = id
+        self.username = username
+        self.display_name = display_name
+        self.social_credit = social_credit
+        self.status = status
+        self.bio = bio
+        self.avatar = avatar
+        self.banner = banner
+        self.badges = badges
+        self.permissions = permissions
+        self.email = email
+        self.verified = verified
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (User,),
+            (
+                self.id,
+                self.username,
+                self.display_name,
+                self.social_credit,
+                self.status,
+                self.bio,
+                self.avatar,
+                self.banner,
+                self.badges,
+                self.permissions,
+                self.email,
+                self.verified,
+            ),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (
+            self.id,
+            self.username,
+            self.display_name,
+            self.social_credit,
+            self.status,
+            self.bio,
+            self.avatar,
+            self.banner,
+            self.badges,
+            self.permissions,
+            self.email,
+            self.verified,
+        ) = state
+
 
 @attrs.define(kw_only=True, weakref_slot=False)
 class UpdateUserProfile:
@@ -304,3 +770,121 @@ class UpdateUserProfile:
 
     This field has to be a valid file ID in the "banner" bucket.
     """
+
+    _LAZY_DECODERS: typing.ClassVar[lazy.Decoders] = {
+        "display_name": lambda payload: payload.get("display_name", undefined.Undefined),
+        "status": lambda payload: payload.get("status", undefined.Undefined),
+        "status_type": lambda payload: (
+            STATUS_TYPE_VALUES.get(payload["status_type"]) or StatusType(payload["status_type"])
+            if "status_type" in payload
+            else undefined.Undefined
+        ),
+        "bio": lambda payload: payload.get("bio", undefined.Undefined),
+        "avatar": lambda payload: payload.get("avatar", undefined.Undefined),
+        "banner": lambda payload: payload.get("banner", undefined.Undefined),
+    }
+    """Field decoders, used to decode this object lazily."""
+
+    _LENGTH_LIMITS: typing.ClassVar[validation.LengthLimits] = {
+        "display_name": (2, 32, False),
+        "status": (0, 150, False),
+        "bio": (0, "bio_limit", False),
+    }
+    """Documented length limits of string fields."""
+
+    _KEY_SLOTS: typing.ClassVar[partial.KeySlots] = {
+        "display_name": ("display_name", None),
+        "status": ("status", None),
+        "status_type": (
+            "status_type",
+            lambda value: STATUS_TYPE_VALUES.get(value) or StatusType(value),
+        ),
+        "bio": ("bio", None),
+        "avatar": ("avatar", None),
+        "banner": ("banner", None),
+    }
+    """Raw API keys mapped to the attributes they are stored in."""
+
+    @staticmethod
+    def _field_types() -> validation.FieldTypes:
+        """Get the allowed types of every field, used for validation."""
+        return {
+            "display_name": (str, None, undefined.Undefined),
+            "status": (str, None, undefined.Undefined),
+            "status_type": (StatusType, undefined.Undefined),
+            "bio": (str, None, undefined.Undefined),
+            "avatar": (int, None, undefined.Undefined),
+            "banner": (int, None, undefined.Undefined),
+        }
+
+    def to_payload(self) -> dict[str, typing.Any]:
+        """Convert this object into its raw API representation."""
+        payload: dict[str, typing.Any] = {}
+        if self.display_name is not undefined.Undefined:
+            payload["display_name"] = self.display_name
+        if self.status is not undefined.Undefined:
+            payload["status"] = self.status
+        if self.status_type is not undefined.Undefined:
+            payload["status_type"] = self.status_type.value
+        if self.bio is not undefined.Undefined:
+            payload["bio"] = self.bio
+        if self.avatar is not undefined.Undefined:
+            payload["avatar"] = self.avatar
+        if self.banner is not undefined.Undefined:
+            payload["banner"] = self.banner
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: typing.Mapping[str, typing.Any]) -> "UpdateUserProfile":
+        """Create this object from its raw API representation."""
+        return cls._from_trusted(
+            display_name=payload.get("display_name", undefined.Undefined),
+            status=payload.get("status", undefined.Undefined),
+            status_type=STATUS_TYPE_VALUES.get(payload["status_type"])
+            or StatusType(payload["status_type"])
+            if "status_type" in payload
+            else undefined.Undefined,
+            bio=payload.get("bio", undefined.Undefined),
+            avatar=payload.get("avatar", undefined.Undefined),
+            banner=payload.get("banner", undefined.Undefined),
+        )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        *,
+        display_name: str | None | typing.Literal[undefined.Undefined],
+        status: str | None | typing.Literal[undefined.Undefined],
+        status_type: StatusType | typing.Literal[undefined.Undefined],
+        bio: str | None | typing.Literal[undefined.Undefined],
+        avatar: int | None | typing.Literal[undefined.Undefined],
+        banner: int | None | typing.Literal[undefined.Undefined],
+    ) -> "UpdateUserProfile":
+        """Create this object from already decoded values, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self.display_name = display_name
+        self.status = status
+        self.status_type = status_type
+        self.bio = bio
+        self.avatar = avatar
+        self.banner = banner
+        return self
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        """Reduce this object to a compact tuple of its attribute values for pickling."""
+        return (
+            copyreg.__newobj__,
+            (UpdateUserProfile,),
+            (self.display_name, self.status, self.status_type, self.bio, self.avatar, self.banner),
+        )
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        """Restore this object from the state created by ``__reduce__``."""
+        (
+            self.display_name,
+            self.status,
+            self.status_type,
+            self.bio,
+            self.avatar,
+            self.banner,
+        ) = state
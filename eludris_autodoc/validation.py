@@ -0,0 +1,251 @@
+"""This module implements optional validation of payloads before they are sent.
+
+Invalid payloads are otherwise only rejected by the server with a
+``VALIDATION`` error response, which costs a full round-trip. Once enabled
+through :func:`enable`, every generated class checks the types of its fields
+and the length limits documented for them before it is converted into its
+raw API representation. Length limits that depend on the instance, such as
+``message_limit``, are taken from the provided
+:class:`~eludris_autodoc.instance.InstanceInfo`, and are not checked without
+one.
+
+The checks for every class are compiled into a single straight-line function
+that replaces its ``to_payload`` method. :func:`disable` restores the original
+methods, so validation costs nothing while it is disabled.
+"""
+
+import functools
+import types
+import typing
+
+from . import undefined
+
+if typing.TYPE_CHECKING:
+    from . import instance
+
+__all__: typing.Sequence[str] = (
+    "FieldTypes",
+    "LengthLimits",
+    "ListOf",
+    "ValidationError",
+    "disable",
+    "enable",
+    "is_enabled",
+    "validate",
+)
+
+_PayloadT = typing.TypeVar("_PayloadT")
+
+
+class ListOf:
+    """A field type that matches a list of which every item matches one of ``types``."""
+
+    __slots__ = ("types",)
+
+    def __init__(self, *types: object) -> None:
+        self.types = types
+
+
+FieldTypes: typing.TypeAlias = "dict[str, tuple[object, ...]]"
+"""A mapping of attribute names to the types or exact values that attribute may have.
+
+Types are checked with ``isinstance``, :class:`ListOf` checks every item of a
+list, and any other value (``None``, ``Undefined`` and tags) must match exactly.
+Booleans never match ``int``.
+"""
+
+LengthLimits: typing.TypeAlias = "dict[str, tuple[int, int | str | None, bool]]"
+"""A mapping of attribute names to the lower and upper limit of their length.
+
+The upper limit is either a number of characters, the name of the attribute
+of :class:`~eludris_autodoc.instance.InstanceInfo` that holds it, or ``None``
+if there is none. The last value is whether the server trims the attribute
+from leading and trailing whitespace before checking its length.
+"""
+
+
+class ValidationError(ValueError):
+    """Raised when a payload contains a field with an invalid value."""
+
+    def __init__(self, payload: object, field: str, value: object) -> None:
+        self.payload = payload
+        """The payload that failed validation."""
+        self.field = field
+        """The name of the attribute with an invalid value."""
+        self.value = value
+        """The invalid value."""
+
+        super().__init__(f"Invalid value for {type(payload).__name__}.{field}: {value!r}")
+
+
+_ORIGINAL_METHODS: dict[type[typing.Any], typing.Callable[..., typing.Any]] = {}
+
+_ResolvedLimits: typing.TypeAlias = "tuple[tuple[str, int, int | None, bool], ...]"
+_Bind: typing.TypeAlias = "typing.Callable[[object], str]"
+
+
+def _resolve_length_limits(
+    cls: type[typing.Any],
+    instance_info: "instance.InstanceInfo | None",
+) -> _ResolvedLimits:
+    # Upper limits that depend on the instance are looked up on it, and left
+    # out without one.
+    limits: LengthLimits = vars(cls).get("_LENGTH_LIMITS", {})
+    return tuple(
+        (
+            name,
+            lower,
+            getattr(instance_info, upper, None) if isinstance(upper, str) else upper,
+            trimmed,
+        )
+        for name, (lower, upper, trimmed) in limits.items()
+    )
+
+
+def _make_class_condition(value: str, classes: list[object], bind: _Bind) -> str:
+    condition = f"isinstance({value}, ({', '.join(map(bind, classes))},))"
+    if int in classes and bool not in classes:
+        # Booleans are ints as well, but are never valid for int fields.
+        return f"({condition} and {value}.__class__ is not bool)"
+
+    return condition
+
+
+def _make_condition(
+    value: str,
+    field_types: tuple[object, ...],
+    namespace: dict[str, object],
+) -> str:
+    def bind(obj: object) -> str:
+        name = f"_{len(namespace)}"
+        namespace[name] = obj
+        return name
+
+    classes: list[object] = []
+    for type_ in field_types:
+        if isinstance(type_, types.UnionType):
+            classes.extend(typing.get_args(type_))
+
+        elif isinstance(type_, type):
+            classes.append(type_)
+
+    conditions = [_make_class_condition(value, classes, bind)] if classes else []
+    for type_ in field_types:
+        if isinstance(type_, type | types.UnionType):
+            continue
+
+        if type_ is None or type_ is undefined.Undefined:
+            conditions.append(f"{value} is {bind(type_)}")
+
+        elif isinstance(type_, ListOf):
+            item = _make_condition("item", type_.types, namespace)
+            conditions.append(
+                f"(isinstance({value}, (list, tuple)) and all({item} for item in {value}))",
+            )
+
+        else:
+            conditions.append(f"{value} == {bind(type_)}")
+
+    return " or ".join(conditions)
+
+
+def _compile_checks(
+    cls: type[typing.Any],
+    method: typing.Callable[..., typing.Any],
+    length_limits: _ResolvedLimits,
+) -> typing.Callable[..., typing.Any]:
+    # The checks are compiled into a single function without any loops or
+    # lookups, which then calls the provided method.
+    field_types: FieldTypes = cls._field_types()
+    limits = {name: (lower, upper, trimmed) for name, lower, upper, trimmed in length_limits}
+    namespace: dict[str, object] = {"ValidationError": ValidationError, "method": method}
+
+    lines = [f"def {method.__name__}(self):"]
+    for name, allowed in field_types.items():
+        lines.append(f"    value = self.{name}")
+        lines.append(f"    if not ({_make_condition('value', allowed, namespace)}):")
+        lines.append(f"        raise ValidationError(self, {name!r}, value)")
+
+        if name in limits:
+            lower, upper, trimmed = limits[name]
+            length = "len(value.strip())" if trimmed else "len(value)"
+            check = f"{lower} <= {length}" if upper is None else f"{lower} <= {length} <= {upper}"
+            lines.append(f"    if isinstance(value, str) and not {check}:")
+            lines.append(f"        raise ValidationError(self, {name!r}, value)")
+
+    lines.append("    return method(self)")
+
+    exec("\n".join(lines), namespace)  # noqa: S102
+    checked = namespace[method.__name__]
+    assert callable(checked)
+    return checked
+
+
+def _get_validated_classes() -> list[type[typing.Any]]:
+    import eludris_autodoc
+
+    return [
+        obj
+        for obj in vars(eludris_autodoc).values()
+        if isinstance(obj, type) and "_field_types" in vars(obj)
+    ]
+
+
+@functools.lru_cache
+def _compile_validator(
+    cls: type[typing.Any],
+    length_limits: _ResolvedLimits,
+) -> typing.Callable[[typing.Any], typing.Any]:
+    return _compile_checks(cls, _return_none, length_limits)
+
+
+def _return_none(_: object) -> None:
+    return None
+
+
+def is_enabled() -> bool:
+    """Check whether validation is currently enabled."""
+    return bool(_ORIGINAL_METHODS)
+
+
+def enable(instance_info: "instance.InstanceInfo | None" = None) -> None:
+    """Validate all payloads before they are converted into their raw API representation.
+
+    If ``instance_info`` is provided, limits that depend on the instance are
+    checked as well. Calling this again replaces the previously used limits.
+    """
+    disable()
+
+    for cls in _get_validated_classes():
+        method = cls.to_payload
+        _ORIGINAL_METHODS[cls] = method
+        limits = _resolve_length_limits(cls, instance_info)
+        cls.to_payload = _compile_checks(cls, method, limits)
+
+
+def disable() -> None:
+    """Stop validating payloads, restoring the original ``to_payload`` methods."""
+    for cls, method in _ORIGINAL_METHODS.items():
+        cls.to_payload = method
+
+    _ORIGINAL_METHODS.clear()
+
+
+def validate(
+    payload: _PayloadT,
+    *,
+    instance_info: "instance.InstanceInfo | None" = None,
+) -> _PayloadT:
+    """Validate a single payload, regardless of whether validation is enabled.
+
+    This only validates the payload itself, not any nested payloads. Raises a
+    :class:`ValidationError` if any field is invalid, or returns the payload
+    as-is otherwise.
+    """
+    for cls in type(payload).__mro__:
+        # Lazily decoded payloads are instances of a subclass.
+        if "_field_types" in vars(cls):
+            _compile_validator(cls, _resolve_length_limits(cls, instance_info))(payload)
+            break
+
+    return payload
@@ -5,10 +5,13 @@
 import argparse
 import asyncio
 import importlib
+import pathlib
+import typing
 
 import aiohttp
+import libcst
 
-from codegen import gen
+from codegen import examples, gen, profiling, routes, utils
 
 
 def _check_import(*, version: str | None = None) -> bool:
@@ -25,27 +28,204 @@ def _check_import(*, version: str | None = None) -> bool:
     return False
 
 
-async def _main() -> None:
+def _make_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("-f", "--force", action="store_true", dest="force")
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=typing.get_args(gen.Backend),
+        default="attrs",
+        help="the kind of classes to generate (default: attrs)",
+    )
+    parser.add_argument(
+        "--emitter",
+        choices=typing.get_args(gen.Emitter),
+        default="libcst",
+        help="how to emit the code of the attrs backend (default: libcst)",
+    )
+    parser.add_argument(
+        "-t",
+        "--target",
+        type=pathlib.Path,
+        default=gen.TARGET_DIR,
+        help="the directory to write the generated package to (default: eludris_autodoc)",
+    )
+    parser.add_argument(
+        "-r",
+        "--root",
+        nargs="+",
+        dest="roots",
+        metavar="TYPE",
+        help=(
+            "only generate these types, e.g. gateway.ServerPayload, and the types they depend on;"
+            " requires --target"
+        ),
+    )
+    parser.add_argument(
+        "-e",
+        "--examples",
+        type=pathlib.Path,
+        default=examples.EXAMPLES_PATH,
+        help="the file to write the docs' JSON examples to (default: benchmarks/examples.json)",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        type=pathlib.Path,
+        nargs="?",
+        const=pathlib.Path("autodoc-profile.json"),
+        help="profile every stage and item into a Chrome trace (default: autodoc-profile.json)",
+    )
+    return parser
+
+
+def _shake(
+    items: dict[str, utils.AutodocItem],
+    route_infos: list[utils.RouteInfo],
+    roots: typing.Iterable[str],
+    *,
+    profiler: profiling.Profiler | None,
+) -> tuple[dict[str, utils.AutodocItem], list[utils.RouteInfo]]:
+    with profiling.optional_span(profiler, "shake"):
+        items = gen.shake_items(items, roots)
+        # Routes can only be generated along with the types they use.
+        return items, [
+            route_info
+            for route_info in route_infos
+            if routes.get_route_dependencies(route_info) <= items.keys()
+        ]
+
+
+def _render_modules(
+    items: dict[str, utils.AutodocItem],
+    route_infos: list[utils.RouteInfo],
+    *,
+    version: str,
+    profiler: profiling.Profiler | None,
+) -> tuple[dict[str, str], dict[str, str]]:
+    with profiling.optional_span(profiler, "render"):
+        modules = gen.render_module_sources(items, profiler=profiler)
+        raw_modules = gen.render_module_sources(items, raw=True, profiler=profiler)
+
+    with profiling.optional_span(profiler, "init"):
+        modules["__init__"] = gen.render_init_module(modules, version=version)
+        raw_modules["__init__"] = gen.render_raw_init_module(raw_modules)
+
+    # The routes module is not imported by the __init__ module.
+    with profiling.optional_span(profiler, "routes"):
+        modules[routes.ROUTES_MODULE] = routes.render_routes_module(route_infos, cache=items)
+
+    return modules, raw_modules
+
+
+def _make_modules(
+    items: dict[str, utils.AutodocItem],
+    route_infos: list[utils.RouteInfo],
+    *,
+    version: str,
+    backend: gen.Backend,
+    profiler: profiling.Profiler | None,
+) -> tuple[dict[str, libcst.Module], dict[str, libcst.Module]]:
+    with profiling.optional_span(profiler, "parse"):
+        gen.parse_items(items, backend=backend, profiler=profiler)
+
+    with profiling.optional_span(profiler, "collect"):
+        modules = gen.collect_module_items(items, backend=backend)
+        raw_modules = gen.collect_module_items(items, raw=True)
+
+    with profiling.optional_span(profiler, "init"):
+        modules["__init__"] = gen.make_init_module(modules, version=version, backend=backend)
+        raw_modules["__init__"] = gen.make_raw_init_module(raw_modules)
+
+    with profiling.optional_span(profiler, "routes"):
+        modules[routes.ROUTES_MODULE] = routes.make_routes_module(route_infos, cache=items)
+
+    return modules, raw_modules
+
+
+def _write_examples(
+    items: dict[str, utils.AutodocItem],
+    *,
+    version: str,
+    path: pathlib.Path,
+    profiler: profiling.Profiler | None,
+) -> None:
+    with profiling.optional_span(profiler, "examples"):
+        valid_examples, invalid_examples = examples.extract_examples(items.values())
+        examples.write_examples(valid_examples, invalid_examples, version=version, path=path)
+
+    for example in invalid_examples:
+        print(f"Invalid example for {example['name']}: {example['error']}")
+
 
+async def _main() -> None:
+    parser = _make_parser()
     args = parser.parse_args()
+    if args.emitter == "templates" and args.backend != "attrs":
+        parser.error("the templates emitter only supports the attrs backend")
+
+    # The up-to-date check only applies to the eludris-autodoc package itself.
+    in_place = args.target.resolve() == gen.TARGET_DIR.resolve()
+    if args.roots and in_place:
+        # The runtime modules of the package itself use types that may be left out.
+        parser.error("--root requires a --target other than the eludris-autodoc package")
+
+    profiler = profiling.Profiler() if args.profile else None
 
     async with aiohttp.ClientSession() as session:
-        version, items = await gen.fetch_index(session=session)
+        with profiling.optional_span(profiler, "fetch_index"):
+            version, items = await gen.fetch_index(session=session)
 
-        if not args.force and _check_import(version=version):
+        if in_place and not args.force and _check_import(version=version):
             return
 
         print("Regenerating autodoc types...")
-        items = await gen.fetch_items(items, session=session)
-
-    parsed = gen.parse_items(items)
-    modules = gen.collect_module_items(parsed)
-    modules["__init__"] = gen.make_init_module(modules, version=version)
-
-    gen.write_modules(modules)
-    _check_import()
+        with profiling.optional_span(profiler, "fetch_routes"):
+            route_infos = await gen.fetch_routes(items, session=session)
+
+        with profiling.optional_span(profiler, "fetch_items"):
+            items = await gen.fetch_items(items, session=session)
+
+    if args.roots:
+        try:
+            items, route_infos = _shake(items, route_infos, args.roots, profiler=profiler)
+
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    modules: typing.Mapping[str, libcst.Module | str]
+    raw_modules: typing.Mapping[str, libcst.Module | str]
+    if args.emitter == "templates":
+        modules, raw_modules = _render_modules(
+            items,
+            route_infos,
+            version=version,
+            profiler=profiler,
+        )
+
+    else:
+        modules, raw_modules = _make_modules(
+            items,
+            route_infos,
+            version=version,
+            backend=args.backend,
+            profiler=profiler,
+        )
+
+    gen.write_modules(modules, raw_modules, target_dir=args.target, profiler=profiler)
+    if not in_place and args.backend == "attrs":
+        gen.copy_runtime_modules(args.target)
+
+    _write_examples(items, version=version, path=args.examples, profiler=profiler)
+
+    if profiler:
+        print(profiler.format_summary())
+        profiler.write_trace(args.profile)
+        print(f"Wrote profile to {args.profile}")
+
+    if in_place:
+        _check_import()
 
 
 def _sync_main() -> None:
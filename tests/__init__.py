@@ -0,0 +1 @@
+"""Tests for eludris-autodoc code-gen and its runtime modules."""
@@ -0,0 +1,47 @@
+"""Test the package generated by the msgspec backend against the gateway corpus."""
+
+import json
+import sys
+import typing
+
+import pytest
+
+from benchmarks import backends
+from benchmarks.emitters import load_items, resolve_items
+from codegen import gen
+from eludris_autodoc import gateway
+
+pytest.importorskip("msgspec")
+
+
+@pytest.fixture(scope="module")
+def codec(tmp_path_factory: pytest.TempPathFactory) -> typing.Iterator[backends.Codec]:
+    """Generate the msgspec package from the item snapshot, and make its codec."""
+    version, item_infos = load_items()
+    items = gen.parse_items(resolve_items(item_infos), backend="msgspec")
+    modules = gen.collect_module_items(items, backend="msgspec")
+    modules["__init__"] = gen.make_init_module(modules, version=version, backend="msgspec")
+
+    path = tmp_path_factory.mktemp("eludris_autodoc_msgspec")
+    for name, module in modules.items():
+        (path / f"{name}.py").write_text(module.code)
+
+    codec = backends.make_msgspec_codec(path)
+    yield codec
+    for name in [name for name in sys.modules if name.startswith("eludris_autodoc_msgspec")]:
+        del sys.modules[name]
+
+
+def test_round_trip(codec: backends.Codec) -> None:
+    """Every frame of the corpus is decoded and encoded back into the same payload."""
+    decode, encode = codec
+    for frame in backends.CORPUS:
+        assert json.loads(encode(decode(frame))) == json.loads(frame)
+
+
+def test_matches_attrs(codec: backends.Codec) -> None:
+    """Payloads encoded by the msgspec package match those of the attrs package."""
+    decode, _ = codec
+    for frame in backends.CORPUS:
+        expected = gateway.decode_server_payload(json.loads(frame)).to_payload()
+        assert decode(frame).to_payload() == expected
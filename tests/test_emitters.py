@@ -0,0 +1,72 @@
+"""Test that the libcst and string-template emitters render identical modules."""
+
+import pytest
+
+from benchmarks import emitters
+from codegen import utils
+
+
+def _field(name: str, field_type: str, *, omittable: bool = False) -> utils.FieldInfo:
+    return {
+        "name": name,
+        "doc": None,
+        "type": field_type,
+        "nullable": False,
+        "omittable": omittable,
+        "flattened": False,
+    }
+
+
+# The item snapshot has no untagged enum, so one is added to the sessions module.
+UNTAGGED_ENUM: utils.ItemInfo = {
+    "name": "SessionLogin",
+    "doc": "The ways a session can be logged into.",
+    "category": "Sessions",
+    "hidden": False,
+    "package": "todel",
+    "item": {
+        "type": "enum",
+        "tag": None,
+        "untagged": True,
+        "content": None,
+        "variants": [
+            {
+                "type": "object",
+                "name": "Password",
+                "doc": "Log in with a password.",
+                "fields": [
+                    _field("identifier", "String"),
+                    _field("password", "String"),
+                    _field("platform", "String", omittable=True),
+                ],
+            },
+            {
+                "type": "object",
+                "name": "Token",
+                "doc": "Log in with the token of an existing session.",
+                "fields": [_field("token", "String"), _field("session", "Session")],
+            },
+            {
+                "type": "object",
+                "name": "Code",
+                "doc": "Log in with a password reset code.",
+                "fields": [_field("code", "u32"), _field("email", "String")],
+            },
+        ],
+    },
+}
+
+
+@pytest.mark.parametrize("extra_items", [[], [UNTAGGED_ENUM]], ids=["snapshot", "untagged"])
+def test_emitters_match(extra_items: list[utils.ItemInfo]) -> None:
+    """Both emitters render every module of the item snapshot identically."""
+    version, item_infos = emitters.load_items()
+    item_infos.extend(extra_items)
+
+    # Items are resolved for every emitter, as parsing stores CST on them.
+    expected = emitters.emit_libcst(emitters.resolve_items(item_infos), version=version)
+    actual = emitters.emit_templates(emitters.resolve_items(item_infos), version=version)
+
+    assert emitters.get_mismatches(expected, actual) == []
+    if extra_items:
+        assert "def decode_session_login(" in expected[0]["sessions"]
@@ -0,0 +1,25 @@
+"""Test decoding the members of unit enums through their lookup tables."""
+
+import pytest
+
+from eludris_autodoc import lazy, partial, users
+
+
+@pytest.mark.parametrize("member", list(users.StatusType))
+def test_known_value(member: users.StatusType) -> None:
+    """Known values decode to the member of the same value."""
+    assert users.Status.from_payload({"type": member.value}).type is member
+
+
+def test_unknown_value() -> None:
+    """Unknown values raise a ValueError, like the enum itself does."""
+    with pytest.raises(ValueError, match="'nope' is not a valid StatusType"):
+        users.Status.from_payload({"type": "nope"})
+
+    status = users.Status.from_payload({"type": "ONLINE"})
+    with pytest.raises(ValueError, match="is not a valid StatusType"):
+        partial.update(status, {"type": "nope"})
+
+    status = lazy.from_payload(users.Status, {"type": "nope"})
+    with pytest.raises(ValueError, match="is not a valid StatusType"):
+        _ = status.type
@@ -0,0 +1,57 @@
+"""Test recording gateway frames to an event log and replaying them."""
+
+import json
+import pathlib
+import typing
+
+from eludris_autodoc import eventlog
+
+FRAMES: typing.Final[tuple[dict[str, typing.Any], ...]] = (
+    {"op": "PONG"},
+    {"op": "RATE_LIMIT", "d": {"wait": 1010}},
+    {"op": "PONG"},
+    {"op": "RATE_LIMIT", "d": {"wait": 2020}},
+)
+
+
+def _write(path: pathlib.Path, frames: typing.Iterable[dict[str, typing.Any]]) -> None:
+    with eventlog.EventLogWriter(path) as writer:
+        for timestamp, frame in enumerate(frames, 1):
+            writer.append(frame["op"], json.dumps(frame).encode(), timestamp=timestamp)
+
+
+def _replay(
+    path: pathlib.Path,
+    *,
+    ops: typing.Collection[str] | None = None,
+    since: int = 0,
+    until: int = 2**63 - 1,
+) -> list[dict[str, typing.Any]]:
+    with eventlog.EventLog.open(path) as log:
+        return [payload.to_payload() for payload in log.replay(ops=ops, since=since, until=until)]
+
+
+def test_replay(tmp_path: pathlib.Path) -> None:
+    """Appended frames are replayed in order, optionally only those with some ops."""
+    path = tmp_path / "events.log"
+    _write(path, FRAMES)
+
+    assert _replay(path) == list(FRAMES)
+    assert _replay(path, ops={"RATE_LIMIT"}) == [FRAMES[1], FRAMES[3]]
+    assert _replay(path, since=2, until=3) == list(FRAMES[1:3])
+
+
+def test_lost_tail(tmp_path: pathlib.Path) -> None:
+    """Index entries of events that did not reach the disk are dropped on recovery."""
+    path = tmp_path / "events.log"
+    _write(path, FRAMES)
+    # A crash lost the end of the log, but not the index entry covering it.
+    size = path.stat().st_size
+    with path.open("r+b") as file:
+        file.truncate(size - 4)
+
+    assert _replay(path) == list(FRAMES[:3])
+
+    _write(path, FRAMES[:1])
+    assert path.stat().st_size < size
+    assert _replay(path) == [*FRAMES[:3], FRAMES[0]]
@@ -0,0 +1,53 @@
+"""Round-trip every JSON example from the eludris-autodoc docs through its generated class."""
+
+import json
+import typing
+
+import pytest
+
+from benchmarks import examples
+
+FIXTURES: typing.Final[dict[str, typing.Any]] = json.loads(examples.EXAMPLES_PATH.read_text())
+
+STALE: typing.Final[frozenset[str]] = frozenset(
+    (
+        "AuthenticatedServerPayload",
+        "InstanceInfo",
+        "InstanceRateLimits",
+        "MessageCreateServerPayload",
+        "OprishRateLimits",
+        "PresenceUpdateServerPayload",
+        "Session",
+        "SessionCreated",
+        "UserUpdateServerPayload",
+    ),
+)
+"""Items whose examples no longer match the API they document."""
+
+INVALID: typing.Final[frozenset[str]] = frozenset(("FileMetadata", "Message", "UserCreate"))
+"""Items whose docs have examples that are not valid JSON."""
+
+
+@pytest.mark.parametrize(
+    "example",
+    [
+        pytest.param(
+            example,
+            id=example["name"],
+            marks=[pytest.mark.xfail(reason="stale example", strict=True)]
+            if example["name"] in STALE
+            else [],
+        )
+        for example in FIXTURES["examples"]
+    ],
+)
+def test_round_trip(example: dict[str, typing.Any]) -> None:
+    """Examples decode and encode into exactly the same payload again."""
+    decode = examples.resolve_decoder(example["decoder"])
+
+    assert examples.check_round_trip(decode, example["payload"]) is None
+
+
+def test_invalid_examples() -> None:
+    """Only the known invalid examples fail to parse."""
+    assert {example["name"] for example in FIXTURES["invalid"]} == INVALID
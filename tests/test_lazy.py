@@ -0,0 +1,65 @@
+"""Test fields that are only decoded on first access."""
+
+import ipaddress
+import pickle
+import typing
+
+import pytest
+
+from eludris_autodoc import lazy, sessions, validation
+
+SESSION: typing.Final[dict[str, typing.Any]] = {
+    "id": 2312155037697,
+    "user_id": 2312155693057,
+    "platform": "linux",
+    "client": "pilfer",
+    "ip": "127.0.0.1",
+}
+
+
+def _make_session(ip: typing.Any) -> sessions.Session:  # noqa: ANN401
+    kwargs = {key: value for key, value in SESSION.items() if key != "ip"}
+    return sessions.Session(**kwargs, ip=ip)
+
+
+def test_decoded_on_first_access() -> None:
+    """A decoded field is parsed on first access, and equal addresses are shared."""
+    session = sessions.Session.from_payload(SESSION)
+    assert session._lazy_raw == {"ip": "127.0.0.1"}  # noqa: SLF001
+
+    assert session.ip == ipaddress.IPv4Address("127.0.0.1")
+    assert session._lazy_raw == {}  # noqa: SLF001
+    assert session.ip is sessions.Session.from_payload(SESSION).ip
+    assert session.to_payload() == SESSION
+
+
+def test_public_field() -> None:
+    """A lazy field behaves like any other field to users of the class."""
+    address = ipaddress.IPv4Address("127.0.0.1")
+    session = _make_session(address)
+    assert session == sessions.Session.from_payload(SESSION)
+    assert repr(session) == repr(sessions.Session.from_payload(SESSION))
+    assert "ip=IPv4Address('127.0.0.1')" in repr(session)
+
+    session.ip = ipaddress.IPv6Address("::1")
+    assert session.ip == ipaddress.IPv6Address("::1")
+    assert pickle.loads(pickle.dumps(session)) == session  # noqa: S301
+
+    decoded = sessions.Session.from_payload(SESSION)
+    decoded.ip = address
+    assert decoded.ip is address
+
+
+def test_validation() -> None:
+    """Only decoded addresses are valid values of a lazy field."""
+    assert validation.validate(sessions.Session.from_payload(SESSION))
+    with pytest.raises(validation.ValidationError):
+        validation.validate(_make_session("not-an-ip"))
+
+
+def test_nested() -> None:
+    """Lazy fields of lazily decoded objects are decoded on first access as well."""
+    payload = {"token": "", "session": SESSION}
+    created = lazy.from_payload(sessions.SessionCreated, payload)
+    assert created.session.ip == ipaddress.IPv4Address("127.0.0.1")
+    assert created == sessions.SessionCreated.from_payload(payload)
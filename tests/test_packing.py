@@ -0,0 +1,39 @@
+"""Test packing payloads into the binary format passed between services."""
+
+import json
+
+import pytest
+
+from benchmarks import backends
+from benchmarks.synthetic import PayloadGenerator
+from eludris_autodoc import gateway, messaging, packing, sessions, users
+
+pytest.importorskip("msgpack")
+
+
+def test_round_trip() -> None:
+    """Every frame of the gateway corpus is serialized and loaded back unchanged."""
+    for frame in backends.CORPUS:
+        payload = gateway.decode_server_payload(json.loads(frame))
+        data = packing.dumps(payload, gateway.ServerPayload)
+
+        assert packing.loads(gateway.ServerPayload, data) == payload
+
+
+@pytest.mark.parametrize("cls", [messaging.MessageCreate, users.User, sessions.Session])
+def test_synthetic_round_trip(cls: type[object]) -> None:
+    """Synthetic payloads, with omitted and null fields, are loaded back unchanged."""
+    generator = PayloadGenerator(seed=1)
+    for _ in range(100):
+        payload = generator.generate(cls)
+        assert packing.loads(cls, packing.dumps(payload)) == payload
+
+
+def test_schema_mismatch() -> None:
+    """Loading a payload with another layout than it was serialized with raises."""
+    data = packing.dumps(users.User.from_payload(backends.USER))
+    with pytest.raises(packing.SchemaMismatchError) as exc_info:
+        packing.loads(messaging.Message, data)
+
+    assert exc_info.value.received == packing.fingerprint(users.User)
+    assert exc_info.value.expected == packing.fingerprint(messaging.Message)
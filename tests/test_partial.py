@@ -0,0 +1,65 @@
+"""Test generic decoding of payloads through the key slots of generated classes."""
+
+import typing
+
+import pytest
+
+from eludris_autodoc import gateway, partial
+
+INSTANCE_INFO: typing.Final[dict[str, typing.Any]] = {
+    "instance_name": "EmreLand",
+    "description": "More based than Oliver's instance (trust)",
+    "version": "0.3.3",
+    "message_limit": 2048,
+    "oprish_url": "https://example.com",
+    "pandemonium_url": "https://example.com",
+    "effis_url": "https://example.com",
+    "file_size": 20000000,
+    "attachment_file_size": 100000000,
+}
+USER: typing.Final[dict[str, typing.Any]] = {
+    "id": 48615849987333,
+    "username": "yendri",
+    "social_credit": 42,
+    "status": {"type": "ONLINE"},
+    "badges": 0,
+    "permissions": 0,
+}
+STATUS: typing.Final[dict[str, typing.Any]] = {"type": "IDLE", "text": "ayúdame por favor"}
+
+FRAMES: typing.Final[tuple[dict[str, typing.Any], ...]] = (
+    {"op": "PONG"},
+    {"op": "RATE_LIMIT", "d": {"wait": 1010}},
+    {
+        "op": "HELLO",
+        "d": {
+            "heartbeat_interval": 45000,
+            "instance_info": INSTANCE_INFO,
+            "rate_limit": {"reset_after": 10, "limit": 5},
+        },
+    },
+    {"op": "AUTHENTICATED", "d": {"user": USER, "users": [USER]}},
+    {"op": "USER_UPDATE", "d": USER},
+    {"op": "PRESENCE_UPDATE", "d": {"user_id": USER["id"], "status": STATUS}},
+    {"op": "MESSAGE_CREATE", "d": {"author": USER, "content": "Woo!"}},
+)
+"""Gateway frames as they are sent by the server."""
+
+
+@pytest.mark.parametrize("frame", FRAMES, ids=[frame["op"] for frame in FRAMES])
+def test_decode_server_frame(frame: dict[str, typing.Any]) -> None:
+    """Frames decode into the same objects as through their generated decoder."""
+    expected = gateway.decode_server_payload(frame)
+
+    assert partial.decode(type(expected), frame) == expected
+
+
+def test_update_adjacently_tagged_content() -> None:
+    """Keys nested in the content of a frame are applied onto an existing object."""
+    presence = gateway.decode_server_payload(FRAMES[5])
+    assert isinstance(presence, gateway.PresenceUpdateServerPayload)
+
+    partial.update(presence, {"d": {"status": {"type": "BUSY"}}})
+
+    assert presence.user_id == USER["id"]
+    assert presence.status.type == "BUSY"
@@ -0,0 +1,222 @@
+"""Test requesting the generated routes from a local HTTP stand-in for Oprish and Effis."""
+
+import asyncio
+import json
+import sys
+import typing
+
+import pytest
+
+from benchmarks import routes
+from benchmarks.emitters import load_items, resolve_items
+from benchmarks.synthetic import PayloadGenerator, resolve
+from codegen import routes as codegen_routes
+from codegen import utils
+from eludris_autodoc import rest
+
+_Table = typing.Mapping[str, rest.Route[typing.Any, typing.Any]]
+
+QUERY_PARAMS: typing.Final[dict[str, object]] = {"rate_limits": True, "code": 234567}
+CREATE_THING: typing.Final[rest.Route[typing.Any, typing.Any]] = rest.Route(
+    name="create_thing",
+    service="oprish",
+    method="POST",
+    path="/things",
+)
+
+
+def _encode(value: object) -> object:
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+
+    to_payload = getattr(value, "to_payload", None)
+    return to_payload() if to_payload else value
+
+
+@pytest.fixture(scope="module")
+def items() -> dict[str, utils.AutodocItem]:
+    """Load the items of the item snapshot."""
+    _, item_infos = load_items()
+    return resolve_items(item_infos)
+
+
+@pytest.fixture(scope="module")
+def table(
+    items: dict[str, utils.AutodocItem],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> typing.Iterator[_Table]:
+    """Import the routes module rendered from the route items of the snapshot."""
+    source = codegen_routes.render_routes_module(routes.load_routes(), cache=items)
+    module = routes.import_routes(source, tmp_path_factory.mktemp("routes"))
+    yield module.ROUTES
+    del sys.modules[module.__name__]
+
+
+@pytest.fixture(scope="module")
+def responses(
+    table: _Table,
+    items: dict[str, utils.AutodocItem],
+) -> dict[str, tuple[typing.Any, typing.Any]]:
+    """Make the response of every route, along with the payload it holds."""
+    return routes.make_responses(table, items, PayloadGenerator(seed=0))
+
+
+@pytest.fixture(scope="module")
+def server(
+    table: _Table,
+    responses: dict[str, tuple[typing.Any, typing.Any]],
+) -> typing.Iterator[routes.StandIn]:
+    """Serve every route from a stand-in."""
+    server = routes.serve(table, responses)
+    yield server
+    server.shutdown()
+
+
+async def _request(
+    url: str,
+    route: rest.Route[typing.Any, typing.Any],
+    body: object = None,
+    **params: object,
+) -> object:
+    async with rest.Client(oprish_url=url, effis_url=url, token="token") as client:  # noqa: S106
+        return await client.request(route, body, **params)
+
+
+def test_emitters_match(items: dict[str, utils.AutodocItem]) -> None:
+    """Both emitters render the routes module identically."""
+    route_infos = routes.load_routes()
+    source = codegen_routes.render_routes_module(route_infos, cache=items)
+    assert codegen_routes.make_routes_module(route_infos, cache=items).code == source
+
+
+@pytest.mark.parametrize("name", [route_info["name"] for route_info in routes.load_routes()])
+def test_route(
+    name: str,
+    table: _Table,
+    items: dict[str, utils.AutodocItem],
+    responses: dict[str, tuple[typing.Any, typing.Any]],
+    server: routes.StandIn,
+) -> None:
+    """A route sends its body and parameters, and decodes its response."""
+    route = table[name]
+    body = None
+    if route.body_type:
+        category = items[route.body_type].category
+        body = PayloadGenerator(seed=0).generate(resolve(f"{category}.{route.body_type}"))
+
+    params = {
+        param: value
+        for param, value in (*routes.PATH_PARAMS.items(), *QUERY_PARAMS.items())
+        if param in route.path_params or param in route.query_params
+    }
+    response = asyncio.run(_request(server.url, route, body, **params))
+
+    method, target, data = server.requests[-1]
+    assert (method, target) == (route.method, route.format_target(params))
+    assert (json.loads(data) if data else None) == (body and body.to_payload())
+    assert _encode(response) == responses[name][1]
+
+
+def test_error_status(table: _Table, server: routes.StandIn) -> None:
+    """An error status raises with the decoded payload of the response."""
+    with pytest.raises(rest.HTTPError) as exc_info:
+        asyncio.run(_request(server.url, table["get_user"], identifier="missing"))
+
+    assert exc_info.value.status == routes.NOT_FOUND.status
+    assert exc_info.value.payload["type"] == "NOT_FOUND"
+
+
+async def _request_twice(
+    replies: typing.Sequence[tuple[bytes, bool]],
+    requests: list[tuple[int, bytes]],
+) -> None:
+    # The server answers every request with the next reply, and closes the
+    # connection after every reply that does not keep it open. Requests are
+    # recorded along with the number of the connection they were sent over.
+    connections = 0
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal connections
+        connections += 1
+        connection, keep_open = connections, True
+        while keep_open:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+
+            except asyncio.IncompleteReadError:
+                break
+
+            length = int(head.partition(b"Content-Length: ")[2].partition(b"\r\n")[0] or 0)
+            requests.append((connection, head + await reader.readexactly(length)))
+            reply, keep_open = replies[len(requests) - 1]
+            writer.write(reply)
+            await writer.drain()
+
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    try:
+        async with rest.Client(oprish_url=url) as client:
+            await client.request(CREATE_THING, {"n": 1})
+            # Give the server time to close the connection, if it does.
+            await asyncio.sleep(0.05)
+            await client.request(CREATE_THING, {"n": 2})
+
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_stale_connection_is_retried() -> None:
+    """A request over an idle connection the server closed is sent over a new one."""
+    requests: list[tuple[int, bytes]] = []
+    reply = b"HTTP/1.1 204 No Content\r\n\r\n"
+    asyncio.run(_request_twice([(reply, False), (reply, False)], requests))
+
+    assert [connection for connection, _ in requests] == [1, 2]
+    assert requests[1][1].endswith(b'{"n":2}')
+
+
+def test_truncated_response_is_not_retried() -> None:
+    """A request is not sent again once any byte of its response was read."""
+    requests: list[tuple[int, bytes]] = []
+    reply = b"HTTP/1.1 204 No Content\r\n\r\n"
+    truncated = b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n{}"
+    with pytest.raises(asyncio.IncompleteReadError):
+        asyncio.run(_request_twice([(reply, True), (truncated, False), (reply, False)], requests))
+
+    assert [connection for connection, _ in requests] == [1, 1]
+
+
+async def _request_stalled(closed: asyncio.Event) -> None:
+    # The server reads the request but never answers it, and records when the
+    # client closes the connection.
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readuntil(b"\r\n\r\n")
+        await reader.read()
+        closed.set()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    try:
+        async with rest.Client(oprish_url=url, timeout=0.05) as client:
+            try:
+                await client.request(CREATE_THING, {"n": 1})
+
+            finally:
+                await asyncio.wait_for(closed.wait(), 1)
+
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_stalled_response_times_out() -> None:
+    """A request the server never answers times out, and its connection is closed."""
+    closed = asyncio.Event()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(_request_stalled(closed))
+
+    assert closed.is_set()
@@ -0,0 +1,117 @@
+"""Test the decision trees of untagged enum decoders against synthetic schemas."""
+
+import typing
+
+from codegen import cst, utils
+
+_Decoder = typing.Callable[[typing.Mapping[str, typing.Any]], str]
+
+
+def _field(
+    name: str,
+    field_type: str,
+    *,
+    nullable: bool = False,
+    omittable: bool = False,
+) -> utils.FieldInfo:
+    return {
+        "name": name,
+        "doc": None,
+        "type": field_type,
+        "nullable": nullable,
+        "omittable": omittable,
+        "flattened": False,
+    }
+
+
+class _Variant:
+    """Stands in for a generated variant class, which decodes payloads with all required keys."""
+
+    def __init__(self, name: str, fields: typing.Sequence[utils.FieldInfo]) -> None:
+        self.name = name
+        self.required = {field["name"] for field in fields if not field["omittable"]}
+
+    def from_payload(self, payload: typing.Mapping[str, typing.Any]) -> str:
+        missing = self.required - payload.keys()
+        if missing:
+            raise KeyError(min(missing))
+
+        return self.name
+
+
+def _make_decoder(*variants: tuple[str, list[utils.FieldInfo]]) -> tuple[_Decoder, str]:
+    item: utils.EnumItem = {
+        "type": "enum",
+        "tag": None,
+        "untagged": True,
+        "content": None,
+        "variants": [
+            {"type": "object", "name": name, "doc": None, "fields": fields}
+            for name, fields in variants
+        ],
+    }
+    item_info: utils.ItemInfo = {
+        "name": "Thing",
+        "doc": None,
+        "category": "things",
+        "hidden": False,
+        "package": "todel",
+        "item": item,
+    }
+    names = [name for name, _ in variants]
+    source = cst.make_untagged_decoder_source(item_info, item, names, cache={})
+
+    namespace: dict[str, typing.Any] = {"typing": typing, "Thing": str}
+    namespace.update((name, _Variant(name, fields)) for name, fields in variants)
+    exec(source, namespace)  # noqa: S102
+    return namespace["decode_thing"], source
+
+
+def test_nullable_key() -> None:
+    """A variant that only differs by a nullable key decodes without recursing forever."""
+    decode, _ = _make_decoder(
+        ("A", [_field("x", "u32", nullable=True)]),
+        ("B", [_field("x", "u32")]),
+    )
+
+    assert decode({"x": None}) == "A"
+    assert decode({"x": 1}) == "A"
+
+
+def test_omittable_key_in_one_variant() -> None:
+    """A variant that only adds an omittable key is tried in order with the others."""
+    decode, source = _make_decoder(
+        ("A", [_field("x", "u32"), _field("y", "String", omittable=True)]),
+        ("B", [_field("x", "u32")]),
+    )
+
+    assert "try:" in source
+    assert decode({"x": 1, "y": "yendri"}) == "A"
+    assert decode({"x": 1}) == "A"
+
+
+def test_split_on_key_presence() -> None:
+    """Variants with different required keys are told apart by key presence alone."""
+    decode, source = _make_decoder(
+        ("A", [_field("id", "u64"), _field("name", "String", omittable=True)]),
+        ("B", [_field("id", "u64"), _field("size", "u32")]),
+    )
+
+    assert "try:" not in source
+    assert decode({"id": 1}) == "A"
+    assert decode({"id": 1, "name": "yendri"}) == "A"
+    assert decode({"id": 1, "size": 2}) == "B"
+
+
+def test_split_on_value_kind() -> None:
+    """Variants with the same keys are told apart by the kinds of their values."""
+    decode, source = _make_decoder(
+        ("Text", [_field("value", "String")]),
+        ("Number", [_field("value", "u32")]),
+        ("Flag", [_field("value", "bool")]),
+    )
+
+    assert "try:" not in source
+    assert decode({"value": "yendri"}) == "Text"
+    assert decode({"value": 1}) == "Number"
+    assert decode({"value": True}) == "Flag"
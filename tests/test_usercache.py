@@ -0,0 +1,75 @@
+"""Test the user cache shared between processes."""
+
+import multiprocessing
+import threading
+import typing
+
+from eludris_autodoc import usercache, users
+
+USER: typing.Final[dict[str, typing.Any]] = {
+    "id": 48615849987333,
+    "username": "yendri",
+    "social_credit": 0,
+    "status": {"type": "ONLINE"},
+    "badges": 0,
+    "permissions": 0,
+}
+READS = 200_000
+
+
+def _make_user(value: int) -> users.User:
+    # Every update sets several fields to the same value, so a torn read shows
+    # up as fields that differ.
+    payload = dict(USER, social_credit=value, badges=value, permissions=value)
+    return users.User.from_payload(payload)
+
+
+def _count_torn_reads(name: str, ready: threading.Event) -> int:
+    cache = usercache.SharedUserCache.attach(name)
+    view = cache.get(USER["id"])
+    assert view is not None
+    ready.set()
+    torn = 0
+    for _ in range(READS):
+        user = view.to_user()
+        torn += not user.social_credit == user.badges == user.permissions
+
+    del view
+    cache.close()
+    return torn
+
+
+def test_round_trip() -> None:
+    """A user is read back as it was set, also through a copy of the table."""
+    with usercache.SharedUserCache.create(capacity=4) as cache:
+        user = users.User.from_payload(dict(USER, display_name="Nicolas", bio="hi"))
+        cache.set(user)
+        table = usercache.UserTable(memoryview(cache.to_bytes()))
+        view = table.get(user.id)
+
+        assert view is not None
+        assert view.to_user() == user
+        assert table.get(user.id + 1) is None
+        cache.unlink()
+
+
+def test_concurrent_writer() -> None:
+    """A reader in another process never observes a partially updated user."""
+    context = multiprocessing.get_context("spawn")
+    with usercache.SharedUserCache.create(capacity=4) as cache, context.Manager() as manager:
+        cache.set(_make_user(0))
+        ready = manager.Event()
+        with context.Pool(1) as pool:
+            result = pool.apply_async(_count_torn_reads, (cache.name, ready))
+            ready.wait()
+            value = 0
+            while not result.ready():
+                value += 1
+                cache.set(_make_user(value))
+
+            torn = result.get()
+
+        cache.unlink()
+
+    assert value > 0
+    assert torn == 0
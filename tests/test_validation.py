@@ -0,0 +1,61 @@
+"""Test validating the types and documented length limits of payloads."""
+
+import types
+import typing
+
+import pytest
+
+from benchmarks.synthetic import PayloadGenerator
+from eludris_autodoc import instance, messaging, users, validation
+
+INSTANCE_INFO: typing.Final = typing.cast(
+    instance.InstanceInfo,
+    types.SimpleNamespace(message_limit=8, bio_limit=8),
+)
+"""Stands in for the info of an instance, as only its limits are used."""
+
+
+@pytest.mark.parametrize(
+    ("content", "valid"),
+    [("ab", True), ("  ab  ", True), (" a ", False), ("abcdefghi", False)],
+)
+def test_trimmed_limit(content: str, valid: bool) -> None:  # noqa: FBT001
+    """The length of fields documented to be trimmed is checked without surrounding whitespace."""
+    payload = messaging.MessageCreate(content=content)
+    if valid:
+        assert validation.validate(payload, instance_info=INSTANCE_INFO) is payload
+
+    else:
+        with pytest.raises(validation.ValidationError):
+            validation.validate(payload, instance_info=INSTANCE_INFO)
+
+
+@pytest.mark.parametrize(("bio", "valid"), [("abcdefgh", True), ("  abcdefgh  ", False)])
+def test_untrimmed_limit(bio: str, valid: bool) -> None:  # noqa: FBT001
+    """The length of other fields includes surrounding whitespace, as it is sent."""
+    payload = users.UpdateUserProfile(bio=bio)
+    if valid:
+        assert validation.validate(payload, instance_info=INSTANCE_INFO) is payload
+
+    else:
+        with pytest.raises(validation.ValidationError):
+            validation.validate(payload, instance_info=INSTANCE_INFO)
+
+
+def test_instance_limit_needs_instance() -> None:
+    """Limits that depend on the instance are not checked without its info."""
+    payload = messaging.MessageCreate(content="abcdefghi")
+    assert validation.validate(payload) is payload
+    with pytest.raises(validation.ValidationError):
+        validation.validate(messaging.MessageCreate(content="a"))
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [messaging.MessageCreate, messaging.Message, users.User, users.UpdateUserProfile],
+)
+def test_synthetic_payloads(cls: type[typing.Any]) -> None:
+    """Synthetic payloads respect the documented length limits of their fields."""
+    generator = PayloadGenerator(seed=1)
+    for _ in range(500):
+        validation.validate(generator.generate(cls))